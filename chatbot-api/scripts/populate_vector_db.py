@@ -31,6 +31,8 @@ Flags & env vars
     --port PORT                      Override REDIS_PORT / QDRANT_PORT.
                                      Defaults to 6379 (redis) / 6333 (qdrant).
     --google-api-key KEY             Required. Falls back to GOOGLE_API_KEY env var.
+    EMBEDDING_CACHE_SHARED=true      Reuse the document embeddings cached in Redis
+                                     (REDIS_HOST / REDIS_PORT) by previous runs.
 
 After running, add a YAML config file in
 ``chatbot-api/src/modules/chatbot/tool/config/`` (or the directory pointed
@@ -460,6 +462,51 @@ def get_embeddings(
     raise ValueError(f"Unsupported embed provider: {embed_provider}")
 
 
+async def get_cached_embeddings(
+    texts: list[str],
+    embed_provider: str,
+    api_key: str | None,
+    embed_dim: int,
+    model_id: str | None = None,
+    api_base: str | None = None,
+) -> list[list[float]]:
+    """Same as `get_embeddings`, but reads and fills the dos_utility embedding
+    cache (EMBEDDING_CACHE_* env vars) so re-running the script only embeds the
+    documents that changed. Only useful with EMBEDDING_CACHE_SHARED=true, as the
+    in-memory tier does not outlive the script.
+    """
+    from dos_utility.embedding_cache import embedding_cache_key, get_embedding_cache
+
+    cache = get_embedding_cache()
+    model_name = model_id or (
+        "gemini-embedding-001"
+        if embed_provider == "google"
+        else "text-embedding-3-small"
+    )
+    task_type = "RETRIEVAL_DOCUMENT" if embed_provider == "google" else None
+    keys = [
+        embedding_cache_key(model_name, embed_dim, task_type, "text", text)
+        for text in texts
+    ]
+    embeddings = await cache.get_many(keys)
+    missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+    if missing:
+        computed = get_embeddings(
+            [texts[i] for i in missing],
+            embed_provider,
+            api_key,
+            embed_dim,
+            model_id,
+            api_base,
+        )
+        for i, embedding in zip(missing, computed):
+            embeddings[i] = embedding
+        await cache.put_many({keys[i]: embeddings[i] for i in missing})
+
+    return embeddings
+
+
 # ---------------------------------------------------------------------------
 # Core populate function
 # ---------------------------------------------------------------------------
@@ -490,7 +537,7 @@ async def populate(
 
     with console.status("[bold]Generating embeddings...", spinner="dots"):
         texts = [doc["content"] for doc in docs]
-        embeddings = get_embeddings(
+        embeddings = await get_cached_embeddings(
             texts, embed_provider, api_key, embed_dim, embed_model_id, api_base
         )
     console.print(
@@ -2,18 +2,21 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dos_utility.tracing import get_tracer
+from dos_utility.database.nosql import nosql_lifespan
 
 from .env import get_settings
 from .modules.sessions.controller import router as sessions_router
 from .modules.queries.controller import router as query_router
+from .modules.queries.masking import close_masking_client
 from .modules.health.controller import router as health_router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     tracer = get_tracer()
-    async with tracer:
+    async with tracer, nosql_lifespan():
         yield
+    await close_masking_client()
     await tracer.flush()
 
 
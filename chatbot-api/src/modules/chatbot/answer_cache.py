@@ -0,0 +1,237 @@
+import asyncio
+import json
+import time
+
+from logging import Logger
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Self
+
+from llama_index.core.vector_stores.types import (
+    FilterOperator,
+    MetadataFilter,
+    MetadataFilters,
+)
+from dos_utility.utils.logger import get_logger
+from dos_utility.vector_db import (
+    ObjectData,
+    SearchResult,
+    VectorDBInterface,
+    get_index_catalog,
+    get_vector_db_ctx,
+)
+
+from .chatbot import FALLBACK_RESPONSE
+from .config_hash import get_agent_config_hash, get_tool_config_hash
+from .env import AnswerCacheSettings, get_answer_cache_settings
+from ..env import LogSettings, get_logging_settings
+
+
+log_settings: LogSettings = get_logging_settings()
+logger: Logger = get_logger(name=__name__, level=log_settings.log_level)
+
+
+class AnswerCache:
+    """Semantic cache of the answers to first-turn questions.
+
+    Every entry is stored in a dedicated vector index, embedded with the
+    question, and is served to a later question whose embedding is at least
+    `answer_cache_threshold` similar. An entry is only served within the scope
+    it was produced in: the agent and tool config hashes (plus whether the
+    answer was masked) are stored as its filename and used as a search filter,
+    so a config change invalidates every entry at once. The revisions of the
+    indexes behind the RAG tools are stored along with the answer, an entry is
+    dropped as soon as any of them changes or `answer_cache_ttl_seconds` pass.
+
+    Only text already stored in the queries table (masked, when masking is
+    enabled) ends up in the cache. Any vector DB failure is logged and counted
+    as a miss: the cache never fails a request.
+    """
+
+    def __init__(self: Self) -> None:
+        self.__settings: AnswerCacheSettings = get_answer_cache_settings()
+        self.__pruned: bool = False
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def enabled(self: Self) -> bool:
+        return self.__settings.answer_cache_enabled
+
+    def __scope(self: Self, masked: bool) -> str:
+        return "-".join(
+            [
+                get_agent_config_hash(),
+                get_tool_config_hash(),
+                "masked" if masked else "plain",
+            ]
+        )
+
+    def __scope_filter(
+        self: Self, scope: str, operator: FilterOperator = FilterOperator.EQ
+    ) -> MetadataFilters:
+        return MetadataFilters(
+            filters=[MetadataFilter(key="filename", value=scope, operator=operator)]
+        )
+
+    async def __revisions(
+        self: Self, vdb: VectorDBInterface, index_ids: List[str]
+    ) -> Dict[str, Optional[str]]:
+        revisions: List[Optional[str]] = await asyncio.gather(
+            *(vdb.get_revision(index_name=index_id) for index_id in index_ids)
+        )
+
+        return dict(zip(index_ids, revisions))
+
+    def __miss(self: Self) -> None:
+        self.misses += 1
+
+    async def lookup(
+        self: Self,
+        question_embedding: List[float],
+        index_ids: List[str],
+        masked: bool,
+    ) -> Optional[Dict[str, Any]]:
+        """Return the cached answer to a similar question, if still valid.
+
+        Args:
+            question_embedding (List[float]): The embedding of the sanitized question.
+            index_ids (List[str]): The indexes the RAG tools of the agent read from.
+            masked (bool): Whether answers are masked before being stored.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached `response`, `tags` and `context`, shaped like `Chatbot.chat_generate`. None on a miss.
+        """
+        index_name: str = self.__settings.answer_cache_index
+
+        try:
+            async with get_vector_db_ctx() as vdb:
+                if not await get_index_catalog().exists(vdb, index_name):
+                    return self.__miss()
+
+                results: List[SearchResult] = await vdb.semantic_search(
+                    index_name=index_name,
+                    embedding_query=question_embedding,
+                    max_results=1,
+                    score_threshold=self.__settings.answer_cache_threshold,
+                    filters=self.__scope_filter(scope=self.__scope(masked=masked)),
+                )
+
+                if len(results) == 0:
+                    return self.__miss()
+
+                entry: Dict[str, Any] = json.loads(results[0].content)
+                revisions: Dict[str, Optional[str]] = await self.__revisions(
+                    vdb=vdb, index_ids=index_ids
+                )
+                expired: bool = (
+                    time.time() - entry["created_at"]
+                    >= self.__settings.answer_cache_ttl_seconds
+                )
+
+                # An index written before revisions existed can't be validated
+                if (
+                    expired
+                    or None in revisions.values()
+                    or revisions != entry["revisions"]
+                ):
+                    logger.debug("Dropping stale cached answer %s", results[0].id)
+                    await vdb.delete_objects(index_name=index_name, ids=[results[0].id])
+                    return self.__miss()
+        except Exception as e:
+            logger.warning(f"Answer cache lookup failed: {e}")
+            return self.__miss()
+
+        self.hits += 1
+        logger.debug("Answer cache hit - score=%s", results[0].score)
+
+        return {
+            "response": entry["answer"],
+            "tags": entry["tags"],
+            "context": entry["context"],
+        }
+
+    async def store(
+        self: Self,
+        question_embedding: List[float],
+        question: str,
+        response: Dict[str, Any],
+        index_ids: List[str],
+        masked: bool,
+    ) -> None:
+        """Store the answer to a first-turn question. Fallback answers are never stored.
+
+        Args:
+            question_embedding (List[float]): The embedding of the sanitized question.
+            question (str): The question, as stored in the queries table.
+            response (Dict[str, Any]): The `response` (as stored in the queries table), `tags` and `context`.
+            index_ids (List[str]): The indexes the RAG tools of the agent read from.
+            masked (bool): Whether the answer has been masked.
+        """
+        if response["response"] == FALLBACK_RESPONSE:
+            return
+
+        index_name: str = self.__settings.answer_cache_index
+        scope: str = self.__scope(masked=masked)
+
+        try:
+            async with get_vector_db_ctx() as vdb:
+                if not await get_index_catalog().exists(vdb, index_name):
+                    await vdb.create_index(
+                        index_name=index_name, vector_dim=len(question_embedding)
+                    )
+
+                if not self.__pruned:
+                    # Entries of previous configs can never be served again
+                    deleted: int = await vdb.delete_by_filter(
+                        index_name=index_name,
+                        filters=self.__scope_filter(
+                            scope=scope, operator=FilterOperator.NE
+                        ),
+                    )
+                    self.__pruned = True
+                    logger.debug("Pruned %d cached answer(s) of other configs", deleted)
+
+                entry: Dict[str, Any] = {
+                    "question": question,
+                    "answer": response["response"],
+                    "tags": response.get("tags", []),
+                    "context": response["context"],
+                    "revisions": await self.__revisions(vdb=vdb, index_ids=index_ids),
+                    "created_at": time.time(),
+                }
+
+                if None in entry["revisions"].values():
+                    return
+
+                await vdb.put_objects(
+                    index_name=index_name,
+                    data=[
+                        ObjectData(
+                            filename=scope,
+                            chunk_id=0,
+                            content=json.dumps(entry),
+                            vector=question_embedding,
+                        )
+                    ],
+                )
+        except Exception as e:
+            logger.warning(f"Answer cache store failed: {e}")
+
+    def stats(self: Self) -> Dict[str, float]:
+        """Return the cache counters.
+
+        Returns:
+            Dict[str, float]: hits, misses and the hit rate.
+        """
+        lookups: int = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+@lru_cache
+def get_answer_cache() -> AnswerCache:
+    return AnswerCache()
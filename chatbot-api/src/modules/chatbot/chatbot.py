@@ -1,12 +1,14 @@
 from logging import Logger
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, Self
+from typing import Any, AsyncIterator, Dict, List, Optional, Self
 
 from dos_utility.utils.logger import get_logger
 from dos_utility.agent import (
     AgentConfig,
+    AgentEvent,
     AgentInterface,
     AgentResponse,
+    AgentResponseEvent,
     ChatGenerationException,
     ChatTurn,
     RagToolSpec,
@@ -50,6 +52,7 @@ class Chatbot:
             config_dir=self.__settings.tools_config_dir
         )
         self.tool_names: List[str] = [t.name for t in rag_tools]
+        self.index_ids: List[str] = sorted({t.index_id for t in rag_tools})
 
         self.agent: AgentInterface = get_agent_client(
             rag_tools=rag_tools,
@@ -118,6 +121,74 @@ class Chatbot:
             "context": [],
         }
 
+    async def chat_generate_stream(
+        self: Self,
+        query_str: str,
+        messages: Optional[List[Dict[str, str]]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the response for `query_str` as plain dict events.
+
+        Args:
+            query_str: The user's current question.
+            messages: Chat history shaped as a list of `{"question", "answer"}` dicts,
+                ordered oldest first.
+
+        Yields:
+            Dicts with a `type` key: `token` (`delta`), `tool_call` (`tool_name`,
+            `tool_kwargs`) and `source` (`chunk`) events, then a single `response`
+            event whose `response` is shaped like the result of `chat_generate`.
+            On failure the stream ends with the `FALLBACK_RESPONSE` payload instead.
+        """
+        history: List[ChatTurn] = self.__messages_to_history(messages=messages)
+        logger.debug("Converted chat history, %d turns", len(history))
+
+        try:
+            event: AgentEvent
+            async for event in self.agent.chat_generate_stream(
+                query=query_str, history=history
+            ):
+                if isinstance(event, AgentResponseEvent):
+                    yield {
+                        "type": event.type,
+                        "response": {
+                            "response": event.response.response,
+                            "tags": event.response.tags,
+                            "context": [c.model_dump() for c in event.response.context],
+                        },
+                    }
+                    return
+
+                yield event.model_dump()
+        except ChatGenerationException as e:
+            logger.warning("Chat generation failed: %s", e)
+        except Exception as e:
+            logger.warning(f"Exception: {e}")
+
+        yield {
+            "type": "response",
+            "response": {
+                "response": FALLBACK_RESPONSE,
+                "tags": [],
+                "context": [],
+            },
+        }
+
+    async def embed_query(self: Self, query_str: str) -> Optional[List[float]]:
+        """Embed `query_str` with the embedding model of the RAG tools.
+
+        Args:
+            query_str: The user's current question.
+
+        Returns:
+            The query embedding, or None if the embedding model failed.
+        """
+        try:
+            return await self.agent.embed_query(query=query_str)
+        except Exception as e:
+            logger.warning(f"Query embedding failed: {e}")
+
+        return None
+
 
 @lru_cache
 def get_chatbot() -> Chatbot:
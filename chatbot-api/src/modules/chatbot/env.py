@@ -1,7 +1,7 @@
 from functools import lru_cache
 from pathlib import Path
 from typing import Annotated, Optional
-from pydantic import Field
+from pydantic import Field, NonNegativeInt
 from pydantic_settings import BaseSettings
 
 
@@ -19,6 +19,26 @@ class ChatbotSettings(BaseSettings):
     ]
 
 
+class AnswerCacheSettings(BaseSettings):
+    # Serve the stored answer of a semantically equivalent first-turn question
+    # instead of running the agent again.
+    answer_cache_enabled: Annotated[bool, Field(default=False)]
+
+    # Vector index holding the cached answers, created on the first store.
+    answer_cache_index: Annotated[str, Field(default="answer-cache")]
+
+    # Minimum similarity between two questions for the cached answer to be served.
+    answer_cache_threshold: Annotated[float, Field(default=0.95, gt=0.0, le=1.0)]
+
+    # How long a cached answer is served, even if nothing else changes.
+    answer_cache_ttl_seconds: Annotated[NonNegativeInt, Field(default=604800)]
+
+
 @lru_cache
 def get_chatbot_settings() -> ChatbotSettings:
     return ChatbotSettings()
+
+
+@lru_cache
+def get_answer_cache_settings() -> AnswerCacheSettings:
+    return AnswerCacheSettings()
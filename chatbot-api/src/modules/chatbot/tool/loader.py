@@ -8,7 +8,6 @@ from dos_utility.utils.logger import get_logger
 from .settings import YamlSettings, get_yaml_settings
 from ...env import LogSettings, get_logging_settings
 
-
 log_settings: LogSettings = get_logging_settings()
 logger: Logger = get_logger(name=__name__, level=log_settings.log_level)
 
@@ -52,6 +51,9 @@ def load_rag_tool_specs(config_dir: Path) -> List[RagToolSpec]:
                 similarity_top_k=config.similarity_top_k,
                 qa_prompt=config.qa_prompt,
                 refine_prompt=config.refine_prompt,
+                search_params=config.search_params,
+                mode=config.mode,
+                parallel=config.parallel,
             )
         )
         logger.debug("Loaded tool spec %r", config.name)
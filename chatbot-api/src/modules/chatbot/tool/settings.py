@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import Optional, Tuple
+from typing import Any, Dict, Literal, Optional, Tuple
 from pathlib import Path
 from pydantic_settings import (
     BaseSettings,
@@ -15,6 +15,9 @@ class YamlSettings(BaseSettings):
     similarity_top_k: Optional[int] = None
     qa_prompt: Optional[str] = None
     refine_prompt: Optional[str] = None
+    search_params: Optional[Dict[str, Any]] = None
+    mode: Literal["synthesize", "retrieve"] = "synthesize"
+    parallel: bool = False
 
 
 @lru_cache
@@ -1,6 +1,9 @@
+import json
+
 from logging import Logger
-from fastapi import APIRouter, Depends, status
-from typing import List, Dict, Any, Annotated
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Dict, Any, Annotated
 from dos_utility.utils.logger import get_logger
 from dos_utility.auth import get_user, User
 
@@ -14,6 +17,41 @@ logger: Logger = get_logger(name=__name__, level=log_settings.log_level)
 router: APIRouter = APIRouter(prefix="/queries", tags=["Queries"])
 
 
+def format_sse(event: str, data: str) -> str:
+    """Format a server-sent event. `data` must be a single line, e.g. compact JSON."""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+async def query_event_stream(
+    events: AsyncIterator[Dict[str, Any]],
+) -> AsyncIterator[str]:
+    """Serialize the events of `QueryService.create_query_stream` as server-sent events.
+
+    The `query` event carries the stored Query, serialized like the response of
+    `POST /queries/{session_id}`. Errors raised once the stream has started can't
+    change the status code anymore, so they end the stream with an `error` event.
+    """
+    try:
+        async for event in events:
+            event_type: str = event.pop("type")
+
+            if event_type == "query":
+                data: str = QueryResponseDTO.model_validate(
+                    event["query"]
+                ).model_dump_json()
+            else:
+                data = json.dumps(event, default=str)
+
+            yield format_sse(event=event_type, data=data)
+    except HTTPException as e:
+        yield format_sse(event="error", data=json.dumps({"detail": e.detail}))
+    except Exception as e:
+        logger.error("Query stream failed: %s", e)
+        yield format_sse(
+            event="error", data=json.dumps({"detail": "Internal server error"})
+        )
+
+
 @router.get(
     path="/{session_id}",
     response_model=List[QueryResponseDTO],
@@ -61,4 +99,47 @@ async def create_query(
         user_role=user.role,
         question=query_data.question,
         session_history=query_data.model_dump(by_alias=False)["session_history"],
+        language=query_data.language,
+    )
+
+
+@router.post(
+    path="/{session_id}/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Server-sent events: `token`, `tool_call` and `source` while the answer is generated, then `query` with the stored Query (or `error`)",
+            "content": {"text/event-stream": {}},
+        },
+        status.HTTP_404_NOT_FOUND: {"description": "Session not found"},
+    },
+    summary="Create a new query for a session, streaming the answer",
+)
+async def create_query_stream(
+    query_service: Annotated[QueryService, Depends(dependency=get_query_service)],
+    user: Annotated[User, Depends(dependency=get_user)],
+    query_data: CreateQueryDTO,
+    session_id: str,
+) -> StreamingResponse:
+    logger.debug(
+        "POST /queries/%s/stream - user_id=%s, question=%r",
+        session_id,
+        user.id,
+        query_data.question,
+    )
+    events: AsyncIterator[Dict[str, Any]] = await query_service.create_query_stream(
+        session_id=session_id,
+        user_id=user.id,
+        user_role=user.role,
+        question=query_data.question,
+        session_history=query_data.model_dump(by_alias=False)["session_history"],
+        language=query_data.language,
+    )
+
+    return StreamingResponse(
+        content=query_event_stream(events=events),
+        media_type="text/event-stream",
+        # Keep proxies from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
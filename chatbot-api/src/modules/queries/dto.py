@@ -17,6 +17,13 @@ class CreateQueryDTO(BaseModel):
     session_history: Annotated[
         Optional[List[Query]], Field(alias="sessionHistory", default=None)
     ]
+    language: Annotated[
+        Optional[str],
+        Field(
+            default=None,
+            description="Language code of the question (e.g. the UI locale), passed to the masking service to skip language detection",
+        ),
+    ]
 
 
 class Source(BaseModel):
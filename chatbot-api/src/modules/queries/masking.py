@@ -0,0 +1,26 @@
+from functools import lru_cache
+from httpx import AsyncClient, Timeout
+
+from ..env import MaskingSettings, get_masking_settings
+
+
+@lru_cache
+def get_masking_client() -> AsyncClient:
+    """Return the HTTP client of the masking service, shared by every request.
+
+    Reusing one client keeps its connections alive between queries instead of
+    paying a new TCP (and TLS) handshake for every masking call.
+    """
+    masking_settings: MaskingSettings = get_masking_settings()
+
+    return AsyncClient(
+        base_url=masking_settings.masking_service_url or "",
+        timeout=Timeout(timeout=20.0),
+    )
+
+
+async def close_masking_client() -> None:
+    """Close the masking client, if it was ever opened."""
+    if get_masking_client.cache_info().currsize > 0:
+        await get_masking_client().aclose()
+        get_masking_client.cache_clear()
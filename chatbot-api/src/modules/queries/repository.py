@@ -1,4 +1,4 @@
-from typing import List, Self, Annotated, Dict, Any
+from typing import AsyncIterator, List, Self, Annotated, Dict, Any, Optional
 
 try:
     from uuid import uuid7
@@ -10,7 +10,6 @@ from datetime import datetime
 from dos_utility.database.nosql import (
     NoSQLInterface,
     get_nosql_client,
-    QueryResult,
     KeyCondition,
     ConditionOperator,
 )
@@ -23,17 +22,28 @@ class QueryRepository:
         self.nosql_client: NoSQLInterface = nosql_client
         self.env: QuerySettings = get_query_settings()
 
-    async def get_queries(self: Self, session_id: str) -> List[Dict[str, Any]]:
-        query_result: QueryResult = await self.nosql_client.query(
+    def iter_queries(
+        self: Self, session_id: str, attributes: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        return self.nosql_client.query_iter(
             table_name=self.env.QUERY_TABLENAME,
             key_conditions=[
                 KeyCondition(
                     field="sessionId", operator=ConditionOperator.EQ, value=session_id
                 )
             ],
+            attributes=attributes,
         )
 
-        return query_result.items
+    async def get_queries(
+        self: Self, session_id: str, attributes: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        return [
+            query
+            async for query in self.iter_queries(
+                session_id=session_id, attributes=attributes
+            )
+        ]
 
     async def create_query(
         self: Self, session_id: str, query_data: Dict[str, Any]
@@ -57,6 +67,12 @@ class QueryRepository:
             key={"id": query_id, "sessionId": session_id},
         )
 
+    async def delete_queries(self: Self, query_ids: List[str], session_id: str) -> None:
+        await self.nosql_client.batch_delete_items(
+            table_name=self.env.QUERY_TABLENAME,
+            keys=[{"id": query_id, "sessionId": session_id} for query_id in query_ids],
+        )
+
 
 def get_query_repository(
     nosql_client: Annotated[NoSQLInterface, Depends(dependency=get_nosql_client)],
@@ -2,12 +2,13 @@ import nh3
 
 from decimal import Decimal
 from logging import Logger
-from typing import List, Self, Annotated, Dict, Any, Optional
+from typing import AsyncIterator, List, Self, Annotated, Dict, Any, Optional
 from fastapi import Depends, HTTPException, status
-from httpx import AsyncClient, Response, Timeout
+from httpx import Response
 from dos_utility.utils.logger import get_logger
 from dos_utility.tracing import TracingInterface, get_tracer
 
+from .masking import get_masking_client
 from .repository import QueryRepository, get_query_repository
 from ..sessions.repository import get_session_repository, SessionRepository
 from ..env import (
@@ -19,6 +20,7 @@ from ..env import (
 from ..utils import format_expiration_dt
 from ..chatbot import Chatbot, get_chatbot
 from ..chatbot.chatbot import FALLBACK_RESPONSE
+from ..chatbot.answer_cache import AnswerCache, get_answer_cache
 from ..chatbot.config_hash import get_agent_config_hash, get_tool_config_hash
 from ..chatbot.version import CHATBOT_API_VERSION
 
@@ -30,35 +32,39 @@ class QueryService:
         session_repository: SessionRepository,
         chatbot: Chatbot,
         tracer: TracingInterface,
+        answer_cache: Optional[AnswerCache] = None,
     ):
         self.query_repository: QueryRepository = query_repository
         self.session_repository: SessionRepository = session_repository
         self.chatbot: Chatbot = chatbot
         self.tracer: TracingInterface = tracer
+        self.answer_cache: Optional[AnswerCache] = answer_cache
         self.masking_settings: MaskingSettings = get_masking_settings()
         self.__log_settings: LogSettings = get_logging_settings()
         self.logger: Logger = get_logger(
             name=__name__, level=self.__log_settings.log_level
         )
 
-    async def __mask_pii(self: Self, text: str) -> str:
-        async with AsyncClient(timeout=Timeout(timeout=20.0)) as client:
-            response: Response = await client.post(
-                url=f"{self.masking_settings.masking_service_url}/mask",
-                json={"text": text},
-            )
+    async def __mask_pii(
+        self: Self, texts: List[str], session_id: str, language: Optional[str]
+    ) -> List[str]:
+        # The session keeps placeholders consistent across the whole conversation
+        response: Response = await get_masking_client().post(
+            url="/mask/batch",
+            json={"texts": texts, "session_id": session_id, "language": language},
+        )
 
-            if response.status_code != status.HTTP_200_OK:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Masking service error",
-                )
+        if response.status_code != status.HTTP_200_OK:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Masking service error",
+            )
 
-        masked_text: str = response.json()
+        masked_texts: List[str] = response.json()
 
-        self.logger.debug("Masked PII")
+        self.logger.debug("Masked PII in %d text(s)", len(masked_texts))
 
-        return masked_text
+        return masked_texts
 
     async def get_queries(
         self: Self, session_id: str, user_id: str
@@ -94,13 +100,8 @@ class QueryService:
             for query in queries
         ]
 
-    async def create_query(
-        self: Self,
-        session_id: str,
-        user_id: str,
-        user_role: str,
-        question: str,
-        session_history: Optional[List[Dict[str, str]]],
+    async def __get_session(
+        self: Self, session_id: str, user_id: str
     ) -> Dict[str, Any]:
         session: Optional[Dict[str, Any]] = await self.session_repository.get_session(
             session_id=session_id, user_id=user_id
@@ -111,6 +112,25 @@ class QueryService:
                 status_code=status.HTTP_404_NOT_FOUND, detail="Session not found"
             )
 
+        return session
+
+    async def __query_events(
+        self: Self,
+        session: Dict[str, Any],
+        session_id: str,
+        user_id: str,
+        user_role: str,
+        question: str,
+        session_history: Optional[List[Dict[str, str]]],
+        stream: bool,
+        language: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Answer the question and store the Query.
+
+        When `stream` is set, the `token`, `tool_call` and `source` events of the
+        agent are yielded while it runs. The last event is always the `query` one,
+        carrying the stored Query: masking and persistence run once, at the end.
+        """
         tracing_trace_id: Optional[str] = None
         masking_enabled: bool = self.masking_settings.mask_pii is True
         async with self.tracer.trace(
@@ -126,6 +146,7 @@ class QueryService:
                     "chatbot_api.version": CHATBOT_API_VERSION,
                     "agent.config_hash": get_agent_config_hash(),
                     "tool.config_hash": get_tool_config_hash(),
+                    "response.streamed": stream,
                 }
             )
 
@@ -142,11 +163,53 @@ class QueryService:
                         session_id=session_id
                     )
 
-            self.logger.debug("Generating answer with AI agent...")
-            response_json: Dict[str, Any] = await self.chatbot.chat_generate(
-                query_str=question_cleaned,
-                messages=session_history,
-            )
+            # Only first turns are cached: a follow-up depends on its history
+            question_embedding: Optional[List[float]] = None
+            cached_response: Optional[Dict[str, Any]] = None
+
+            if (
+                self.answer_cache is not None
+                and self.answer_cache.enabled
+                and not session_history
+            ):
+                async with trace_handle.start_span(
+                    name="answer_cache_lookup", input=question_cleaned
+                ):
+                    question_embedding = await self.chatbot.embed_query(
+                        query_str=question_cleaned
+                    )
+
+                    if question_embedding is not None:
+                        cached_response = await self.answer_cache.lookup(
+                            question_embedding=question_embedding,
+                            index_ids=self.chatbot.index_ids,
+                            masked=masking_enabled,
+                        )
+                trace_handle.set_metadata(
+                    {"answer_cache.hit": cached_response is not None}
+                )
+
+            if cached_response is not None:
+                response_json: Dict[str, Any] = cached_response
+
+                if stream:
+                    yield {"type": "token", "delta": cached_response["response"]}
+            elif stream:
+                self.logger.debug("Streaming answer with AI agent...")
+                async for event in self.chatbot.chat_generate_stream(
+                    query_str=question_cleaned,
+                    messages=session_history,
+                ):
+                    if event["type"] == "response":
+                        response_json = event["response"]
+                    else:
+                        yield event
+            else:
+                self.logger.debug("Generating answer with AI agent...")
+                response_json = await self.chatbot.chat_generate(
+                    query_str=question_cleaned,
+                    messages=session_history,
+                )
             answer: str = response_json["response"]
             trace_handle.set_metadata(
                 {"response.fallback": answer == FALLBACK_RESPONSE}
@@ -156,16 +219,26 @@ class QueryService:
             answer_masked: str = answer
 
             if masking_enabled:
+                # Question and answer are masked in a single request, sharing
+                # placeholders. A cached answer is stored already masked.
+                texts: Dict[str, str] = {"question": question_cleaned}
+
+                if cached_response is None:
+                    texts["answer"] = answer
+
                 async with trace_handle.start_span(
-                    name="mask_pii_input", input=question_cleaned
-                ) as span:
-                    question_masked = await self.__mask_pii(text=question_cleaned)
-                    span.set_output(question_masked)
-                async with trace_handle.start_span(
-                    name="mask_pii_output", input=answer
+                    name="mask_pii", input=texts
                 ) as span:
-                    answer_masked = await self.__mask_pii(text=answer)
-                    span.set_output(answer_masked)
+                    masked_texts: List[str] = await self.__mask_pii(
+                        texts=list(texts.values()),
+                        session_id=session_id,
+                        language=language,
+                    )
+                    masked: Dict[str, str] = dict(zip(texts, masked_texts))
+                    span.set_output(masked)
+
+                question_masked = masked["question"]
+                answer_masked = masked.get("answer", answer)
                 trace_handle.set_metadata(
                     {
                         "masking.input_changed": question_masked != question_cleaned,
@@ -173,6 +246,15 @@ class QueryService:
                     }
                 )
 
+            if question_embedding is not None and cached_response is None:
+                await self.answer_cache.store(
+                    question_embedding=question_embedding,
+                    question=question_masked,
+                    response={**response_json, "response": answer_masked},
+                    index_ids=self.chatbot.index_ids,
+                    masked=masking_enabled,
+                )
+
             trace_handle.set_output(answer_masked)
             tracing_trace_id = trace_handle.id
 
@@ -202,21 +284,87 @@ class QueryService:
             "Query stored - id=%s, session_id=%s", item["id"], item["sessionId"]
         )
 
-        return {
-            "id": item["id"],
-            "session_id": item["sessionId"],
-            "question": item["question"],
-            "answer": item["answer"],
-            "topic": item["topic"],
-            "context": item["context"],
-            "created_at": item["createdAt"],
-            "expires_at": format_expiration_dt(item["expiresAt"]),
-            "feedback": item.get("feedback", 0),
-            "tracing_trace_id": item.get("tracingTraceId"),
-            "scores": item.get("scores"),
-            "is_evaluated": item.get("isEvaluated", False),
+        yield {
+            "type": "query",
+            "query": {
+                "id": item["id"],
+                "session_id": item["sessionId"],
+                "question": item["question"],
+                "answer": item["answer"],
+                "topic": item["topic"],
+                "context": item["context"],
+                "created_at": item["createdAt"],
+                "expires_at": format_expiration_dt(item["expiresAt"]),
+                "feedback": item.get("feedback", 0),
+                "tracing_trace_id": item.get("tracingTraceId"),
+                "scores": item.get("scores"),
+                "is_evaluated": item.get("isEvaluated", False),
+            },
         }
 
+    async def create_query(
+        self: Self,
+        session_id: str,
+        user_id: str,
+        user_role: str,
+        question: str,
+        session_history: Optional[List[Dict[str, str]]],
+        language: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        session: Dict[str, Any] = await self.__get_session(
+            session_id=session_id, user_id=user_id
+        )
+
+        query: Dict[str, Any] = {}
+
+        # Without streaming the only event is the stored Query
+        async for event in self.__query_events(
+            session=session,
+            session_id=session_id,
+            user_id=user_id,
+            user_role=user_role,
+            question=question,
+            session_history=session_history,
+            stream=False,
+            language=language,
+        ):
+            query = event["query"]
+
+        return query
+
+    async def create_query_stream(
+        self: Self,
+        session_id: str,
+        user_id: str,
+        user_role: str,
+        question: str,
+        session_history: Optional[List[Dict[str, str]]],
+        language: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Check the session, then return the events of the streamed answer.
+
+        The session is checked before the first event, so a missing session is
+        still reported with a 404 status code instead of an error event.
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: `token`, `tool_call` and `source` events,
+                then the `query` event with the stored Query.
+        """
+        session: Dict[str, Any] = await self.__get_session(
+            session_id=session_id, user_id=user_id
+        )
+
+        return self.__query_events(
+            session=session,
+            session_id=session_id,
+            user_id=user_id,
+            user_role=user_role,
+            question=question,
+            session_history=session_history,
+            stream=True,
+            language=language,
+        )
+
 
 def get_query_service(
     query_repository: Annotated[
@@ -227,10 +375,12 @@ def get_query_service(
     ],
     chatbot: Annotated[Chatbot, Depends(dependency=get_chatbot)],
     tracer: Annotated[TracingInterface, Depends(dependency=get_tracer)],
+    answer_cache: Annotated[AnswerCache, Depends(dependency=get_answer_cache)],
 ) -> QueryService:
     return QueryService(
         query_repository=query_repository,
         session_repository=session_repository,
         chatbot=chatbot,
         tracer=tracer,
+        answer_cache=answer_cache,
     )
@@ -1,5 +1,5 @@
 from logging import Logger
-from typing import List, Self, Annotated, Dict, Any, Optional
+from typing import AsyncIterator, List, Self, Annotated, Dict, Any, Optional
 from fastapi import Depends
 from datetime import datetime
 
@@ -51,17 +51,28 @@ class SessionRepository:
 
         return query_result.items[0]
 
-    async def get_sessions(self: Self, user_id: str) -> List[Dict[str, Any]]:
-        query_result: QueryResult = await self.nosql_client.query(
+    def iter_sessions(
+        self: Self, user_id: str, attributes: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        return self.nosql_client.query_iter(
             table_name=self.env.SESSIONS_TABLENAME,
             key_conditions=[
                 KeyCondition(
                     field="userId", operator=ConditionOperator.EQ, value=user_id
                 )
             ],
+            attributes=attributes,
         )
 
-        return query_result.items
+    async def get_sessions(
+        self: Self, user_id: str, attributes: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        return [
+            session
+            async for session in self.iter_sessions(
+                user_id=user_id, attributes=attributes
+            )
+        ]
 
     async def create_session(
         self: Self, user_id: str, session_data: Dict[str, Any]
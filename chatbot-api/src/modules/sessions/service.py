@@ -11,6 +11,9 @@ from ..env import get_logging_settings, LogSettings
 from ..queries.repository import get_query_repository, QueryRepository
 from ..utils import format_expiration_dt
 
+# Attributes returned by the session list, the only ones fetched from the table
+SESSION_LIST_ATTRIBUTES: List[str] = ["id", "userId", "title", "createdAt", "expiresAt"]
+
 
 class SessionService:
     def __init__(
@@ -45,10 +48,6 @@ class SessionService:
         }
 
     async def get_sessions(self: Self, user_id: str) -> List[Dict[str, Any]]:
-        sessions: List[Dict[str, Any]] = await self.session_repository.get_sessions(
-            user_id=user_id
-        )
-
         return [
             {
                 "id": session["id"],
@@ -57,7 +56,9 @@ class SessionService:
                 "created_at": session["createdAt"],
                 "expires_at": format_expiration_dt(session["expiresAt"]),
             }
-            for session in sessions
+            async for session in self.session_repository.iter_sessions(
+                user_id=user_id, attributes=SESSION_LIST_ATTRIBUTES
+            )
         ]
 
     async def create_session(
@@ -91,16 +92,18 @@ class SessionService:
         }
 
     async def __delete_session_queries(self: Self, session_id: str) -> None:
-        # Get all queries related to the session to delete
-        queries: List[Dict[str, Any]] = await self.query_repository.get_queries(
-            session_id=session_id
-        )
-
-        # Delete all queries related to the session
-        for query in queries:
-            await self.query_repository.delete_query(
-                query_id=query["id"], session_id=session_id
+        # Get the ids of the queries related to the session, nothing else is needed
+        query_ids: List[str] = [
+            query["id"]
+            async for query in self.query_repository.iter_queries(
+                session_id=session_id, attributes=["id"]
             )
+        ]
+
+        # Delete all queries related to the session in concurrent batches
+        await self.query_repository.delete_queries(
+            query_ids=query_ids, session_id=session_id
+        )
 
         self.logger.debug("All session queries deleted")
 
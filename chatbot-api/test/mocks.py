@@ -1,4 +1,4 @@
-from typing import Self, Dict, Any, Optional, List
+from typing import AsyncIterator, Self, Dict, Any, Optional, List
 
 from dos_utility.database.nosql import (
     NoSQLInterface,
@@ -10,9 +10,9 @@ from dos_utility.database.nosql import (
 
 class MockNoSQLDatabase(NoSQLInterface):
     def __init__(self: Self):
-        self._data: Dict[
-            str, Any
-        ] = {}  # To be used for storing data in-memory for testing purposes
+        self._data: Dict[str, Any] = (
+            {}
+        )  # To be used for storing data in-memory for testing purposes
 
     async def __aenter__(self: Self) -> Self:
         return self
@@ -55,6 +55,26 @@ class MockNoSQLDatabase(NoSQLInterface):
         start_key: Optional[Dict[str, Any]] = None,
     ) -> ScanResult: ...
 
+    async def batch_put_items(
+        self: Self, table_name: str, items: List[Dict[str, Any]]
+    ) -> None: ...
+
+    async def batch_delete_items(
+        self: Self, table_name: str, keys: List[Dict[str, Any]]
+    ) -> None: ...
+
+    async def query_iter(
+        self: Self, table_name: str, key_conditions: List[KeyCondition], **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for item in []:
+            yield item
+
+    async def scan_iter(
+        self: Self, table_name: str, **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for item in []:
+            yield item
+
 
 def override_get_nosql_client() -> MockNoSQLDatabase:
     return MockNoSQLDatabase()
@@ -0,0 +1,155 @@
+import pytest
+
+from typing import Any, Dict
+
+from src.modules.chatbot import answer_cache as answer_cache_module
+from src.modules.chatbot.answer_cache import AnswerCache, get_answer_cache
+from src.modules.chatbot.chatbot import FALLBACK_RESPONSE
+
+from test.modules.chatbot.mocks import (
+    IndexCatalogMock,
+    VectorDBMock,
+    build_get_vector_db_ctx_mock,
+    get_answer_cache_settings_mock,
+)
+
+
+RESPONSE: Dict[str, Any] = {
+    "response": "Test answer",
+    "tags": [],
+    "context": [
+        {"filename": "file1.pdf", "chunk_id": 1, "content": "some", "score": 0.9}
+    ],
+}
+
+
+@pytest.fixture
+def vdb(monkeypatch: pytest.MonkeyPatch) -> VectorDBMock:
+    vdb = VectorDBMock()
+    monkeypatch.setattr(
+        answer_cache_module, "get_answer_cache_settings", get_answer_cache_settings_mock
+    )
+    monkeypatch.setattr(
+        answer_cache_module, "get_vector_db_ctx", build_get_vector_db_ctx_mock(vdb)
+    )
+    monkeypatch.setattr(
+        answer_cache_module, "get_index_catalog", lambda: IndexCatalogMock()
+    )
+    return vdb
+
+
+async def _store(cache: AnswerCache, response: Dict[str, Any] = RESPONSE) -> None:
+    await cache.store(
+        question_embedding=[1.0, 0.0],
+        question="What is Python?",
+        response=response,
+        index_ids=["idx-1"],
+        masked=False,
+    )
+
+
+async def _lookup(cache: AnswerCache, masked: bool = False):
+    return await cache.lookup(
+        question_embedding=[1.0, 0.01], index_ids=["idx-1"], masked=masked
+    )
+
+
+@pytest.mark.asyncio
+async def test_answer_cache_serves_similar_question(vdb: VectorDBMock):
+    cache = AnswerCache()
+
+    assert await _lookup(cache) is None
+    await _store(cache)
+
+    assert await _lookup(cache) == RESPONSE
+    assert (
+        await cache.lookup(
+            question_embedding=[0.0, 1.0], index_ids=["idx-1"], masked=False
+        )
+        is None
+    )
+    assert cache.stats() == {"hits": 1, "misses": 2, "hit_rate": 1 / 3}
+
+
+@pytest.mark.asyncio
+async def test_answer_cache_is_scoped_by_masking(vdb: VectorDBMock):
+    cache = AnswerCache()
+    await _store(cache)
+
+    assert await _lookup(cache, masked=True) is None
+
+
+@pytest.mark.asyncio
+async def test_answer_cache_invalidated_by_index_revision(vdb: VectorDBMock):
+    cache = AnswerCache()
+    await _store(cache)
+
+    vdb.revisions["idx-1"] = "r2"
+
+    assert await _lookup(cache) is None
+    # The stale entry is dropped
+    assert vdb.indexes["answer-cache"] == {}
+
+
+@pytest.mark.asyncio
+async def test_answer_cache_invalidated_by_config_change(
+    vdb: VectorDBMock, monkeypatch: pytest.MonkeyPatch
+):
+    await _store(AnswerCache())
+
+    monkeypatch.setattr(answer_cache_module, "get_tool_config_hash", lambda: "new")
+    cache = AnswerCache()
+
+    assert await _lookup(cache) is None
+    await _store(cache)
+    # Entries of the previous config are pruned on the first store
+    assert len(vdb.indexes["answer-cache"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_answer_cache_expires(vdb: VectorDBMock, monkeypatch: pytest.MonkeyPatch):
+    cache = AnswerCache()
+    await _store(cache)
+
+    now = answer_cache_module.time.time()
+    monkeypatch.setattr(answer_cache_module.time, "time", lambda: now + 61)
+
+    assert await _lookup(cache) is None
+
+
+@pytest.mark.asyncio
+async def test_answer_cache_skips_unversioned_indexes(vdb: VectorDBMock):
+    vdb.revisions = {}
+    cache = AnswerCache()
+    await _store(cache)
+
+    assert vdb.indexes["answer-cache"] == {}
+    assert await _lookup(cache) is None
+
+
+@pytest.mark.asyncio
+async def test_answer_cache_never_stores_fallback(vdb: VectorDBMock):
+    cache = AnswerCache()
+    await _store(cache, response={**RESPONSE, "response": FALLBACK_RESPONSE})
+
+    assert "answer-cache" not in vdb.indexes
+
+
+@pytest.mark.asyncio
+async def test_answer_cache_failure_is_a_miss(
+    vdb: VectorDBMock, monkeypatch: pytest.MonkeyPatch
+):
+    cache = AnswerCache()
+    await _store(cache)
+
+    async def semantic_search_failing(**kwargs):
+        raise RuntimeError("unreachable")
+
+    monkeypatch.setattr(vdb, "semantic_search", semantic_search_failing)
+
+    assert await _lookup(cache) is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_get_answer_cache_is_process_wide():
+    assert get_answer_cache() is get_answer_cache()
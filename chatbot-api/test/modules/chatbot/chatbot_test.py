@@ -42,6 +42,7 @@ def test_get_chatbot(monkeypatch: pytest.MonkeyPatch) -> None:
 
     assert isinstance(chatbot, Chatbot)
     assert chatbot.tool_names == ["tool1"]
+    assert chatbot.index_ids == ["idx-1"]
 
 
 @pytest.mark.asyncio
@@ -108,3 +109,53 @@ async def test_chat_generate_no_history(monkeypatch: pytest.MonkeyPatch) -> None
     response: Dict[str, Any] = await chatbot.chat_generate(query_str="Hi")
 
     assert response["response"] == "Test answer"
+
+
+@pytest.mark.asyncio
+async def test_embed_query(monkeypatch: pytest.MonkeyPatch) -> None:
+    _patch_common(monkeypatch, SuccessAgent())
+
+    chatbot: Chatbot = get_chatbot()
+
+    assert await chatbot.embed_query(query_str="Hi") == [2.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_embed_query_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    _patch_common(monkeypatch, UnexpectedFailingAgent())
+
+    chatbot: Chatbot = get_chatbot()
+
+    assert await chatbot.embed_query(query_str="Hi") is None
+
+
+@pytest.mark.asyncio
+async def test_chat_generate_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    _patch_common(monkeypatch, SuccessAgent())
+
+    chatbot: Chatbot = get_chatbot()
+    events: List[Dict[str, Any]] = [
+        event async for event in chatbot.chat_generate_stream(query_str="Hi")
+    ]
+
+    assert events[0] == {"type": "token", "delta": "Test answer"}
+    assert events[-1]["type"] == "response"
+    assert events[-1]["response"]["response"] == "Test answer"
+    assert events[-1]["response"]["context"][0]["filename"] == "file1.pdf"
+
+
+@pytest.mark.asyncio
+async def test_chat_generate_stream_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    _patch_common(monkeypatch, FailingAgent())
+
+    chatbot: Chatbot = get_chatbot()
+    events: List[Dict[str, Any]] = [
+        event async for event in chatbot.chat_generate_stream(query_str="Hi")
+    ]
+
+    assert events == [
+        {
+            "type": "response",
+            "response": {"response": FALLBACK_RESPONSE, "tags": [], "context": []},
+        }
+    ]
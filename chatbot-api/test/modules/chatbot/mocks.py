@@ -1,5 +1,8 @@
+import math
+
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import List, Optional, Self, Type
+from typing import Dict, List, Optional, Self, Type
 
 from pydantic import BaseModel
 
@@ -7,13 +10,19 @@ from dos_utility.agent import (
     AgentConfig,
     AgentInterface,
     AgentResponse,
+    AgentResponseEvent,
+    AgentTokenEvent,
     ChatGenerationException,
     ChatTurn,
     ContextChunk,
     RagToolSpec,
 )
 
+from dos_utility.vector_db import ObjectData, SearchResult
+from llama_index.core.vector_stores.types import FilterOperator, MetadataFilters
+
 from src.modules.chatbot.agent.settings import AgentYamlSettings
+from src.modules.chatbot.env import AnswerCacheSettings
 
 
 # --- Stub AgentInterface implementations -----------------------------------
@@ -33,6 +42,16 @@ class _BaseStubAgent(AgentInterface):
     ) -> AgentResponse:
         raise NotImplementedError
 
+    async def chat_generate_stream(
+        self: Self, query: str, history: Optional[List[ChatTurn]] = None
+    ):
+        response: AgentResponse = await self.chat_generate(query=query, history=history)
+        yield AgentTokenEvent(delta=response.response)
+        yield AgentResponseEvent(response=response)
+
+    async def embed_query(self: Self, query: str) -> List[float]:
+        return [float(len(query)), 1.0]
+
     async def close(self: Self) -> None:
         pass
 
@@ -68,6 +87,9 @@ class UnexpectedFailingAgent(_BaseStubAgent):
     ) -> AgentResponse:
         raise RuntimeError("unexpected")
 
+    async def embed_query(self: Self, query: str) -> List[float]:
+        raise RuntimeError("unexpected")
+
 
 # --- Factory replacements --------------------------------------------------
 
@@ -101,3 +123,93 @@ def load_rag_tool_specs_mock(config_dir: Path) -> List[RagToolSpec]:
             description="Test tool 1",
         ),
     ]
+
+
+# --- Answer cache ----------------------------------------------------------
+
+
+def get_answer_cache_settings_mock() -> AnswerCacheSettings:
+    return AnswerCacheSettings(
+        answer_cache_enabled=True,
+        answer_cache_index="answer-cache",
+        answer_cache_threshold=0.95,
+        answer_cache_ttl_seconds=60,
+    )
+
+
+class VectorDBMock:
+    """In-memory vector DB supporting the calls made by `AnswerCache`."""
+
+    def __init__(self: Self) -> None:
+        self.indexes: Dict[str, Dict[str, ObjectData]] = {}
+        self.revisions: Dict[str, Optional[str]] = {"idx-1": "r1"}
+
+    def __matches(self: Self, obj: ObjectData, filters: MetadataFilters) -> bool:
+        [f] = filters.filters
+        return (obj.filename == f.value) == (f.operator == FilterOperator.EQ)
+
+    async def create_index(self: Self, index_name: str, vector_dim: int) -> None:
+        self.indexes[index_name] = {}
+
+    async def get_revision(self: Self, index_name: str) -> Optional[str]:
+        return self.revisions.get(index_name)
+
+    async def put_objects(
+        self: Self, index_name: str, data: List[ObjectData]
+    ) -> List[str]:
+        index = self.indexes[index_name]
+        ids = [str(len(index) + i) for i in range(len(data))]
+        index.update(zip(ids, data))
+        return ids
+
+    async def delete_objects(self: Self, index_name: str, ids: List[str]) -> None:
+        for id in ids:
+            self.indexes[index_name].pop(id, None)
+
+    async def delete_by_filter(
+        self: Self, index_name: str, filters: MetadataFilters
+    ) -> int:
+        index = self.indexes[index_name]
+        ids = [id for id, obj in index.items() if self.__matches(obj, filters)]
+        await self.delete_objects(index_name=index_name, ids=ids)
+        return len(ids)
+
+    async def semantic_search(
+        self: Self,
+        index_name: str,
+        embedding_query: List[float],
+        max_results: int,
+        score_threshold: float,
+        filters: Optional[MetadataFilters] = None,
+    ) -> List[SearchResult]:
+        results: List[SearchResult] = []
+
+        for id, obj in self.indexes[index_name].items():
+            score = sum(a * b for a, b in zip(obj.vector, embedding_query)) / (
+                math.hypot(*obj.vector) * math.hypot(*embedding_query)
+            )
+            if score >= score_threshold and self.__matches(obj, filters):
+                results.append(
+                    SearchResult(
+                        id=id,
+                        filename=obj.filename,
+                        chunk_id=obj.chunk_id,
+                        content=obj.content,
+                        score=score,
+                    )
+                )
+
+        return sorted(results, key=lambda r: -r.score)[:max_results]
+
+
+def build_get_vector_db_ctx_mock(vdb: VectorDBMock):
+    @asynccontextmanager
+    async def _get_vector_db_ctx_mock(index_name: Optional[str] = None):
+        yield vdb
+
+    return _get_vector_db_ctx_mock
+
+
+class IndexCatalogMock:
+    async def exists(self: Self, vdb: VectorDBMock, index_name: str) -> bool:
+        return index_name in vdb.indexes
@@ -34,3 +34,15 @@ def test_load_rag_tool_specs() -> None:
     assert len(specs) == 1
     assert isinstance(specs[0], RagToolSpec)
     assert specs[0].name == "RAGToolTest"
+    assert specs[0].mode == "synthesize"
+    assert specs[0].parallel is False
+
+
+def test_load_rag_tool_specs_retrieve_parallel() -> None:
+    dir: Path = Path(__file__).parent / "tool_config_parallel_folder"
+
+    specs: List[RagToolSpec] = load_rag_tool_specs(config_dir=dir)
+
+    assert len(specs) == 1
+    assert specs[0].mode == "retrieve"
+    assert specs[0].parallel is True
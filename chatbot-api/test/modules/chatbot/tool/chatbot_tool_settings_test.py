@@ -13,3 +13,18 @@ def test_get_yaml_settings():
     assert settings.index_id == "index-test"
     assert settings.name == "RAGToolTest"
     assert settings.description == "Test RAG tool description"
+    assert settings.mode == "synthesize"
+    assert settings.parallel is False
+
+
+def test_get_yaml_settings_retrieve_parallel():
+    get_yaml_settings.cache_clear()
+
+    settings: YamlSettings = get_yaml_settings(
+        file=Path(__file__).parent
+        / "tool_config_parallel_folder"
+        / "RAGToolParallel.yaml"
+    )
+
+    assert settings.mode == "retrieve"
+    assert settings.parallel is True
@@ -1,5 +1,5 @@
 from contextlib import asynccontextmanager
-from typing import Any, Dict, List, Optional, Self
+from typing import AsyncIterator, Any, Dict, List, Optional, Self
 
 from fastapi import HTTPException, status
 from dos_utility.database.nosql import (
@@ -16,6 +16,7 @@ from dos_utility.tracing.models import TraceId
 # ---------------------------------------------------------------------------
 __all__ = [
     "MockChatbot",
+    "MockAnswerCache",
     "MockQueryRepository",
     "MockQueryRepositoryEmpty",
     "MockSessionRepositoryFound",
@@ -27,6 +28,9 @@ __all__ = [
     "get_query_service_get_queries_404_mock",
     "get_query_service_create_query_201_mock",
     "get_query_service_create_query_404_mock",
+    "get_query_service_create_query_stream_200_mock",
+    "get_query_service_create_query_stream_404_mock",
+    "get_query_service_create_query_stream_error_mock",
 ]
 
 
@@ -97,6 +101,28 @@ class MockNoSQLClientWithQueries(NoSQLInterface):
     async def scan(self: Self, table_name: str, **kwargs) -> ScanResult:
         return ScanResult(items=[], last_evaluated_key=None)
 
+    async def batch_put_items(
+        self: Self, table_name: str, items: List[Dict[str, Any]]
+    ) -> None:
+        pass
+
+    async def batch_delete_items(
+        self: Self, table_name: str, keys: List[Dict[str, Any]]
+    ) -> None:
+        pass
+
+    async def query_iter(
+        self: Self, table_name: str, key_conditions: List[KeyCondition], **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for item in (await self.query(table_name, key_conditions)).items:
+            yield item
+
+    async def scan_iter(
+        self: Self, table_name: str, **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for item in []:
+            yield item
+
 
 class MockNoSQLClientEmpty(NoSQLInterface):
     async def __aenter__(self: Self) -> Self:
@@ -135,6 +161,28 @@ class MockNoSQLClientEmpty(NoSQLInterface):
     async def scan(self: Self, table_name: str, **kwargs) -> ScanResult:
         return ScanResult(items=[], last_evaluated_key=None)
 
+    async def batch_put_items(
+        self: Self, table_name: str, items: List[Dict[str, Any]]
+    ) -> None:
+        pass
+
+    async def batch_delete_items(
+        self: Self, table_name: str, keys: List[Dict[str, Any]]
+    ) -> None:
+        pass
+
+    async def query_iter(
+        self: Self, table_name: str, key_conditions: List[KeyCondition], **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for item in (await self.query(table_name, key_conditions)).items:
+            yield item
+
+    async def scan_iter(
+        self: Self, table_name: str, **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for item in []:
+            yield item
+
 
 # ---------------------------------------------------------------------------
 # Repository mocks (for service tests)
@@ -255,6 +303,7 @@ def get_query_service_create_query_201_mock():
             user_role: str,
             session_history: Optional[List[Dict[str, str]]],
             question: str,
+            language: Optional[str] = None,
         ) -> Dict[str, Any]:
             return {
                 "id": "03084655-d5c4-42b4-b39a-7097f4a5ed1f",
@@ -286,6 +335,7 @@ def get_query_service_create_query_404_mock():
             user_role: str,
             question: str,
             session_history: Optional[List[Dict[str, str]]],
+            language: Optional[str] = None,
         ) -> Dict[str, Any]:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Session not found"
@@ -294,12 +344,86 @@ def get_query_service_create_query_404_mock():
     return QueryServiceMock()
 
 
+def get_query_service_create_query_stream_200_mock():
+    class QueryServiceMock:
+        async def create_query_stream(
+            self: Self,
+            session_id: str,
+            user_id: str,
+            user_role: str,
+            question: str,
+            session_history: Optional[List[Dict[str, str]]],
+            language: Optional[str] = None,
+        ) -> AsyncIterator[Dict[str, Any]]:
+            async def events():
+                yield {"type": "token", "delta": "Paris"}
+                yield {
+                    "type": "query",
+                    "query": {
+                        "id": "03084655-d5c4-42b4-b39a-7097f4a5ed1f",
+                        "session_id": session_id,
+                        "question": question,
+                        "answer": "Paris",
+                        "topic": [],
+                        "context": [],
+                        "created_at": "2024-06-01T12:00:00Z",
+                        "expires_at": None,
+                    },
+                }
+
+            return events()
+
+    return QueryServiceMock()
+
+
+def get_query_service_create_query_stream_404_mock():
+    class QueryServiceMock:
+        async def create_query_stream(
+            self: Self,
+            session_id: str,
+            user_id: str,
+            user_role: str,
+            question: str,
+            session_history: Optional[List[Dict[str, str]]],
+            language: Optional[str] = None,
+        ) -> AsyncIterator[Dict[str, Any]]:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Session not found"
+            )
+
+    return QueryServiceMock()
+
+
+def get_query_service_create_query_stream_error_mock():
+    class QueryServiceMock:
+        async def create_query_stream(
+            self: Self,
+            session_id: str,
+            user_id: str,
+            user_role: str,
+            question: str,
+            session_history: Optional[List[Dict[str, str]]],
+            language: Optional[str] = None,
+        ) -> AsyncIterator[Dict[str, Any]]:
+            async def events():
+                yield {"type": "token", "delta": "Paris"}
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Masking service error",
+                )
+
+            return events()
+
+    return QueryServiceMock()
+
+
 class MockChatbot:
     """Mock for Chatbot used in QueryService tests."""
 
     def __init__(self, response: str = "Simulated answer") -> None:
         self.chat_generate_call_count = 0
         self._response = response
+        self.index_ids: List[str] = ["docs"]
 
     async def chat_generate(
         self: Self,
@@ -312,6 +436,68 @@ class MockChatbot:
             "context": {},
         }
 
+    async def chat_generate_stream(
+        self: Self,
+        query_str: str,
+        messages: Optional[List[Dict[str, Any]]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        self.chat_generate_call_count += 1
+        yield {"type": "tool_call", "tool_name": "docs", "tool_kwargs": {}}
+        for word in self._response.split(" "):
+            yield {"type": "token", "delta": word}
+        yield {
+            "type": "response",
+            "response": {"response": self._response, "tags": [], "context": []},
+        }
+
+    async def embed_query(self: Self, query_str: str) -> Optional[List[float]]:
+        return [float(len(query_str)), 1.0]
+
+
+class MockAnswerCache:
+    """Mock for AnswerCache recording lookups and stored answers."""
+
+    def __init__(
+        self, cached: Optional[Dict[str, Any]] = None, enabled: bool = True
+    ) -> None:
+        self.enabled = enabled
+        self._cached = cached
+        self.lookups: List[Dict[str, Any]] = []
+        self.stored: List[Dict[str, Any]] = []
+
+    async def lookup(
+        self: Self,
+        question_embedding: List[float],
+        index_ids: List[str],
+        masked: bool,
+    ) -> Optional[Dict[str, Any]]:
+        self.lookups.append(
+            {
+                "question_embedding": question_embedding,
+                "index_ids": index_ids,
+                "masked": masked,
+            }
+        )
+        return self._cached
+
+    async def store(
+        self: Self,
+        question_embedding: List[float],
+        question: str,
+        response: Dict[str, Any],
+        index_ids: List[str],
+        masked: bool,
+    ) -> None:
+        self.stored.append(
+            {
+                "question_embedding": question_embedding,
+                "question": question,
+                "response": response,
+                "index_ids": index_ids,
+                "masked": masked,
+            }
+        )
+
 
 MOCK_TRACE_ID = "mock-trace-id-1234"
 
@@ -446,14 +632,16 @@ class MockTracerThatRaises(TracingInterface):
         pass
 
 
-class MockMaskingResponse: ...
+class MockMaskingResponse:
+    def __init__(self, texts):
+        self.texts = texts
 
 
 class MockMaskingResponse200(MockMaskingResponse):
     status_code = 200
 
     def json(self):
-        return "masked text"
+        return ["masked text" for _ in self.texts]
 
 
 class MockMaskingErrorResponse500(MockMaskingResponse):
@@ -463,18 +651,20 @@ class MockMaskingErrorResponse500(MockMaskingResponse):
         return {}
 
 
-def get_mock_async_client(mock_masking_response: MockMaskingResponse):
-    class MockAsyncClient:
-        def __init__(self, **kwargs):
-            pass
+class MockMaskingClient:
+    """Shared masking client: calling it returns itself, like `get_masking_client`."""
 
-        async def __aenter__(self):
-            return self
+    def __init__(self, mock_masking_response):
+        self.mock_masking_response = mock_masking_response
+        self.requests = []
+
+    def __call__(self):
+        return self
 
-        async def __aexit__(self, *args):
-            pass
+    async def post(self, url, json):
+        self.requests.append({"url": url, "json": json})
+        return self.mock_masking_response(json["texts"])
 
-        async def post(self, url, json):
-            return mock_masking_response()
 
-    return MockAsyncClient
+def get_mock_masking_client(mock_masking_response) -> MockMaskingClient:
+    return MockMaskingClient(mock_masking_response)
@@ -10,6 +10,9 @@ from test.modules.queries.mocks import (
     get_query_service_get_queries_404_mock,
     get_query_service_create_query_201_mock,
     get_query_service_create_query_404_mock,
+    get_query_service_create_query_stream_200_mock,
+    get_query_service_create_query_stream_404_mock,
+    get_query_service_create_query_stream_error_mock,
 )
 
 
@@ -95,3 +98,74 @@ async def test_create_query_404(
     )
 
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_create_query_stream_200(
+    app_test: FastAPI,
+    client_test: AsyncClient,
+):
+    app_test.dependency_overrides[get_query_service] = (
+        get_query_service_create_query_stream_200_mock
+    )
+
+    response: Response = await client_test.post(
+        url=f"{query_router.prefix}/123e4567-e89b-12d3-a456-426614174000/stream",
+        headers={
+            "X-User-Id": "123e4567-e89b-12d3-a456-426614174000",
+            "X-User-Role": "user",
+        },
+        json={"question": "What is the capital of France?"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = response.text.strip().split("\n\n")
+    assert events[0] == 'event: token\ndata: {"delta": "Paris"}'
+    assert events[1].startswith("event: query\ndata: ")
+    assert '"sessionId":"123e4567-e89b-12d3-a456-426614174000"' in events[1]
+
+
+@pytest.mark.asyncio
+async def test_create_query_stream_404(
+    app_test: FastAPI,
+    client_test: AsyncClient,
+):
+    app_test.dependency_overrides[get_query_service] = (
+        get_query_service_create_query_stream_404_mock
+    )
+
+    response: Response = await client_test.post(
+        url=f"{query_router.prefix}/123e4567-e89b-12d3-a456-426614174000/stream",
+        headers={
+            "X-User-Id": "123e4567-e89b-12d3-a456-426614174000",
+            "X-User-Role": "user",
+        },
+        json={"question": "What is the capital of France?"},
+    )
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_create_query_stream_ends_with_error_event(
+    app_test: FastAPI,
+    client_test: AsyncClient,
+):
+    app_test.dependency_overrides[get_query_service] = (
+        get_query_service_create_query_stream_error_mock
+    )
+
+    response: Response = await client_test.post(
+        url=f"{query_router.prefix}/123e4567-e89b-12d3-a456-426614174000/stream",
+        headers={
+            "X-User-Id": "123e4567-e89b-12d3-a456-426614174000",
+            "X-User-Role": "user",
+        },
+        json={"question": "What is the capital of France?"},
+    )
+
+    assert response.status_code == 200
+    assert response.text.strip().split("\n\n")[-1] == (
+        'event: error\ndata: {"detail": "Masking service error"}'
+    )
@@ -0,0 +1,31 @@
+import pytest
+
+from src.modules.env import get_masking_settings
+from src.modules.queries.masking import close_masking_client, get_masking_client
+
+
+@pytest.mark.asyncio
+async def test_masking_client_is_shared_and_closed(monkeypatch: pytest.MonkeyPatch):
+    get_masking_settings.cache_clear()
+    get_masking_client.cache_clear()
+    monkeypatch.setenv("MASKING_SERVICE_URL", "http://masking:3000")
+
+    client = get_masking_client()
+
+    assert get_masking_client() is client
+    assert str(client.base_url) == "http://masking:3000"
+
+    await close_masking_client()
+
+    assert client.is_closed
+    assert get_masking_client.cache_info().currsize == 0
+    get_masking_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_close_masking_client_without_client():
+    get_masking_client.cache_clear()
+
+    await close_masking_client()
+
+    assert get_masking_client.cache_info().currsize == 0
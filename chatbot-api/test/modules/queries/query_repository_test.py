@@ -95,6 +95,24 @@ async def test_delete_query_does_not_raise():
     await repo.delete_query(query_id=MOCK_QUERY_ID, session_id=MOCK_SESSION_ID)
 
 
+@pytest.mark.asyncio
+async def test_delete_queries_batches_keys():
+    deleted_keys: list = []
+
+    class TrackingNoSQLClient(MockNoSQLClientEmpty):
+        async def batch_delete_items(self, table_name: str, keys: list) -> None:
+            deleted_keys.extend(keys)
+
+    repo = QueryRepository(nosql_client=TrackingNoSQLClient())
+
+    await repo.delete_queries(query_ids=["q-1", "q-2"], session_id=MOCK_SESSION_ID)
+
+    assert deleted_keys == [
+        {"id": "q-1", "sessionId": MOCK_SESSION_ID},
+        {"id": "q-2", "sessionId": MOCK_SESSION_ID},
+    ]
+
+
 # ---------------------------------------------------------------------------
 # get_query_repository
 # ---------------------------------------------------------------------------
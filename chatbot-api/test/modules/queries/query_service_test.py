@@ -14,6 +14,7 @@ from test.modules.queries.mocks import (
     MockSessionRepositoryFound,
     MockSessionRepositoryNotFound,
     MockChatbot,
+    MockAnswerCache,
     MockTracer,
     MockTracerThatRaises,
     MockMaskingResponse200,
@@ -21,7 +22,7 @@ from test.modules.queries.mocks import (
     MOCK_SESSION_ID,
     MOCK_QUERY_ID,
     MOCK_TRACE_ID,
-    get_mock_async_client,
+    get_mock_masking_client,
 )
 
 
@@ -169,9 +170,9 @@ async def test_create_query_masks_question_and_answer_when_pii_enabled(
     get_masking_settings.cache_clear()
 
     monkeypatch.setenv("MASK_PII", "true")
+    masking_client = get_mock_masking_client(MockMaskingResponse200)
     monkeypatch.setattr(
-        "src.modules.queries.service.AsyncClient",
-        get_mock_async_client(MockMaskingResponse200),
+        "src.modules.queries.service.get_masking_client", masking_client
     )
 
     service = QueryService(
@@ -186,10 +187,23 @@ async def test_create_query_masks_question_and_answer_when_pii_enabled(
         user_role="user",
         question="What is Python?",
         session_history=None,
+        language="en",
     )
 
     assert result["question"] == "masked text"
     assert result["answer"] == "masked text"
+    # Question and answer are masked in a single request, scoped to the session
+    # and with the language hint of the caller
+    assert masking_client.requests == [
+        {
+            "url": "/mask/batch",
+            "json": {
+                "texts": ["What is Python?", "Simulated answer"],
+                "session_id": MOCK_SESSION_ID,
+                "language": "en",
+            },
+        }
+    ]
 
 
 @pytest.mark.asyncio
@@ -200,8 +214,8 @@ async def test_create_query_raises_500_when_masking_service_fails(
 
     monkeypatch.setenv("MASK_PII", "true")
     monkeypatch.setattr(
-        "src.modules.queries.service.AsyncClient",
-        get_mock_async_client(MockMaskingErrorResponse500),
+        "src.modules.queries.service.get_masking_client",
+        get_mock_masking_client(MockMaskingErrorResponse500),
     )
 
     service = QueryService(
@@ -235,6 +249,7 @@ def test_get_query_service_returns_instance():
         session_repository=MockSessionRepositoryFound(),
         chatbot=MockChatbot(),
         tracer=MockTracer(),
+        answer_cache=MockAnswerCache(),
     )
 
     assert isinstance(service, QueryService)
@@ -341,8 +356,8 @@ async def test_create_query_opens_outer_spans_with_masking(
     get_masking_settings.cache_clear()
     monkeypatch.setenv("MASK_PII", "true")
     monkeypatch.setattr(
-        "src.modules.queries.service.AsyncClient",
-        get_mock_async_client(MockMaskingResponse200),
+        "src.modules.queries.service.get_masking_client",
+        get_mock_masking_client(MockMaskingResponse200),
     )
 
     tracer = MockTracer()
@@ -363,8 +378,7 @@ async def test_create_query_opens_outer_spans_with_masking(
     assert tracer.span_names == [
         "sanitize_input",
         "load_history",
-        "mask_pii_input",
-        "mask_pii_output",
+        "mask_pii",
     ]
 
 
@@ -436,8 +450,8 @@ async def test_create_query_metadata_includes_masking_flags_when_enabled(
     get_masking_settings.cache_clear()
     monkeypatch.setenv("MASK_PII", "true")
     monkeypatch.setattr(
-        "src.modules.queries.service.AsyncClient",
-        get_mock_async_client(MockMaskingResponse200),
+        "src.modules.queries.service.get_masking_client",
+        get_mock_masking_client(MockMaskingResponse200),
     )
 
     tracer = MockTracer()
@@ -484,3 +498,259 @@ async def test_create_query_invokes_chat_generate_once_under_tracing_fault():
     )
 
     assert chatbot.chat_generate_call_count == 1
+
+
+# ---------------------------------------------------------------------------
+# create_query — answer cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_create_query_serves_cached_answer_on_first_turn():
+    chatbot = MockChatbot()
+    tracer = MockTracer()
+    answer_cache = MockAnswerCache(
+        cached={"response": "Cached answer", "tags": [], "context": []}
+    )
+    service = QueryService(
+        query_repository=MockQueryRepositoryEmpty(),
+        session_repository=MockSessionRepositoryFound(),
+        chatbot=chatbot,
+        tracer=tracer,
+        answer_cache=answer_cache,
+    )
+    result = await service.create_query(
+        session_id=MOCK_SESSION_ID,
+        user_id="user-123",
+        user_role="user",
+        question="What is Python?",
+        session_history=None,
+    )
+
+    merged: Dict[str, Any] = {}
+    for call in tracer.metadata_calls:
+        merged.update(call)
+
+    assert result["answer"] == "Cached answer"
+    assert chatbot.chat_generate_call_count == 0
+    assert answer_cache.lookups[0]["index_ids"] == ["docs"]
+    assert answer_cache.stored == []
+    assert tracer.span_names == [
+        "sanitize_input",
+        "load_history",
+        "answer_cache_lookup",
+    ]
+    assert merged["answer_cache.hit"] is True
+
+
+@pytest.mark.asyncio
+async def test_create_query_stores_answer_on_cache_miss(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    get_masking_settings.cache_clear()
+    monkeypatch.setenv("MASK_PII", "true")
+    monkeypatch.setattr(
+        "src.modules.queries.service.get_masking_client",
+        get_mock_masking_client(MockMaskingResponse200),
+    )
+
+    chatbot = MockChatbot()
+    answer_cache = MockAnswerCache()
+    service = QueryService(
+        query_repository=MockQueryRepositoryEmpty(),
+        session_repository=MockSessionRepositoryFound(),
+        chatbot=chatbot,
+        tracer=MockTracer(),
+        answer_cache=answer_cache,
+    )
+    await service.create_query(
+        session_id=MOCK_SESSION_ID,
+        user_id="user-123",
+        user_role="user",
+        question="What is Python?",
+        session_history=None,
+    )
+
+    assert chatbot.chat_generate_call_count == 1
+    # Only the masked question and answer are cached
+    [stored] = answer_cache.stored
+    assert stored["question"] == "masked text"
+    assert stored["response"]["response"] == "masked text"
+    assert stored["masked"] is True
+
+
+@pytest.mark.asyncio
+async def test_create_query_cached_answer_is_not_masked_again(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    get_masking_settings.cache_clear()
+    monkeypatch.setenv("MASK_PII", "true")
+    masking_client = get_mock_masking_client(MockMaskingResponse200)
+    monkeypatch.setattr(
+        "src.modules.queries.service.get_masking_client", masking_client
+    )
+
+    service = QueryService(
+        query_repository=MockQueryRepositoryEmpty(),
+        session_repository=MockSessionRepositoryFound(),
+        chatbot=MockChatbot(),
+        tracer=MockTracer(),
+        answer_cache=MockAnswerCache(
+            cached={"response": "Cached answer", "tags": [], "context": []}
+        ),
+    )
+    result = await service.create_query(
+        session_id=MOCK_SESSION_ID,
+        user_id="user-123",
+        user_role="user",
+        question="What is Python?",
+        session_history=None,
+    )
+
+    assert result["question"] == "masked text"
+    assert result["answer"] == "Cached answer"
+    assert [r["json"]["texts"] for r in masking_client.requests] == [
+        ["What is Python?"]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_create_query_skips_answer_cache_with_history():
+    chatbot = MockChatbot()
+    answer_cache = MockAnswerCache(
+        cached={"response": "Cached answer", "tags": [], "context": []}
+    )
+    service = QueryService(
+        query_repository=MockQueryRepository(),
+        session_repository=MockSessionRepositoryFound(),
+        chatbot=chatbot,
+        tracer=MockTracer(),
+        answer_cache=answer_cache,
+    )
+    result = await service.create_query(
+        session_id=MOCK_SESSION_ID,
+        user_id="user-123",
+        user_role="user",
+        question="What is Python?",
+        session_history=None,
+    )
+
+    assert result["answer"] == "Simulated answer"
+    assert answer_cache.lookups == []
+    assert answer_cache.stored == []
+
+
+@pytest.mark.asyncio
+async def test_create_query_skips_disabled_answer_cache():
+    chatbot = MockChatbot()
+    answer_cache = MockAnswerCache(enabled=False)
+    service = QueryService(
+        query_repository=MockQueryRepositoryEmpty(),
+        session_repository=MockSessionRepositoryFound(),
+        chatbot=chatbot,
+        tracer=MockTracer(),
+        answer_cache=answer_cache,
+    )
+    await service.create_query(
+        session_id=MOCK_SESSION_ID,
+        user_id="user-123",
+        user_role="user",
+        question="What is Python?",
+        session_history=None,
+    )
+
+    assert chatbot.chat_generate_call_count == 1
+    assert answer_cache.lookups == []
+
+
+# ---------------------------------------------------------------------------
+# create_query_stream
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_create_query_stream_yields_events_then_stored_query(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    get_masking_settings.cache_clear()
+    monkeypatch.setenv("MASK_PII", "true")
+    monkeypatch.setattr(
+        "src.modules.queries.service.get_masking_client",
+        get_mock_masking_client(MockMaskingResponse200),
+    )
+
+    tracer = MockTracer()
+    chatbot = MockChatbot(response="Simulated streamed answer")
+    service = QueryService(
+        query_repository=MockQueryRepository(),
+        session_repository=MockSessionRepositoryFound(),
+        chatbot=chatbot,
+        tracer=tracer,
+    )
+    events = await service.create_query_stream(
+        session_id=MOCK_SESSION_ID,
+        user_id="user-123",
+        user_role="user",
+        question="What is Python?",
+        session_history=None,
+    )
+    events = [event async for event in events]
+
+    assert [e["type"] for e in events] == [
+        "tool_call",
+        "token",
+        "token",
+        "token",
+        "query",
+    ]
+    # Masking runs once, on the whole answer, before the Query is stored
+    assert events[-1]["query"]["answer"] == "masked text"
+    assert tracer.span_names.count("mask_pii") == 1
+    assert chatbot.chat_generate_call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_create_query_stream_session_not_found():
+    service = QueryService(
+        query_repository=MockQueryRepository(),
+        session_repository=MockSessionRepositoryNotFound(),
+        chatbot=MockChatbot(),
+        tracer=MockTracer(),
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.create_query_stream(
+            session_id=MOCK_SESSION_ID,
+            user_id="user-123",
+            user_role="user",
+            question="What is Python?",
+            session_history=None,
+        )
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_create_query_stream_serves_cached_answer():
+    chatbot = MockChatbot()
+    service = QueryService(
+        query_repository=MockQueryRepositoryEmpty(),
+        session_repository=MockSessionRepositoryFound(),
+        chatbot=chatbot,
+        tracer=MockTracer(),
+        answer_cache=MockAnswerCache(
+            cached={"response": "Cached answer", "tags": [], "context": []}
+        ),
+    )
+    events = await service.create_query_stream(
+        session_id=MOCK_SESSION_ID,
+        user_id="user-123",
+        user_role="user",
+        question="What is Python?",
+        session_history=None,
+    )
+    events = [event async for event in events]
+
+    assert events[0] == {"type": "token", "delta": "Cached answer"}
+    assert events[-1]["query"]["answer"] == "Cached answer"
+    assert chatbot.chat_generate_call_count == 0
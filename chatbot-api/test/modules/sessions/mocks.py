@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Self
+from typing import AsyncIterator, Any, Dict, List, Optional, Self
 from fastapi import HTTPException, status
 from dos_utility.database.nosql import (
     NoSQLInterface,
@@ -8,7 +8,6 @@ from dos_utility.database.nosql import (
 )
 from src.modules.sessions.env import SessionSettings
 
-
 # ---------------------------------------------------------------------------
 # Settings mocks
 # ---------------------------------------------------------------------------
@@ -52,6 +51,9 @@ MOCK_QUERY_ITEM = {
 
 
 class MockNoSQLClientWithSession(NoSQLInterface):
+    def __init__(self: Self) -> None:
+        self.query_iter_calls: List[Dict[str, Any]] = []
+
     async def __aenter__(self: Self) -> Self:
         return self
 
@@ -88,6 +90,29 @@ class MockNoSQLClientWithSession(NoSQLInterface):
     async def scan(self: Self, table_name: str, **kwargs) -> ScanResult:
         return ScanResult(items=[], last_evaluated_key=None)
 
+    async def batch_put_items(
+        self: Self, table_name: str, items: List[Dict[str, Any]]
+    ) -> None:
+        pass
+
+    async def batch_delete_items(
+        self: Self, table_name: str, keys: List[Dict[str, Any]]
+    ) -> None:
+        pass
+
+    async def query_iter(
+        self: Self, table_name: str, key_conditions: List[KeyCondition], **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        self.query_iter_calls.append({"table_name": table_name, **kwargs})
+        for item in (await self.query(table_name, key_conditions)).items:
+            yield item
+
+    async def scan_iter(
+        self: Self, table_name: str, **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for item in []:
+            yield item
+
 
 class MockNoSQLClientEmpty(NoSQLInterface):
     async def __aenter__(self: Self) -> Self:
@@ -126,6 +151,28 @@ class MockNoSQLClientEmpty(NoSQLInterface):
     async def scan(self: Self, table_name: str, **kwargs) -> ScanResult:
         return ScanResult(items=[], last_evaluated_key=None)
 
+    async def batch_put_items(
+        self: Self, table_name: str, items: List[Dict[str, Any]]
+    ) -> None:
+        pass
+
+    async def batch_delete_items(
+        self: Self, table_name: str, keys: List[Dict[str, Any]]
+    ) -> None:
+        pass
+
+    async def query_iter(
+        self: Self, table_name: str, key_conditions: List[KeyCondition], **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for item in (await self.query(table_name, key_conditions)).items:
+            yield item
+
+    async def scan_iter(
+        self: Self, table_name: str, **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for item in []:
+            yield item
+
 
 # ---------------------------------------------------------------------------
 # Repository mocks (for service tests)
@@ -141,6 +188,12 @@ class MockSessionRepository:
     async def get_sessions(self: Self, user_id: str) -> List[Dict[str, Any]]:
         return [MOCK_SESSION_ITEM]
 
+    async def iter_sessions(
+        self: Self, user_id: str, attributes: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for session in [MOCK_SESSION_ITEM]:
+            yield session
+
     async def create_session(
         self: Self, user_id: str, session_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -164,6 +217,12 @@ class MockSessionRepositoryNotFound:
     async def get_sessions(self: Self, user_id: str) -> List[Dict[str, Any]]:
         return []
 
+    async def iter_sessions(
+        self: Self, user_id: str, attributes: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for session in []:
+            yield session
+
     async def create_session(
         self: Self, user_id: str, session_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -187,6 +246,15 @@ class MockQueryRepository:
     async def delete_query(self: Self, query_id: str, session_id: str) -> None:
         pass
 
+    async def iter_queries(
+        self: Self, session_id: str, attributes: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for query in [MOCK_QUERY_ITEM]:
+            yield query
+
+    async def delete_queries(self: Self, query_ids: List[str], session_id: str) -> None:
+        pass
+
 
 class MockQueryRepositoryEmpty:
     """Mock for QueryRepository that always returns empty results."""
@@ -197,6 +265,15 @@ class MockQueryRepositoryEmpty:
     async def delete_query(self: Self, query_id: str, session_id: str) -> None:
         pass
 
+    async def iter_queries(
+        self: Self, session_id: str, attributes: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for query in []:
+            yield query
+
+    async def delete_queries(self: Self, query_ids: List[str], session_id: str) -> None:
+        pass
+
 
 # ---------------------------------------------------------------------------
 # Service mocks (for controller tests)
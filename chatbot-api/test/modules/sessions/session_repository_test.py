@@ -11,7 +11,6 @@ from test.modules.sessions.mocks import (
     MOCK_USER_ID,
 )
 
-
 # ---------------------------------------------------------------------------
 # get_session
 # ---------------------------------------------------------------------------
@@ -74,6 +73,25 @@ async def test_get_sessions_returns_empty(monkeypatch: pytest.MonkeyPatch):
     assert result == []
 
 
+@pytest.mark.asyncio
+async def test_iter_sessions_forwards_projection(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        session_repository_module, "get_session_settings", lambda: MOCK_SESSION_SETTINGS
+    )
+    nosql_client = MockNoSQLClientWithSession()
+
+    repo = SessionRepository(nosql_client=nosql_client)
+    result = [
+        session
+        async for session in repo.iter_sessions(
+            user_id=MOCK_USER_ID, attributes=["id", "title"]
+        )
+    ]
+
+    assert len(result) == 1
+    assert nosql_client.query_iter_calls[0]["attributes"] == ["id", "title"]
+
+
 # ---------------------------------------------------------------------------
 # create_session
 # ---------------------------------------------------------------------------
@@ -148,8 +148,8 @@ async def test_delete_session_also_deletes_queries():
     deleted_queries: list = []
 
     class TrackingQueryRepository(MockQueryRepository):
-        async def delete_query(self, query_id: str, session_id: str) -> None:
-            deleted_queries.append(query_id)
+        async def delete_queries(self, query_ids: list, session_id: str) -> None:
+            deleted_queries.extend(query_ids)
 
     service = SessionService(
         session_repository=MockSessionRepository(),
@@ -157,7 +157,7 @@ async def test_delete_session_also_deletes_queries():
     )
     await service.delete_session(session_id=MOCK_SESSION_ID, user_id=MOCK_USER_ID)
 
-    # MockQueryRepository.get_queries returns 1 item, so 1 delete should happen
+    # MockQueryRepository.iter_queries yields 1 item, so 1 delete should happen
     assert len(deleted_queries) == 1
 
 
@@ -1,14 +1,24 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from dos_utility.database.nosql import nosql_lifespan
 
 from .env import get_settings
 from .modules.health import health
 from .modules.evaluate import controller as evaluate
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    async with nosql_lifespan():
+        yield
+
+
 app: FastAPI = FastAPI(
     title="Chatbot Evaluate API",
     description="API for interacting with the Chatbot Evaluate service.",
     docs_url="/",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -2,7 +2,7 @@ import json
 import random
 
 from logging import Logger
-from typing import Self, Annotated, Dict, Any, Optional
+from typing import Self, Annotated, Dict, Any, List, Optional
 from fastapi import Depends, HTTPException, status
 from uuid import UUID
 
@@ -21,6 +21,16 @@ from ...env import (
     Settings,
 )
 
+# Query attributes needed to select and report the queries to evaluate
+EVALUATE_ALL_ATTRIBUTES: List[str] = [
+    "id",
+    "createdAt",
+    "feedback",
+    "isEvaluated",
+    "question",
+    "answer",
+]
+
 
 class EvaluationService:
     def __init__(
@@ -149,7 +159,12 @@ class EvaluationService:
         self.logger.info(f"Evaluating all queries for session_id: {session_id}")
 
         session_id_str: str = str(session_id)
-        query_result: QueryResult = await self.nosql.query(
+        found: int = 0
+        pending: List[Dict[str, Any]] = []
+
+        # Stream the session queries fetching only the attributes used below,
+        # keeping in memory just the ones not yet evaluated
+        async for query in self.nosql.query_iter(
             table_name=self.settings.QUERY_TABLENAME,
             key_conditions=[
                 KeyCondition(
@@ -158,13 +173,16 @@ class EvaluationService:
                     value=session_id_str,
                 )
             ],
-        )
+            attributes=EVALUATE_ALL_ATTRIBUTES,
+        ):
+            found += 1
+
+            if not query.get("isEvaluated", False):
+                pending.append(query)
 
-        queries = query_result.items
-        self.logger.info(f"Found {len(queries)} queries for session_id: {session_id}")
+        self.logger.info(f"Found {found} queries for session_id: {session_id}")
 
-        # Filter not yet evaluated, sort newest→oldest, keep only those with feedback, apply limit
-        pending = [q for q in queries if not q.get("isEvaluated", False)]
+        # Sort not yet evaluated newest→oldest, keep only those with feedback, apply limit
         pending.sort(key=lambda q: q.get("createdAt", ""), reverse=True)
         with_feedback = [q for q in pending if q.get("feedback", 0) != 0]
         selected = with_feedback[: self.settings.EVALUATE_UPPER_LIMIT]
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, Self
+from typing import AsyncIterator, Any, Dict, List, Optional, Self
 
 from fastapi import HTTPException, status
 
@@ -9,7 +9,6 @@ from dos_utility.database.nosql import (
     ScanResult,
 )
 
-
 MOCK_USER_ID = "123e4567-e89b-12d3-a456-426614174000"
 MOCK_SESSION_ID = "223e4567-e89b-12d3-a456-426614174001"
 MOCK_QUERY_ID = "323e4567-e89b-12d3-a456-426614174002"
@@ -107,6 +106,28 @@ class MockNoSQLClient(NoSQLInterface):
     async def scan(self: Self, table_name: str, **kwargs) -> ScanResult:
         return ScanResult(items=[], last_evaluated_key=None)
 
+    async def batch_put_items(
+        self: Self, table_name: str, items: List[Dict[str, Any]]
+    ) -> None:
+        pass
+
+    async def batch_delete_items(
+        self: Self, table_name: str, keys: List[Dict[str, Any]]
+    ) -> None:
+        pass
+
+    async def query_iter(
+        self: Self, table_name: str, key_conditions: List[KeyCondition], **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for item in (await self.query(table_name, key_conditions)).items:
+            yield item
+
+    async def scan_iter(
+        self: Self, table_name: str, **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for item in []:
+            yield item
+
 
 # ---------------------------------------------------------------------------
 # Controller dependency mocks
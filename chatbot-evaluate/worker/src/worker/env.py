@@ -26,6 +26,17 @@ class GlobalSettings(BaseSettings):
     log_level: Annotated[PositiveInt, Field(default=20)]
 
 
+class WorkerSettings(BaseSettings):
+    worker_concurrency: Annotated[
+        PositiveInt,
+        Field(default=1, description="Maximum number of evaluations run at the same time"),
+    ]
+    worker_poll_wait_seconds: Annotated[
+        PositiveFloat,
+        Field(default=20.0, description="Seconds an idle worker waits for new evaluations in one receive (long polling). SQS caps it at 20"),
+    ]
+
+
 class NOSQLSettings(BaseSettings):
     query_tablename: str
     session_tablename: str
@@ -40,6 +51,11 @@ def get_global_settings() -> GlobalSettings:
     return GlobalSettings()
 
 
+@lru_cache
+def get_worker_settings() -> WorkerSettings:
+    return WorkerSettings()
+
+
 @lru_cache
 def get_nosql_settings() -> NOSQLSettings:
     return NOSQLSettings()
\ No newline at end of file
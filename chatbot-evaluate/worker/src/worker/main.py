@@ -1,28 +1,105 @@
 import asyncio
 import logging
 
-from dos_utility.queue import get_queue_client_ctx
+from typing import List, Tuple
+from dos_utility.queue import (
+    get_queue_client_ctx,
+    install_stop_handlers,
+    remove_stop_handlers,
+    dequeue_many_or_stop,
+)
 
 from task import process_task
+from env import get_worker_settings, WorkerSettings
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
 
+# Receive wait while evaluations are running: the tokens of the finished ones are
+# acknowledged between receives, so they must not wait for a whole long poll
+_BUSY_POLL_WAIT_SECONDS = 1.0
+
+
 async def main():
+    worker_settings: WorkerSettings = get_worker_settings()
+
+    stop = asyncio.Event()
+    install_stop_handlers(stop)
+
+    # At most worker_concurrency evaluations run at the same time
+    in_flight: set[asyncio.Task] = set()
+    # Ack tokens of the evaluated messages, acknowledged together between receives
+    processed: list[str] = []
+    # First error raised by a task. Errors crash the worker (after draining the
+    # other in-flight tasks) so a failing message is never acknowledged.
+    failure: list[Exception] = []
+
+    async def _run(msg: bytes, ack_token: str) -> None:
+        try:
+            await process_task(body=msg)
+            processed.append(ack_token)
+        except Exception as e:
+            failure.append(e)
+            stop.set()
+
     async with get_queue_client_ctx() as queue_client:
-        logging.info("Worker started and connected to the queue.")
+
+        async def _acknowledge_processed() -> None:
+            if not processed:
+                return
+
+            ack_tokens: list[str] = processed.copy()
+            processed.clear()
+            await queue_client.acknowledge_many(ack_tokens=ack_tokens)
+
+        logging.info(
+            f"Worker started and connected to the queue (concurrency={worker_settings.worker_concurrency})."
+        )
         logging.info("Waiting for tasks...")
 
-        while True:
-            msg, ack_token = await queue_client.dequeue()
+        try:
+            while not stop.is_set():
+                await _acknowledge_processed()
+
+                free_slots: int = worker_settings.worker_concurrency - len(in_flight)
+
+                if free_slots == 0:
+                    await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+
+                # Long-poll only when idle
+                wait: float = worker_settings.worker_poll_wait_seconds
+
+                if in_flight:
+                    wait = min(wait, _BUSY_POLL_WAIT_SECONDS)
+
+                messages: List[Tuple[bytes, str]] = await dequeue_many_or_stop(
+                    queue_client=queue_client,
+                    stop=stop,
+                    max_messages=free_slots,
+                    wait=wait,
+                )
+
+                for msg, ack_token in messages:
+                    task = asyncio.create_task(_run(msg=msg, ack_token=ack_token))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+        finally:
+            if in_flight:
+                logging.info(f"Draining {len(in_flight)} in-flight tasks...")
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+            remove_stop_handlers()
+
+        # The evaluations completed before and while draining are kept
+        await _acknowledge_processed()
 
-            if msg is not None:
-                await process_task(body=msg)
+        if failure:
+            raise failure[0]
 
-                if ack_token is not None:
-                    await queue_client.acknowledge(ack_token=ack_token)
+        logging.info("Stop signal received. Worker stopped.")
 
 
 if __name__ == "__main__":
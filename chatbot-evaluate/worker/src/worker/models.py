@@ -5,6 +5,7 @@ from google.genai import types
 from logging import Logger
 from ragas.llms import llm_factory
 
+from dos_utility.embedding_cache import cached_embed_model
 from dos_utility.utils.logger import get_logger
 
 from env import get_global_settings, GlobalSettings
@@ -93,7 +94,8 @@ def get_embed_model(
         retry_min_seconds: Override the minimum retry wait time from SETTINGS.
 
     Returns:
-        BaseEmbedding: A LlamaIndex-compatible embedding model instance.
+        BaseEmbedding: A LlamaIndex-compatible embedding model instance, wrapped
+            with the embedding cache when EMBEDDING_CACHE_ENABLED is set.
     """
     if provider == "google":
         from llama_index.embeddings.google_genai import GoogleGenAIEmbedding
@@ -115,4 +117,6 @@ def get_embed_model(
             embed_dim,
         )
 
-    return embed_model
+    return cached_embed_model(
+        embed_model=embed_model, embed_dim=embed_dim, task_type=task_type
+    )
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 
 from src.worker import main
@@ -39,7 +40,54 @@ async def test_main_acknowledges_after_successful_processing(
     monkeypatch.setattr(main, "get_queue_client_ctx", get_queue_client_loop_ctx_mock)
     monkeypatch.setattr(main, "process_task", process_task_noop_mock)
 
-    # QueueClientLoopMock raises StopAsyncIteration from acknowledge() on the
+    # QueueClientLoopMock raises StopAsyncIteration from acknowledge_many() on the
     # first ack, proving the ack path was actually reached.
     with pytest.raises(expected_exception=StopAsyncIteration):
         await main.main()
+
+
+class _ConcurrentWorkerSettingsMock:
+    worker_concurrency = 2
+    worker_poll_wait_seconds = 20.0
+
+
+@pytest.mark.asyncio
+async def test_main_runs_tasks_concurrently_and_drains_on_error(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """With concurrency > 1 several evaluations run at once, and an error stops
+    the loop only after the other in-flight evaluations have completed.
+
+    Regression risk: cancelling the in-flight evaluations on error would drop
+    scores that were about to be persisted.
+    """
+    monkeypatch.setattr(main, "get_queue_client_ctx", get_queue_client_ctx_mock)
+    monkeypatch.setattr(
+        main, "get_worker_settings", lambda: _ConcurrentWorkerSettingsMock()
+    )
+
+    running = [0]
+    max_running = [0]
+    completed = []
+
+    async def _process_task(body: bytes) -> None:
+        running[0] += 1
+        max_running[0] = max(max_running[0], running[0])
+        await asyncio.sleep(0.01)
+        running[0] -= 1
+
+        if not completed:
+            completed.append(body)
+            raise Exception("Simulated processing error")
+
+        completed.append(body)
+
+    monkeypatch.setattr(main, "process_task", _process_task)
+
+    with pytest.raises(
+        expected_exception=Exception, match="Simulated processing error"
+    ):
+        await main.main()
+
+    assert max_running[0] == 2
+    assert len(completed) == 2
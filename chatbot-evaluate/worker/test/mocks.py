@@ -19,10 +19,12 @@ class QueueClientMock:
     async def __aexit__(self: Self, exc_type, exc_val, exc_tb) -> None:
         pass
 
-    async def dequeue(self: Self) -> Tuple[Optional[bytes], Optional[str]]:
-        return b'{"task": "example"}', "ack_token_example"
+    async def dequeue_many(
+        self: Self, max_messages: int = 10, wait: float = 20.0
+    ) -> List[Tuple[bytes, str]]:
+        return [(b'{"task": "example"}', "ack_token_example")] * max_messages
 
-    async def acknowledge(self: Self, ack_token: str) -> None:
+    async def acknowledge_many(self: Self, ack_tokens: List[str]) -> None:
         pass
 
 
@@ -36,10 +38,12 @@ class QueueClientLoopMock:
     async def __aexit__(self: Self, exc_type, exc_val, exc_tb) -> None:
         pass
 
-    async def dequeue(self: Self) -> Tuple[Optional[bytes], Optional[str]]:
-        return b'{"task": "example"}', "ack_token_example"
+    async def dequeue_many(
+        self: Self, max_messages: int = 10, wait: float = 20.0
+    ) -> List[Tuple[bytes, str]]:
+        return [(b'{"task": "example"}', "ack_token_example")] * max_messages
 
-    async def acknowledge(self: Self, ack_token: str) -> None:
+    async def acknowledge_many(self: Self, ack_tokens: List[str]) -> None:
         self._call_count += 1
 
         if self._call_count >= 1:
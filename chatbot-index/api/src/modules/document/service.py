@@ -10,7 +10,7 @@ from llama_index.core.vector_stores import (
     MetadataFilters,
 )
 
-from dos_utility.vector_db import VectorDBInterface, get_vector_db, SearchResult
+from dos_utility.vector_db import VectorDBInterface, get_vector_db
 from dos_utility.storage import StorageInterface, get_storage
 from dos_utility.queue import QueueInterface, get_queue_client
 from dos_utility.utils.logger import get_logger
@@ -24,7 +24,6 @@ from ...env import (
     Settings,
 )
 
-
 ALLOWED_EXTENSIONS = {".pdf", ".md", ".txt"}
 
 
@@ -130,31 +129,21 @@ class DocumentService:
         )  # Delete object from storage
         self.logger.debug("Document deleted from storage")
 
-        # Delete all vector db chunks for the specified document (1000 at a time)
-        while True:
-            vdb_objects: List[SearchResult] = await self.vdb.filter_search(
-                index_name=index_id,
-                filters=MetadataFilters(
-                    filters=[
-                        MetadataFilter(
-                            key="filename", operator=FilterOperator.EQ, value=object_key
-                        ),
-                    ]
-                ),
-                max_results=1000,
-            )
-            vdb_objects_len: int = len(vdb_objects)
-
-            self.logger.debug(f"Found {vdb_objects_len} chunks to delete")
-
-            if vdb_objects_len == 0:
-                self.logger.debug("No more chunks to delete")
-                break
+        # Delete all vector db chunks for the specified document, server-side
+        deleted: int = await self.vdb.delete_by_filter(
+            index_name=index_id,
+            filters=MetadataFilters(
+                filters=[
+                    MetadataFilter(
+                        key="filename", operator=FilterOperator.EQ, value=object_key
+                    ),
+                ]
+            ),
+        )
+        self.logger.debug(f"Deleted {deleted} chunks")
 
-            await self.vdb.delete_objects(
-                index_name=index_id, ids=[obj.id for obj in vdb_objects]
-            )  # Delete chunks from vector db
-            self.logger.debug(f"Deleted {vdb_objects_len} chunks")
+        # Its hidden versions would otherwise stay in the filter of every search
+        await self.vdb.delete_versions(index_name=index_id, filename=object_key)
 
         self.logger.info(f"Document '{document_name}' successfully deleted")
 
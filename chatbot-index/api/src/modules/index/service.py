@@ -6,6 +6,7 @@ from fastapi import Depends, HTTPException, status
 from dos_utility.vector_db import (
     VectorDBInterface,
     get_vector_db,
+    get_index_catalog,
     IndexCreationException,
     IndexDeletionException,
 )
@@ -33,9 +34,8 @@ class IndexService:
 
     async def verify_index_exists(self: Self, index_id: str) -> None:
         """If index does not exists, it raises an HTTPException"""
-        existing_indexes: List[str] = await self.vdb.get_indexes()
-
-        if index_id not in existing_indexes:
+        # Served from the process-wide index catalog instead of listing every index
+        if not await get_index_catalog().exists(vdb=self.vdb, index_name=index_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Index '{index_id}' does not exist",
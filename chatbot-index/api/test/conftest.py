@@ -17,6 +17,16 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_index_catalog():
+    from dos_utility.vector_db import get_index_catalog
+
+    # The index catalog is process-wide, start every test with an empty one
+    get_index_catalog.cache_clear()
+    yield
+    get_index_catalog.cache_clear()
+
+
 @pytest_asyncio.fixture
 async def app_test():
     from src.main import app
@@ -48,6 +48,12 @@ class VectorDBMock:
     async def delete_objects(self: Self, index_name: str, ids: List[str]) -> None:
         pass
 
+    async def delete_by_filter(self: Self, index_name: str, filters) -> int:
+        return 0
+
+    async def delete_versions(self: Self, index_name: str, filename: str) -> None:
+        pass
+
     async def filter_search(
         self: Self, index_name: str, filters, max_results: int = 1000
     ) -> list:
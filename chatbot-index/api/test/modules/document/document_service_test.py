@@ -241,6 +241,7 @@ async def test_delete_document_success():
     remaining = storage.list_objects(bucket=MOCK_BUCKET_NAME)
     assert not any(o.key == object_key for o in remaining)
     assert object_key in vdb.deleted_ids
+    assert vdb.deleted_versions == [object_key]
 
 
 @pytest.mark.asyncio
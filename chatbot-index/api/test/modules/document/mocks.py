@@ -4,7 +4,6 @@ from fastapi import HTTPException, status
 from dos_utility.storage import ObjectInfo
 from dos_utility.vector_db import SearchResult
 
-
 # ---------------------------------------------------------------------------
 # Shared data fixtures
 # ---------------------------------------------------------------------------
@@ -65,6 +64,7 @@ class MockVectorDBWithIndexes:
             list(indexes) if indexes is not None else list(MOCK_EXISTING_INDEXES)
         )
         self.deleted_ids: List[str] = []
+        self.deleted_versions: List[str] = []
 
     async def get_indexes(self: Self) -> List[str]:
         return list(self._indexes)
@@ -72,6 +72,19 @@ class MockVectorDBWithIndexes:
     async def delete_objects(self: Self, index_name: str, ids: List[str]) -> None:
         self.deleted_ids.extend(ids)
 
+    async def delete_by_filter(self: Self, index_name: str, filters) -> int:
+        deleted: List[str] = [
+            f.value
+            for f in filters.filters
+            if f.key == "filename" and f.value not in self.deleted_ids
+        ]
+        self.deleted_ids.extend(deleted)
+
+        return len(deleted)
+
+    async def delete_versions(self: Self, index_name: str, filename: str) -> None:
+        self.deleted_versions.append(filename)
+
     async def filter_search(
         self: Self, index_name: str, filters, max_results: int = 1000
     ) -> List[SearchResult]:
@@ -94,6 +107,12 @@ class MockVectorDBEmpty:
     async def delete_objects(self: Self, index_name: str, ids: List[str]) -> None:
         pass
 
+    async def delete_by_filter(self: Self, index_name: str, filters) -> int:
+        return 0
+
+    async def delete_versions(self: Self, index_name: str, filename: str) -> None:
+        pass
+
     async def filter_search(
         self: Self, index_name: str, filters, max_results: int = 1000
     ) -> List[SearchResult]:
@@ -1,6 +1,10 @@
+import asyncio
+import time
+
 from functools import lru_cache
 from logging import Logger
 
+from dos_utility.embedding_cache import CachedEmbedding, get_embedding_cache
 from dos_utility.vector_db import ObjectData
 from dos_utility.utils.logger import get_logger
 
@@ -9,6 +13,12 @@ from models import get_embed_model, BaseEmbedding
 from env import get_global_settings
 
 
+def is_rate_limit_error(exception: BaseException) -> bool:
+    """Checks whether the exception is a provider rate-limit (HTTP 429) error."""
+    code = getattr(exception, "code", None) or getattr(exception, "status_code", None)
+    return code == 429
+
+
 class Embedder:
     def __init__(
         self,
@@ -20,6 +30,8 @@ class Embedder:
         embed_retries: int,
         embed_retry_min_seconds: int,
         model_api_key: str,
+        embed_max_concurrency: int = 4,
+        embed_rate_limit_retries: int = 5,
     ):
         settings = get_global_settings()
         self._logger: Logger = get_logger(name=__name__, level=settings.log_level)
@@ -31,6 +43,8 @@ class Embedder:
         self.embed_retries = embed_retries
         self.embed_retry_min_seconds = embed_retry_min_seconds
         self.model_api_key = model_api_key
+        self.embed_max_concurrency = embed_max_concurrency
+        self.embed_rate_limit_retries = embed_rate_limit_retries
         self.embed_model: BaseEmbedding = get_embed_model(
             provider=self.provider,
             model_id=self.embed_model_id,
@@ -41,21 +55,94 @@ class Embedder:
             retry_min_seconds=self.embed_retry_min_seconds,
             api_key=self.model_api_key,
         )
+        # Monotonic deadline shared by every in-flight batch: when the provider
+        # rate limits one batch, the whole stage pauses until it expires.
+        self._cooldown_until: float = 0.0
 
-    def transform(self, chunks: list[ChunkData]) -> list[ObjectData]:
-        embedded_chunks = []
+    async def transform(self, chunks: list[ChunkData]) -> list[ObjectData]:
+        """Embeds the chunks in batches of `embed_batch_size`, keeping at most
+        `embed_max_concurrency` batches in flight. The output preserves the
+        order of the input chunks.
+        """
+        if not chunks:
+            return []
+
+        batches = [
+            chunks[start : start + self.embed_batch_size]
+            for start in range(0, len(chunks), self.embed_batch_size)
+        ]
+        semaphore = asyncio.Semaphore(self.embed_max_concurrency)
+        started_at = time.perf_counter()
 
-        for idx, chunk in enumerate(chunks):
-            if (idx + 1) % max(1, len(chunks) // 10) == 0 or idx == 0:
-                self._logger.debug(
-                    f"Embedding progress: {idx + 1}/{len(chunks)} chunks"
+        async def _run(batch_idx: int, batch: list[ChunkData]) -> list[list[float]]:
+            async with semaphore:
+                return await self._embed_batch(
+                    batch_idx=batch_idx, n_batches=len(batches), batch=batch
                 )
 
-            embedding = self.embed_model.get_text_embedding(chunk.content)
-            embedded_chunks.append(ObjectData(**chunk.model_dump(), vector=embedding))
+        results = await asyncio.gather(
+            *(_run(batch_idx, batch) for batch_idx, batch in enumerate(batches))
+        )
+
+        elapsed = time.perf_counter() - started_at
+        self._logger.info(
+            f"Embedded {len(chunks)} chunks in {len(batches)} batches in {elapsed:.2f}s "
+            f"({len(chunks) / max(elapsed, 1e-6):.1f} chunks/s, concurrency={self.embed_max_concurrency})"
+        )
+
+        if isinstance(self.embed_model, CachedEmbedding):
+            self._logger.info(f"Embedding cache stats: {get_embedding_cache().stats()}")
+
+        embedded_chunks = []
+
+        for batch, embeddings in zip(batches, results):
+            for chunk, embedding in zip(batch, embeddings):
+                embedded_chunks.append(
+                    ObjectData(**chunk.model_dump(), vector=embedding)
+                )
 
         return embedded_chunks
 
+    async def _embed_batch(
+        self, batch_idx: int, n_batches: int, batch: list[ChunkData]
+    ) -> list[list[float]]:
+        texts = [chunk.content for chunk in batch]
+
+        for attempt in range(1, self.embed_rate_limit_retries + 1):
+            cooldown = self._cooldown_until - time.monotonic()
+
+            if cooldown > 0:
+                await asyncio.sleep(cooldown)
+
+            started_at = time.perf_counter()
+
+            try:
+                embeddings = await self.embed_model.aget_text_embedding_batch(texts)
+            except Exception as e:
+                if (
+                    not is_rate_limit_error(e)
+                    or attempt == self.embed_rate_limit_retries
+                ):
+                    raise
+
+                backoff = self.embed_retry_min_seconds * 2 ** (attempt - 1)
+                self._cooldown_until = max(
+                    self._cooldown_until, time.monotonic() + backoff
+                )
+                self._logger.warning(
+                    f"Embedding batch {batch_idx + 1}/{n_batches} rate limited "
+                    f"(attempt {attempt}/{self.embed_rate_limit_retries}). Backing off {backoff:.1f}s"
+                )
+                continue
+
+            latency = time.perf_counter() - started_at
+            self._logger.debug(
+                f"Embedding batch {batch_idx + 1}/{n_batches}: {len(texts)} chunks in {latency:.2f}s "
+                f"({len(texts) / max(latency, 1e-6):.1f} chunks/s)"
+            )
+
+            return embeddings
+
 
 @lru_cache
 def get_embedder(
@@ -67,6 +154,8 @@ def get_embedder(
     embed_retries: int,
     embed_retry_min_seconds: int,
     model_api_key: str,
+    embed_max_concurrency: int = 4,
+    embed_rate_limit_retries: int = 5,
 ) -> Embedder:
     return Embedder(
         provider=provider,
@@ -77,4 +166,6 @@ def get_embedder(
         embed_retries=embed_retries,
         embed_retry_min_seconds=embed_retry_min_seconds,
         model_api_key=model_api_key,
+        embed_max_concurrency=embed_max_concurrency,
+        embed_rate_limit_retries=embed_rate_limit_retries,
     )
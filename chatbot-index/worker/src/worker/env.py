@@ -1,7 +1,7 @@
 from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Annotated, Literal
-from pydantic import Field, PositiveInt, PositiveFloat
+from pydantic import Field, NonNegativeInt, PositiveInt, PositiveFloat
 
 
 class TaskSettings(BaseSettings):
@@ -24,12 +24,83 @@ class TaskSettings(BaseSettings):
     embed_task: Annotated[str, Field(default="RETRIEVAL_DOCUMENT")]
     embed_retries: Annotated[PositiveInt, Field(default=3)]
     embed_retry_min_seconds: Annotated[PositiveFloat, Field(default=1.0)]
+    embed_max_concurrency: Annotated[
+        PositiveInt,
+        Field(default=4, description="Maximum number of embedding batches in flight"),
+    ]
+    embed_rate_limit_retries: Annotated[
+        PositiveInt,
+        Field(
+            default=5,
+            description="Attempts per batch when the provider keeps rate limiting",
+        ),
+    ]
+
+    # Ingestion settings
+    ingest_streaming: Annotated[
+        bool,
+        Field(
+            default=False,
+            description="Read, chunk, embed and store documents page by page in bounded windows",
+        ),
+    ]
+    ingest_window_size: Annotated[
+        PositiveInt,
+        Field(
+            default=500,
+            description="Chunks embedded and stored per window in streaming mode",
+        ),
+    ]
+    ingest_dedup: Annotated[
+        bool,
+        Field(
+            default=True,
+            description="Skip unchanged documents and reuse the vectors of unchanged chunks",
+        ),
+    ]
+    ingest_dedup_max_chunks: Annotated[
+        PositiveInt,
+        Field(
+            default=10000,
+            description="Stored chunks read back per document to reuse their vectors",
+        ),
+    ]
+    ingest_abandon_after_seconds: Annotated[
+        PositiveFloat,
+        Field(
+            default=3600.0,
+            description="Age after which a staged version is deemed abandoned by a failed ingestion and garbage collected",
+        ),
+    ]
 
 
 class GlobalSettings(BaseSettings):
     log_level: Annotated[PositiveInt, Field(default=20)]
 
 
+class WorkerSettings(BaseSettings):
+    worker_concurrency: Annotated[
+        PositiveInt,
+        Field(
+            default=1, description="Maximum number of tasks processed at the same time"
+        ),
+    ]
+    worker_process_pool_size: Annotated[
+        NonNegativeInt,
+        Field(
+            default=0,
+            description="Worker processes used to parse and chunk documents. 0 runs them in the main process",
+        ),
+    ]
+    worker_poll_wait_seconds: Annotated[
+        PositiveFloat,
+        Field(
+            default=20.0,
+            description="Seconds an idle worker waits for new tasks in one receive (long polling). SQS caps it at 20",
+        ),
+    ]
+
+
 class StorageSettings(BaseSettings):
     index_documents_bucket_name: str
 
@@ -44,6 +115,11 @@ def get_global_settings() -> GlobalSettings:
     return GlobalSettings()
 
 
+@lru_cache
+def get_worker_settings() -> WorkerSettings:
+    return WorkerSettings()
+
+
 @lru_cache
 def get_storage_settings() -> StorageSettings:
     return StorageSettings()
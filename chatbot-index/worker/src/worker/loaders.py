@@ -1,5 +1,10 @@
+import hashlib
+import os
+import tempfile
+
+from contextlib import contextmanager
 from functools import lru_cache
-from typing import Annotated, BinaryIO, Literal
+from typing import Annotated, BinaryIO, Iterator, Literal, Optional
 from pydantic import Field, BaseModel, ConfigDict
 import pymupdf
 
@@ -48,6 +53,10 @@ class Document(BaseModel):
     content: Annotated[
         list[str], Field(description="Content of each page of the object")
     ]
+    content_hash: Annotated[
+        Optional[str],
+        Field(default=None, description="SHA-256 of the raw bytes of the object"),
+    ]
 
 
 class PDFLoader:
@@ -59,11 +68,26 @@ class PDFLoader:
         ]
         return content
 
+    def iter_pages(self, path: str) -> Iterator[str]:
+        """Yields the text of each page, loading one page at a time."""
+        with pymupdf.open(path) as document:
+            for number in range(document.page_count):
+                yield document.load_page(number).get_text()
+
 
 class TextLoader:
+    # Approximate number of characters yielded per block by `iter_pages`
+    block_size: int = 64 * 1024
+
     def read(self, data: BinaryIO):
         return [data.decode()]
 
+    def iter_pages(self, path: str) -> Iterator[str]:
+        """Yields the file in blocks of whole lines of about `block_size` characters."""
+        with open(path, encoding="utf-8") as file:
+            while lines := file.readlines(self.block_size):
+                yield "".join(lines).removesuffix("\n")
+
 
 class DocumentLoader:
     def __init__(self, bucket_name: str):
@@ -77,10 +101,33 @@ class DocumentLoader:
         loader = self._loaders[doc_type]
         data = self._storage.get_object(bucket=self.bucket_name, name=filename)
         content = loader.read(data)
-        document = Document(filename=filename, content=content)
+        document = Document(
+            filename=filename,
+            content=content,
+            content_hash=hashlib.sha256(data).hexdigest(),
+        )
 
         return document
 
+    @contextmanager
+    def open_pages(self, message: Message) -> Iterator[tuple[str, Iterator[str]]]:
+        """Downloads the object to a temporary file and yields the SHA-256 of
+        its raw bytes together with a lazy iterator over its pages. The file is
+        removed when the context exits.
+        """
+        loader = self._loaders[message.document_type]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "document")
+            self._storage.download_object(
+                bucket=self.bucket_name, name=message.object_key, path=path
+            )
+
+            with open(path, "rb") as file:
+                content_hash = hashlib.file_digest(file, "sha256").hexdigest()
+
+            yield content_hash, loader.iter_pages(path)
+
 
 @lru_cache
 def get_document_loader(bucket_name: str) -> DocumentLoader:
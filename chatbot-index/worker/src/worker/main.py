@@ -1,42 +1,140 @@
 import asyncio
 
+from concurrent.futures import Executor, ProcessPoolExecutor
 from logging import Logger
-from dos_utility.queue import get_queue_client_ctx
+from typing import List, Optional, Tuple
+from dos_utility.queue import (
+    get_queue_client_ctx,
+    install_stop_handlers,
+    remove_stop_handlers,
+    dequeue_many_or_stop,
+)
 from dos_utility.utils.logger import get_logger
 
 from task import process_task
-from env import get_global_settings, GlobalSettings
+from env import (
+    get_global_settings,
+    GlobalSettings,
+    get_worker_settings,
+    WorkerSettings,
+)
+
+
+# Receive wait while tasks are running: the tokens of the finished ones are
+# acknowledged between receives, so they must not wait for a whole long poll
+_BUSY_POLL_WAIT_SECONDS = 1.0
+
+
+async def _handle_message(
+    msg: bytes,
+    executor: Optional[Executor],
+    logger: Logger,
+) -> bool:
+    """Processes a task. Returns whether it succeeded, i.e. can be acknowledged."""
+    try:
+        logger.info("Task found. Start processing...")
+        logger.debug(f"Message content: {msg}")
+
+        await process_task(body=msg, executor=executor)
+
+        logger.info("Task correctly processed")
+
+        return True
+    except Exception as e:
+        logger.error(f"Error processing task: {str(e)}", exc_info=True)
+
+        return False
 
 
 async def main():
     settings: GlobalSettings = get_global_settings()
+    worker_settings: WorkerSettings = get_worker_settings()
     logger: Logger = get_logger(name=__name__, level=settings.log_level)
 
+    stop = asyncio.Event()
+    install_stop_handlers(stop)
+
+    # At most worker_concurrency messages are processed at the same time
+    in_flight: set[asyncio.Task] = set()
+    # Ack tokens of the processed messages, acknowledged together between receives
+    processed: list[str] = []
+    executor: Optional[Executor] = (
+        ProcessPoolExecutor(max_workers=worker_settings.worker_process_pool_size)
+        if worker_settings.worker_process_pool_size > 0
+        else None
+    )
+
+    async def _run(msg: bytes, ack_token: str) -> None:
+        if await _handle_message(msg=msg, executor=executor, logger=logger):
+            processed.append(ack_token)
+
     async with get_queue_client_ctx() as queue_client:
-        logger.info("Worker started and connected to the queue.")
-        logger.info("Waiting for tasks...")
 
-        while True:
+        async def _acknowledge_processed() -> None:
+            if not processed:
+                return
+
+            ack_tokens: list[str] = processed.copy()
+            processed.clear()
+
             try:
-                msg, ack_token = await queue_client.dequeue()
+                await queue_client.acknowledge_many(ack_tokens=ack_tokens)
+                logger.debug(
+                    f"{len(ack_tokens)} messages acknowledged and removed from queue"
+                )
+            except Exception as e:
+                logger.error(f"Error acknowledging tasks: {str(e)}", exc_info=True)
+
+        logger.info(
+            f"Worker started and connected to the queue (concurrency={worker_settings.worker_concurrency}, "
+            f"process_pool_size={worker_settings.worker_process_pool_size})."
+        )
+        logger.info("Waiting for tasks...")
 
-                if msg is not None:
-                    logger.info("Task found. Start processing...")
-                    logger.debug(f"Message content: {msg}")
+        try:
+            while not stop.is_set():
+                await _acknowledge_processed()
 
-                    await process_task(body=msg)
+                free_slots: int = worker_settings.worker_concurrency - len(in_flight)
 
-                    logger.info("Task correctly processed")
+                if free_slots == 0:
+                    await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    continue
 
-                    if ack_token is not None:
-                        await queue_client.acknowledge(ack_token=ack_token)
-                        logger.debug("Message acknowledged and removed from queue")
-                    else:
-                        logger.warning(
-                            "No ack token received - message may not be removed from queue"
-                        )
-            except Exception as e:
-                logger.error(f"Error processing task: {str(e)}", exc_info=True)
+                # Long-poll only when idle
+                wait: float = worker_settings.worker_poll_wait_seconds
+
+                if in_flight:
+                    wait = min(wait, _BUSY_POLL_WAIT_SECONDS)
+
+                try:
+                    messages: List[Tuple[bytes, str]] = await dequeue_many_or_stop(
+                        queue_client=queue_client,
+                        stop=stop,
+                        max_messages=free_slots,
+                        wait=wait,
+                    )
+                except Exception as e:
+                    logger.error(f"Error receiving tasks: {str(e)}", exc_info=True)
+                    continue
+
+                for msg, ack_token in messages:
+                    task = asyncio.create_task(_run(msg=msg, ack_token=ack_token))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+
+            logger.info("Stop signal received. No more tasks will be accepted.")
+        finally:
+            if in_flight:
+                logger.info(f"Draining {len(in_flight)} in-flight tasks...")
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+            await _acknowledge_processed()
+
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+            remove_stop_handlers()
 
 
 if __name__ == "__main__":  # pragma: no cover
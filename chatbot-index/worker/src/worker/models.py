@@ -3,6 +3,7 @@ from typing import Literal, Optional
 from google.genai import types
 from llama_index.core.base.embeddings.base import BaseEmbedding
 
+from dos_utility.embedding_cache import cached_embed_model
 from dos_utility.utils.logger import get_logger
 
 from env import get_global_settings
@@ -33,7 +34,8 @@ def get_embed_model(
         retry_min_seconds: Override the minimum retry wait time from SETTINGS.
 
     Returns:
-        BaseEmbedding: A LlamaIndex-compatible embedding model instance.
+        BaseEmbedding: A LlamaIndex-compatible embedding model instance, wrapped
+            with the embedding cache when EMBEDDING_CACHE_ENABLED is set.
     """
     if provider == "google":
         from llama_index.embeddings.google_genai import GoogleGenAIEmbedding
@@ -58,4 +60,6 @@ def get_embed_model(
             f"Embedding model successfully initialized - provider={provider}, model_id={model_id}"
         )
 
-    return embed_model
+    return cached_embed_model(
+        embed_model=embed_model, embed_dim=embed_dim, task_type=task_type
+    )
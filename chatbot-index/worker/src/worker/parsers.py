@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import Annotated
+from typing import Annotated, Iterable, Iterator
 from pydantic import Field, BaseModel
 from llama_index.core.node_parser import SentenceSplitter
 from llama_index.core import Document as RefDocument
@@ -44,6 +44,39 @@ class Parser:
 
         return chunks
 
+    def transform_stream(
+        self, filename: str, pages: Iterable[str]
+    ) -> Iterator[ChunkData]:
+        """Chunks the pages incrementally, holding at most one page plus one
+        chunk in memory. The last chunk of each page is carried over and
+        re-split together with the next page, so chunks and their overlap
+        span page boundaries as in `transform`.
+        """
+        chunk_id = 0
+        carry = ""
+
+        for page in pages:
+            text = f"{carry}\n{page}" if carry else page
+            text_chunks = self._splitter.split_text(text)
+
+            if not text_chunks:
+                continue
+
+            carry = text_chunks.pop()
+
+            for text_chunk in text_chunks:
+                yield ChunkData(
+                    filename=filename, chunk_id=chunk_id, content=text_chunk
+                )
+                chunk_id += 1
+
+        if carry:
+            for text_chunk in self._splitter.split_text(carry):
+                yield ChunkData(
+                    filename=filename, chunk_id=chunk_id, content=text_chunk
+                )
+                chunk_id += 1
+
 
 @lru_cache
 def get_parser(chunk_size: int, chunk_overlap: int) -> Parser:
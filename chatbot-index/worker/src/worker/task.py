@@ -1,12 +1,19 @@
+import asyncio
+import hashlib
 import json
+import time
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager
+from itertools import islice
 from logging import Logger
-from typing import Any
+from typing import Any, AsyncIterator, Iterator, Optional
+from uuid import uuid4
 from llama_index.core.vector_stores import MetadataFilter, MetadataFilters
 from llama_index.core.vector_stores.types import FilterOperator
 
-from loaders import get_document_loader, Message, Document
-from parsers import get_parser, ChunkData
-from embedder import get_embedder
+from loaders import get_document_loader, DocumentLoader, Message, Document
+from parsers import get_parser, Parser, ChunkData
+from embedder import get_embedder, Embedder
 from env import (
     get_task_settings,
     TaskSettings,
@@ -16,15 +23,36 @@ from env import (
     StorageSettings,
 )
 
-from dos_utility.vector_db import get_vector_db_ctx, ObjectData
+from dos_utility.vector_db import (
+    get_vector_db_ctx,
+    get_index_catalog,
+    ObjectData,
+    VectorDBInterface,
+)
 from dos_utility.utils.logger import get_logger
 
 
-async def process_task(body: bytes) -> None:
+def read_and_chunk(
+    message: Message, bucket_name: str, chunk_size: int, chunk_overlap: int
+) -> tuple[Optional[str], list[ChunkData]]:
+    """Reads and chunks a document, returning the hash of its raw bytes and its
+    chunks. Used as the entry point of the process pool, so it only takes
+    picklable arguments and builds its own loader and parser.
+    """
+    loader = get_document_loader(bucket_name=bucket_name)
+    parser = get_parser(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    document: Document = loader.read(message=message)
+
+    return document.content_hash, parser.transform(document=document)
+
+
+async def process_task(body: bytes, executor: Optional[Executor] = None) -> None:
     """Process a task with the given body.
 
     Args:
         body (bytes): The body of the task to be processed.
+        executor (Optional[Executor]): Process pool used to read and chunk the
+            document outside the event loop. Ignored in streaming mode.
     """
     settings: GlobalSettings = get_global_settings()
     task_settings: TaskSettings = get_task_settings()
@@ -49,72 +77,475 @@ async def process_task(body: bytes) -> None:
         embed_retries=task_settings.embed_retries,
         embed_retry_min_seconds=task_settings.embed_retry_min_seconds,
         model_api_key=task_settings.model_api_key,
+        embed_max_concurrency=task_settings.embed_max_concurrency,
+        embed_rate_limit_retries=task_settings.embed_rate_limit_retries,
     )
 
     logger.debug("Parsing task body...")
     converted_data: Any = json.loads(body.decode("utf-8"))
     message = Message(**converted_data)
 
+    # Every ingestion stores its chunks under a new version of the document,
+    # which replaces the current one only once all of them are stored
+    version: str = uuid4().hex
     logger.info(
-        f"Processing document '{message.object_key}' (index: '{message.index_id}')"
+        f"Processing document '{message.object_key}' (index: '{message.index_id}', version: '{version}')"
     )
 
-    document: Document = loader.read(message=message)
-    logger.debug(
-        f"Document '{message.object_key}' retrieved from bucket. Starting chunking..."
-    )
+    if task_settings.ingest_streaming:
+        await _process_document_streaming(
+            message=message,
+            version=version,
+            loader=loader,
+            parser=parser,
+            embedder=embedder,
+            task_settings=task_settings,
+            logger=logger,
+        )
+        return
 
-    chunks: ChunkData = parser.transform(document=document)
-    logger.debug(
-        f"Document '{message.object_key}' chunked into {len(chunks)} chunks. Starting embedding..."
-    )
+    if executor is not None:
+        logger.debug(
+            f"Reading and chunking '{message.object_key}' in the process pool..."
+        )
+        content_hash, chunks = await asyncio.get_running_loop().run_in_executor(
+            executor,
+            read_and_chunk,
+            message,
+            storage_settings.index_documents_bucket_name,
+            task_settings.embed_chunk_size,
+            task_settings.embed_chunk_overlap,
+        )
+    else:
+        # Off the event loop, so the other tasks in flight keep running
+        document: Document = await asyncio.to_thread(loader.read, message=message)
+        logger.debug(
+            f"Document '{message.object_key}' retrieved from bucket. Starting chunking..."
+        )
 
-    data_to_store: ObjectData = embedder.transform(chunks=chunks)
-    logger.info(
-        f"Successfully embedded {len(data_to_store)} chunks. Preparing to store in vector DB..."
+        content_hash = document.content_hash
+        chunks: list[ChunkData] = await asyncio.to_thread(
+            parser.transform, document=document
+        )
+
+    logger.debug(f"Document '{message.object_key}' chunked into {len(chunks)} chunks")
+    document_hash: Optional[str] = _document_hash(
+        content_hash=content_hash, task_settings=task_settings
     )
 
     async with get_vector_db_ctx() as vector_db:
-        indexes = await vector_db.get_indexes()
+        stored: list[ObjectData] = await _stored_chunks(
+            vector_db=vector_db,
+            message=message,
+            task_settings=task_settings,
+            max_results=task_settings.ingest_dedup_max_chunks,
+        )
+
+        if _is_unchanged(stored=stored, document_hash=document_hash):
+            logger.info(
+                f"Document '{message.object_key}' is unchanged. Skipping ingestion"
+            )
+            return
+
+        data_to_store: list[ObjectData] = await _embed_changed(
+            embedder=embedder,
+            chunks=chunks,
+            stored=stored,
+            fingerprint=_embedding_fingerprint(task_settings=task_settings),
+            logger=logger,
+        )
+        logger.info(
+            f"Successfully embedded {len(data_to_store)} chunks. Preparing to store in vector DB..."
+        )
 
-        doc_to_delete = []
+        await _prepare_index(
+            vector_db=vector_db,
+            message=message,
+            version=version,
+            vector_dim=task_settings.embed_dim,
+            logger=logger,
+        )
 
-        if message.index_id not in indexes:
-            logger.info(f"Index '{message.index_id}' not found. Creating new index")
-            await vector_db.create_index(
-                index_name=message.index_id, vector_dim=task_settings.embed_dim
+        try:
+            logger.info(f"Adding {len(data_to_store)} new chunks...")
+            await vector_db.put_objects(
+                data=_stamp(
+                    data=data_to_store,
+                    version=version,
+                    document_hash=document_hash,
+                    task_settings=task_settings,
+                ),
+                index_name=message.index_id,
             )
-            logger.debug(f"Index '{message.index_id}' created successfully")
-        else:
-            logger.debug(
-                f"Index '{message.index_id}' already exists. Searching for existing chunks to delete..."
+            logger.debug(f"Successfully added {len(data_to_store)} chunks")
+        except Exception:
+            await _discard_version(
+                vector_db=vector_db, message=message, version=version, logger=logger
             )
-            filters = MetadataFilters(
-                filters=[
-                    MetadataFilter(
-                        key="filename",
-                        value=message.object_key,
-                        operator=FilterOperator.TEXT_MATCH,
-                    )
-                ]
+            raise
+
+        await _activate_version(
+            vector_db=vector_db,
+            message=message,
+            version=version,
+            abandon_after_seconds=task_settings.ingest_abandon_after_seconds,
+            logger=logger,
+        )
+
+
+async def _process_document_streaming(
+    message: Message,
+    version: str,
+    loader: DocumentLoader,
+    parser: Parser,
+    embedder: Embedder,
+    task_settings: TaskSettings,
+    logger: Logger,
+) -> None:
+    """Reads, chunks, embeds and stores the document one window of
+    `ingest_window_size` chunks at a time, so memory stays flat regardless of
+    the document size and chunks reach the vector DB while reading continues.
+    The chunks stay hidden until the whole document has been stored. Unchanged
+    documents are skipped, but the vectors of unchanged chunks aren't reused,
+    since that would mean holding every stored vector of the document.
+    """
+    async with get_vector_db_ctx() as vector_db:
+        async with _open_pages(loader=loader, message=message) as (
+            content_hash,
+            pages,
+        ):
+            document_hash: Optional[str] = _document_hash(
+                content_hash=content_hash, task_settings=task_settings
             )
-            results = await vector_db.filter_search(
-                index_name=message.index_id, max_results=10000, filters=filters
+
+            if _is_unchanged(
+                stored=await _stored_chunks(
+                    vector_db=vector_db,
+                    message=message,
+                    task_settings=task_settings,
+                    max_results=1,
+                ),
+                document_hash=document_hash,
+            ):
+                logger.info(
+                    f"Document '{message.object_key}' is unchanged. Skipping ingestion"
+                )
+                return
+
+            await _prepare_index(
+                vector_db=vector_db,
+                message=message,
+                version=version,
+                vector_dim=task_settings.embed_dim,
+                logger=logger,
             )
+            stored = 0
 
-            doc_to_delete.extend([x.id for x in results])
-            logger.debug(f"Found {len(doc_to_delete)} existing chunks to delete")
+            async def _flush(window: list[ChunkData]) -> None:
+                nonlocal stored
 
-        try:
-            logger.info(f"Adding {len(data_to_store)} new chunks...")
-            await vector_db.put_objects(data=data_to_store, index_name=message.index_id)
-            logger.debug(f"Successfully added {len(data_to_store)} chunks")
-        finally:
-            if doc_to_delete:
-                logger.debug(f"Deleting {len(doc_to_delete)} old chunks...")
-                await vector_db.delete_objects(
-                    index_name=message.index_id, ids=doc_to_delete
+                data_to_store = await embedder.transform(chunks=window)
+                await vector_db.put_objects(
+                    data=_stamp(
+                        data=data_to_store,
+                        version=version,
+                        document_hash=document_hash,
+                        task_settings=task_settings,
+                    ),
+                    index_name=message.index_id,
+                )
+                stored += len(data_to_store)
+                logger.debug(f"Stored {stored} chunks of '{message.object_key}' so far")
+
+            try:
+                chunks: Iterator[ChunkData] = parser.transform_stream(
+                    filename=message.object_key, pages=pages
+                )
+
+                # Pages are read and chunked off the event loop, one window at a time
+                while window := await asyncio.to_thread(
+                    _next_window, chunks, task_settings.ingest_window_size
+                ):
+                    await _flush(window)
+            except Exception:
+                await _discard_version(
+                    vector_db=vector_db,
+                    message=message,
+                    version=version,
+                    logger=logger,
                 )
-                logger.info(f"Old chunks deleted")
-            else:
-                logger.debug("No old chunks to delete")
+                raise
+
+        logger.info(
+            f"Successfully streamed {stored} chunks of '{message.object_key}' into the vector DB"
+        )
+        await _activate_version(
+            vector_db=vector_db,
+            message=message,
+            version=version,
+            abandon_after_seconds=task_settings.ingest_abandon_after_seconds,
+            logger=logger,
+        )
+
+
+@asynccontextmanager
+async def _open_pages(
+    loader: DocumentLoader, message: Message
+) -> AsyncIterator[tuple[str, Iterator[str]]]:
+    """`DocumentLoader.open_pages` with the download run off the event loop."""
+    pages_ctx = loader.open_pages(message=message)
+    opened: tuple[str, Iterator[str]] = await asyncio.to_thread(pages_ctx.__enter__)
+
+    try:
+        yield opened
+    except BaseException as e:
+        if not pages_ctx.__exit__(type(e), e, e.__traceback__):
+            raise
+    else:
+        pages_ctx.__exit__(None, None, None)
+
+
+def _next_window(chunks: Iterator[ChunkData], size: int) -> list[ChunkData]:
+    return list(islice(chunks, size))
+
+
+def _embedding_fingerprint(task_settings: TaskSettings) -> str:
+    """Identifies the vectors produced by the configured embedding model, so a
+    change of model never reuses vectors of another one.
+    """
+    return (
+        f"{task_settings.provider}:{task_settings.embed_model_id}:"
+        f"{task_settings.embed_dim}:{task_settings.embed_task}"
+    )
+
+
+def _chunk_hash(content: str, fingerprint: str) -> str:
+    return hashlib.sha256(f"{fingerprint}\n{content}".encode("utf-8")).hexdigest()
+
+
+def _document_hash(
+    content_hash: Optional[str], task_settings: TaskSettings
+) -> Optional[str]:
+    """Hash of the raw document together with the settings its chunks and
+    vectors depend on: changing any of them re-ingests the document.
+    """
+    if content_hash is None:
+        return None
+
+    return hashlib.sha256(
+        (
+            f"{_embedding_fingerprint(task_settings=task_settings)}:"
+            f"{task_settings.embed_chunk_size}:{task_settings.embed_chunk_overlap}\n"
+            f"{content_hash}"
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+async def _stored_chunks(
+    vector_db: VectorDBInterface,
+    message: Message,
+    task_settings: TaskSettings,
+    max_results: int,
+) -> list[ObjectData]:
+    """Reads back the chunks of the active version of the document, if any."""
+    if not task_settings.ingest_dedup or not await get_index_catalog().exists(
+        vdb=vector_db, index_name=message.index_id
+    ):
+        return []
+
+    return await vector_db.get_objects(
+        index_name=message.index_id,
+        filters=_document_filters(message),
+        max_results=max_results,
+    )
+
+
+def _is_unchanged(stored: list[ObjectData], document_hash: Optional[str]) -> bool:
+    return (
+        document_hash is not None
+        and bool(stored)
+        and stored[0].document_hash == document_hash
+    )
+
+
+async def _embed_changed(
+    embedder: Embedder,
+    chunks: list[ChunkData],
+    stored: list[ObjectData],
+    fingerprint: str,
+    logger: Logger,
+) -> list[ObjectData]:
+    """Embeds only the chunks whose content isn't already stored, reusing the
+    stored vectors for the others. The output preserves the order of the chunks.
+    """
+    vectors: dict[str, list[float]] = {
+        obj.content_hash: obj.vector for obj in stored if obj.content_hash
+    }
+    hashes: list[str] = [
+        _chunk_hash(content=chunk.content, fingerprint=fingerprint) for chunk in chunks
+    ]
+    embedded = iter(
+        await embedder.transform(
+            chunks=[
+                chunk
+                for chunk, content_hash in zip(chunks, hashes)
+                if content_hash not in vectors
+            ]
+        )
+    )
+    data: list[ObjectData] = []
+
+    for chunk, content_hash in zip(chunks, hashes):
+        if content_hash in vectors:
+            obj = ObjectData(**chunk.model_dump(), vector=vectors[content_hash])
+        else:
+            obj = next(embedded)
+
+        obj.content_hash = content_hash
+        data.append(obj)
+
+    reused: int = sum(content_hash in vectors for content_hash in hashes)
+
+    if reused:
+        logger.info(f"Reused the stored vectors of {reused}/{len(chunks)} chunks")
+
+    return data
+
+
+def _stamp(
+    data: list[ObjectData],
+    version: str,
+    document_hash: Optional[str],
+    task_settings: TaskSettings,
+) -> list[ObjectData]:
+    """Sets the version and the hashes of the objects about to be stored."""
+    fingerprint: str = _embedding_fingerprint(task_settings=task_settings)
+
+    for obj in data:
+        obj.version = version
+        obj.document_hash = document_hash
+        obj.content_hash = obj.content_hash or _chunk_hash(
+            content=obj.content, fingerprint=fingerprint
+        )
+
+    return data
+
+
+def _document_filters(message: Message, *filters: MetadataFilter) -> MetadataFilters:
+    return MetadataFilters(
+        filters=[
+            MetadataFilter(
+                key="filename", value=message.object_key, operator=FilterOperator.EQ
+            ),
+            *filters,
+        ]
+    )
+
+
+async def _prepare_index(
+    vector_db: VectorDBInterface,
+    message: Message,
+    version: str,
+    vector_dim: int,
+    logger: Logger,
+) -> None:
+    """Creates the index if missing, then stages the new version of the
+    document, so its chunks are hidden from retrieval until it is activated.
+    """
+    if not await get_index_catalog().exists(vdb=vector_db, index_name=message.index_id):
+        logger.info(f"Index '{message.index_id}' not found. Creating new index")
+        await vector_db.create_index(index_name=message.index_id, vector_dim=vector_dim)
+        logger.debug(f"Index '{message.index_id}' created successfully")
+
+    await vector_db.stage_version(
+        index_name=message.index_id, filename=message.object_key, version=version
+    )
+    logger.debug(f"Version '{version}' of '{message.object_key}' staged")
+
+
+async def _activate_version(
+    vector_db: VectorDBInterface,
+    message: Message,
+    version: str,
+    abandon_after_seconds: float,
+    logger: Logger,
+) -> None:
+    """Atomically swaps the new version of the document in, then garbage
+    collects the chunks of the superseded and abandoned versions. The versions
+    staged by ingestions of the same document still in progress are left alone.
+    Retrieval stops seeing the old chunks at the flip, so the collection is off
+    the query path: if it fails, the task still succeeds and the old chunks stay
+    hidden until the next ingestion of the document collects them.
+    """
+    previous: Optional[str] = await vector_db.activate_version(
+        index_name=message.index_id, filename=message.object_key, version=version
+    )
+    logger.info(f"Version '{version}' of '{message.object_key}' is now active")
+
+    try:
+        hidden: dict[str, Optional[float]] = await vector_db.get_hidden_versions(
+            index_name=message.index_id, filename=message.object_key
+        )
+        staged_since: float = time.time() - abandon_after_seconds
+        in_flight: list[str] = [
+            v
+            for v, staged_at in hidden.items()
+            if staged_at is not None and staged_at > staged_since
+        ]
+        collectable: list[str] = [v for v in hidden if v not in in_flight]
+
+        if previous is None:
+            # First versioned ingestion of the document: also collects the
+            # chunks stored before documents were versioned
+            version_filter: MetadataFilter = MetadataFilter(
+                key="version", value=[version, *in_flight], operator=FilterOperator.NIN
+            )
+        else:
+            version_filter = MetadataFilter(
+                key="version", value=collectable, operator=FilterOperator.IN
+            )
+
+        if previous is None or collectable:
+            deleted: int = await vector_db.delete_by_filter(
+                index_name=message.index_id,
+                filters=_document_filters(message, version_filter),
+            )
+            logger.debug(f"Deleted {deleted} chunks of the previous versions")
+
+        await vector_db.release_versions(
+            index_name=message.index_id,
+            filename=message.object_key,
+            versions=collectable,
+        )
+    except Exception as e:
+        logger.warning(
+            f"Garbage collection of the previous versions of '{message.object_key}' failed: {e}"
+        )
+
+
+async def _discard_version(
+    vector_db: VectorDBInterface, message: Message, version: str, logger: Logger
+) -> None:
+    """Deletes the chunks already stored for a version that will never be
+    activated. Best effort: the version stays hidden if this fails.
+    """
+    try:
+        deleted: int = await vector_db.delete_by_filter(
+            index_name=message.index_id,
+            filters=_document_filters(
+                message,
+                MetadataFilter(
+                    key="version", value=version, operator=FilterOperator.EQ
+                ),
+            ),
+        )
+        await vector_db.release_versions(
+            index_name=message.index_id,
+            filename=message.object_key,
+            versions=[version],
+        )
+        logger.debug(f"Discarded {deleted} chunks of version '{version}'")
+    except Exception as e:
+        logger.warning(
+            f"Discarding version '{version}' of '{message.object_key}' failed: {e}"
+        )
@@ -5,10 +5,31 @@ from src.worker.embedder import Embedder, get_embedder
 from src.worker.parsers import ChunkData
 from dos_utility.vector_db import ObjectData
 
-from test.worker.mocks import EmbedModelMock
+from test.worker.mocks import (
+    EmbedModelMock,
+    RateLimitErrorMock,
+    RateLimitedEmbedModelMock,
+)
 
 
-def test_embedder_transform(monkeypatch):
+def _make_embedder(monkeypatch, model, **kwargs) -> Embedder:
+    monkeypatch.setattr(embedder, "get_embed_model", lambda **_: model)
+    params = dict(
+        provider="google",
+        embed_model_id="gemini-embedding-001",
+        embed_batch_size=100,
+        embed_dim=3,
+        embed_task="RETRIEVAL_DOCUMENT",
+        embed_retries=3,
+        embed_retry_min_seconds=0.01,
+        model_api_key="test-key",
+    )
+    params.update(kwargs)
+
+    return Embedder(**params)
+
+
+async def test_embedder_transform(monkeypatch):
     monkeypatch.setattr(embedder, "get_embed_model", lambda **kwargs: EmbedModelMock())
 
     e = Embedder(
@@ -26,7 +47,7 @@ def test_embedder_transform(monkeypatch):
         ChunkData(filename="doc.pdf", chunk_id=1, content="world"),
     ]
 
-    result = e.transform(chunks=chunks)
+    result = await e.transform(chunks=chunks)
 
     assert len(result) == 2
     assert all(isinstance(o, ObjectData) for o in result)
@@ -38,6 +59,68 @@ def test_embedder_transform(monkeypatch):
     assert result[1].content == "world"
 
 
+async def test_embedder_transform_batches_and_preserves_order(monkeypatch):
+    model = EmbedModelMock()
+    e = _make_embedder(monkeypatch, model, embed_batch_size=2, embed_max_concurrency=2)
+    chunks = [
+        ChunkData(filename="doc.pdf", chunk_id=i, content=f"chunk {i}")
+        for i in range(5)
+    ]
+
+    result = await e.transform(chunks=chunks)
+
+    assert sorted(model.batches) == [
+        ["chunk 0", "chunk 1"],
+        ["chunk 2", "chunk 3"],
+        ["chunk 4"],
+    ]
+    assert [o.chunk_id for o in result] == [0, 1, 2, 3, 4]
+
+
+async def test_embedder_transform_empty(monkeypatch):
+    model = EmbedModelMock()
+    e = _make_embedder(monkeypatch, model)
+
+    assert await e.transform(chunks=[]) == []
+    assert model.batches == []
+
+
+async def test_embedder_transform_backs_off_on_rate_limit(monkeypatch):
+    model = RateLimitedEmbedModelMock(failures=2)
+    e = _make_embedder(monkeypatch, model)
+    chunks = [ChunkData(filename="doc.pdf", chunk_id=0, content="hello")]
+
+    result = await e.transform(chunks=chunks)
+
+    assert len(result) == 1
+    assert model.batches == [["hello"]]
+
+
+async def test_embedder_transform_gives_up_after_rate_limit_retries(monkeypatch):
+    model = RateLimitedEmbedModelMock(failures=5)
+    e = _make_embedder(monkeypatch, model, embed_rate_limit_retries=2)
+    chunks = [ChunkData(filename="doc.pdf", chunk_id=0, content="hello")]
+
+    with pytest.raises(RateLimitErrorMock):
+        await e.transform(chunks=chunks)
+
+
+async def test_embedder_transform_does_not_retry_other_errors(monkeypatch):
+    class _FailingModel(EmbedModelMock):
+        async def aget_text_embedding_batch(self, texts):
+            self.batches.append(texts)
+            raise ValueError("bad request")
+
+    model = _FailingModel()
+    e = _make_embedder(monkeypatch, model)
+    chunks = [ChunkData(filename="doc.pdf", chunk_id=0, content="hello")]
+
+    with pytest.raises(ValueError, match="bad request"):
+        await e.transform(chunks=chunks)
+
+    assert len(model.batches) == 1
+
+
 def test_get_embedder(monkeypatch):
     monkeypatch.setattr(embedder, "get_embed_model", lambda **kwargs: EmbedModelMock())
     get_embedder.cache_clear()
@@ -1,7 +1,12 @@
 import pytest
 
 from src.worker import env
-from src.worker.env import TaskSettings, GlobalSettings, StorageSettings
+from src.worker.env import (
+    TaskSettings,
+    GlobalSettings,
+    StorageSettings,
+    WorkerSettings,
+)
 
 
 def test_get_task_settings(monkeypatch):
@@ -42,3 +47,15 @@ def test_get_storage_settings(monkeypatch):
     assert isinstance(settings, StorageSettings)
     assert settings.index_documents_bucket_name == "test-bucket"
     env.get_storage_settings.cache_clear()
+
+
+def test_get_worker_settings():
+    env.get_worker_settings.cache_clear()
+
+    settings = env.get_worker_settings()
+
+    assert isinstance(settings, WorkerSettings)
+    assert settings.worker_concurrency == 1
+    assert settings.worker_process_pool_size == 0
+    assert settings.worker_poll_wait_seconds == 20.0
+    env.get_worker_settings.cache_clear()
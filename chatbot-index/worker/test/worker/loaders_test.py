@@ -1,3 +1,4 @@
+import hashlib
 import pytest
 
 from src.worker import loaders
@@ -57,6 +58,28 @@ def test_pdf_loader_read(monkeypatch):
     assert result == ["page content", "page content"]
 
 
+def test_pdf_loader_iter_pages(monkeypatch):
+    monkeypatch.setattr(loaders, "pymupdf", PyMuPDFMock())
+
+    loader = PDFLoader()
+    result = loader.iter_pages(path="doc.pdf")
+
+    assert next(result) == "page content"
+    assert list(result) == ["page content"]
+
+
+def test_text_loader_iter_pages(tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_text("line 1\nline 2\nline 3\n")
+
+    loader = TextLoader()
+    loader.block_size = 8
+    result = list(loader.iter_pages(path=str(path)))
+
+    assert "\n".join(result) == "line 1\nline 2\nline 3"
+    assert len(result) > 1
+
+
 def test_text_loader_read():
     loader = TextLoader()
     result = loader.read(data=b"hello world")
@@ -81,6 +104,26 @@ def test_document_loader_read(monkeypatch):
     assert isinstance(result, Document)
     assert result.filename == "doc.txt"
     assert result.content == ["hello world"]
+    assert result.content_hash == hashlib.sha256(b"hello world").hexdigest()
+
+
+def test_document_loader_open_pages(monkeypatch):
+    storage_mock = StorageMock(data=b"hello world")
+    monkeypatch.setattr(loaders, "get_storage", lambda: storage_mock)
+
+    document_loader = DocumentLoader(bucket_name="test-bucket")
+    msg = Message(
+        index_id="idx1",
+        user_id="user1",
+        object_key="doc.txt",
+        document_type="text/plain",
+    )
+
+    with document_loader.open_pages(message=msg) as (content_hash, pages):
+        result = list(pages)
+
+    assert result == ["hello world"]
+    assert content_hash == hashlib.sha256(b"hello world").hexdigest()
 
 
 def test_get_document_loader(monkeypatch):
@@ -1,10 +1,11 @@
+import asyncio
 import traceback as traceback_module
-import pytest
 
 from src.worker import main
 
 from test.worker.mocks import (
     GlobalSettingsMock,
+    WorkerSettingsMock,
     LoggerMock,
     QueueClientMock,
     make_queue_client_ctx_mock,
@@ -13,12 +14,22 @@ from test.worker.mocks import (
 _TASK_BODY = b'{"indexId": "idx1", "userId": "user1", "objectKey": "doc.pdf", "documentType": "application/pdf"}'
 
 
-def _patch_dependencies(monkeypatch, queue_client: QueueClientMock):
+def _patch_dependencies(
+    monkeypatch, queue_client: QueueClientMock, worker_settings=WorkerSettingsMock()
+):
     monkeypatch.setattr(main, "get_global_settings", lambda: GlobalSettingsMock())
+    monkeypatch.setattr(main, "get_worker_settings", lambda: worker_settings)
     monkeypatch.setattr(main, "get_logger", lambda name, level: LoggerMock())
     monkeypatch.setattr(
         main, "get_queue_client_ctx", make_queue_client_ctx_mock(queue_client)
     )
+    monkeypatch.setattr(
+        main, "install_stop_handlers", lambda stop: setattr(queue_client, "stop", stop)
+    )
+
+
+class _ConcurrentWorkerSettingsMock(WorkerSettingsMock):
+    worker_concurrency = 3
 
 
 async def test_main_processes_task_and_acknowledges(monkeypatch):
@@ -27,31 +38,50 @@ async def test_main_processes_task_and_acknowledges(monkeypatch):
 
     process_task_calls = []
 
-    async def _mock_process_task(body):
+    async def _mock_process_task(body, executor=None):
         process_task_calls.append(body)
 
     monkeypatch.setattr(main, "process_task", _mock_process_task)
 
-    with pytest.raises(SystemExit):
-        await main.main()
+    await main.main()
 
     assert process_task_calls == [_TASK_BODY]
     assert queue_client.acknowledged == ["ack_1"]
 
 
-async def test_main_skips_acknowledge_when_ack_token_is_none(monkeypatch):
-    queue_client = QueueClientMock(messages=[_TASK_BODY], ack_tokens=[None])
-    _patch_dependencies(monkeypatch, queue_client)
+async def test_main_long_polls_only_when_idle(monkeypatch):
+    queue_client = QueueClientMock(messages=[_TASK_BODY], ack_tokens=["ack_1"])
+    _patch_dependencies(monkeypatch, queue_client, _ConcurrentWorkerSettingsMock())
+
+    async def _mock_process_task(body, executor=None):
+        await asyncio.sleep(0.01)
+
+    monkeypatch.setattr(main, "process_task", _mock_process_task)
+
+    await main.main()
 
-    async def _mock_process_task(body):
+    # Receives ask for the free slots, and wait briefly while a task is running
+    assert queue_client.receives[0] == (3, 20.0)
+    assert queue_client.receives[1] == (2, 1.0)
+
+
+async def test_main_acknowledges_processed_tasks_together(monkeypatch):
+    queue_client = QueueClientMock(
+        messages=[_TASK_BODY, _TASK_BODY, _TASK_BODY],
+        ack_tokens=["ack_1", "ack_2", "ack_3"],
+    )
+    _patch_dependencies(monkeypatch, queue_client, _ConcurrentWorkerSettingsMock())
+
+    async def _mock_process_task(body, executor=None):
         pass
 
     monkeypatch.setattr(main, "process_task", _mock_process_task)
 
-    with pytest.raises(SystemExit):
-        await main.main()
+    await main.main()
 
-    assert queue_client.acknowledged == []
+    assert [sorted(call) for call in queue_client.acknowledge_calls] == [
+        ["ack_1", "ack_2", "ack_3"]
+    ]
 
 
 async def test_main_skips_processing_when_no_message(monkeypatch):
@@ -60,13 +90,12 @@ async def test_main_skips_processing_when_no_message(monkeypatch):
 
     process_task_calls = []
 
-    async def _mock_process_task(body):
+    async def _mock_process_task(body, executor=None):
         process_task_calls.append(body)
 
     monkeypatch.setattr(main, "process_task", _mock_process_task)
 
-    with pytest.raises(SystemExit):
-        await main.main()
+    await main.main()
 
     assert process_task_calls == []
 
@@ -80,14 +109,54 @@ async def test_main_catches_process_task_exception(monkeypatch):
 
     call_count = [0]
 
-    async def _mock_process_task(body):
+    async def _mock_process_task(body, executor=None):
         call_count[0] += 1
         raise Exception("processing error")
 
     monkeypatch.setattr(main, "process_task", _mock_process_task)
 
-    with pytest.raises(SystemExit):
-        await main.main()
+    await main.main()
 
     assert call_count[0] == 2
     assert queue_client.acknowledged == []
+
+
+async def test_main_processes_tasks_concurrently(monkeypatch):
+    queue_client = QueueClientMock(
+        messages=[_TASK_BODY, _TASK_BODY, _TASK_BODY],
+        ack_tokens=["ack_1", "ack_2", "ack_3"],
+    )
+    _patch_dependencies(monkeypatch, queue_client, _ConcurrentWorkerSettingsMock())
+
+    running = [0]
+    max_running = [0]
+
+    async def _mock_process_task(body, executor=None):
+        running[0] += 1
+        max_running[0] = max(max_running[0], running[0])
+        await asyncio.sleep(0.01)
+        running[0] -= 1
+
+    monkeypatch.setattr(main, "process_task", _mock_process_task)
+
+    await main.main()
+
+    # In-flight tasks are drained before exiting
+    assert max_running[0] == 3
+    assert sorted(queue_client.acknowledged) == ["ack_1", "ack_2", "ack_3"]
+
+
+async def test_main_drains_and_stops_on_stop_signal(monkeypatch):
+    queue_client = QueueClientMock(
+        messages=[_TASK_BODY, _TASK_BODY], ack_tokens=["ack_1", "ack_2"]
+    )
+    _patch_dependencies(monkeypatch, queue_client)
+
+    async def _mock_process_task(body, executor=None):
+        queue_client.stop.set()
+
+    monkeypatch.setattr(main, "process_task", _mock_process_task)
+
+    await main.main()
+
+    assert queue_client.acknowledged == ["ack_1"]
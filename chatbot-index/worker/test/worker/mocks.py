@@ -1,8 +1,10 @@
-from contextlib import asynccontextmanager
-from typing import Self, Optional, List, Tuple
+import asyncio
+import time
 
-from dos_utility.vector_db import SearchResult
+from contextlib import asynccontextmanager
+from typing import Self, Dict, Optional, List, Tuple
 
+from dos_utility.vector_db import ObjectData, SearchResult
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Settings mocks
@@ -24,6 +26,19 @@ class TaskSettingsMock:
     embed_task = "RETRIEVAL_DOCUMENT"
     embed_retries = 3
     embed_retry_min_seconds = 1.0
+    embed_max_concurrency = 4
+    embed_rate_limit_retries = 5
+    ingest_streaming = False
+    ingest_window_size = 500
+    ingest_dedup = True
+    ingest_dedup_max_chunks = 10000
+    ingest_abandon_after_seconds = 3600.0
+
+
+class WorkerSettingsMock:
+    worker_concurrency = 1
+    worker_process_pool_size = 0
+    worker_poll_wait_seconds = 20.0
 
 
 class StorageSettingsMock:
@@ -55,13 +70,18 @@ class LoggerMock:
 
 
 class QueueClientMock:
-    def __init__(
-        self: Self, messages: List[Optional[bytes]], ack_tokens: List[Optional[str]]
-    ):
+    """Returns the messages in order, as many per receive as requested. A `None`
+    message stands for a receive that found the queue empty. Once the messages
+    are over, sets the stop event handed over by `install_stop_handlers`."""
+
+    def __init__(self: Self, messages: List[Optional[bytes]], ack_tokens: List[str]):
         self._messages = messages
         self._ack_tokens = ack_tokens
         self._index = 0
+        self.stop: Optional[asyncio.Event] = None
+        self.receives: List[Tuple[int, float]] = []
         self.acknowledged: List[str] = []
+        self.acknowledge_calls: List[List[str]] = []
 
     async def __aenter__(self: Self) -> Self:
         return self
@@ -69,16 +89,36 @@ class QueueClientMock:
     async def __aexit__(self: Self, *_) -> None:
         pass
 
-    async def dequeue(self: Self) -> Tuple[Optional[bytes], Optional[str]]:
-        if self._index < len(self._messages):
-            msg = self._messages[self._index]
-            ack = self._ack_tokens[self._index]
+    async def dequeue_many(
+        self: Self, max_messages: int = 10, wait: float = 20.0
+    ) -> List[Tuple[bytes, str]]:
+        self.receives.append((max_messages, wait))
+
+        if self._index >= len(self._messages):
+            self.stop.set()
+            return []
+
+        if self._messages[self._index] is None:
             self._index += 1
-            return msg, ack
-        raise SystemExit("test complete")
+            return []
+
+        messages: List[Tuple[bytes, str]] = []
+
+        while (
+            len(messages) < max_messages
+            and self._index < len(self._messages)
+            and self._messages[self._index] is not None
+        ):
+            messages.append(
+                (self._messages[self._index], self._ack_tokens[self._index])
+            )
+            self._index += 1
+
+        return messages
 
-    async def acknowledge(self: Self, ack_token: str) -> None:
-        self.acknowledged.append(ack_token)
+    async def acknowledge_many(self: Self, ack_tokens: List[str]) -> None:
+        self.acknowledge_calls.append(ack_tokens)
+        self.acknowledged.extend(ack_tokens)
 
 
 def make_queue_client_ctx_mock(client: QueueClientMock):
@@ -99,12 +139,22 @@ class VectorDBMock:
         self: Self,
         indexes: Optional[List[str]] = None,
         filter_results: Optional[List[SearchResult]] = None,
+        active_version: Optional[str] = None,
+        stored_objects: Optional[List[ObjectData]] = None,
+        hidden_versions: Optional[Dict[str, Optional[float]]] = None,
     ):
         self._indexes = indexes or []
         self._filter_results = filter_results or []
+        self._active_version = active_version
+        self._stored_objects = stored_objects or []
+        self._hidden_versions = dict(hidden_versions or {})
         self.create_index_calls: List[dict] = []
         self.put_calls: List[dict] = []
         self.delete_calls: List[dict] = []
+        self.delete_by_filter_calls: List[dict] = []
+        self.staged_versions: List[str] = []
+        self.activated_versions: List[str] = []
+        self.released_versions: List[str] = []
 
     async def __aenter__(self: Self) -> Self:
         return self
@@ -125,12 +175,58 @@ class VectorDBMock:
     ) -> List:
         return self._filter_results
 
+    async def get_objects(
+        self: Self, index_name: str, filters, max_results: int
+    ) -> List[ObjectData]:
+        return self._stored_objects[:max_results]
+
     async def put_objects(self: Self, index_name: str, data: list) -> None:
         self.put_calls.append({"index_name": index_name, "data": data})
 
     async def delete_objects(self: Self, index_name: str, ids: List[str]) -> None:
         self.delete_calls.append({"index_name": index_name, "ids": ids})
 
+    async def delete_by_filter(self: Self, index_name: str, filters) -> int:
+        self.delete_by_filter_calls.append(
+            {
+                "index_name": index_name,
+                "filters": filters,
+                "before_put": not self.put_calls,
+            }
+        )
+        return len(self._filter_results)
+
+    async def stage_version(
+        self: Self, index_name: str, filename: str, version: str
+    ) -> None:
+        self.staged_versions.append(version)
+        self._hidden_versions[version] = time.time()
+
+    async def activate_version(
+        self: Self, index_name: str, filename: str, version: str
+    ) -> Optional[str]:
+        self.activated_versions.append(version)
+        previous, self._active_version = self._active_version, version
+        self._hidden_versions.pop(version, None)
+
+        if previous is not None:
+            self._hidden_versions[previous] = None
+
+        return previous
+
+    async def release_versions(
+        self: Self, index_name: str, filename: str, versions: List[str]
+    ) -> None:
+        self.released_versions.extend(versions)
+
+        for version in versions:
+            self._hidden_versions.pop(version, None)
+
+    async def get_hidden_versions(
+        self: Self, index_name: str, filename: str
+    ) -> Dict[str, Optional[float]]:
+        return dict(self._hidden_versions)
+
 
 def make_vector_db_ctx_mock(vdb: VectorDBMock):
     @asynccontextmanager
@@ -152,6 +248,10 @@ class StorageMock:
     def get_object(self: Self, bucket: str, name: str) -> bytes:
         return self._data
 
+    def download_object(self: Self, bucket: str, name: str, path: str) -> None:
+        with open(path, "wb") as file:
+            file.write(self._data)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Embed model mock
@@ -159,8 +259,28 @@ class StorageMock:
 
 
 class EmbedModelMock:
-    def get_text_embedding(self, text: str) -> List[float]:
-        return [0.1, 0.2, 0.3]
+    def __init__(self):
+        self.batches: List[List[str]] = []
+
+    async def aget_text_embedding_batch(self, texts: List[str]) -> List[List[float]]:
+        self.batches.append(texts)
+        return [[0.1, 0.2, 0.3] for _ in texts]
+
+
+class RateLimitErrorMock(Exception):
+    code = 429
+
+
+class RateLimitedEmbedModelMock(EmbedModelMock):
+    def __init__(self, failures: int):
+        super().__init__()
+        self._failures = failures
+
+    async def aget_text_embedding_batch(self, texts: List[str]) -> List[List[float]]:
+        if self._failures > 0:
+            self._failures -= 1
+            raise RateLimitErrorMock("429 RESOURCE_EXHAUSTED")
+        return await super().aget_text_embedding_batch(texts)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -195,6 +315,12 @@ class PyMuPDFPageMock:
 class PyMuPDFDocumentMock:
     page_count = 2
 
+    def __enter__(self) -> "PyMuPDFDocumentMock":
+        return self
+
+    def __exit__(self, *_) -> None:
+        pass
+
     def load_page(self, number: int) -> PyMuPDFPageMock:
         return PyMuPDFPageMock()
 
@@ -32,6 +32,30 @@ def test_parser_transform(monkeypatch):
     assert result[1].content == "chunk 2"
 
 
+def test_parser_transform_stream_carries_text_across_pages():
+    parser = Parser(chunk_size=20, chunk_overlap=5)
+    pages = [
+        " ".join(f"page one sentence {i}." for i in range(10)),
+        " ".join(f"page two sentence {i}." for i in range(10)),
+    ]
+
+    result = list(parser.transform_stream(filename="doc.pdf", pages=iter(pages)))
+
+    assert [c.chunk_id for c in result] == list(range(len(result)))
+    assert all(c.filename == "doc.pdf" for c in result)
+    assert any("page one" in c.content and "page two" in c.content for c in result)
+    assert "page one sentence 0." in result[0].content
+    assert "page two sentence 9." in result[-1].content
+
+
+def test_parser_transform_stream_skips_empty_pages():
+    parser = Parser(chunk_size=512, chunk_overlap=50)
+
+    result = list(parser.transform_stream(filename="doc.pdf", pages=["", "hello", ""]))
+
+    assert [c.content for c in result] == ["hello"]
+
+
 def test_get_parser(monkeypatch):
     monkeypatch.setattr(parsers, "SentenceSplitter", SentenceSplitterMock)
     get_parser.cache_clear()
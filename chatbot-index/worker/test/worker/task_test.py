@@ -1,10 +1,16 @@
 import json
+import threading
+import time
 import pytest
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
 from src.worker import task
 from src.worker.loaders import Document
 from src.worker.parsers import ChunkData
-from dos_utility.vector_db import ObjectData, SearchResult
+from dos_utility.vector_db import ObjectData, SearchResult, IndexCatalog
+from llama_index.core.vector_stores.types import FilterOperator
 
 from test.worker.mocks import (
     GlobalSettingsMock,
@@ -24,11 +30,8 @@ TASK_BODY = json.dumps(
     }
 ).encode()
 
-_MOCK_DOCUMENT = Document(filename="doc.pdf", content=["page 1"])
+_MOCK_DOCUMENT = Document(filename="doc.pdf", content=["page 1"], content_hash="abc")
 _MOCK_CHUNKS = [ChunkData(filename="doc.pdf", chunk_id=0, content="chunk 1")]
-_MOCK_OBJECTS = [
-    ObjectData(filename="doc.pdf", chunk_id=0, content="chunk 1", vector=[0.1, 0.2])
-]
 
 
 def _make_loader_mock():
@@ -36,6 +39,10 @@ def _make_loader_mock():
         def read(self, message):
             return _MOCK_DOCUMENT
 
+        @contextmanager
+        def open_pages(self, message):
+            yield _MOCK_DOCUMENT.content_hash, iter(_MOCK_DOCUMENT.content)
+
     return _LoaderMock()
 
 
@@ -44,20 +51,36 @@ def _make_parser_mock():
         def transform(self, document):
             return _MOCK_CHUNKS
 
+        def transform_stream(self, filename, pages):
+            for page in pages:
+                for chunk_id in range(3):
+                    yield ChunkData(
+                        filename=filename,
+                        chunk_id=chunk_id,
+                        content=f"{page} {chunk_id}",
+                    )
+
     return _ParserMock()
 
 
-def _make_embedder_mock():
-    class _EmbedderMock:
-        def transform(self, chunks):
-            return _MOCK_OBJECTS
+class _EmbedderMock:
+    def __init__(self):
+        self.embedded: list[str] = []
 
-    return _EmbedderMock()
+    async def transform(self, chunks):
+        self.embedded.extend(c.content for c in chunks)
+        return [ObjectData(**c.model_dump(), vector=[0.1, 0.2]) for c in chunks]
 
 
-def _patch_dependencies(monkeypatch, vdb_mock: VectorDBMock):
+def _patch_dependencies(
+    monkeypatch,
+    vdb_mock: VectorDBMock,
+    task_settings=TaskSettingsMock(),
+    embedder_mock=None,
+):
+    embedder_mock = embedder_mock or _EmbedderMock()
     monkeypatch.setattr(task, "get_global_settings", lambda: GlobalSettingsMock())
-    monkeypatch.setattr(task, "get_task_settings", lambda: TaskSettingsMock())
+    monkeypatch.setattr(task, "get_task_settings", lambda: task_settings)
     monkeypatch.setattr(task, "get_storage_settings", lambda: StorageSettingsMock())
     monkeypatch.setattr(task, "get_logger", lambda name, level: LoggerMock())
     monkeypatch.setattr(
@@ -66,8 +89,11 @@ def _patch_dependencies(monkeypatch, vdb_mock: VectorDBMock):
     monkeypatch.setattr(
         task, "get_parser", lambda chunk_size, chunk_overlap: _make_parser_mock()
     )
-    monkeypatch.setattr(task, "get_embedder", lambda **kwargs: _make_embedder_mock())
+    monkeypatch.setattr(task, "get_embedder", lambda **kwargs: embedder_mock)
     monkeypatch.setattr(task, "get_vector_db_ctx", make_vector_db_ctx_mock(vdb_mock))
+    # Fresh index catalog per test, the process-wide one would leak between tests
+    index_catalog = IndexCatalog()
+    monkeypatch.setattr(task, "get_index_catalog", lambda: index_catalog)
 
 
 async def test_process_task_index_not_exists(monkeypatch):
@@ -76,12 +102,20 @@ async def test_process_task_index_not_exists(monkeypatch):
 
     await task.process_task(body=TASK_BODY)
 
+    [version] = vdb_mock.staged_versions
     assert len(vdb_mock.create_index_calls) == 1
     assert vdb_mock.create_index_calls[0]["index_name"] == "idx1"
     assert vdb_mock.create_index_calls[0]["vector_dim"] == 768
     assert len(vdb_mock.put_calls) == 1
     assert vdb_mock.put_calls[0]["index_name"] == "idx1"
-    assert len(vdb_mock.delete_calls) == 0
+    assert [o.version for o in vdb_mock.put_calls[0]["data"]] == [version]
+    assert vdb_mock.activated_versions == [version]
+    # First version of the document: collects the unversioned chunks
+    [delete_call] = vdb_mock.delete_by_filter_calls
+    _, version_filter = delete_call["filters"].filters
+    assert version_filter.operator == FilterOperator.NIN
+    assert version_filter.value == [version]
+    assert vdb_mock.released_versions == []
 
 
 async def test_process_task_index_exists(monkeypatch):
@@ -90,26 +124,274 @@ async def test_process_task_index_exists(monkeypatch):
             id="old_id_1", filename="doc.pdf", chunk_id=0, content="old", score=None
         ),
     ]
-    vdb_mock = VectorDBMock(indexes=["idx1"], filter_results=existing_results)
+    vdb_mock = VectorDBMock(
+        indexes=["idx1"], filter_results=existing_results, active_version="old"
+    )
     _patch_dependencies(monkeypatch, vdb_mock)
 
     await task.process_task(body=TASK_BODY)
 
+    [version] = vdb_mock.staged_versions
     assert len(vdb_mock.create_index_calls) == 0
     assert len(vdb_mock.put_calls) == 1
-    assert len(vdb_mock.delete_calls) == 1
-    assert vdb_mock.delete_calls[0]["ids"] == ["old_id_1"]
+    assert vdb_mock.activated_versions == [version]
+    # The previous version is collected only after the new one is active
+    [delete_call] = vdb_mock.delete_by_filter_calls
+    filename_filter, version_filter = delete_call["filters"].filters
+    assert delete_call["index_name"] == "idx1"
+    assert delete_call["before_put"] is False
+    assert filename_filter.key == "filename"
+    assert filename_filter.operator == FilterOperator.EQ
+    assert filename_filter.value == "doc.pdf"
+    assert version_filter.key == "version"
+    assert version_filter.operator == FilterOperator.IN
+    assert version_filter.value == ["old"]
+    assert vdb_mock.released_versions == ["old"]
+
+
+async def test_process_task_keeps_concurrent_ingestions(monkeypatch):
+    vdb_mock = VectorDBMock(
+        indexes=["idx1"],
+        active_version="old",
+        # Another ingestion of the document is in progress, a third one died
+        hidden_versions={"running": time.time(), "abandoned": time.time() - 7200},
+    )
+    _patch_dependencies(monkeypatch, vdb_mock)
+
+    await task.process_task(body=TASK_BODY)
 
+    [delete_call] = vdb_mock.delete_by_filter_calls
+    _, version_filter = delete_call["filters"].filters
+    assert version_filter.operator == FilterOperator.IN
+    assert sorted(version_filter.value) == ["abandoned", "old"]
+    assert sorted(vdb_mock.released_versions) == ["abandoned", "old"]
+
+
+async def test_process_task_first_version_keeps_concurrent_ingestions(monkeypatch):
+    vdb_mock = VectorDBMock(indexes=["idx1"], hidden_versions={"running": time.time()})
+    _patch_dependencies(monkeypatch, vdb_mock)
 
-async def test_process_task_delete_called_on_put_failure(monkeypatch):
+    await task.process_task(body=TASK_BODY)
+
+    [version] = vdb_mock.activated_versions
+    [delete_call] = vdb_mock.delete_by_filter_calls
+    _, version_filter = delete_call["filters"].filters
+    assert version_filter.operator == FilterOperator.NIN
+    assert version_filter.value == [version, "running"]
+    assert vdb_mock.released_versions == []
+
+
+async def test_process_task_garbage_collection_failure(monkeypatch):
+    class _VectorDBDeleteFailsMock(VectorDBMock):
+        async def delete_by_filter(self, index_name: str, filters) -> int:
+            raise RuntimeError("delete failed")
+
+    vdb_mock = _VectorDBDeleteFailsMock(indexes=["idx1"], active_version="old")
+    _patch_dependencies(monkeypatch, vdb_mock)
+
+    await task.process_task(body=TASK_BODY)
+
+    # The new version is served, the old one stays hidden until collected
+    assert vdb_mock.activated_versions == vdb_mock.staged_versions
+    assert vdb_mock.released_versions == []
+
+
+async def test_process_task_put_failure(monkeypatch):
     class _VectorDBPutFailsMock(VectorDBMock):
         async def put_objects(self, index_name: str, data: list) -> None:
             raise RuntimeError("put failed")
 
-    vdb_mock = _VectorDBPutFailsMock(indexes=[])
+    vdb_mock = _VectorDBPutFailsMock(indexes=["idx1"], active_version="old")
     _patch_dependencies(monkeypatch, vdb_mock)
 
     with pytest.raises(RuntimeError, match="put failed"):
         await task.process_task(body=TASK_BODY)
 
-    assert len(vdb_mock.delete_calls) == 0
+    [version] = vdb_mock.staged_versions
+    [delete_call] = vdb_mock.delete_by_filter_calls
+    _, version_filter = delete_call["filters"].filters
+    assert vdb_mock.activated_versions == []
+    assert version_filter.operator == FilterOperator.EQ
+    assert version_filter.value == version
+    assert vdb_mock.released_versions == [version]
+
+
+def _stored_chunk(document_hash: str, content: str = "chunk 1") -> ObjectData:
+    return ObjectData(
+        filename="doc.pdf",
+        chunk_id=0,
+        content=content,
+        vector=[0.9, 0.9],
+        version="old",
+        document_hash=document_hash,
+        content_hash=task._chunk_hash(
+            content=content,
+            fingerprint=task._embedding_fingerprint(task_settings=TaskSettingsMock()),
+        ),
+    )
+
+
+async def test_process_task_unchanged_document_is_skipped(monkeypatch):
+    document_hash = task._document_hash(
+        content_hash="abc", task_settings=TaskSettingsMock()
+    )
+    vdb_mock = VectorDBMock(
+        indexes=["idx1"], stored_objects=[_stored_chunk(document_hash=document_hash)]
+    )
+    embedder_mock = _EmbedderMock()
+    _patch_dependencies(monkeypatch, vdb_mock, embedder_mock=embedder_mock)
+
+    await task.process_task(body=TASK_BODY)
+
+    assert embedder_mock.embedded == []
+    assert vdb_mock.staged_versions == []
+    assert vdb_mock.put_calls == []
+
+
+async def test_process_task_changed_document_reuses_unchanged_chunks(monkeypatch):
+    vdb_mock = VectorDBMock(
+        indexes=["idx1"],
+        active_version="old",
+        stored_objects=[_stored_chunk(document_hash="previous")],
+    )
+    embedder_mock = _EmbedderMock()
+    _patch_dependencies(monkeypatch, vdb_mock, embedder_mock=embedder_mock)
+
+    await task.process_task(body=TASK_BODY)
+
+    [stored] = vdb_mock.put_calls[0]["data"]
+    assert embedder_mock.embedded == []
+    assert stored.vector == [0.9, 0.9]
+    assert stored.document_hash == task._document_hash(
+        content_hash="abc", task_settings=TaskSettingsMock()
+    )
+    assert vdb_mock.activated_versions == vdb_mock.staged_versions
+
+
+async def test_process_task_new_model_re_embeds(monkeypatch):
+    class _NewModelTaskSettingsMock(TaskSettingsMock):
+        embed_model_id = "another-model"
+
+    vdb_mock = VectorDBMock(
+        indexes=["idx1"], stored_objects=[_stored_chunk(document_hash="previous")]
+    )
+    embedder_mock = _EmbedderMock()
+    _patch_dependencies(
+        monkeypatch,
+        vdb_mock,
+        task_settings=_NewModelTaskSettingsMock(),
+        embedder_mock=embedder_mock,
+    )
+
+    await task.process_task(body=TASK_BODY)
+
+    assert embedder_mock.embedded == ["chunk 1"]
+    assert vdb_mock.put_calls[0]["data"][0].vector == [0.1, 0.2]
+
+
+class _StreamingTaskSettingsMock(TaskSettingsMock):
+    ingest_streaming = True
+    ingest_window_size = 2
+
+
+async def test_process_task_streaming_stores_in_windows(monkeypatch):
+    existing_results = [
+        SearchResult(
+            id="old_id_1", filename="doc.pdf", chunk_id=0, content="old", score=None
+        ),
+    ]
+    vdb_mock = VectorDBMock(indexes=["idx1"], filter_results=existing_results)
+    _patch_dependencies(monkeypatch, vdb_mock, _StreamingTaskSettingsMock())
+
+    await task.process_task(body=TASK_BODY)
+
+    assert [len(c["data"]) for c in vdb_mock.put_calls] == [2, 1]
+    assert [o.content for c in vdb_mock.put_calls for o in c["data"]] == [
+        "page 1 0",
+        "page 1 1",
+        "page 1 2",
+    ]
+    [version] = vdb_mock.activated_versions
+    assert all(o.version == version for c in vdb_mock.put_calls for o in c["data"])
+    assert vdb_mock.delete_by_filter_calls[0]["before_put"] is False
+
+
+async def test_process_task_streaming_creates_index(monkeypatch):
+    vdb_mock = VectorDBMock(indexes=[])
+    _patch_dependencies(monkeypatch, vdb_mock, _StreamingTaskSettingsMock())
+
+    await task.process_task(body=TASK_BODY)
+
+    assert vdb_mock.create_index_calls[0]["index_name"] == "idx1"
+    assert len(vdb_mock.put_calls) == 2
+    assert vdb_mock.activated_versions == vdb_mock.staged_versions
+
+
+async def test_process_task_streaming_failure_discards_version(monkeypatch):
+    class _VectorDBPutFailsMock(VectorDBMock):
+        async def put_objects(self, index_name: str, data: list) -> None:
+            raise RuntimeError("put failed")
+
+    vdb_mock = _VectorDBPutFailsMock(indexes=["idx1"])
+    _patch_dependencies(monkeypatch, vdb_mock, _StreamingTaskSettingsMock())
+
+    with pytest.raises(RuntimeError, match="put failed"):
+        await task.process_task(body=TASK_BODY)
+
+    assert vdb_mock.activated_versions == []
+    assert vdb_mock.released_versions == vdb_mock.staged_versions
+
+
+async def test_process_task_reads_and_chunks_in_executor(monkeypatch):
+    vdb_mock = VectorDBMock(indexes=["idx1"])
+    _patch_dependencies(monkeypatch, vdb_mock)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        await task.process_task(body=TASK_BODY, executor=executor)
+
+    assert len(vdb_mock.put_calls) == 1
+    assert vdb_mock.put_calls[0]["data"][0].content == "chunk 1"
+
+
+async def test_process_task_streaming_unchanged_document_is_skipped(monkeypatch):
+    document_hash = task._document_hash(
+        content_hash="abc", task_settings=_StreamingTaskSettingsMock()
+    )
+    vdb_mock = VectorDBMock(
+        indexes=["idx1"], stored_objects=[_stored_chunk(document_hash=document_hash)]
+    )
+    _patch_dependencies(monkeypatch, vdb_mock, _StreamingTaskSettingsMock())
+
+    await task.process_task(body=TASK_BODY)
+
+    assert vdb_mock.staged_versions == []
+    assert vdb_mock.put_calls == []
+
+
+@pytest.mark.parametrize(
+    "task_settings", [TaskSettingsMock(), _StreamingTaskSettingsMock()]
+)
+async def test_process_task_reads_off_the_event_loop(monkeypatch, task_settings):
+    read_threads: list[int] = []
+
+    class _ThreadRecordingLoaderMock:
+        def read(self, message):
+            read_threads.append(threading.get_ident())
+            return _MOCK_DOCUMENT
+
+        @contextmanager
+        def open_pages(self, message):
+            read_threads.append(threading.get_ident())
+            yield _MOCK_DOCUMENT.content_hash, iter(_MOCK_DOCUMENT.content)
+
+    vdb_mock = VectorDBMock(indexes=["idx1"])
+    _patch_dependencies(monkeypatch, vdb_mock, task_settings)
+    monkeypatch.setattr(
+        task, "get_document_loader", lambda bucket_name: _ThreadRecordingLoaderMock()
+    )
+
+    await task.process_task(body=TASK_BODY)
+
+    assert len(read_threads) == 1
+    assert read_threads[0] != threading.get_ident()
+    assert vdb_mock.activated_versions == vdb_mock.staged_versions
@@ -4,7 +4,12 @@ from pydantic import BaseModel
 from .interface import AgentInterface
 from .models import (
     AgentConfig,
+    AgentEvent,
     AgentResponse,
+    AgentResponseEvent,
+    AgentSourceEvent,
+    AgentTokenEvent,
+    AgentToolCallEvent,
     ChatTurn,
     ContextChunk,
     RagToolSpec,
@@ -17,6 +22,11 @@ __all__ = [
     "AgentInterface",
     "AgentConfig",
     "AgentResponse",
+    "AgentEvent",
+    "AgentTokenEvent",
+    "AgentToolCallEvent",
+    "AgentSourceEvent",
+    "AgentResponseEvent",
     "ChatTurn",
     "ContextChunk",
     "RagToolSpec",
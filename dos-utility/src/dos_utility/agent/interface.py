@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Self
+from typing import AsyncIterator, List, Optional, Self
 
-from .models import AgentResponse, ChatTurn
+from .models import AgentEvent, AgentResponse, ChatTurn
 
 
 class AgentInterface(ABC):
@@ -57,6 +57,61 @@ class AgentInterface(ABC):
         """
         ...
 
+    @abstractmethod
+    def chat_generate_stream(
+        self: Self,
+        query: str,
+        history: Optional[List[ChatTurn]] = None,
+    ) -> AsyncIterator[AgentEvent]:
+        """Generate a response to the user's query, streaming it while it is produced.
+
+        Yields the tool calls and the retrieved chunks as soon as the agent gets
+        them and the final answer token by token, then a last
+        `AgentResponseEvent` carrying the same `AgentResponse` `chat_generate`
+        would return. The streamed tokens are a preview: the final response is
+        the structured one and may differ slightly. Closing the iterator early
+        stops the agent.
+
+        Args:
+            query (str): The current user question.
+            history (Optional[List[ChatTurn]]): Prior conversation turns, ordered
+                oldest first. May be omitted for a fresh conversation.
+
+        Yields:
+            AgentEvent: `AgentTokenEvent`, `AgentToolCallEvent` and `AgentSourceEvent`
+                items, followed by a single `AgentResponseEvent`.
+
+        Raises:
+            ChatGenerationException: When the provider fails to produce a valid
+                structured response.
+
+        Examples:
+            >>> async for event in agent.chat_generate_stream(query="What is the project about?"):
+            >>>     if isinstance(event, AgentTokenEvent):
+            >>>         print(event.delta, end="")
+            >>>     elif isinstance(event, AgentResponseEvent):
+            >>>         response: AgentResponse = event.response
+        """
+        ...
+
+    @abstractmethod
+    async def embed_query(self: Self, query: str) -> List[float]:
+        """Embed the user's query with the same model used by the RAG tools.
+
+        Lets the calling service compare questions (e.g. to serve a cached
+        answer) without depending on the provider SDK.
+
+        Args:
+            query (str): The user question to embed.
+
+        Returns:
+            List[float]: The query embedding.
+
+        Examples:
+            >>> embedding: List[float] = await agent.embed_query(query="What is the project about?")
+        """
+        ...
+
     @abstractmethod
     async def close(self: Self) -> None:
         """Release any provider-side resources held by this agent.
@@ -10,6 +10,8 @@ from google.genai.types import (
     SafetySetting,
 )
 
+from ...embedding_cache import cached_embed_model
+
 
 def get_llm(
     model_id: str,
@@ -49,8 +51,9 @@ def get_embed_model(
     retries: int,
     retry_min_seconds: float,
 ) -> BaseEmbedding:
-    """Build a LlamaIndex-compatible embedding model backed by Google GenAI."""
-    return GoogleGenAIEmbedding(
+    """Build a LlamaIndex-compatible embedding model backed by Google GenAI,
+    wrapped with the embedding cache when enabled."""
+    embed_model: BaseEmbedding = GoogleGenAIEmbedding(
         model_name=model_id,
         api_key=api_key,
         embed_batch_size=embed_batch_size,
@@ -61,3 +64,7 @@ def get_embed_model(
             task_type=task_type,
         ),
     )
+
+    return cached_embed_model(
+        embed_model=embed_model, embed_dim=embed_dim, task_type=task_type
+    )
@@ -1,6 +1,13 @@
 from functools import lru_cache
 from typing import Annotated
-from pydantic import Field, PositiveInt, PositiveFloat, NonNegativeFloat, SecretStr
+from pydantic import (
+    Field,
+    NonNegativeInt,
+    PositiveInt,
+    PositiveFloat,
+    NonNegativeFloat,
+    SecretStr,
+)
 from pydantic_settings import BaseSettings
 
 
@@ -41,6 +48,20 @@ class LlamaIndexGoogleAgentSettings(BaseSettings):
     ]
     EMBED_RETRIES: Annotated[PositiveInt, Field(default=3)]
     EMBED_RETRY_MIN_SECONDS: Annotated[PositiveFloat, Field(default=1.0)]
+    EMBED_QUERY_CACHE_SIZE: Annotated[
+        NonNegativeInt,
+        Field(
+            default=1024,
+            description="Query embeddings kept in memory and shared by every RAG tool (0 disables the cache).",
+        ),
+    ]
+    EMBED_QUERY_CACHE_TTL_SECONDS: Annotated[
+        NonNegativeFloat,
+        Field(
+            default=600.0,
+            description="How long a query embedding is served from the cache (0 disables the cache).",
+        ),
+    ]
 
     # Retrieval
     SIMILARITY_TOPK: Annotated[
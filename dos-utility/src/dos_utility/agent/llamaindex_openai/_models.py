@@ -5,6 +5,8 @@ from llama_index.core.base.embeddings.base import BaseEmbedding
 from llama_index.llms.openai import OpenAI
 from llama_index.embeddings.openai import OpenAIEmbedding
 
+from ...embedding_cache import cached_embed_model
+
 
 def get_llm(
     model_id: str,
@@ -34,7 +36,8 @@ def get_embed_model(
     retries: int,
     api_base: Optional[str] = None,
 ) -> BaseEmbedding:
-    """Build a LlamaIndex-compatible embedding model backed by OpenAI."""
+    """Build a LlamaIndex-compatible embedding model backed by OpenAI,
+    wrapped with the embedding cache when enabled."""
     kwargs = {
         "model": model_id,
         "api_key": api_key,
@@ -45,4 +48,6 @@ def get_embed_model(
     if api_base is not None:
         kwargs["api_base"] = api_base
 
-    return OpenAIEmbedding(**kwargs)
+    return cached_embed_model(
+        embed_model=OpenAIEmbedding(**kwargs), embed_dim=embed_dim
+    )
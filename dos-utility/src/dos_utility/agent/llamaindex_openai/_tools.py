@@ -1,17 +1,119 @@
-from typing import List, Optional
+import asyncio
+
+from logging import Logger
+from typing import Any, Dict, List, Optional, Self
 
 from llama_index.core import PromptTemplate, VectorStoreIndex
+from llama_index.core.base.base_query_engine import BaseQueryEngine
 from llama_index.core.base.base_retriever import BaseRetriever
 from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.base.response.schema import RESPONSE_TYPE, Response
 from llama_index.core.llms.llm import LLM
-from llama_index.core.query_engine import RetrieverQueryEngine
+from llama_index.core.query_engine import CustomQueryEngine, RetrieverQueryEngine
+from llama_index.core.schema import NodeWithScore
 from llama_index.core.tools import QueryEngineTool
 
 from ..models import RagToolSpec
+from ...utils.logger import get_logger
 from ...vector_db import VectorDBInterface, get_vector_db_instance
 from ._structured_outputs import RAGOutput
 
 
+logger: Logger = get_logger(name=__name__)
+
+# Name of the tool querying every `parallel` RAG tool at once
+PARALLEL_TOOL_NAME: str = "ParallelSearch"
+
+
+def _format_sources(nodes: List[NodeWithScore]) -> str:
+    """Render retrieved chunks as a ranked list of sources for the agent."""
+    if len(nodes) == 0:
+        return "No relevant sources found."
+
+    sources: List[str] = []
+
+    for rank, node in enumerate(nodes, start=1):
+        score: str = f"{node.score:.3f}" if node.score is not None else "n/a"
+        sources.append(
+            f"[{rank}] {node.metadata.get('filename', '')} "
+            f"(chunk {node.metadata.get('chunk_id', 0)}, score {score})\n{node.text}"
+        )
+
+    return "\n\n".join(sources)
+
+
+class RetrievalQueryEngine(CustomQueryEngine):
+    """Query engine returning the retrieved chunks without any LLM synthesis.
+
+    Backs the `retrieve` tool mode: the ranked chunks are handed straight to
+    the agent, saving the LLM round trip(s) a `RetrieverQueryEngine` spends
+    on every tool call. Like a synthesized response, the returned `Response`
+    carries the `source_nodes` the agent context is built from.
+    """
+
+    retriever: BaseRetriever
+
+    def custom_query(self: Self, query_str: str) -> Response:
+        nodes: List[NodeWithScore] = self.retriever.retrieve(query_str)
+
+        return Response(response=_format_sources(nodes), source_nodes=nodes)
+
+    async def acustom_query(self: Self, query_str: str) -> Response:
+        nodes: List[NodeWithScore] = await self.retriever.aretrieve(query_str)
+
+        return Response(response=_format_sources(nodes), source_nodes=nodes)
+
+
+class ParallelQueryEngine(CustomQueryEngine):
+    """Query engine sending the same query to several RAG tools concurrently.
+
+    A ReAct step selects a single tool, so the agent would query several
+    indexes one step (and one LLM round trip) at a time. This engine lets it
+    reach all of them in one step: the sections of the tools are joined in
+    their configuration order and their `source_nodes` merged. A failing tool
+    is reported in its section instead of failing the others.
+    """
+
+    query_engines: Dict[str, BaseQueryEngine]
+
+    def __combine(self: Self, responses: List[RESPONSE_TYPE | Exception]) -> Response:
+        sections: List[str] = []
+        nodes: List[NodeWithScore] = []
+
+        for name, response in zip(self.query_engines, responses):
+            if isinstance(response, Exception):
+                logger.warning("Parallel tool %s failed: %s", name, response)
+                sections.append(f"{name}:\nFailed to retrieve sources.")
+                continue
+
+            sections.append(f"{name}:\n{response}")
+            nodes.extend(response.source_nodes)
+
+        return Response(response="\n\n".join(sections), source_nodes=nodes)
+
+    def custom_query(self: Self, query_str: str) -> Response:
+        responses: List[RESPONSE_TYPE | Exception] = []
+
+        for query_engine in self.query_engines.values():
+            try:
+                responses.append(query_engine.query(query_str))
+            except Exception as e:
+                responses.append(e)
+
+        return self.__combine(responses=responses)
+
+    async def acustom_query(self: Self, query_str: str) -> Response:
+        responses: List[RESPONSE_TYPE | Exception] = await asyncio.gather(
+            *(
+                query_engine.aquery(query_str)
+                for query_engine in self.query_engines.values()
+            ),
+            return_exceptions=True,
+        )
+
+        return self.__combine(responses=responses)
+
+
 def _load_index(
     vector_db: VectorDBInterface, embed_model: BaseEmbedding
 ) -> VectorStoreIndex:
@@ -30,19 +132,28 @@ def _build_query_engine_tool(
     similarity_top_k: int,
     text_qa_template: Optional[PromptTemplate],
     refine_template: Optional[PromptTemplate],
+    search_params: Optional[Dict[str, Any]] = None,
     use_async: bool = True,
+    retrieve_only: bool = False,
 ) -> QueryEngineTool:
     retriever: BaseRetriever = index.as_retriever(
         similarity_top_k=similarity_top_k,
         embed_model=embed_model,
+        vector_store_kwargs=(
+            {"search_params": search_params} if search_params is not None else {}
+        ),
     )
-    query_engine: RetrieverQueryEngine = RetrieverQueryEngine.from_args(
-        retriever=retriever,
-        llm=llm,
-        output_cls=RAGOutput,
-        text_qa_template=text_qa_template,
-        refine_template=refine_template,
-        use_async=use_async,
+    query_engine: BaseQueryEngine = (
+        RetrievalQueryEngine(retriever=retriever)
+        if retrieve_only
+        else RetrieverQueryEngine.from_args(
+            retriever=retriever,
+            llm=llm,
+            output_cls=RAGOutput,
+            text_qa_template=text_qa_template,
+            refine_template=refine_template,
+            use_async=use_async,
+        )
     )
 
     return QueryEngineTool.from_defaults(
@@ -52,6 +163,26 @@ def _build_query_engine_tool(
     )
 
 
+def _build_parallel_tool(
+    tools: List[QueryEngineTool], specs: List[RagToolSpec]
+) -> QueryEngineTool:
+    descriptions: str = "\n".join(
+        f"- {spec.name}: {spec.description.strip()}" for spec in specs
+    )
+
+    return QueryEngineTool.from_defaults(
+        query_engine=ParallelQueryEngine(
+            query_engines={tool.metadata.name: tool.query_engine for tool in tools}
+        ),
+        name=PARALLEL_TOOL_NAME,
+        description=(
+            "Runs the same query against all of the following tools at once and "
+            "returns the result of each one. Prefer it to calling them one by one "
+            f"when the question may be answered by several of them:\n{descriptions}"
+        ),
+    )
+
+
 def build_rag_tools(
     rag_tools: List[RagToolSpec],
     llm: LLM,
@@ -61,9 +192,13 @@ def build_rag_tools(
     """Materialise a list of RagToolSpec into LlamaIndex QueryEngineTools.
 
     Each spec is wired to an index in the configured vector database via
-    `dos_utility.vector_db.get_vector_db_instance`.
+    `dos_utility.vector_db.get_vector_db_instance`. When at least two specs are
+    `parallel`, a `ParallelSearch` tool querying all of them concurrently is
+    appended to the list.
     """
     tools: List[QueryEngineTool] = []
+    parallel_tools: List[QueryEngineTool] = []
+    parallel_specs: List[RagToolSpec] = []
 
     for spec in rag_tools:
         qa_template: Optional[PromptTemplate] = (
@@ -94,17 +229,31 @@ def build_rag_tools(
         index: VectorStoreIndex = _load_index(
             vector_db=vector_db, embed_model=embed_model
         )
-        tools.append(
-            _build_query_engine_tool(
-                index=index,
-                name=spec.name,
-                description=spec.description,
-                llm=llm,
-                embed_model=embed_model,
-                similarity_top_k=spec.similarity_top_k or default_similarity_top_k,
-                text_qa_template=qa_template,
-                refine_template=refine_template,
-            )
+        tool: QueryEngineTool = _build_query_engine_tool(
+            index=index,
+            name=spec.name,
+            description=spec.description,
+            llm=llm,
+            embed_model=embed_model,
+            similarity_top_k=spec.similarity_top_k or default_similarity_top_k,
+            text_qa_template=qa_template,
+            refine_template=refine_template,
+            search_params=spec.search_params,
+            retrieve_only=spec.mode == "retrieve",
+        )
+        tools.append(tool)
+
+        if spec.parallel:
+            parallel_tools.append(tool)
+            parallel_specs.append(spec)
+
+    if len(parallel_tools) >= 2:
+        tools.append(_build_parallel_tool(tools=parallel_tools, specs=parallel_specs))
+    elif len(parallel_tools) == 1:
+        logger.warning(
+            "Only one parallel RAG tool (%s), no %s tool built",
+            parallel_specs[0].name,
+            PARALLEL_TOOL_NAME,
         )
 
     return tools
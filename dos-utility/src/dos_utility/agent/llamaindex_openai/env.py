@@ -1,6 +1,6 @@
 from functools import lru_cache
 from typing import Annotated, Optional
-from pydantic import Field, NonNegativeFloat, PositiveInt, SecretStr
+from pydantic import Field, NonNegativeInt, NonNegativeFloat, PositiveInt, SecretStr
 from pydantic_settings import BaseSettings
 
 
@@ -40,6 +40,20 @@ class LlamaIndexOpenAIAgentSettings(BaseSettings):
     ]
     EMBED_BATCH_SIZE: Annotated[PositiveInt, Field(default=100)]
     EMBED_RETRIES: Annotated[PositiveInt, Field(default=3)]
+    EMBED_QUERY_CACHE_SIZE: Annotated[
+        NonNegativeInt,
+        Field(
+            default=1024,
+            description="Query embeddings kept in memory and shared by every RAG tool (0 disables the cache).",
+        ),
+    ]
+    EMBED_QUERY_CACHE_TTL_SECONDS: Annotated[
+        NonNegativeFloat,
+        Field(
+            default=600.0,
+            description="How long a query embedding is served from the cache (0 disables the cache).",
+        ),
+    ]
 
     # Retrieval
     SIMILARITY_TOPK: Annotated[
@@ -1,16 +1,35 @@
 from logging import Logger
-from typing import Any, Dict, List, Optional, Self, Type
+from typing import Any, AsyncIterator, Dict, List, Optional, Self, Type
 
 from pydantic import BaseModel
 from workflows import Context
-from llama_index.core.agent.workflow import AgentOutput, ReActAgent
+from workflows.handler import WorkflowHandler
+from llama_index.core.agent.workflow import (
+    AgentOutput,
+    AgentStream,
+    ReActAgent,
+    ToolCall,
+    ToolCallResult,
+)
 from llama_index.core.base.embeddings.base import BaseEmbedding
 from llama_index.core.llms import ChatMessage, MessageRole
 from llama_index.core.llms.llm import LLM, ToolSelection
 
 from ..interface import AgentInterface
-from ..models import AgentConfig, AgentResponse, ChatTurn, ContextChunk, RagToolSpec
+from ..models import (
+    AgentConfig,
+    AgentEvent,
+    AgentResponse,
+    AgentResponseEvent,
+    AgentSourceEvent,
+    AgentTokenEvent,
+    AgentToolCallEvent,
+    ChatTurn,
+    ContextChunk,
+    RagToolSpec,
+)
 from ..exceptions import AgentInitializationException, ChatGenerationException
+from ...embedding_cache import CachedQueryEmbedding, cached_query_embed_model
 from ...utils.logger import get_logger
 from .env import LlamaIndexOpenAIAgentSettings, get_llamaindex_openai_agent_settings
 from ._models import get_embed_model, get_llm
@@ -20,6 +39,9 @@ from ._agent import build_react_agent
 
 logger: Logger = get_logger(name=__name__)
 
+# Marks the final answer in the text of a ReAct reasoning step
+_ANSWER_MARKER: str = "Answer:"
+
 
 class LlamaIndexOpenAIAgent(AgentInterface):
     """`AgentInterface` implementation backed by LlamaIndex ReActAgent + OpenAI.
@@ -48,13 +70,19 @@ class LlamaIndexOpenAIAgent(AgentInterface):
                 max_tokens=self._settings.MAX_TOKENS,
                 api_base=self._settings.OPENAI_API_BASE,
             )
-            self._embed_model: BaseEmbedding = get_embed_model(
-                model_id=self._settings.EMBED_MODEL_ID,
-                api_key=self._settings.MODEL_API_KEY.get_secret_value(),
-                embed_dim=self._settings.EMBED_DIM,
-                embed_batch_size=self._settings.EMBED_BATCH_SIZE,
-                retries=self._settings.EMBED_RETRIES,
-                api_base=self._settings.OPENAI_API_BASE,
+            # One instance shared by every RAG tool, so a sub-query sent to several
+            # tools (or asked again by another user) is embedded once.
+            self._embed_model: BaseEmbedding = cached_query_embed_model(
+                embed_model=get_embed_model(
+                    model_id=self._settings.EMBED_MODEL_ID,
+                    api_key=self._settings.MODEL_API_KEY.get_secret_value(),
+                    embed_dim=self._settings.EMBED_DIM,
+                    embed_batch_size=self._settings.EMBED_BATCH_SIZE,
+                    retries=self._settings.EMBED_RETRIES,
+                    api_base=self._settings.OPENAI_API_BASE,
+                ),
+                max_entries=self._settings.EMBED_QUERY_CACHE_SIZE,
+                ttl_seconds=self._settings.EMBED_QUERY_CACHE_TTL_SECONDS,
             )
 
             tools = build_rag_tools(
@@ -94,6 +122,9 @@ class LlamaIndexOpenAIAgent(AgentInterface):
         # The OpenAI client does not currently require explicit cleanup.
         return None
 
+    async def embed_query(self: Self, query: str) -> List[float]:
+        return await self._embed_model.aget_query_embedding(query)
+
     def _history_to_chat_messages(
         self: Self, history: Optional[List[ChatTurn]]
     ) -> List[ChatMessage]:
@@ -133,6 +164,33 @@ class LlamaIndexOpenAIAgent(AgentInterface):
         chunks.sort(key=lambda c: (c.score is None, -(c.score or 0)))
         return chunks
 
+    def _response_from_output(
+        self: Self, engine_response: AgentOutput
+    ) -> AgentResponse:
+        structured: Optional[Dict[str, Any]] = engine_response.structured_response
+
+        if not isinstance(structured, dict) or "response" not in structured:
+            raise ChatGenerationException(
+                msg=f"Structured output parsing failed (got type={type(structured).__name__})"
+            )
+
+        return AgentResponse(
+            response=structured["response"],
+            tags=[],
+            context=self._context_from_tool_calls(
+                tool_calls=engine_response.tool_calls
+            ),
+        )
+
+    def _answer_delta(self: Self, response: str, emitted: int) -> str:
+        """Return the part of the final answer in `response` not streamed yet."""
+        start: int = response.find(_ANSWER_MARKER)
+
+        if start < 0:
+            return ""
+
+        return response[start + len(_ANSWER_MARKER) :].lstrip()[emitted:]
+
     async def chat_generate(
         self: Self,
         query: str,
@@ -154,22 +212,71 @@ class LlamaIndexOpenAIAgent(AgentInterface):
                 early_stopping_method="generate",
             )
             logger.debug("Agent run completed")
+
+            if isinstance(self._embed_model, CachedQueryEmbedding):
+                logger.debug("Query embedding cache - %s", self._embed_model.stats())
         except Exception as e:
             raise ChatGenerationException(msg=str(e))
 
-        structured: Optional[Dict[str, Any]] = engine_response.structured_response
+        return self._response_from_output(engine_response=engine_response)
 
-        if not isinstance(structured, dict) or "response" not in structured:
-            raise ChatGenerationException(
-                msg=f"Structured output parsing failed (got type={type(structured).__name__})"
+    async def chat_generate_stream(
+        self: Self,
+        query: str,
+        history: Optional[List[ChatTurn]] = None,
+    ) -> AsyncIterator[AgentEvent]:
+        chat_history: List[ChatMessage] = self._history_to_chat_messages(
+            history=history
+        )
+        logger.debug("Converted chat history, %d messages", len(chat_history))
+        handler: Optional[WorkflowHandler] = None
+
+        try:
+            ctx: Context = Context.from_dict(workflow=self._agent, data={})
+
+            logger.debug("Running agent, streaming...")
+            handler = self._agent.run(
+                user_msg=query,
+                chat_history=chat_history,
+                ctx=ctx,
+                early_stopping_method="generate",
             )
+            # Length of the answer streamed for the current reasoning step
+            emitted: int = 0
 
-        return AgentResponse(
-            response=structured["response"],
-            tags=[],
-            context=self._context_from_tool_calls(
-                tool_calls=engine_response.tool_calls
-            ),
+            async for event in handler.stream_events():
+                if isinstance(event, AgentStream):
+                    delta: str = self._answer_delta(
+                        response=event.response, emitted=emitted
+                    )
+
+                    if delta:
+                        emitted += len(delta)
+                        yield AgentTokenEvent(delta=delta)
+                elif isinstance(event, AgentOutput):
+                    emitted = 0
+                elif isinstance(event, ToolCall):
+                    yield AgentToolCallEvent(
+                        tool_name=event.tool_name, tool_kwargs=event.tool_kwargs
+                    )
+                elif isinstance(event, ToolCallResult):
+                    for chunk in self._context_from_tool_calls(tool_calls=[event]):
+                        yield AgentSourceEvent(chunk=chunk)
+
+            engine_response: AgentOutput = await handler
+            logger.debug("Agent run completed")
+
+            if isinstance(self._embed_model, CachedQueryEmbedding):
+                logger.debug("Query embedding cache - %s", self._embed_model.stats())
+        except Exception as e:
+            raise ChatGenerationException(msg=str(e))
+        finally:
+            # The consumer stopped early: don't let the agent run for nothing
+            if handler is not None and not handler.is_done():
+                await handler.cancel_run()
+
+        yield AgentResponseEvent(
+            response=self._response_from_output(engine_response=engine_response)
         )
 
 
@@ -1,4 +1,4 @@
-from typing import Annotated, List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 from pydantic import BaseModel, Field, PositiveInt
 
 
@@ -56,6 +56,47 @@ class AgentResponse(BaseModel):
     ]
 
 
+class AgentTokenEvent(BaseModel):
+    """A piece of the final answer, streamed while the agent writes it."""
+
+    type: Annotated[Literal["token"], Field(default="token")]
+    delta: Annotated[str, Field(description="The text appended to the answer.")]
+
+
+class AgentToolCallEvent(BaseModel):
+    """A tool the agent decided to call."""
+
+    type: Annotated[Literal["tool_call"], Field(default="tool_call")]
+    tool_name: Annotated[str, Field(description="Name of the called tool.")]
+    tool_kwargs: Annotated[
+        Dict[str, Any],
+        Field(default_factory=dict, description="Arguments of the tool call."),
+    ]
+
+
+class AgentSourceEvent(BaseModel):
+    """A document chunk retrieved by a RAG tool call."""
+
+    type: Annotated[Literal["source"], Field(default="source")]
+    chunk: Annotated[ContextChunk, Field(description="The retrieved chunk.")]
+
+
+class AgentResponseEvent(BaseModel):
+    """Last event of a stream, carrying the same response `chat_generate` returns."""
+
+    type: Annotated[Literal["response"], Field(default="response")]
+    response: Annotated[
+        AgentResponse, Field(description="The final structured response.")
+    ]
+
+
+AgentEvent = Annotated[
+    Union[AgentTokenEvent, AgentToolCallEvent, AgentSourceEvent, AgentResponseEvent],
+    Field(discriminator="type"),
+]
+"""Event streamed by `AgentInterface.chat_generate_stream`."""
+
+
 class RagToolSpec(BaseModel):
     """Specification of a single RAG tool backed by a vector index.
 
@@ -98,6 +139,27 @@ class RagToolSpec(BaseModel):
             description="Custom refine prompt template. Must expose {existing_answer} and {context_msg} variables.",
         ),
     ]
+    search_params: Annotated[
+        Optional[Dict[str, Any]],
+        Field(
+            default=None,
+            description='Vector DB search parameters for this tool, e.g. {"hnsw_ef": 128, "quantization": {"oversampling": 2.0}} for Qdrant. Ignored by providers without search parameters.',
+        ),
+    ]
+    mode: Annotated[
+        Literal["synthesize", "retrieve"],
+        Field(
+            default="synthesize",
+            description="`synthesize` answers every tool call with its own LLM synthesis over the retrieved chunks. `retrieve` skips it and returns the ranked chunks straight to the agent (qa_prompt and refine_prompt are then ignored).",
+        ),
+    ]
+    parallel: Annotated[
+        bool,
+        Field(
+            default=False,
+            description="Also expose the tool through a combined tool querying every parallel tool concurrently, in a single agent step. Needs at least two parallel tools.",
+        ),
+    ]
 
 
 class AgentConfig(BaseModel):
@@ -4,17 +4,23 @@ from .env import NoSQLProvider, NoSQLSettings, get_nosql_settings
 
 from .interface import NoSQLInterface
 from .models import KeyCondition, ConditionOperator, QueryResult, ScanResult
-from .dynamodb import get_dynamodb_nosql
-
+from .exceptions import BatchWriteException
+from .dynamodb import (
+    get_dynamodb_nosql,
+    open_dynamodb_connection,
+    close_dynamodb_connection,
+)
 
 __all__ = [
     "get_nosql_client",
     "get_nosql_client_ctx",
+    "nosql_lifespan",
     "NoSQLInterface",
     "KeyCondition",
     "ConditionOperator",
     "QueryResult",
     "ScanResult",
+    "BatchWriteException",
 ]
 
 
@@ -52,3 +58,30 @@ async def get_nosql_client() -> AsyncGenerator[NoSQLInterface, None]:
     """
     async with get_nosql_client_ctx() as nosql_client:
         yield nosql_client
+
+
+@asynccontextmanager
+async def nosql_lifespan() -> AsyncGenerator[None, None]:
+    """Asynchronous context manager owning the process-wide NoSQL connection pool.
+
+    Enter it in the application lifespan: the client is created once at startup,
+    reused by every `get_nosql_client` / `get_nosql_client_ctx` call, and closed on
+    shutdown. Without it the pool is created lazily on first use.
+
+    Examples:
+        >>> @asynccontextmanager
+        >>> async def lifespan(app: FastAPI):
+        >>>     async with nosql_lifespan():
+        >>>         yield
+    """
+    nosql_settings: NoSQLSettings = get_nosql_settings()
+
+    if nosql_settings.NOSQL_PROVIDER is NoSQLProvider.DYNAMODB:
+        await open_dynamodb_connection()
+
+        try:
+            yield
+        finally:
+            await close_dynamodb_connection()
+    else:
+        yield
@@ -1,3 +1,14 @@
 from .implementation import DynamoDBNoSQL, get_dynamodb_nosql
+from .connection import (
+    DynamoDBConnection,
+    open_dynamodb_connection,
+    close_dynamodb_connection,
+)
 
-__all__ = ["DynamoDBNoSQL", "get_dynamodb_nosql"]
+__all__ = [
+    "DynamoDBNoSQL",
+    "get_dynamodb_nosql",
+    "DynamoDBConnection",
+    "open_dynamodb_connection",
+    "close_dynamodb_connection",
+]
@@ -0,0 +1,111 @@
+import asyncio
+import threading
+import boto3
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Self, TypeVar
+from botocore.client import BaseClient
+from botocore.config import Config
+
+from ....utils.aws import get_aws_credentials_settings, AWSCredentialsSettings
+from .env import DynamoDBSettings, get_dynamodb_settings
+
+T = TypeVar("T")
+
+
+class DynamoDBConnection:
+    """Process-wide DynamoDB client.
+
+    The low-level boto3 client is thread-safe and keeps a pool of up to
+    `DYNAMODB_MAX_POOL_CONNECTIONS` keep-alive HTTP connections. Its blocking
+    calls run on a dedicated thread pool of the same size, so they never
+    queue behind unrelated work on the loop's default executor.
+    """
+
+    def __init__(self: Self) -> None:
+        self._settings: DynamoDBSettings = get_dynamodb_settings()
+        self._aws_credentials: AWSCredentialsSettings = get_aws_credentials_settings()
+
+        kwargs: Dict[str, Any] = {
+            "region_name": self._settings.DYNAMODB_REGION,
+            "config": Config(
+                max_pool_connections=self._settings.DYNAMODB_MAX_POOL_CONNECTIONS,
+                connect_timeout=self._settings.DYNAMODB_CONNECT_TIMEOUT,
+                read_timeout=self._settings.DYNAMODB_READ_TIMEOUT,
+                retries={
+                    "max_attempts": self._settings.DYNAMODB_MAX_ATTEMPTS,
+                    "mode": "standard",
+                },
+                tcp_keepalive=True,
+            ),
+        }
+
+        if self._aws_credentials.AWS_ACCESS_KEY_ID is not None:
+            kwargs["aws_access_key_id"] = self._aws_credentials.AWS_ACCESS_KEY_ID
+
+        if self._aws_credentials.AWS_SECRET_ACCESS_KEY is not None:
+            kwargs["aws_secret_access_key"] = (
+                self._aws_credentials.AWS_SECRET_ACCESS_KEY.get_secret_value()
+            )
+
+        if self._settings.DYNAMODB_ENDPOINT_URL is not None:
+            kwargs["endpoint_url"] = self._settings.DYNAMODB_ENDPOINT_URL + (
+                f":{self._settings.DYNAMODB_PORT}"
+                if self._settings.DYNAMODB_PORT
+                else ""
+            )
+
+        self.client: BaseClient = boto3.client("dynamodb", **kwargs)
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=self._settings.DYNAMODB_MAX_POOL_CONNECTIONS,
+            thread_name_prefix="dynamodb",
+        )
+
+    async def run(self: Self, func: Callable[..., T], **kwargs: Any) -> T:
+        """Runs a blocking client call on the connection thread pool."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self._executor, lambda: func(**kwargs))
+
+    def close(self: Self) -> None:
+        self._executor.shutdown(wait=True)
+        self.client.close()
+
+
+_connection: Optional[DynamoDBConnection] = None
+_connection_lock: threading.Lock = threading.Lock()
+
+
+async def open_dynamodb_connection() -> DynamoDBConnection:
+    """Returns the process-wide DynamoDB connection, creating it on first use.
+
+    Creating the client loads the botocore service model, so it is done off
+    the event loop. Call it from the application lifespan to pay that cost at
+    startup instead of on the first request.
+    """
+    global _connection
+
+    if _connection is not None:
+        return _connection
+
+    def _open() -> DynamoDBConnection:
+        global _connection
+
+        with _connection_lock:
+            if _connection is None:
+                _connection = DynamoDBConnection()
+
+            return _connection
+
+    return await asyncio.to_thread(_open)
+
+
+async def close_dynamodb_connection() -> None:
+    """Closes the process-wide DynamoDB connection, if it was opened."""
+    global _connection
+
+    with _connection_lock:
+        connection, _connection = _connection, None
+
+    if connection is not None:
+        await asyncio.to_thread(connection.close)
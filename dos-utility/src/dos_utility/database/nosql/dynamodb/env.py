@@ -9,6 +9,12 @@ class DynamoDBSettings(BaseSettings):
     DYNAMODB_ENDPOINT_URL: Annotated[Optional[str], Field(default=None)]
     DYNAMODB_PORT: Annotated[Optional[int], Field(default=None)]
     DYNAMODB_TABLE_PREFIX: Annotated[Optional[str], Field(default=None)]
+    DYNAMODB_MAX_POOL_CONNECTIONS: Annotated[int, Field(default=50, gt=0)]
+    DYNAMODB_CONNECT_TIMEOUT: Annotated[float, Field(default=5.0, gt=0)]
+    DYNAMODB_READ_TIMEOUT: Annotated[float, Field(default=10.0, gt=0)]
+    DYNAMODB_MAX_ATTEMPTS: Annotated[int, Field(default=3, gt=0)]
+    DYNAMODB_BATCH_WRITE_CONCURRENCY: Annotated[int, Field(default=8, gt=0)]
+    DYNAMODB_BATCH_WRITE_MAX_RETRIES: Annotated[int, Field(default=5, ge=0)]
 
 
 @lru_cache
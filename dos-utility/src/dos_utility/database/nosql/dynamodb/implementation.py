@@ -1,49 +1,32 @@
 import asyncio
-import boto3
 import logging
+import random
 
-from typing import Any, Dict, List, Optional, Self
-from asyncio import AbstractEventLoop
-from boto3.dynamodb.conditions import Key
-from boto3.resources.factory import ServiceResource
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Self
+from boto3.dynamodb.conditions import ConditionExpressionBuilder, Key
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 
-from ....utils.aws import get_aws_credentials_settings, AWSCredentialsSettings
+from ..exceptions import BatchWriteException
 from ..interface import NoSQLInterface
 from ..models import ConditionOperator, KeyCondition, QueryResult, ScanResult
+from .connection import DynamoDBConnection, open_dynamodb_connection
 from .env import DynamoDBSettings, get_dynamodb_settings
 
+# BatchWriteItem accepts at most 25 put/delete requests per call
+DYNAMODB_BATCH_WRITE_SIZE: int = 25
+DYNAMODB_BATCH_WRITE_BACKOFF_SECONDS: float = 0.05
+
 
 class DynamoDBNoSQL(NoSQLInterface):
     def __init__(self: Self) -> None:
         self._settings: DynamoDBSettings = get_dynamodb_settings()
-        self._aws_credentials: AWSCredentialsSettings = get_aws_credentials_settings()
+        self._serializer: TypeSerializer = TypeSerializer()
+        self._deserializer: TypeDeserializer = TypeDeserializer()
 
     async def __aenter__(self: Self) -> Self:
-        loop: AbstractEventLoop = asyncio.get_event_loop()
-
-        kwargs: Dict[str, Any] = {
-            "region_name": self._settings.DYNAMODB_REGION,
-        }
-
-        if self._aws_credentials.AWS_ACCESS_KEY_ID is not None:
-            kwargs["aws_access_key_id"] = self._aws_credentials.AWS_ACCESS_KEY_ID
-
-        if self._aws_credentials.AWS_SECRET_ACCESS_KEY is not None:
-            kwargs["aws_secret_access_key"] = (
-                self._aws_credentials.AWS_SECRET_ACCESS_KEY.get_secret_value()
-            )
-
-        if self._settings.DYNAMODB_ENDPOINT_URL is not None:
-            kwargs["endpoint_url"] = self._settings.DYNAMODB_ENDPOINT_URL + (
-                f":{self._settings.DYNAMODB_PORT}"
-                if self._settings.DYNAMODB_PORT
-                else ""
-            )
-
-        self._resource: ServiceResource = await loop.run_in_executor(
-            None,
-            lambda: boto3.resource("dynamodb", **kwargs),
-        )
+        # The client and its connection pool are shared by the whole process,
+        # entering the context only borrows them.
+        self._connection: DynamoDBConnection = await open_dynamodb_connection()
 
         return self
 
@@ -57,13 +40,19 @@ class DynamoDBNoSQL(NoSQLInterface):
 
         return table_name
 
+    def __serialize(self: Self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a plain python dict to DynamoDB attribute values."""
+        return {name: self._serializer.serialize(value) for name, value in item.items()}
+
+    def __deserialize(self: Self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert DynamoDB attribute values to a plain python dict."""
+        return {
+            name: self._deserializer.deserialize(value) for name, value in item.items()
+        }
+
     async def is_healthy(self: Self) -> bool:
-        loop: AbstractEventLoop = asyncio.get_event_loop()
         try:
-            await loop.run_in_executor(
-                None,
-                lambda: list(self._resource.tables.limit(1)),
-            )
+            await self._connection.run(self._connection.client.list_tables, Limit=1)
         except Exception as e:
             logging.error(f"DynamoDB health check failed: {e}")
 
@@ -72,32 +61,29 @@ class DynamoDBNoSQL(NoSQLInterface):
         return True
 
     async def put_item(self: Self, table_name: str, item: Dict[str, Any]) -> None:
-        loop: AbstractEventLoop = asyncio.get_event_loop()
-        table = self._resource.Table(self.__get_table_name(table_name=table_name))
-
-        await loop.run_in_executor(
-            None,
-            lambda: table.put_item(Item=item),
+        await self._connection.run(
+            self._connection.client.put_item,
+            TableName=self.__get_table_name(table_name=table_name),
+            Item=self.__serialize(item),
         )
 
     async def get_item(
         self: Self, table_name: str, key: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
-        loop: AbstractEventLoop = asyncio.get_event_loop()
-        table = self._resource.Table(self.__get_table_name(table_name=table_name))
-        response = await loop.run_in_executor(
-            None,
-            lambda: table.get_item(Key=key),
+        response = await self._connection.run(
+            self._connection.client.get_item,
+            TableName=self.__get_table_name(table_name=table_name),
+            Key=self.__serialize(key),
         )
+        item: Optional[Dict[str, Any]] = response.get("Item")
 
-        return response.get("Item")
+        return self.__deserialize(item) if item is not None else None
 
     async def delete_item(self: Self, table_name: str, key: Dict[str, Any]) -> None:
-        loop: AbstractEventLoop = asyncio.get_event_loop()
-        table = self._resource.Table(self.__get_table_name(table_name=table_name))
-        await loop.run_in_executor(
-            None,
-            lambda: table.delete_item(Key=key),
+        await self._connection.run(
+            self._connection.client.delete_item,
+            TableName=self.__get_table_name(table_name=table_name),
+            Key=self.__serialize(key),
         )
 
     async def update_item(
@@ -106,9 +92,6 @@ class DynamoDBNoSQL(NoSQLInterface):
         key: Dict[str, Any],
         fields_to_update: Dict[str, Any],
     ) -> Optional[Dict[str, Any]]:
-        loop: AbstractEventLoop = asyncio.get_event_loop()
-        table = self._resource.Table(self.__get_table_name(table_name=table_name))
-
         # Build UpdateExpression, ExpressionAttributeNames, and ExpressionAttributeValues
         update_parts: List[str] = []
         expression_attribute_names: Dict[str, str] = {}
@@ -123,18 +106,80 @@ class DynamoDBNoSQL(NoSQLInterface):
 
         update_expression: str = "SET " + ", ".join(update_parts)
 
-        response = await loop.run_in_executor(
-            None,
-            lambda: table.update_item(
-                Key=key,
-                UpdateExpression=update_expression,
-                ExpressionAttributeNames=expression_attribute_names,
-                ExpressionAttributeValues=expression_attribute_values,
-                ReturnValues="ALL_NEW",
-            ),
+        response = await self._connection.run(
+            self._connection.client.update_item,
+            TableName=self.__get_table_name(table_name=table_name),
+            Key=self.__serialize(key),
+            UpdateExpression=update_expression,
+            ExpressionAttributeNames=expression_attribute_names,
+            ExpressionAttributeValues=self.__serialize(expression_attribute_values),
+            ReturnValues="ALL_NEW",
         )
+        attributes: Optional[Dict[str, Any]] = response.get("Attributes")
+
+        return self.__deserialize(attributes) if attributes is not None else None
+
+    async def __batch_write(
+        self: Self, table_name: str, requests: List[Dict[str, Any]]
+    ) -> None:
+        """Send the write requests in concurrent BatchWriteItem calls of 25,
+        retrying the UnprocessedItems of each call with exponential backoff.
+        """
+        table: str = self.__get_table_name(table_name=table_name)
+        max_retries: int = self._settings.DYNAMODB_BATCH_WRITE_MAX_RETRIES
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(
+            self._settings.DYNAMODB_BATCH_WRITE_CONCURRENCY
+        )
+
+        async def _write(batch: List[Dict[str, Any]]) -> None:
+            async with semaphore:
+                for attempt in range(max_retries + 1):
+                    if attempt > 0:
+                        await asyncio.sleep(
+                            DYNAMODB_BATCH_WRITE_BACKOFF_SECONDS
+                            * 2 ** (attempt - 1)
+                            * random.uniform(0.5, 1.5)
+                        )
+
+                    response = await self._connection.run(
+                        self._connection.client.batch_write_item,
+                        RequestItems={table: batch},
+                    )
+                    batch = response.get("UnprocessedItems", {}).get(table, [])
+
+                    if len(batch) == 0:
+                        return
+
+            raise BatchWriteException(
+                f"{len(batch)} requests on table '{table}' still unprocessed after {max_retries} retries"
+            )
 
-        return response.get("Attributes")
+        await asyncio.gather(
+            *(
+                _write(requests[start : start + DYNAMODB_BATCH_WRITE_SIZE])
+                for start in range(0, len(requests), DYNAMODB_BATCH_WRITE_SIZE)
+            )
+        )
+
+    async def batch_put_items(
+        self: Self, table_name: str, items: List[Dict[str, Any]]
+    ) -> None:
+        await self.__batch_write(
+            table_name=table_name,
+            requests=[
+                {"PutRequest": {"Item": self.__serialize(item)}} for item in items
+            ],
+        )
+
+    async def batch_delete_items(
+        self: Self, table_name: str, keys: List[Dict[str, Any]]
+    ) -> None:
+        await self.__batch_write(
+            table_name=table_name,
+            requests=[
+                {"DeleteRequest": {"Key": self.__serialize(key)}} for key in keys
+            ],
+        )
 
     def __build_key_condition_expression(
         self: Self, key_conditions: List[KeyCondition]
@@ -167,21 +212,24 @@ class DynamoDBNoSQL(NoSQLInterface):
 
         return expression
 
-    async def query(
+    def __build_query_kwargs(
         self: Self,
         table_name: str,
         key_conditions: List[KeyCondition],
-        index_name: Optional[str] = None,
-        sort_ascending: bool = True,
-        limit: Optional[int] = None,
-        count_only: bool = False,
-    ) -> QueryResult:
-        loop: AbstractEventLoop = asyncio.get_event_loop()
-        table = self._resource.Table(self.__get_table_name(table_name))
+        index_name: Optional[str],
+        sort_ascending: bool,
+    ) -> Dict[str, Any]:
+        key_condition = ConditionExpressionBuilder().build_expression(
+            self.__build_key_condition_expression(key_conditions),
+            is_key_condition=True,
+        )
 
         kwargs: Dict[str, Any] = {
-            "KeyConditionExpression": self.__build_key_condition_expression(
-                key_conditions
+            "TableName": self.__get_table_name(table_name),
+            "KeyConditionExpression": key_condition.condition_expression,
+            "ExpressionAttributeNames": key_condition.attribute_name_placeholders,
+            "ExpressionAttributeValues": self.__serialize(
+                key_condition.attribute_value_placeholders
             ),
             "ScanIndexForward": sort_ascending,
         }
@@ -189,21 +237,88 @@ class DynamoDBNoSQL(NoSQLInterface):
         if index_name is not None:
             kwargs["IndexName"] = index_name
 
-        if limit is not None:
-            kwargs["Limit"] = limit
+        return kwargs
+
+    def __add_projection(
+        self: Self, kwargs: Dict[str, Any], attributes: Optional[List[str]]
+    ) -> None:
+        """Restrict the fetched attributes to the given ones (ProjectionExpression)."""
+        if attributes is None:
+            return
+
+        placeholders: Dict[str, str] = {
+            f"#p{i}": attribute for i, attribute in enumerate(attributes)
+        }
+        kwargs["ProjectionExpression"] = ", ".join(placeholders)
+        kwargs["ExpressionAttributeNames"] = {
+            **kwargs.get("ExpressionAttributeNames", {}),
+            **placeholders,
+        }
+
+    async def __paginate(
+        self: Self, operation: Callable[..., Dict[str, Any]], kwargs: Dict[str, Any]
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield the deserialized items of each page, following LastEvaluatedKey."""
+        kwargs = dict(kwargs)
+
+        while True:
+            response = await self._connection.run(operation, **kwargs)
+
+            yield [self.__deserialize(item) for item in response.get("Items", [])]
+
+            last_evaluated_key: Optional[Dict[str, Any]] = response.get(
+                "LastEvaluatedKey"
+            )
+
+            if last_evaluated_key is None:
+                return
+
+            kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+    async def query(
+        self: Self,
+        table_name: str,
+        key_conditions: List[KeyCondition],
+        index_name: Optional[str] = None,
+        sort_ascending: bool = True,
+        limit: Optional[int] = None,
+        count_only: bool = False,
+    ) -> QueryResult:
+        kwargs: Dict[str, Any] = self.__build_query_kwargs(
+            table_name=table_name,
+            key_conditions=key_conditions,
+            index_name=index_name,
+            sort_ascending=sort_ascending,
+        )
 
         if count_only is True:
             kwargs["Select"] = "COUNT"
 
-        response = await loop.run_in_executor(
-            None,
-            lambda: table.query(**kwargs),
-        )
+        items: List[Dict[str, Any]] = []
+        count: int = 0
 
-        return QueryResult(
-            items=response.get("Items", []),
-            count=response.get("Count", 0),
-        )
+        # A single Query call returns at most 1 MB of data: keep following
+        # LastEvaluatedKey until the limit is reached or the partition ends.
+        while True:
+            if limit is not None:
+                kwargs["Limit"] = limit - count
+
+            response = await self._connection.run(
+                self._connection.client.query, **kwargs
+            )
+            items.extend(self.__deserialize(item) for item in response.get("Items", []))
+            count += response.get("Count", 0)
+
+            last_evaluated_key: Optional[Dict[str, Any]] = response.get(
+                "LastEvaluatedKey"
+            )
+
+            if last_evaluated_key is None or (limit is not None and count >= limit):
+                break
+
+            kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+        return QueryResult(items=items, count=count)
 
     async def scan(
         self: Self,
@@ -211,27 +326,110 @@ class DynamoDBNoSQL(NoSQLInterface):
         limit: Optional[int] = None,
         start_key: Optional[Dict[str, Any]] = None,
     ) -> ScanResult:
-        loop: AbstractEventLoop = asyncio.get_event_loop()
-        table = self._resource.Table(self.__get_table_name(table_name))
-
-        kwargs: Dict[str, Any] = {}
+        kwargs: Dict[str, Any] = {"TableName": self.__get_table_name(table_name)}
 
         if limit is not None:
             kwargs["Limit"] = limit
 
         if start_key is not None:
-            kwargs["ExclusiveStartKey"] = start_key
+            kwargs["ExclusiveStartKey"] = self.__serialize(start_key)
 
-        response = await loop.run_in_executor(
-            None,
-            lambda: table.scan(**kwargs),
-        )
+        response = await self._connection.run(self._connection.client.scan, **kwargs)
+        last_evaluated_key: Optional[Dict[str, Any]] = response.get("LastEvaluatedKey")
 
         return ScanResult(
-            items=response.get("Items", []),
-            last_evaluated_key=response.get("LastEvaluatedKey"),
+            items=[self.__deserialize(item) for item in response.get("Items", [])],
+            last_evaluated_key=(
+                self.__deserialize(last_evaluated_key)
+                if last_evaluated_key is not None
+                else None
+            ),
         )
 
+    async def query_iter(
+        self: Self,
+        table_name: str,
+        key_conditions: List[KeyCondition],
+        index_name: Optional[str] = None,
+        sort_ascending: bool = True,
+        page_size: Optional[int] = None,
+        attributes: Optional[List[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        kwargs: Dict[str, Any] = self.__build_query_kwargs(
+            table_name=table_name,
+            key_conditions=key_conditions,
+            index_name=index_name,
+            sort_ascending=sort_ascending,
+        )
+        self.__add_projection(kwargs=kwargs, attributes=attributes)
+
+        if page_size is not None:
+            kwargs["Limit"] = page_size
+
+        async for page in self.__paginate(self._connection.client.query, kwargs):
+            for item in page:
+                yield item
+
+    async def scan_iter(
+        self: Self,
+        table_name: str,
+        page_size: Optional[int] = None,
+        attributes: Optional[List[str]] = None,
+        segments: int = 1,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        kwargs: Dict[str, Any] = {"TableName": self.__get_table_name(table_name)}
+        self.__add_projection(kwargs=kwargs, attributes=attributes)
+
+        if page_size is not None:
+            kwargs["Limit"] = page_size
+
+        if segments <= 1:
+            async for page in self.__paginate(self._connection.client.scan, kwargs):
+                for item in page:
+                    yield item
+
+            return
+
+        # Parallel scan: one task per segment feeds a bounded queue, so the
+        # segments only run ahead of the consumer by a couple of pages each.
+        pages: asyncio.Queue = asyncio.Queue(maxsize=segments * 2)
+
+        async def _scan_segment(segment: int) -> None:
+            try:
+                async for page in self.__paginate(
+                    self._connection.client.scan,
+                    {**kwargs, "Segment": segment, "TotalSegments": segments},
+                ):
+                    await pages.put(page)
+            except Exception as e:
+                await pages.put(e)
+            else:
+                await pages.put(None)
+
+        tasks: List[asyncio.Task] = [
+            asyncio.create_task(_scan_segment(segment)) for segment in range(segments)
+        ]
+        running: int = segments
+
+        try:
+            while running > 0:
+                page = await pages.get()
+
+                if page is None:
+                    running -= 1
+                    continue
+
+                if isinstance(page, Exception):
+                    raise page
+
+                for item in page:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+
 
 def get_dynamodb_nosql() -> DynamoDBNoSQL:
     return DynamoDBNoSQL()
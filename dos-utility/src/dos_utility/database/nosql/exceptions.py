@@ -0,0 +1,8 @@
+from typing import Self
+
+
+class BatchWriteException(Exception):
+    """Exception raised when some items of a batch write cannot be processed."""
+
+    def __init__(self: Self, msg: str):
+        super().__init__(f"Batch write failed. Details: {msg}")
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Self
+from typing import Any, AsyncIterator, Dict, List, Optional, Self
 
 from .models import KeyCondition, QueryResult, ScanResult
 
@@ -106,6 +106,46 @@ class NoSQLInterface(ABC):
         """
         ...
 
+    @abstractmethod
+    async def batch_put_items(
+        self: Self, table_name: str, items: List[Dict[str, Any]]
+    ) -> None:
+        """Insert or replace many documents in the specified table.
+        Items are written in provider-sized batches sent concurrently; items the database could not
+        process are retried. The same primary key must not appear twice in `items`.
+
+        Args:
+            table_name (str): The name of the table.
+            items (List[Dict[str, Any]]): The documents to insert or replace.
+
+        Raises:
+            BatchWriteException: If some items are still unprocessed after all retries.
+
+        Examples:
+            >>> await client.batch_put_items("users", [{"user_id": "1"}, {"user_id": "2"}])
+        """
+        ...
+
+    @abstractmethod
+    async def batch_delete_items(
+        self: Self, table_name: str, keys: List[Dict[str, Any]]
+    ) -> None:
+        """Delete many items by primary key.
+        Keys are deleted in provider-sized batches sent concurrently; keys the database could not
+        process are retried. The same key must not appear twice in `keys`.
+
+        Args:
+            table_name (str): The name of the table.
+            keys (List[Dict[str, Any]]): The primary keys of the items to delete.
+
+        Raises:
+            BatchWriteException: If some keys are still unprocessed after all retries.
+
+        Examples:
+            >>> await client.batch_delete_items("users", [{"user_id": "1"}, {"user_id": "2"}])
+        """
+        ...
+
     @abstractmethod
     async def query(
         self: Self,
@@ -117,6 +157,8 @@ class NoSQLInterface(ABC):
         count_only: bool = False,
     ) -> QueryResult:
         """Query items by key conditions.
+        Result pages are followed until `limit` items are collected or the partition is exhausted.
+        Use `query_iter` to stream large partitions instead of loading them at once.
 
         Args:
             table_name (str): The name of the table.
@@ -163,3 +205,65 @@ class NoSQLInterface(ABC):
             ...     result = await client.scan("queries", limit=100, start_key=result.last_evaluated_key)
         """
         ...
+
+    @abstractmethod
+    def query_iter(
+        self: Self,
+        table_name: str,
+        key_conditions: List[KeyCondition],
+        index_name: Optional[str] = None,
+        sort_ascending: bool = True,
+        page_size: Optional[int] = None,
+        attributes: Optional[List[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream items matching the key conditions, fetching result pages lazily.
+        The next page is requested only when the caller consumes the current one, so breaking out of
+        the loop stops reading from the database.
+
+        Args:
+            table_name (str): The name of the table.
+            key_conditions (List[KeyCondition]): Conditions to filter items by key.
+            index_name (Optional[str]): The name of the secondary index to query.
+            sort_ascending (bool): Whether to sort results in ascending order.
+            page_size (Optional[int]): Maximum number of items fetched per round trip.
+            attributes (Optional[List[str]]): Attributes to fetch (projection). If None, whole items are returned.
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: An asynchronous iterator over the matching items.
+
+        Examples:
+            >>> async for query in client.query_iter(
+            ...     "queries",
+            ...     [KeyCondition("sessionId", ConditionOperator.EQ, "123")],
+            ...     attributes=["id", "createdAt"],
+            ... ):
+            ...     print(query["id"])
+        """
+        ...
+
+    @abstractmethod
+    def scan_iter(
+        self: Self,
+        table_name: str,
+        page_size: Optional[int] = None,
+        attributes: Optional[List[str]] = None,
+        segments: int = 1,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every item of the table, fetching result pages lazily.
+        With `segments` > 1 the table is split in that many segments scanned in parallel; items are then
+        yielded in no particular order.
+
+        Args:
+            table_name (str): The name of the table.
+            page_size (Optional[int]): Maximum number of items fetched per round trip (per segment).
+            attributes (Optional[List[str]]): Attributes to fetch (projection). If None, whole items are returned.
+            segments (int): Number of segments to scan in parallel.
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: An asynchronous iterator over the table items.
+
+        Examples:
+            >>> async for item in client.scan_iter("queries", attributes=["id"], segments=4):
+            ...     print(item["id"])
+        """
+        ...
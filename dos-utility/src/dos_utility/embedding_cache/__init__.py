@@ -0,0 +1,22 @@
+from .env import EmbeddingCacheSettings, get_embedding_cache_settings
+from .cache import (
+    EmbeddingCache,
+    EmbeddingKind,
+    embedding_cache_key,
+    get_embedding_cache,
+)
+from .embedding import CachedEmbedding, cached_embed_model
+from .query import CachedQueryEmbedding, cached_query_embed_model
+
+__all__ = [
+    "EmbeddingCacheSettings",
+    "get_embedding_cache_settings",
+    "EmbeddingCache",
+    "EmbeddingKind",
+    "embedding_cache_key",
+    "get_embedding_cache",
+    "CachedEmbedding",
+    "cached_embed_model",
+    "CachedQueryEmbedding",
+    "cached_query_embed_model",
+]
@@ -0,0 +1,256 @@
+import hashlib
+import logging
+import time
+
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Literal, Optional, Self, Sequence, Tuple
+from redis.asyncio import Redis
+
+from ..utils.redis import get_redis_connection_pool
+from .env import EmbeddingCacheSettings, get_embedding_cache_settings
+
+
+EmbeddingKind = Literal["query", "text"]
+
+
+def embedding_cache_key(
+    model_name: str,
+    embed_dim: Optional[int],
+    task_type: Optional[str],
+    kind: EmbeddingKind,
+    text: str,
+) -> str:
+    """Build the cache key of one embedding.
+
+    Every parameter that changes the vector is part of the key, so switching the
+    model, the output dimensionality or the task type never serves a stale vector.
+
+    Args:
+        model_name (str): The embedding model name, es: "gemini-embedding-001".
+        embed_dim (Optional[int]): The output dimensionality, None for the model default.
+        task_type (Optional[str]): The embedding task type, None if the provider has none.
+        kind (EmbeddingKind): Whether the text is a query or a document text.
+        text (str): The embedded text.
+
+    Returns:
+        str: The sha256 hex digest identifying the embedding.
+    """
+    return hashlib.sha256(
+        "\x1f".join(
+            [model_name, str(embed_dim or ""), task_type or "", kind, text]
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def _encode(vector: Sequence[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _decode(value: bytes) -> List[float]:
+    vector: array = array("f")
+    vector.frombytes(value)
+    return vector.tolist()
+
+
+class EmbeddingCache:
+    """Process-wide cache of the embeddings, keyed by `embedding_cache_key`.
+
+    The vectors are kept in memory as float32 bytes (4 bytes per dimension) in a
+    LRU of at most `EMBEDDING_CACHE_MAX_ENTRIES` entries, each one valid for
+    `EMBEDDING_CACHE_TTL_SECONDS`. When `EMBEDDING_CACHE_SHARED` is set they are
+    also stored in Redis under `EMBEDDING_CACHE_REDIS_PREFIX`, so an embedding
+    computed by one process is reused by every other one and survives restarts.
+
+    Redis failures are logged and treated as misses: the cache never makes an
+    embedding request fail.
+    """
+
+    def __init__(self: Self) -> None:
+        self._settings: EmbeddingCacheSettings = get_embedding_cache_settings()
+        self._entries: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+        self.hits: int = 0
+        self.shared_hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def enabled(self: Self) -> bool:
+        return self._settings.EMBEDDING_CACHE_TTL_SECONDS > 0
+
+    def __shared_client(self: Self) -> Redis:
+        return Redis(connection_pool=get_redis_connection_pool(decode_responses=False))
+
+    def __shared_key(self: Self, key: str) -> str:
+        return f"{self._settings.EMBEDDING_CACHE_REDIS_PREFIX}:{key}"
+
+    async def __read_shared(self: Self, keys: List[str]) -> List[Optional[bytes]]:
+        try:
+            return await self.__shared_client().mget(
+                [self.__shared_key(key=key) for key in keys]
+            )
+        except Exception as e:
+            logging.warning(f"Failed to read the shared embedding cache: {e}")
+            return [None] * len(keys)
+
+    async def __write_shared(self: Self, values: Dict[str, bytes]) -> None:
+        px: int = max(int(self._settings.EMBEDDING_CACHE_TTL_SECONDS * 1000), 1)
+
+        try:
+            async with self.__shared_client().pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    pipe.set(self.__shared_key(key=key), value, px=px)
+
+                await pipe.execute()
+        except Exception as e:
+            logging.warning(f"Failed to write the shared embedding cache: {e}")
+
+    def __store(self: Self, key: str, value: bytes) -> None:
+        self._entries[key] = (
+            time.monotonic() + self._settings.EMBEDDING_CACHE_TTL_SECONDS,
+            value,
+        )
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._settings.EMBEDDING_CACHE_MAX_ENTRIES:
+            self._entries.popitem(last=False)
+
+    def __lookup(self: Self, key: str) -> Optional[bytes]:
+        entry: Optional[Tuple[float, bytes]] = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        if time.monotonic() >= entry[0]:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def get_many_local(self: Self, keys: List[str]) -> List[Optional[List[float]]]:
+        """Return the embeddings found in memory, None for the missing ones.
+        Never reaches Redis, so it is safe to call from synchronous code.
+
+        Args:
+            keys (List[str]): The cache keys, built with `embedding_cache_key`.
+
+        Returns:
+            List[Optional[List[float]]]: One entry per key, in the same order.
+        """
+        if not self.enabled:
+            return [None] * len(keys)
+
+        result: List[Optional[List[float]]] = []
+
+        for key in keys:
+            value: Optional[bytes] = self.__lookup(key=key)
+
+            if value is None:
+                self.misses += 1
+                result.append(None)
+            else:
+                self.hits += 1
+                result.append(_decode(value=value))
+
+        return result
+
+    async def get_many(self: Self, keys: List[str]) -> List[Optional[List[float]]]:
+        """Return the cached embeddings, from memory first and then from Redis.
+
+        Args:
+            keys (List[str]): The cache keys, built with `embedding_cache_key`.
+
+        Returns:
+            List[Optional[List[float]]]: One entry per key, in the same order, None for the missing ones.
+
+        Examples:
+            >>> keys = [embedding_cache_key("gemini-embedding-001", 768, "RETRIEVAL_DOCUMENT", "text", t) for t in texts]
+            >>> vectors = await get_embedding_cache().get_many(keys)
+        """
+        if not self.enabled:
+            return [None] * len(keys)
+
+        result: List[Optional[List[float]]] = []
+        missing: List[int] = []
+
+        for i, key in enumerate(keys):
+            value: Optional[bytes] = self.__lookup(key=key)
+
+            if value is None:
+                missing.append(i)
+                result.append(None)
+            else:
+                self.hits += 1
+                result.append(_decode(value=value))
+
+        if missing and self._settings.EMBEDDING_CACHE_SHARED:
+            shared: List[Optional[bytes]] = await self.__read_shared(
+                keys=[keys[i] for i in missing]
+            )
+
+            for i, value in zip(missing, shared):
+                if value is not None:
+                    self.shared_hits += 1
+                    self.__store(key=keys[i], value=value)
+                    result[i] = _decode(value=value)
+
+        self.misses += sum(1 for vector in result if vector is None)
+
+        return result
+
+    def put_many_local(self: Self, embeddings: Dict[str, List[float]]) -> None:
+        """Store the embeddings in memory only.
+
+        Args:
+            embeddings (Dict[str, List[float]]): The embeddings by cache key.
+        """
+        if not self.enabled:
+            return
+
+        for key, vector in embeddings.items():
+            self.__store(key=key, value=_encode(vector=vector))
+
+    async def put_many(self: Self, embeddings: Dict[str, List[float]]) -> None:
+        """Store the embeddings in memory and, when shared, in Redis.
+
+        Args:
+            embeddings (Dict[str, List[float]]): The embeddings by cache key.
+        """
+        if not self.enabled or not embeddings:
+            return
+
+        values: Dict[str, bytes] = {
+            key: _encode(vector=vector) for key, vector in embeddings.items()
+        }
+
+        for key, value in values.items():
+            self.__store(key=key, value=value)
+
+        if self._settings.EMBEDDING_CACHE_SHARED:
+            await self.__write_shared(values=values)
+
+    def clear(self: Self) -> None:
+        """Drop the embeddings kept in memory. The shared Redis keys expire on their own."""
+        self._entries.clear()
+
+    def stats(self: Self) -> Dict[str, float]:
+        """Return the cache counters.
+
+        Returns:
+            Dict[str, float]: hits (local), shared_hits (Redis), misses (embedded by the model), the number of entries in memory and the overall hit rate.
+        """
+        lookups: int = self.hits + self.shared_hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "hit_rate": (self.hits + self.shared_hits) / lookups if lookups else 0.0,
+        }
+
+
+@lru_cache
+def get_embedding_cache() -> EmbeddingCache:
+    return EmbeddingCache()
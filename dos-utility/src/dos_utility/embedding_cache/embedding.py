@@ -0,0 +1,174 @@
+from typing import Dict, List, Optional, Self
+
+from pydantic import Field, PrivateAttr
+from llama_index.core.base.embeddings.base import BaseEmbedding, Embedding
+
+from .cache import (
+    EmbeddingCache,
+    EmbeddingKind,
+    embedding_cache_key,
+    get_embedding_cache,
+)
+from .env import EmbeddingCacheSettings, get_embedding_cache_settings
+
+
+class CachedEmbedding(BaseEmbedding):
+    """LlamaIndex embedding model serving the embeddings from the `EmbeddingCache`.
+
+    Wraps any `BaseEmbedding`: only the texts missing from the cache are sent to
+    the wrapped model, in a single batch, and the new vectors are stored back.
+    The async methods use both the in-memory and the Redis tier, the sync ones
+    only the in-memory tier.
+    """
+
+    embed_model: BaseEmbedding = Field(description="The wrapped embedding model")
+    embed_dim: Optional[int] = Field(
+        default=None, description="The output dimensionality of the wrapped model"
+    )
+    task_type: Optional[str] = Field(
+        default=None, description="The task type of the wrapped model, if any"
+    )
+    _cache: EmbeddingCache = PrivateAttr()
+
+    def __init__(
+        self: Self,
+        embed_model: BaseEmbedding,
+        embed_dim: Optional[int] = None,
+        task_type: Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(
+            embed_model=embed_model,
+            embed_dim=embed_dim,
+            task_type=task_type,
+            model_name=embed_model.model_name,
+            embed_batch_size=embed_model.embed_batch_size,
+            **kwargs,
+        )
+        self._cache = get_embedding_cache()
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "CachedEmbedding"
+
+    def __key(self: Self, kind: EmbeddingKind, text: str) -> str:
+        return embedding_cache_key(
+            model_name=self.model_name,
+            embed_dim=self.embed_dim,
+            task_type=self.task_type,
+            kind=kind,
+            text=text,
+        )
+
+    def __missing(
+        self: Self, keys: List[str], cached: List[Optional[Embedding]], texts: List[str]
+    ) -> Dict[str, str]:
+        """Return the texts to embed by cache key, each distinct text only once."""
+        return {
+            key: text
+            for key, text, embedding in zip(keys, texts, cached)
+            if embedding is None
+        }
+
+    def _get_query_embedding(self: Self, query: str) -> Embedding:
+        key: str = self.__key(kind="query", text=query)
+        cached: Optional[Embedding] = self._cache.get_many_local(keys=[key])[0]
+
+        if cached is not None:
+            return cached
+
+        embedding: Embedding = self.embed_model.get_query_embedding(query)
+        self._cache.put_many_local(embeddings={key: embedding})
+
+        return embedding
+
+    async def _aget_query_embedding(self: Self, query: str) -> Embedding:
+        key: str = self.__key(kind="query", text=query)
+        cached: Optional[Embedding] = (await self._cache.get_many(keys=[key]))[0]
+
+        if cached is not None:
+            return cached
+
+        embedding: Embedding = await self.embed_model.aget_query_embedding(query)
+        await self._cache.put_many(embeddings={key: embedding})
+
+        return embedding
+
+    def _get_text_embedding(self: Self, text: str) -> Embedding:
+        return self._get_text_embeddings(texts=[text])[0]
+
+    async def _aget_text_embedding(self: Self, text: str) -> Embedding:
+        return (await self._aget_text_embeddings(texts=[text]))[0]
+
+    def _get_text_embeddings(self: Self, texts: List[str]) -> List[Embedding]:
+        keys: List[str] = [self.__key(kind="text", text=text) for text in texts]
+        cached: List[Optional[Embedding]] = self._cache.get_many_local(keys=keys)
+        missing: Dict[str, str] = self.__missing(keys=keys, cached=cached, texts=texts)
+
+        if missing:
+            embeddings: Dict[str, Embedding] = dict(
+                zip(
+                    missing.keys(),
+                    self.embed_model.get_text_embedding_batch(list(missing.values())),
+                )
+            )
+            self._cache.put_many_local(embeddings=embeddings)
+            cached = [
+                embedding if embedding is not None else embeddings[key]
+                for key, embedding in zip(keys, cached)
+            ]
+
+        return cached
+
+    async def _aget_text_embeddings(self: Self, texts: List[str]) -> List[Embedding]:
+        keys: List[str] = [self.__key(kind="text", text=text) for text in texts]
+        cached: List[Optional[Embedding]] = await self._cache.get_many(keys=keys)
+        missing: Dict[str, str] = self.__missing(keys=keys, cached=cached, texts=texts)
+
+        if missing:
+            embeddings: Dict[str, Embedding] = dict(
+                zip(
+                    missing.keys(),
+                    await self.embed_model.aget_text_embedding_batch(
+                        list(missing.values())
+                    ),
+                )
+            )
+            await self._cache.put_many(embeddings=embeddings)
+            cached = [
+                embedding if embedding is not None else embeddings[key]
+                for key, embedding in zip(keys, cached)
+            ]
+
+        return cached
+
+
+def cached_embed_model(
+    embed_model: BaseEmbedding,
+    embed_dim: Optional[int] = None,
+    task_type: Optional[str] = None,
+) -> BaseEmbedding:
+    """Wrap the embedding model with the embedding cache, when enabled.
+
+    Args:
+        embed_model (BaseEmbedding): The embedding model to wrap.
+        embed_dim (Optional[int]): The output dimensionality configured on the model.
+        task_type (Optional[str]): The task type configured on the model, if any.
+
+    Returns:
+        BaseEmbedding: A `CachedEmbedding` if `EMBEDDING_CACHE_ENABLED` is set and the TTL is positive, the model itself otherwise.
+
+    Examples:
+        >>> embed_model = cached_embed_model(GoogleGenAIEmbedding(...), embed_dim=768, task_type="RETRIEVAL_QUERY")
+    """
+    settings: EmbeddingCacheSettings = get_embedding_cache_settings()
+
+    if (
+        not settings.EMBEDDING_CACHE_ENABLED
+        or settings.EMBEDDING_CACHE_TTL_SECONDS <= 0
+    ):
+        return embed_model
+
+    return CachedEmbedding(
+        embed_model=embed_model, embed_dim=embed_dim, task_type=task_type
+    )
@@ -0,0 +1,49 @@
+from functools import lru_cache
+from pydantic_settings import BaseSettings
+from pydantic import Field
+from typing import Annotated
+
+
+class EmbeddingCacheSettings(BaseSettings):
+    EMBEDDING_CACHE_ENABLED: Annotated[
+        bool,
+        Field(
+            default=False,
+            description="Wrap the embedding models returned by get_embed_model with the embedding cache",
+        ),
+    ]
+    EMBEDDING_CACHE_TTL_SECONDS: Annotated[
+        float,
+        Field(
+            default=86400.0,
+            ge=0.0,
+            description="How long an embedding is served from the cache. 0 disables the cache",
+        ),
+    ]
+    EMBEDDING_CACHE_MAX_ENTRIES: Annotated[
+        int,
+        Field(
+            default=10000,
+            ge=1,
+            description="Maximum number of embeddings kept in memory, the least recently used are evicted first",
+        ),
+    ]
+    EMBEDDING_CACHE_SHARED: Annotated[
+        bool,
+        Field(
+            default=False,
+            description="Also store the embeddings in Redis, shared by every process",
+        ),
+    ]
+    EMBEDDING_CACHE_REDIS_PREFIX: Annotated[
+        str,
+        Field(
+            default="embedding_cache",
+            description="Prefix of the Redis keys holding the shared embeddings",
+        ),
+    ]
+
+
+@lru_cache
+def get_embedding_cache_settings() -> EmbeddingCacheSettings:
+    return EmbeddingCacheSettings()
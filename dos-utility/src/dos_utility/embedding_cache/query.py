@@ -0,0 +1,197 @@
+import asyncio
+import time
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Self, Tuple
+
+from pydantic import Field, PrivateAttr
+from llama_index.core.base.embeddings.base import BaseEmbedding, Embedding
+
+
+class CachedQueryEmbedding(BaseEmbedding):
+    """LlamaIndex embedding model keeping the last query embeddings in memory.
+
+    Meant for the retrieval path of an agent: one instance is shared by every RAG
+    tool, so the same sub-query sent to several tools, or asked again by another
+    user, is embedded once. The cache is a LRU of at most `max_entries` queries,
+    each one valid for `ttl_seconds`; concurrent requests for the same query
+    wait for the embedding already in flight instead of sending their own.
+
+    Only query embeddings are cached, text embeddings go straight to the wrapped
+    model. Unlike `CachedEmbedding` nothing is shared across processes, which
+    keeps a hit free of any network round trip.
+    """
+
+    embed_model: BaseEmbedding = Field(description="The wrapped embedding model")
+    max_entries: int = Field(description="Maximum number of queries kept in memory")
+    ttl_seconds: float = Field(description="How long a query embedding is served")
+    _entries: OrderedDict[str, Tuple[float, Embedding]] = PrivateAttr(
+        default_factory=OrderedDict
+    )
+    _in_flight: Dict[str, asyncio.Future] = PrivateAttr(default_factory=dict)
+    _hits: int = PrivateAttr(default=0)
+    _misses: int = PrivateAttr(default=0)
+    _embed_seconds: float = PrivateAttr(default=0.0)
+    _saved_seconds: float = PrivateAttr(default=0.0)
+
+    def __init__(
+        self: Self,
+        embed_model: BaseEmbedding,
+        max_entries: int,
+        ttl_seconds: float,
+        **kwargs,
+    ) -> None:
+        super().__init__(
+            embed_model=embed_model,
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            model_name=embed_model.model_name,
+            embed_batch_size=embed_model.embed_batch_size,
+            **kwargs,
+        )
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "CachedQueryEmbedding"
+
+    def __lookup(self: Self, query: str) -> Optional[Embedding]:
+        entry: Optional[Tuple[float, Embedding]] = self._entries.get(query)
+
+        if entry is None:
+            return None
+
+        if time.monotonic() >= entry[0]:
+            del self._entries[query]
+            return None
+
+        self._entries.move_to_end(query)
+        self.__hit()
+
+        return entry[1]
+
+    def __store(self: Self, query: str, embedding: Embedding, elapsed: float) -> None:
+        self._misses += 1
+        self._embed_seconds += elapsed
+        self._entries[query] = (time.monotonic() + self.ttl_seconds, embedding)
+        self._entries.move_to_end(query)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __hit(self: Self) -> None:
+        """Count a hit, crediting it with the average latency of a miss."""
+        self._hits += 1
+
+        if self._misses:
+            self._saved_seconds += self._embed_seconds / self._misses
+
+    def _get_query_embedding(self: Self, query: str) -> Embedding:
+        cached: Optional[Embedding] = self.__lookup(query=query)
+
+        if cached is not None:
+            return cached
+
+        started_at: float = time.perf_counter()
+        embedding: Embedding = self.embed_model.get_query_embedding(query)
+        self.__store(
+            query=query, embedding=embedding, elapsed=time.perf_counter() - started_at
+        )
+
+        return embedding
+
+    async def _aget_query_embedding(self: Self, query: str) -> Embedding:
+        cached: Optional[Embedding] = self.__lookup(query=query)
+
+        if cached is not None:
+            return cached
+
+        in_flight: Optional[asyncio.Future] = self._in_flight.get(query)
+
+        if in_flight is not None:
+            try:
+                embedding: Embedding = await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+                # The request embedding the query was cancelled, not this one:
+                # embed it here instead, the first waiter taking over the others
+                return await self._aget_query_embedding(query)
+
+            self.__hit()
+            return embedding
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._in_flight[query] = future
+        started_at: float = time.perf_counter()
+
+        try:
+            embedding = await self.embed_model.aget_query_embedding(query)
+        except asyncio.CancelledError:
+            # Waiters resume after the entry is gone and embed the query again
+            self._in_flight.pop(query, None)
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else was waiting
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(query, None)
+
+        self.__store(
+            query=query, embedding=embedding, elapsed=time.perf_counter() - started_at
+        )
+        future.set_result(embedding)
+
+        return embedding
+
+    def _get_text_embedding(self: Self, text: str) -> Embedding:
+        return self.embed_model.get_text_embedding(text)
+
+    async def _aget_text_embedding(self: Self, text: str) -> Embedding:
+        return await self.embed_model.aget_text_embedding(text)
+
+    def _get_text_embeddings(self: Self, texts: List[str]) -> List[Embedding]:
+        return self.embed_model.get_text_embedding_batch(texts)
+
+    async def _aget_text_embeddings(self: Self, texts: List[str]) -> List[Embedding]:
+        return await self.embed_model.aget_text_embedding_batch(texts)
+
+    def stats(self: Self) -> Dict[str, float]:
+        """Return the cache counters.
+
+        Returns:
+            Dict[str, float]: hits, misses (embedded by the model), the number of entries in memory, the hit rate and the embedding latency saved by the hits, estimated from the average latency of the misses.
+        """
+        lookups: int = self._hits + self._misses
+
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "entries": len(self._entries),
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "saved_seconds": self._saved_seconds,
+        }
+
+
+def cached_query_embed_model(
+    embed_model: BaseEmbedding, max_entries: int, ttl_seconds: float
+) -> BaseEmbedding:
+    """Wrap the embedding model with a query embedding cache.
+
+    Args:
+        embed_model (BaseEmbedding): The embedding model to wrap.
+        max_entries (int): Maximum number of queries kept in memory. 0 disables the cache.
+        ttl_seconds (float): How long a query embedding is served. 0 disables the cache.
+
+    Returns:
+        BaseEmbedding: A `CachedQueryEmbedding`, or the model itself when the cache is disabled.
+    """
+    if max_entries <= 0 or ttl_seconds <= 0:
+        return embed_model
+
+    return CachedQueryEmbedding(
+        embed_model=embed_model, max_entries=max_entries, ttl_seconds=ttl_seconds
+    )
@@ -3,6 +3,12 @@ from typing import AsyncGenerator
 from .env import QueueProvider, QueueSettings, get_queue_settings
 
 from .interface import QueueInterface
+from .exceptions import BatchEnqueueException, BatchAcknowledgeException
+from .shutdown import (
+    install_stop_handlers,
+    remove_stop_handlers,
+    dequeue_many_or_stop,
+)
 from .redis import get_redis_queue
 from .sqs import get_sqs_queue
 
@@ -11,6 +17,11 @@ __all__ = [
     "get_queue_client",
     "get_queue_client_ctx",
     "QueueInterface",
+    "BatchEnqueueException",
+    "BatchAcknowledgeException",
+    "install_stop_handlers",
+    "remove_stop_handlers",
+    "dequeue_many_or_stop",
 ]
 
 
@@ -0,0 +1,15 @@
+from typing import Self
+
+
+class BatchEnqueueException(Exception):
+    """Exception raised when some messages of a batch cannot be enqueued."""
+
+    def __init__(self: Self, msg: str):
+        super().__init__(f"Batch enqueue failed. Details: {msg}")
+
+
+class BatchAcknowledgeException(Exception):
+    """Exception raised when some messages of a batch cannot be acknowledged."""
+
+    def __init__(self: Self, msg: str):
+        super().__init__(f"Batch acknowledge failed. Details: {msg}")
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Self, Tuple, Optional
+from typing import Self, Tuple, Optional, List
 
 
 class QueueInterface(ABC):
@@ -54,6 +54,21 @@ class QueueInterface(ABC):
         """
         ...
 
+    @abstractmethod
+    async def enqueue_many(self: Self, msgs: List[bytes]) -> List[str]:
+        """Enqueue several messages to the queue, using as few round-trips as the provider allows.
+
+        Args:
+            msgs (List[bytes]): The messages to enqueue.
+
+        Returns:
+            List[str]: message ids, in the same order as `msgs`.
+
+        Examples:
+            >>> msg_ids: List[str] = await queue_client.enqueue_many(msgs=[b"Hello", b"World!"])
+        """
+        ...
+
     @abstractmethod
     async def dequeue(self: Self) -> Tuple[Optional[bytes], Optional[str]]:
         """Dequeue a message from the queue.
@@ -71,6 +86,30 @@ class QueueInterface(ABC):
         """
         ...
 
+    @abstractmethod
+    async def dequeue_many(
+        self: Self, max_messages: int = 10, wait: float = 20.0
+    ) -> List[Tuple[bytes, str]]:
+        """Dequeue up to `max_messages` messages from the queue in a single round-trip.
+        When the queue is empty the call waits up to `wait` seconds for new messages (long polling).
+        Delivery is at-least-once: a message not acknowledged in time (e.g. its consumer crashed) is delivered again.
+
+        Args:
+            max_messages (int): Maximum number of messages to return. Providers may cap it (e.g. 10 for SQS).
+            wait (float): Maximum number of seconds to wait for messages when the queue is empty.
+
+        Returns:
+            List[Tuple[bytes, str]]: The dequeued messages (bytes) with their acknowledgment tokens (str).
+            If no message arrives within `wait` seconds, the list is empty.
+
+        Examples:
+            >>> messages = await queue_client.dequeue_many(max_messages=10, wait=20)
+            >>> for msg, ack_token in messages:
+            >>>     # Process the message...
+            >>> await queue_client.acknowledge_many(ack_tokens=[ack_token for _, ack_token in messages])
+        """
+        ...
+
     @abstractmethod
     async def acknowledge(self: Self, ack_token: str) -> None:
         """Acknowledge the processing of a message using its acknowledgment token.
@@ -82,3 +121,14 @@ class QueueInterface(ABC):
         Examples: look at `dequeue` method.
         """
         ...
+
+    @abstractmethod
+    async def acknowledge_many(self: Self, ack_tokens: List[str]) -> None:
+        """Acknowledge the processing of several messages, using as few round-trips as the provider allows.
+
+        Args:
+            ack_tokens (List[str]): The acknowledgment tokens of the messages to acknowledge.
+
+        Examples: look at `dequeue_many` method.
+        """
+        ...
@@ -1,12 +1,15 @@
 from functools import lru_cache
-from typing import Annotated
-from pydantic import Field
+from typing import Annotated, Optional
+from pydantic import Field, PositiveFloat
 from pydantic_settings import BaseSettings
 
 
 class RedisQueueSettings(BaseSettings):
     REDIS_STREAM: Annotated[str, Field(default="my-stream")]
     REDIS_GROUP: Annotated[str, Field(default="my-group")]
+    REDIS_CONSUMER_NAME: Annotated[Optional[str], Field(default=None)]
+    # Messages from dequeue_many not acknowledged within this time are delivered again
+    REDIS_CLAIM_IDLE_SECONDS: Annotated[PositiveFloat, Field(default=300.0)]
 
 
 @lru_cache()
@@ -1,6 +1,7 @@
 import logging
+import os
+import socket
 
-from uuid import uuid4
 from typing import Self, Tuple, List, Optional
 from redis import ResponseError
 from redis.asyncio import Redis, ConnectionPool
@@ -15,6 +16,12 @@ class RedisQueue(QueueInterface):
         self._settings: RedisQueueSettings = (
             get_redis_queue_settings()
         )  # Load redis env variables
+        # Stable consumer name for the whole process, so the consumer group
+        # doesn't fill up with a throwaway consumer per read
+        self._consumer_name: str = (
+            self._settings.REDIS_CONSUMER_NAME
+            or f"{socket.gethostname()}-{os.getpid()}"
+        )
 
     async def __aenter__(self: Self) -> Self:
         connection_pool: ConnectionPool = get_redis_connection_pool(
@@ -61,10 +68,23 @@ class RedisQueue(QueueInterface):
 
         return msg_id
 
+    async def enqueue_many(self: Self, msgs: List[bytes]) -> List[str]:
+        if not msgs:
+            return []
+
+        # Pipeline the XADDs so all messages are sent in a single round-trip
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            for msg in msgs:
+                pipe.xadd(name=self._settings.REDIS_STREAM, fields={b"body": msg})
+
+            msg_ids: List[str] = await pipe.execute()
+
+        return msg_ids
+
     async def dequeue(self: Self) -> Tuple[Optional[bytes], Optional[str]]:
         response: List = await self._redis_client.xreadgroup(
             groupname=self._settings.REDIS_GROUP,
-            consumername=uuid4().hex,
+            consumername=self._consumer_name,
             streams={self._settings.REDIS_STREAM: ">"},  # read new messages
             count=1,
             block=1,
@@ -78,12 +98,65 @@ class RedisQueue(QueueInterface):
 
         return None, None
 
+    async def dequeue_many(
+        self: Self, max_messages: int = 10, wait: float = 20.0
+    ) -> List[Tuple[bytes, str]]:
+        # Messages stay pending until acknowledged: the ones a crashed consumer
+        # left behind are claimed back before reading new ones
+        claimed: List[Tuple[bytes, str]] = await self.__claim_stale(
+            max_messages=max_messages
+        )
+
+        if len(claimed) > 0:
+            return claimed
+
+        block_ms: int = int(wait * 1000)
+        response: List = await self._redis_client.xreadgroup(
+            groupname=self._settings.REDIS_GROUP,
+            consumername=self._consumer_name,
+            streams={self._settings.REDIS_STREAM: ">"},  # read new messages
+            count=max_messages,
+            block=block_ms if block_ms > 0 else None,  # block=0 would wait forever
+        )
+
+        return [
+            (message_data[b"body"], message_id)
+            for _, messages in response
+            for message_id, message_data in messages
+        ]
+
+    async def __claim_stale(self: Self, max_messages: int) -> List[Tuple[bytes, str]]:
+        response: List = await self._redis_client.xautoclaim(
+            name=self._settings.REDIS_STREAM,
+            groupname=self._settings.REDIS_GROUP,
+            consumername=self._consumer_name,
+            min_idle_time=int(self._settings.REDIS_CLAIM_IDLE_SECONDS * 1000),
+            start_id="0-0",
+            count=max_messages,
+        )
+
+        # Entries trimmed from the stream while pending come back without data
+        return [
+            (message_data[b"body"], message_id)
+            for message_id, message_data in response[1]
+            if message_data
+        ]
+
     async def acknowledge(self: Self, ack_token: str) -> None:
         # Acknowledge message processing
         _ = await self._redis_client.xack(
             self._settings.REDIS_STREAM, self._settings.REDIS_GROUP, ack_token
         )
 
+    async def acknowledge_many(self: Self, ack_tokens: List[str]) -> None:
+        if not ack_tokens:
+            return
+
+        # XACK accepts several ids at once
+        _ = await self._redis_client.xack(
+            self._settings.REDIS_STREAM, self._settings.REDIS_GROUP, *ack_tokens
+        )
+
 
 def get_redis_queue() -> RedisQueue:
     return RedisQueue()
@@ -0,0 +1,92 @@
+import asyncio
+import signal
+
+from asyncio import AbstractEventLoop
+from typing import List, Tuple
+
+from .interface import QueueInterface
+
+
+STOP_SIGNALS = (signal.SIGTERM, signal.SIGINT)
+
+
+def install_stop_handlers(stop: asyncio.Event) -> None:
+    """Set the stop event on SIGTERM/SIGINT, so a queue consumer can stop taking
+    messages and drain the ones in flight. Must be called from the running loop.
+
+    Args:
+        stop (asyncio.Event): The event to set when a stop signal is received.
+
+    Examples:
+        >>> stop = asyncio.Event()
+        >>> install_stop_handlers(stop)
+        >>> while not stop.is_set():
+        >>>     # Dequeue and process messages...
+        >>> remove_stop_handlers()
+    """
+    loop: AbstractEventLoop = asyncio.get_running_loop()
+
+    for sig in STOP_SIGNALS:
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):  # pragma: no cover
+            # Not supported on this platform or outside the main thread
+            pass
+
+
+def remove_stop_handlers() -> None:
+    """Remove the handlers installed by `install_stop_handlers`."""
+    loop: AbstractEventLoop = asyncio.get_running_loop()
+
+    for sig in STOP_SIGNALS:
+        try:
+            loop.remove_signal_handler(sig)
+        except (NotImplementedError, RuntimeError):  # pragma: no cover
+            pass
+
+
+async def dequeue_many_or_stop(
+    queue_client: QueueInterface,
+    stop: asyncio.Event,
+    max_messages: int = 10,
+    wait: float = 20.0,
+) -> List[Tuple[bytes, str]]:
+    """Dequeue like `QueueInterface.dequeue_many`, but return no messages as soon as
+    the stop event is set, so a long poll does not hold back the shutdown.
+    Messages received by an interrupted call are not lost: not being acknowledged,
+    they are delivered again.
+
+    Args:
+        queue_client (QueueInterface): The queue to dequeue from.
+        stop (asyncio.Event): The event that interrupts the wait.
+        max_messages (int): Maximum number of messages to return.
+        wait (float): Maximum number of seconds to wait for messages when the queue is empty.
+
+    Returns:
+        List[Tuple[bytes, str]]: The dequeued messages (bytes) with their acknowledgment tokens (str).
+
+    Examples:
+        >>> while not stop.is_set():
+        >>>     messages = await dequeue_many_or_stop(queue_client=queue_client, stop=stop, wait=20)
+        >>>     # Process the messages...
+    """
+    receive: asyncio.Future = asyncio.ensure_future(
+        queue_client.dequeue_many(max_messages=max_messages, wait=wait)
+    )
+    stopped: asyncio.Future = asyncio.ensure_future(stop.wait())
+
+    try:
+        await asyncio.wait({receive, stopped}, return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        receive.cancel()
+        raise
+    finally:
+        stopped.cancel()
+
+    if receive.done():
+        return receive.result()
+
+    # The stop event came first
+    receive.cancel()
+
+    return []
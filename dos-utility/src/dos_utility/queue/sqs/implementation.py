@@ -4,13 +4,18 @@ import base64
 import logging
 
 from uuid import uuid4
-from typing import Self, Tuple, Optional, Dict
+from typing import Self, Tuple, Optional, Dict, List
 from asyncio import AbstractEventLoop
 
 from ...utils.aws import get_aws_credentials_settings, AWSCredentialsSettings
 from ..interface import QueueInterface
+from ..exceptions import BatchEnqueueException, BatchAcknowledgeException
 from .env import SQSQueueSettings, get_sqs_queue_settings
 
+# SQS limits for batch APIs and long polling
+SQS_MAX_BATCH_SIZE: int = 10
+SQS_MAX_WAIT_TIME_SECONDS: int = 20
+
 
 class SQSQueue(QueueInterface):
     def __init__(self: Self) -> None:
@@ -84,6 +89,38 @@ class SQSQueue(QueueInterface):
 
         return response["MessageId"]
 
+    async def enqueue_many(self: Self, msgs: List[bytes]) -> List[str]:
+        loop: AbstractEventLoop = asyncio.get_event_loop()
+        msg_ids: List[str] = []
+
+        for start in range(0, len(msgs), SQS_MAX_BATCH_SIZE):
+            entries = [
+                {
+                    "Id": str(idx),
+                    "MessageBody": base64.b64encode(msg).decode("utf-8"),
+                    "MessageGroupId": "default",
+                    "MessageDeduplicationId": uuid4().hex,
+                }
+                for idx, msg in enumerate(msgs[start : start + SQS_MAX_BATCH_SIZE])
+            ]
+            response = await loop.run_in_executor(
+                None,
+                lambda: self._client.send_message_batch(
+                    QueueUrl=self._settings.SQS_QUEUE_URL, Entries=entries
+                ),
+            )
+
+            if response.get("Failed"):
+                raise BatchEnqueueException(
+                    msg=f"SQS SendMessageBatch failed for {len(response['Failed'])} messages: {response['Failed']}"
+                )
+
+            # Successful entries are not guaranteed to be in request order
+            ids_by_entry = {x["Id"]: x["MessageId"] for x in response["Successful"]}
+            msg_ids.extend(ids_by_entry[entry["Id"]] for entry in entries)
+
+        return msg_ids
+
     async def dequeue(self: Self) -> Tuple[Optional[bytes], Optional[str]]:
         loop: AbstractEventLoop = asyncio.get_event_loop()
         response = await loop.run_in_executor(
@@ -108,6 +145,27 @@ class SQSQueue(QueueInterface):
 
         return None, None
 
+    async def dequeue_many(
+        self: Self, max_messages: int = 10, wait: float = 20.0
+    ) -> List[Tuple[bytes, str]]:
+        loop: AbstractEventLoop = asyncio.get_event_loop()
+        response = await loop.run_in_executor(
+            None,
+            lambda: self._client.receive_message(
+                QueueUrl=self._settings.SQS_QUEUE_URL,
+                MaxNumberOfMessages=max(1, min(max_messages, SQS_MAX_BATCH_SIZE)),
+                WaitTimeSeconds=max(0, min(int(wait), SQS_MAX_WAIT_TIME_SECONDS)),
+            ),
+        )
+
+        return [
+            (
+                base64.b64decode(message["Body"].encode("utf-8")),
+                message["ReceiptHandle"],
+            )
+            for message in response.get("Messages", [])
+        ]
+
     async def acknowledge(self: Self, ack_token: str) -> None:
         loop: AbstractEventLoop = asyncio.get_event_loop()
         # Delete the message from the queue using the receipt handle. In SQS this is how we acknowledge message processing.
@@ -119,6 +177,28 @@ class SQSQueue(QueueInterface):
             ),
         )
 
+    async def acknowledge_many(self: Self, ack_tokens: List[str]) -> None:
+        loop: AbstractEventLoop = asyncio.get_event_loop()
+
+        for start in range(0, len(ack_tokens), SQS_MAX_BATCH_SIZE):
+            entries = [
+                {"Id": str(idx), "ReceiptHandle": ack_token}
+                for idx, ack_token in enumerate(
+                    ack_tokens[start : start + SQS_MAX_BATCH_SIZE]
+                )
+            ]
+            response = await loop.run_in_executor(
+                None,
+                lambda: self._client.delete_message_batch(
+                    QueueUrl=self._settings.SQS_QUEUE_URL, Entries=entries
+                ),
+            )
+
+            if response.get("Failed"):
+                raise BatchAcknowledgeException(
+                    msg=f"SQS DeleteMessageBatch failed for {len(response['Failed'])} messages: {response['Failed']}"
+                )
+
 
 def get_sqs_queue() -> SQSQueue:
     return SQSQueue()
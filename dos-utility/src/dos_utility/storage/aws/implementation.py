@@ -42,6 +42,9 @@ class AWSS3(StorageInterface):
 
         return body.read()
 
+    def download_object(self: Self, bucket: str, name: str, path: str) -> None:
+        self.client.download_file(Bucket=bucket, Key=name, Filename=path)
+
     def put_object(
         self: Self, bucket: str, name: str, data: BinaryIO, content_type: str
     ) -> None:
@@ -39,6 +39,19 @@ class StorageInterface(ABC):
         """
         ...
 
+    def download_object(self: Self, bucket: str, name: str, path: str) -> None:
+        """Download an object from the storage to a local file, without holding
+        the whole object in memory when the backend supports streaming.
+        The default implementation falls back to `get_object`.
+
+        Args:
+            bucket (str): The name of the bucket.
+            name (str): The name of the object.
+            path (str): The local file path to write the object to.
+        """
+        with open(path, "wb") as file:
+            file.write(self.get_object(bucket=bucket, name=name))
+
     @abstractmethod
     def put_object(
         self: Self, bucket: str, name: str, data: BinaryIO, content_type: str
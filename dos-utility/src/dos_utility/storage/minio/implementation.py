@@ -42,6 +42,9 @@ class MinIO(StorageInterface):
 
         return data
 
+    def download_object(self: Self, bucket: str, name: str, path: str) -> None:
+        self.client.fget_object(bucket_name=bucket, object_name=name, file_path=path)
+
     def put_object(
         self: Self, bucket: str, name: str, data: BinaryIO, content_type: str
     ) -> None:
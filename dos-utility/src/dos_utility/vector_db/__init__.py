@@ -3,6 +3,8 @@ from typing import AsyncGenerator, Optional
 
 from .interface import VectorDBInterface, ObjectData, SearchResult
 from .env import get_vector_db_settings, VectorDBSettings, VectorDBProvider
+from .catalog import IndexCatalog, get_index_catalog
+from .hidden_versions import HiddenVersionsCache, get_hidden_versions_cache
 from .redis import get_redis_vector_db
 from .qdrant import get_qdrant_vector_db
 from .exceptions import (
@@ -10,6 +12,7 @@ from .exceptions import (
     IndexDeletionException,
     PutObjectsException,
     DeleteObjectsException,
+    VersionUpdateException,
 )
 
 __all__ = [
@@ -19,10 +22,15 @@ __all__ = [
     "get_vector_db_ctx",
     "get_vector_db",
     "get_vector_db_instance",
+    "IndexCatalog",
+    "get_index_catalog",
+    "HiddenVersionsCache",
+    "get_hidden_versions_cache",
     "IndexCreationException",
     "IndexDeletionException",
     "PutObjectsException",
     "DeleteObjectsException",
+    "VersionUpdateException",
 ]
 
 
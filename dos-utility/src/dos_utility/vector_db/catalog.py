@@ -0,0 +1,173 @@
+import json
+import logging
+import time
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Self
+from redis.asyncio import Redis
+
+from ..utils.redis import get_redis_connection_pool
+from .interface import VectorDBInterface
+from .env import IndexCatalogSettings, get_index_catalog_settings
+
+
+class IndexCatalog:
+    """Process-wide cache of the names of the indexes in the vector database.
+
+    Listing the indexes (`FT._LIST` / `get_collections`) costs O(indexes), while
+    most requests only need to know whether one index exists. The catalog keeps
+    the list in memory for `VECTOR_DB_INDEX_CATALOG_TTL_SECONDS` and, when
+    `VECTOR_DB_INDEX_CATALOG_SHARED` is set, in a Redis key shared by every
+    process, so only one of them reloads it from the vector database.
+
+    Only positive answers are served from the cache: an index missing from the
+    cached list is looked up again in the vector database before reporting it as
+    missing, so an index just created by another process is never hidden.
+    """
+
+    def __init__(self: Self) -> None:
+        self._settings: IndexCatalogSettings = get_index_catalog_settings()
+        self._indexes: Optional[FrozenSet[str]] = None
+        self._expires_at: float = 0.0
+        self.hits: int = 0
+        self.shared_hits: int = 0
+        self.misses: int = 0
+
+    def __shared_client(self: Self) -> Redis:
+        return Redis(connection_pool=get_redis_connection_pool(decode_responses=True))
+
+    async def __read_shared(self: Self) -> Optional[List[str]]:
+        try:
+            value: Optional[str] = await self.__shared_client().get(
+                self._settings.VECTOR_DB_INDEX_CATALOG_REDIS_KEY
+            )
+        except Exception as e:
+            logging.warning(f"Failed to read the shared index catalog: {e}")
+            return None
+
+        return json.loads(value) if value is not None else None
+
+    async def __write_shared(self: Self, indexes: List[str]) -> None:
+        try:
+            await self.__shared_client().set(
+                self._settings.VECTOR_DB_INDEX_CATALOG_REDIS_KEY,
+                json.dumps(indexes),
+                px=max(
+                    int(self._settings.VECTOR_DB_INDEX_CATALOG_TTL_SECONDS * 1000), 1
+                ),
+            )
+        except Exception as e:
+            logging.warning(f"Failed to write the shared index catalog: {e}")
+
+    def __store(self: Self, indexes: List[str]) -> None:
+        self._indexes = frozenset(indexes)
+        self._expires_at = (
+            time.monotonic() + self._settings.VECTOR_DB_INDEX_CATALOG_TTL_SECONDS
+        )
+
+    async def __get_cached(self: Self) -> Optional[List[str]]:
+        """Return the cached index names, or None if there is no fresh copy."""
+        if self._settings.VECTOR_DB_INDEX_CATALOG_TTL_SECONDS <= 0:
+            return None
+
+        if self._indexes is not None and time.monotonic() < self._expires_at:
+            self.hits += 1
+            return list(self._indexes)
+
+        if self._settings.VECTOR_DB_INDEX_CATALOG_SHARED:
+            shared: Optional[List[str]] = await self.__read_shared()
+
+            if shared is not None:
+                self.shared_hits += 1
+                self.__store(shared)
+                return shared
+
+        return None
+
+    async def __load(self: Self, vdb: VectorDBInterface) -> List[str]:
+        self.misses += 1
+        indexes: List[str] = await vdb.get_indexes()
+
+        if self._settings.VECTOR_DB_INDEX_CATALOG_TTL_SECONDS > 0:
+            self.__store(indexes)
+
+            if self._settings.VECTOR_DB_INDEX_CATALOG_SHARED:
+                await self.__write_shared(indexes)
+
+        return indexes
+
+    async def get_indexes(
+        self: Self, vdb: VectorDBInterface, refresh: bool = False
+    ) -> List[str]:
+        """Return the index names, from the cache when still fresh.
+
+        Args:
+            vdb (VectorDBInterface): The vector database to load the list from on a miss.
+            refresh (bool): Skip the cache and reload the list from the vector database.
+
+        Returns:
+            List[str]: The index names.
+        """
+        if not refresh:
+            cached: Optional[List[str]] = await self.__get_cached()
+
+            if cached is not None:
+                return cached
+
+        return await self.__load(vdb=vdb)
+
+    async def exists(self: Self, vdb: VectorDBInterface, index_name: str) -> bool:
+        """Check whether the index exists.
+
+        Args:
+            vdb (VectorDBInterface): The vector database to load the list from on a miss.
+            index_name (str): The name of the index.
+
+        Returns:
+            bool: True if the index exists, False otherwise.
+
+        Examples:
+            >>> if not await get_index_catalog().exists(vdb, "my_index"):
+            >>>     await vdb.create_index(index_name="my_index", vector_dim=768)
+        """
+        cached: Optional[List[str]] = await self.__get_cached()
+
+        if cached is not None and index_name in cached:
+            return True
+
+        return index_name in await self.__load(vdb=vdb)
+
+    async def invalidate(self: Self) -> None:
+        """Drop the cached list, locally and in the shared Redis key.
+        Called by the providers after an index is created or deleted.
+        """
+        self._indexes = None
+        self._expires_at = 0.0
+
+        if self._settings.VECTOR_DB_INDEX_CATALOG_SHARED:
+            try:
+                await self.__shared_client().delete(
+                    self._settings.VECTOR_DB_INDEX_CATALOG_REDIS_KEY
+                )
+            except Exception as e:
+                logging.warning(f"Failed to invalidate the shared index catalog: {e}")
+
+    def stats(self: Self) -> Dict[str, float]:
+        """Return the cache counters.
+
+        Returns:
+            Dict[str, float]: hits (local), shared_hits (Redis), misses (vector database) and the overall hit rate.
+        """
+        lookups: int = self.hits + self.shared_hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.shared_hits) / lookups if lookups else 0.0,
+        }
+
+
+@lru_cache
+def get_index_catalog() -> IndexCatalog:
+    return IndexCatalog()
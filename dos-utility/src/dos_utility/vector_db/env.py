@@ -1,6 +1,8 @@
 from functools import lru_cache
 from pydantic_settings import BaseSettings
+from pydantic import Field
 from enum import StrEnum
+from typing import Annotated
 
 
 class VectorDBProvider(StrEnum):
@@ -15,3 +17,49 @@ class VectorDBSettings(BaseSettings):
 @lru_cache
 def get_vector_db_settings() -> VectorDBSettings:
     return VectorDBSettings()
+
+
+class IndexCatalogSettings(BaseSettings):
+    VECTOR_DB_INDEX_CATALOG_TTL_SECONDS: Annotated[
+        float,
+        Field(
+            default=30.0,
+            ge=0.0,
+            description="How long the list of indexes is served from memory. 0 disables the cache",
+        ),
+    ]
+    VECTOR_DB_INDEX_CATALOG_SHARED: Annotated[
+        bool,
+        Field(
+            default=False,
+            description="Share the list of indexes across processes through a Redis key",
+        ),
+    ]
+    VECTOR_DB_INDEX_CATALOG_REDIS_KEY: Annotated[
+        str,
+        Field(
+            default="vector_db:index_catalog",
+            description="Redis key holding the shared list of indexes",
+        ),
+    ]
+
+
+@lru_cache
+def get_index_catalog_settings() -> IndexCatalogSettings:
+    return IndexCatalogSettings()
+
+
+class HiddenVersionsCacheSettings(BaseSettings):
+    VECTOR_DB_HIDDEN_VERSIONS_TTL_SECONDS: Annotated[
+        float,
+        Field(
+            default=1.0,
+            ge=0.0,
+            description="How long the hidden versions of an index are served from memory. Staging and activating a version wait this long. 0 disables the cache",
+        ),
+    ]
+
+
+@lru_cache
+def get_hidden_versions_cache_settings() -> HiddenVersionsCacheSettings:
+    return HiddenVersionsCacheSettings()
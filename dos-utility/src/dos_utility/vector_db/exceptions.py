@@ -35,3 +35,12 @@ class DeleteObjectsException(Exception):
         super().__init__(
             f"Deleting objects failed in the vector database. Details: {msg}"
         )
+
+
+class VersionUpdateException(Exception):
+    """Exception raised when staging, activating or releasing a document version fails in the vector database."""
+
+    def __init__(self: Self, msg: str):
+        super().__init__(
+            f"Updating the document versions failed in the vector database. Details: {msg}"
+        )
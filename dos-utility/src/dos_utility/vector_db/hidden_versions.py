@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, List, Optional, Self, Tuple
+
+from .env import HiddenVersionsCacheSettings, get_hidden_versions_cache_settings
+
+
+class HiddenVersionsCache:
+    """Process-wide cache of the hidden versions of each index.
+
+    Every search excludes the chunks of the staged and superseded versions, so
+    without a cache each one reads them from the vector database first. The
+    cache keeps them in memory for `VECTOR_DB_HIDDEN_VERSIONS_TTL_SECONDS`.
+
+    Other processes are not told when the versions change, so the providers
+    drop the local entry and then `settle()`: after staging a version, before
+    any of its chunks is stored, and after activating one, before the revision
+    of the index is bumped. A stale copy thus only ever shows the index as it
+    was before the change, and never outlives the revision it was read under.
+    """
+
+    def __init__(self: Self) -> None:
+        self._settings: HiddenVersionsCacheSettings = (
+            get_hidden_versions_cache_settings()
+        )
+        self._entries: Dict[str, Tuple[float, List[str]]] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    async def get(
+        self: Self, index_name: str, load: Callable[[], Awaitable[List[str]]]
+    ) -> List[str]:
+        """Return the hidden versions of the index, from the cache when still fresh.
+
+        Args:
+            index_name (str): The name of the index.
+            load (Callable[[], Awaitable[List[str]]]): Reads them from the vector database on a miss.
+
+        Returns:
+            List[str]: The hidden versions.
+        """
+        entry: Optional[Tuple[float, List[str]]] = self._entries.get(index_name)
+
+        if entry is not None and time.monotonic() < entry[0]:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        # Counted from before the read, so a copy never outlives the TTL
+        expires_at: float = (
+            time.monotonic() + self._settings.VECTOR_DB_HIDDEN_VERSIONS_TTL_SECONDS
+        )
+        hidden: List[str] = await load()
+
+        if self._settings.VECTOR_DB_HIDDEN_VERSIONS_TTL_SECONDS > 0:
+            self._entries[index_name] = (expires_at, hidden)
+
+        return hidden
+
+    def invalidate(self: Self, index_name: str) -> None:
+        """Drop the cached hidden versions of the index."""
+        self._entries.pop(index_name, None)
+
+    async def settle(self: Self) -> None:
+        """Wait until every copy cached before now, in any process, expired."""
+        if self._settings.VECTOR_DB_HIDDEN_VERSIONS_TTL_SECONDS > 0:
+            await asyncio.sleep(self._settings.VECTOR_DB_HIDDEN_VERSIONS_TTL_SECONDS)
+
+
+@lru_cache
+def get_hidden_versions_cache() -> HiddenVersionsCache:
+    return HiddenVersionsCache()
@@ -1,6 +1,6 @@
 import asyncio
 from abc import abstractmethod
-from typing import Self, List, Annotated, Optional, Any
+from typing import Self, Dict, List, Annotated, Optional, Any
 from pydantic import BaseModel, Field, PositiveFloat, PositiveInt
 from llama_index.core.vector_stores.types import (
     BasePydanticVectorStore,
@@ -29,6 +29,27 @@ class ObjectData(BaseModel):
             description="The embedding vector of the content. Make sure its dimension matches the vector DB index dimension."
         ),
     ]
+    version: Annotated[
+        Optional[str],
+        Field(
+            default=None,
+            description="The version of the file the chunk belongs to. Searches skip the chunks of staged and superseded versions.",
+        ),
+    ]
+    document_hash: Annotated[
+        Optional[str],
+        Field(
+            default=None,
+            description="Hash of the whole file the chunk comes from, to detect unchanged files.",
+        ),
+    ]
+    content_hash: Annotated[
+        Optional[str],
+        Field(
+            default=None,
+            description="Hash of the content of the chunk, to reuse its vector while the content doesn't change.",
+        ),
+    ]
 
 
 class SearchResult(BaseModel):
@@ -242,6 +263,157 @@ class VectorDBInterface(BasePydanticVectorStore):
         """
         ...
 
+    @abstractmethod
+    async def delete_by_filter(
+        self: Self, index_name: str, filters: MetadataFilters
+    ) -> int:
+        """Delete every object matching the filters. The deletion runs in the vector
+        database, in batches, so the ids never have to be fetched by the caller and
+        memory stays bounded regardless of the number of matching objects.
+
+        Args:
+            index_name (str): The name of the index to delete the objects from.
+            filters (MetadataFilters): The filters the objects to delete must match. Must not be empty.
+
+        Returns:
+            int: The number of deleted objects.
+
+        Raises:
+            DeleteObjectsException: If deleting objects fails or the filters are empty.
+
+        Examples:
+            >>> vector_db = MyVectorDBImplementation()
+            >>> async with vector_db as vdb:
+            >>>     filters = MetadataFilters(filters=[MetadataFilter(key="filename", value="my_index/doc.pdf")])
+            >>>     try:
+            >>>         deleted: int = await vdb.delete_by_filter(index_name="my_index", filters=filters)
+            >>>     except DeleteObjectsException as e:
+            >>>         ... # handle the exception
+        """
+        ...
+
+    @abstractmethod
+    async def stage_version(
+        self: Self, index_name: str, filename: str, version: str
+    ) -> None:
+        """Register a new version of a file as staged. The chunks stored with this
+        version are skipped by every search until the version is activated, so a
+        file can be re-ingested while its current version keeps being served.
+
+        Args:
+            index_name (str): The name of the index the file belongs to.
+            filename (str): The name of the file.
+            version (str): The new version. Must be unique, e.g. a random UUID.
+
+        Raises:
+            VersionUpdateException: If the version could not be staged.
+        """
+        ...
+
+    @abstractmethod
+    async def activate_version(
+        self: Self, index_name: str, filename: str, version: str
+    ) -> Optional[str]:
+        """Atomically make a staged version the active version of a file: its chunks
+        become visible and the chunks of the previous version are hidden, in a single
+        step, so searches never see both versions or none.
+
+        Args:
+            index_name (str): The name of the index the file belongs to.
+            filename (str): The name of the file.
+            version (str): The staged version to activate.
+
+        Returns:
+            Optional[str]: The superseded version, whose chunks can now be deleted. None if the file had no active version.
+
+        Raises:
+            VersionUpdateException: If the version could not be activated.
+
+        Examples:
+            >>> async with vector_db as vdb:
+            >>>     await vdb.stage_version(index_name="my_index", filename="doc.pdf", version=version)
+            >>>     await vdb.put_objects(index_name="my_index", data=chunks)  # stored with version=version
+            >>>     previous: Optional[str] = await vdb.activate_version(index_name="my_index", filename="doc.pdf", version=version)
+        """
+        ...
+
+    @abstractmethod
+    async def release_versions(
+        self: Self, index_name: str, filename: str, versions: List[str]
+    ) -> None:
+        """Forget hidden versions of a file, once their chunks have been deleted.
+
+        Args:
+            index_name (str): The name of the index the file belongs to.
+            filename (str): The name of the file.
+            versions (List[str]): The superseded or abandoned versions to forget.
+
+        Raises:
+            VersionUpdateException: If the versions could not be released.
+        """
+        ...
+
+    @abstractmethod
+    async def delete_versions(self: Self, index_name: str, filename: str) -> None:
+        """Forget every version of a file, the active one and the hidden ones, once
+        all its chunks have been deleted (e.g. because the file was removed). Left
+        behind, its hidden versions would keep being excluded by every search.
+
+        Args:
+            index_name (str): The name of the index the file belonged to.
+            filename (str): The name of the file.
+
+        Raises:
+            VersionUpdateException: If the versions could not be deleted.
+
+        Examples:
+            >>> async with vector_db as vdb:
+            >>>     await vdb.delete_by_filter(index_name="my_index", filters=filename_filter)
+            >>>     await vdb.delete_versions(index_name="my_index", filename="doc.pdf")
+        """
+        ...
+
+    @abstractmethod
+    async def get_hidden_versions(
+        self: Self, index_name: str, filename: str
+    ) -> Dict[str, Optional[float]]:
+        """Return the hidden versions of a file: the staged ones, which may belong
+        to an ingestion still in progress, and the superseded ones, waiting for
+        their chunks to be deleted.
+
+        Args:
+            index_name (str): The name of the index the file belongs to.
+            filename (str): The name of the file.
+
+        Returns:
+            Dict[str, Optional[float]]: The staging time (Unix seconds) of each staged version, None for the superseded ones.
+
+        Examples:
+            >>> hidden: Dict[str, Optional[float]] = await vdb.get_hidden_versions(index_name="my_index", filename="doc.pdf")
+            >>> superseded: List[str] = [v for v, staged_at in hidden.items() if staged_at is None]
+        """
+        ...
+
+    @abstractmethod
+    async def get_revision(self: Self, index_name: str) -> Optional[str]:
+        """Return the revision of the contents of the index: an opaque token that
+        changes every time the searchable contents change (index created, objects
+        put or deleted, a version activated). Whoever caches results derived from
+        the index keeps the revision along with them, to tell when they go stale.
+
+        Args:
+            index_name (str): The name of the index.
+
+        Returns:
+            Optional[str]: The revision, None if the index has not been written since revisions were introduced.
+
+        Examples:
+            >>> revision: Optional[str] = await vdb.get_revision(index_name="my_index")
+            >>> if revision is None or revision != cached_revision:
+            >>>     ... # recompute the cached result
+        """
+        ...
+
     @abstractmethod
     async def semantic_search(
         self: Self,
@@ -251,7 +423,7 @@ class VectorDBInterface(BasePydanticVectorStore):
         score_threshold: Annotated[PositiveFloat, Field(ge=0.0, le=1.0)],
         filters: Optional[MetadataFilters] = None,
     ) -> List[SearchResult]:
-        """Perform a semantic search in the vector database.
+        """Perform a semantic search in the vector database. Chunks of staged and superseded versions are skipped.
 
         Args:
             index_name (str): The name of the index to search in.
@@ -284,6 +456,7 @@ class VectorDBInterface(BasePydanticVectorStore):
         max_results: PositiveInt,
     ) -> List[SearchResult]:
         """Perform a metadata filter search in the vector database, without a query embedding.
+        Chunks of staged and superseded versions are skipped.
 
         Args:
             index_name (str): The name of the index to search in.
@@ -305,6 +478,35 @@ class VectorDBInterface(BasePydanticVectorStore):
         """
         ...
 
+    @abstractmethod
+    async def get_objects(
+        self: Self,
+        index_name: str,
+        filters: MetadataFilters,
+        max_results: PositiveInt,
+    ) -> List[ObjectData]:
+        """Read back the stored objects matching the filters, vectors included.
+        Chunks of staged and superseded versions are skipped.
+
+        Args:
+            index_name (str): The name of the index to read from.
+            filters (MetadataFilters): The metadata filters to apply (from LlamaIndex).
+            max_results (PositiveInt): The maximum number of objects to return.
+
+        Returns:
+            List[ObjectData]: The stored objects, in no particular order.
+
+        Examples:
+            >>> vector_db = MyVectorDBImplementation()
+            >>> async with vector_db as vdb:
+            >>>     stored: List[ObjectData] = await vdb.get_objects(
+            >>>         index_name="my_index",
+            >>>         filters=MetadataFilters(filters=[MetadataFilter(key="filename", value="doc.pdf")]),
+            >>>         max_results=1000,
+            >>>     )
+        """
+        ...
+
     @abstractmethod
     async def aquery(
         self: Self, query: VectorStoreQuery, **kwargs: Any
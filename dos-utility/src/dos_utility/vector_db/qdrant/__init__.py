@@ -1,3 +1,3 @@
-from .implementation import get_qdrant_vector_db, QdrantVectorDB
+from .implementation import get_qdrant_vector_db, QdrantVectorDB, QdrantIndexOptions
 
-__all__ = ["get_qdrant_vector_db", "QdrantVectorDB"]
+__all__ = ["get_qdrant_vector_db", "QdrantVectorDB", "QdrantIndexOptions"]
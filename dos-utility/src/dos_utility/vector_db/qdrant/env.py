@@ -1,12 +1,63 @@
 from functools import lru_cache
 from pydantic_settings import BaseSettings
 from pydantic import Field
-from typing import Annotated
+from typing import Annotated, Literal, Optional
 
 
 class QdrantVectorDBSettings(BaseSettings):
     QDRANT_HOST: Annotated[str, Field(default="localhost")]
     QDRANT_PORT: Annotated[int, Field(default=6333)]
+    QDRANT_QUANTIZATION: Annotated[
+        Literal["none", "scalar", "binary"],
+        Field(
+            default="none",
+            description="Quantization of the new collections: int8 scalar or binary",
+        ),
+    ]
+    QDRANT_QUANTIZATION_ALWAYS_RAM: Annotated[
+        bool,
+        Field(
+            default=True,
+            description="Keep the quantized vectors in RAM, even with on-disk vectors",
+        ),
+    ]
+    QDRANT_ON_DISK_VECTORS: Annotated[
+        bool,
+        Field(
+            default=False,
+            description="Store the original vectors of the new collections on disk",
+        ),
+    ]
+    QDRANT_ON_DISK_PAYLOAD: Annotated[
+        bool,
+        Field(
+            default=False,
+            description="Store the payload of the new collections on disk",
+        ),
+    ]
+    QDRANT_HNSW_M: Annotated[
+        int, Field(default=16, gt=0, description="HNSW max edges per node")
+    ]
+    QDRANT_HNSW_EF_CONSTRUCT: Annotated[
+        int,
+        Field(default=100, gt=0, description="HNSW candidate list size while building"),
+    ]
+    QDRANT_SEARCH_HNSW_EF: Annotated[
+        Optional[int],
+        Field(
+            default=None,
+            gt=0,
+            description="Default HNSW candidate list size while searching. None uses the collection default",
+        ),
+    ]
+    QDRANT_SEARCH_OVERSAMPLING: Annotated[
+        Optional[float],
+        Field(
+            default=None,
+            ge=1.0,
+            description="Default oversampling of the quantized search, rescored with the original vectors",
+        ),
+    ]
 
 
 @lru_cache()
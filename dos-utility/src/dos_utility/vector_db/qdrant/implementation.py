@@ -1,6 +1,9 @@
+import asyncio
 import logging
+import random
+import time
 
-from uuid import uuid4
+from uuid import NAMESPACE_URL, uuid4, uuid5
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import (
     VectorParams,
@@ -13,6 +16,22 @@ from qdrant_client.models import (
     MatchAny,
     MatchText,
     Range,
+    HnswConfigDiff,
+    QuantizationConfig,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    SearchParams,
+    QuantizationSearchParams,
+    KeywordIndexParams,
+    IntegerIndexParams,
+    FilterSelector,
+    CountResult,
+    IsEmptyCondition,
+    PayloadField,
+    Record,
 )
 from qdrant_client.conversions.common_types import (
     UpdateResult,
@@ -20,8 +39,8 @@ from qdrant_client.conversions.common_types import (
     PointStruct,
 )
 from qdrant_client.conversions.common_types import QueryResponse
-from typing import Self, List, Optional, Annotated, Any
-from pydantic import Field, PositiveInt, PositiveFloat, PrivateAttr
+from typing import Self, Dict, List, Literal, Optional, Annotated, Any, Callable, Set
+from pydantic import BaseModel, Field, PositiveInt, PositiveFloat, PrivateAttr
 from llama_index.core.vector_stores.types import (
     VectorStoreQuery,
     VectorStoreQueryResult,
@@ -32,15 +51,72 @@ from llama_index.core.vector_stores.types import (
 from llama_index.core.schema import TextNode
 
 from ..interface import VectorDBInterface, ObjectData, SearchResult
+from ..catalog import get_index_catalog
+from ..hidden_versions import get_hidden_versions_cache
 from ..exceptions import (
     IndexCreationException,
     IndexDeletionException,
     PutObjectsException,
     DeleteObjectsException,
+    VersionUpdateException,
 )
 from .env import QdrantVectorDBSettings, get_qdrant_vector_db_settings
 
 
+class QdrantIndexOptions(BaseModel):
+    """Tuning of a Qdrant collection. The defaults are the options of the
+    collections created before they were configurable; new collections take
+    theirs from the `QDRANT_*` env.
+    """
+
+    quantization: Annotated[
+        Literal["none", "scalar", "binary"],
+        Field(
+            default="none",
+            description="int8 scalar (4x smaller) or binary (32x smaller) quantization. Searches rescore with the original vectors.",
+        ),
+    ]
+    quantization_always_ram: Annotated[
+        bool,
+        Field(
+            default=True,
+            description="Keep the quantized vectors in RAM, even when the original ones are on disk.",
+        ),
+    ]
+    on_disk_vectors: Annotated[
+        bool,
+        Field(default=False, description="Store the original vectors on disk."),
+    ]
+    on_disk_payload: Annotated[
+        bool, Field(default=False, description="Store the payload on disk.")
+    ]
+    hnsw_m: Annotated[
+        PositiveInt, Field(default=16, description="HNSW: max edges per node.")
+    ]
+    hnsw_ef_construct: Annotated[
+        PositiveInt,
+        Field(default=100, description="HNSW: candidate list size while building."),
+    ]
+
+
+# Page size used to collect the hidden versions of a collection
+_HIDDEN_VERSIONS_PAGE_SIZE: int = 256
+# Attempts, and base backoff between them, to update a version record that
+# other processes keep updating at the same time
+_VERSION_RECORD_ATTEMPTS: int = 10
+_VERSION_RECORD_BACKOFF_SECONDS: float = 0.05
+# Id of the point holding the revision of the collection contents
+_REVISION_RECORD_ID: str = str(uuid5(NAMESPACE_URL, "revision"))
+
+# Collections whose payload indexes this process already ensured
+_indexed_collections: Set[str] = set()
+
+
+def clear_payload_index_cache() -> None:
+    """Forgets which collections had their payload indexes ensured."""
+    _indexed_collections.clear()
+
+
 class QdrantVectorDB(VectorDBInterface):
     index_name: Optional[str] = None
 
@@ -75,8 +151,117 @@ class QdrantVectorDB(VectorDBInterface):
             logging.error(f"Qdrant health check failed: {e}")
             return False
 
-    async def create_index(self: Self, index_name: str, vector_dim: int) -> None:
+    def __default_index_options(self: Self) -> QdrantIndexOptions:
+        return QdrantIndexOptions(
+            quantization=self._settings.QDRANT_QUANTIZATION,
+            quantization_always_ram=self._settings.QDRANT_QUANTIZATION_ALWAYS_RAM,
+            on_disk_vectors=self._settings.QDRANT_ON_DISK_VECTORS,
+            on_disk_payload=self._settings.QDRANT_ON_DISK_PAYLOAD,
+            hnsw_m=self._settings.QDRANT_HNSW_M,
+            hnsw_ef_construct=self._settings.QDRANT_HNSW_EF_CONSTRUCT,
+        )
+
+    def __build_quantization_config(
+        self: Self, options: QdrantIndexOptions
+    ) -> Optional[QuantizationConfig]:
+        if options.quantization == "scalar":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=options.quantization_always_ram,
+                )
+            )
+
+        if options.quantization == "binary":
+            return BinaryQuantization(
+                binary=BinaryQuantizationConfig(
+                    always_ram=options.quantization_always_ram
+                )
+            )
+
+        return None
+
+    def __default_search_params(self: Self) -> Optional[SearchParams]:
+        if (
+            self._settings.QDRANT_SEARCH_HNSW_EF is None
+            and self._settings.QDRANT_SEARCH_OVERSAMPLING is None
+        ):
+            return None
+
+        return SearchParams(
+            hnsw_ef=self._settings.QDRANT_SEARCH_HNSW_EF,
+            quantization=(
+                QuantizationSearchParams(
+                    rescore=True,
+                    oversampling=self._settings.QDRANT_SEARCH_OVERSAMPLING,
+                )
+                if self._settings.QDRANT_SEARCH_OVERSAMPLING is not None
+                else None
+            ),
+        )
+
+    async def __create_payload_indexes(
+        self: Self, index_name: str, on_disk: bool
+    ) -> None:
+        """Indexes the payload fields the documents are looked up and deleted
+        by, and the ones of the version records, so those filters don't scan
+        the whole collection. Creating an index that already exists is a no-op,
+        so this also upgrades old collections.
+        """
+        await self._client.create_payload_index(
+            collection_name=index_name,
+            field_name="filename",
+            field_schema=KeywordIndexParams(type="keyword", on_disk=on_disk),
+            wait=True,
+        )
+        await self._client.create_payload_index(
+            collection_name=index_name,
+            field_name="chunk_id",
+            field_schema=IntegerIndexParams(
+                type="integer", lookup=True, range=True, on_disk=on_disk
+            ),
+            wait=True,
+        )
+        await self._client.create_payload_index(
+            collection_name=index_name,
+            field_name="version",
+            field_schema=KeywordIndexParams(type="keyword", on_disk=on_disk),
+            wait=True,
+        )
+        await self._client.create_payload_index(
+            collection_name=index_name,
+            field_name="hidden_versions",
+            field_schema=KeywordIndexParams(type="keyword", on_disk=on_disk),
+            wait=True,
+        )
+        _indexed_collections.add(index_name)
+
+    async def __ensure_payload_indexes(self: Self, index_name: str) -> None:
+        """Creates the payload indexes of a collection created before they
+        existed, once per process. Called before every ingestion, so collections
+        get them before they are deleted from by filter or versioned.
+        """
+        if index_name not in _indexed_collections:
+            await self.__create_payload_indexes(
+                index_name=index_name,
+                on_disk=self.__default_index_options().on_disk_payload,
+            )
+
+    async def create_index(
+        self: Self,
+        index_name: str,
+        vector_dim: int,
+        options: Optional[QdrantIndexOptions] = None,
+    ) -> None:
+        """Creates the collection, with its payload indexes. Without `options`,
+        the tuning comes from the `QDRANT_*` env. If the collection already
+        exists, only its payload indexes are ensured; collections nobody calls
+        this for get them from `stage_version`, at their next ingestion.
+        """
         try:
+            options = options or self.__default_index_options()
+
             if not await self._client.collection_exists(collection_name=index_name):
                 created: bool = await self._client.create_collection(
                     collection_name=index_name,
@@ -85,8 +270,16 @@ class QdrantVectorDB(VectorDBInterface):
                             size=vector_dim,
                             distance=Distance.COSINE,
                             datatype=Datatype.FLOAT32,
+                            on_disk=options.on_disk_vectors,
                         )
                     },
+                    hnsw_config=HnswConfigDiff(
+                        m=options.hnsw_m, ef_construct=options.hnsw_ef_construct
+                    ),
+                    quantization_config=self.__build_quantization_config(
+                        options=options
+                    ),
+                    on_disk_payload=options.on_disk_payload,
                 )
 
                 if created is False:
@@ -94,8 +287,18 @@ class QdrantVectorDB(VectorDBInterface):
                         f"Qdrant gave a negative output when creating index '{index_name}'"
                     )
 
+                await self.__create_payload_indexes(
+                    index_name=index_name, on_disk=options.on_disk_payload
+                )
+                await self.__bump_revision(index_name=index_name)
+
                 logging.info(f"Index '{index_name}' created successfully.")
+                await get_index_catalog().invalidate()
             else:
+                await self.__create_payload_indexes(
+                    index_name=index_name, on_disk=options.on_disk_payload
+                )
+
                 logging.info(f"Index '{index_name}' already exists.")
         except Exception as e:
             raise IndexCreationException(msg=str(e))
@@ -111,7 +314,10 @@ class QdrantVectorDB(VectorDBInterface):
                     f"Qdrant gave a negative output when deleting index '{index_name}'"
                 )
 
+            _indexed_collections.discard(index_name)
+            get_hidden_versions_cache().invalidate(index_name=index_name)
             logging.info(f"Index '{index_name}' deleted successfully.")
+            await get_index_catalog().invalidate()
         except Exception as e:
             raise IndexDeletionException(msg=str(e))
 
@@ -138,11 +344,7 @@ class QdrantVectorDB(VectorDBInterface):
                     PointStruct(
                         id=ids[i],
                         vector={"vector": point.vector},
-                        payload={
-                            "filename": point.filename,
-                            "chunk_id": point.chunk_id,
-                            "content": point.content,
-                        },
+                        payload=point.model_dump(exclude={"vector"}, exclude_none=True),
                     )
                     for i, point in enumerate(data)
                 ],
@@ -150,6 +352,7 @@ class QdrantVectorDB(VectorDBInterface):
             )
 
             if result.status is UpdateStatus.COMPLETED:
+                await self.__bump_revision(index_name=index_name)
                 logging.info(f"Objects added to index '{index_name}' successfully.")
 
                 return ids
@@ -171,6 +374,7 @@ class QdrantVectorDB(VectorDBInterface):
             )
 
             if result.status is UpdateStatus.COMPLETED:
+                await self.__bump_revision(index_name=index_name)
                 logging.info(f"Objects deleted from index '{index_name}' successfully.")
             else:
                 raise Exception(
@@ -179,6 +383,350 @@ class QdrantVectorDB(VectorDBInterface):
         except Exception as e:
             raise DeleteObjectsException(msg=str(e))
 
+    async def delete_by_filter(
+        self: Self, index_name: str, filters: MetadataFilters
+    ) -> int:
+        """See `VectorDBInterface.delete_by_filter`. Counts the matching points,
+        then deletes them with a single server-side `FilterSelector` deletion.
+        """
+        try:
+            query_filter: Optional[Filter] = self._build_filter_condition(filters)
+
+            if query_filter is None:
+                raise Exception("Refusing to delete by an empty filter")
+
+            count: CountResult = await self._client.count(
+                collection_name=index_name, count_filter=query_filter, exact=True
+            )
+
+            if count.count == 0:
+                logging.info("No objects to delete")
+                return 0
+
+            result: UpdateResult = await self._client.delete(
+                collection_name=index_name,
+                points_selector=FilterSelector(filter=query_filter),
+                wait=True,
+            )
+
+            if result.status is not UpdateStatus.COMPLETED:
+                raise Exception(
+                    f"Deleting objects from index '{index_name}' did not complete successfully."
+                )
+
+            await self.__bump_revision(index_name=index_name)
+            logging.info(
+                f"{count.count} objects deleted from index '{index_name}' successfully."
+            )
+
+            return count.count
+        except Exception as e:
+            raise DeleteObjectsException(msg=str(e))
+
+    def __version_record_id(self: Self, filename: str) -> str:
+        return str(uuid5(NAMESPACE_URL, f"versions/{filename}"))
+
+    async def __read_version_record(
+        self: Self, index_name: str, filename: str
+    ) -> Dict[str, Any]:
+        records: List[Record] = await self._client.retrieve(
+            collection_name=index_name,
+            ids=[self.__version_record_id(filename=filename)],
+            with_payload=True,
+            with_vectors=False,
+        )
+
+        if records:
+            return records[0].payload
+
+        return {"versions_of": filename, "active_version": None, "hidden_versions": []}
+
+    async def __write_version_record(
+        self: Self,
+        index_name: str,
+        filename: str,
+        record: Dict[str, Any],
+        expected_revision: Optional[str],
+    ) -> None:
+        """Upserts the version record of the file, unless its `record_revision`
+        changed since it was read. It is a point without vectors, so semantic
+        searches never return it, and without `filename`, so the filters on the
+        chunks never match it. Upserting a single point is atomic, so readers see
+        either the old or the new versions.
+        """
+        result: UpdateResult = await self._client.upsert(
+            collection_name=index_name,
+            points=[
+                PointStruct(
+                    id=self.__version_record_id(filename=filename),
+                    vector={},
+                    payload=record,
+                )
+            ],
+            update_filter=Filter(
+                must=[
+                    FieldCondition(
+                        key="record_revision", match=MatchValue(value=expected_revision)
+                    )
+                    if expected_revision is not None
+                    else IsEmptyCondition(is_empty=PayloadField(key="record_revision"))
+                ]
+            ),
+            wait=True,
+        )
+
+        if result.status is not UpdateStatus.COMPLETED:
+            raise Exception(
+                f"Updating the versions of '{filename}' in index '{index_name}' did not complete successfully."
+            )
+
+    async def __update_version_record(
+        self: Self,
+        index_name: str,
+        filename: str,
+        update: Callable[[Dict[str, Any]], Optional[str]],
+    ) -> Optional[str]:
+        """Applies `update` to the version record of the file, with optimistic
+        concurrency: the write only lands if nobody else wrote the record since it
+        was read, otherwise the record is read and updated again. Returns what
+        `update` returned for the record that was written.
+        """
+        for attempt in range(_VERSION_RECORD_ATTEMPTS):
+            record: Dict[str, Any] = await self.__read_version_record(
+                index_name=index_name, filename=filename
+            )
+            expected_revision: Optional[str] = record.get("record_revision")
+            result: Optional[str] = update(record)
+            record["record_revision"] = uuid4().hex
+
+            await self.__write_version_record(
+                index_name=index_name,
+                filename=filename,
+                record=record,
+                expected_revision=expected_revision,
+            )
+            written: Dict[str, Any] = await self.__read_version_record(
+                index_name=index_name, filename=filename
+            )
+
+            if written.get("record_revision") == record["record_revision"]:
+                return result
+
+            await asyncio.sleep(
+                random.uniform(0, _VERSION_RECORD_BACKOFF_SECONDS * 2**attempt)
+            )
+
+        raise Exception(
+            f"Too many concurrent updates of the versions of '{filename}' in index '{index_name}'."
+        )
+
+    async def stage_version(
+        self: Self, index_name: str, filename: str, version: str
+    ) -> None:
+        """See `VectorDBInterface.stage_version`. The versions of a file are kept
+        in a record point of the collection, keyed by the file name. Collections
+        created before the payload indexes get them here. Returns once no
+        process serves a cached copy of the hidden versions without this one.
+        """
+
+        def stage(record: Dict[str, Any]) -> None:
+            if version not in record["hidden_versions"]:
+                record["hidden_versions"].append(version)
+
+            record["staged_at"] = {**record.get("staged_at", {}), version: time.time()}
+
+        try:
+            await self.__ensure_payload_indexes(index_name=index_name)
+            await self.__update_version_record(
+                index_name=index_name, filename=filename, update=stage
+            )
+            get_hidden_versions_cache().invalidate(index_name=index_name)
+            await get_hidden_versions_cache().settle()
+        except Exception as e:
+            raise VersionUpdateException(msg=str(e))
+
+    async def activate_version(
+        self: Self, index_name: str, filename: str, version: str
+    ) -> Optional[str]:
+        """See `VectorDBInterface.activate_version`. The active version and the
+        hidden ones are swapped with a single upsert of the version record. The
+        revision is bumped once no process serves the old hidden versions.
+        """
+
+        def activate(record: Dict[str, Any]) -> Optional[str]:
+            previous: Optional[str] = record["active_version"]
+            hidden: List[str] = [v for v in record["hidden_versions"] if v != version]
+
+            if previous is not None and previous != version:
+                hidden.append(previous)
+            else:
+                previous = None
+
+            record["active_version"] = version
+            record["hidden_versions"] = hidden
+            record["staged_at"] = {
+                v: t for v, t in record.get("staged_at", {}).items() if v != version
+            }
+
+            return previous
+
+        try:
+            previous: Optional[str] = await self.__update_version_record(
+                index_name=index_name, filename=filename, update=activate
+            )
+            get_hidden_versions_cache().invalidate(index_name=index_name)
+            await get_hidden_versions_cache().settle()
+            await self.__bump_revision(index_name=index_name)
+
+            logging.info(
+                f"Version '{version}' of '{filename}' is now active in index '{index_name}'."
+            )
+
+            return previous
+        except Exception as e:
+            raise VersionUpdateException(msg=str(e))
+
+    async def release_versions(
+        self: Self, index_name: str, filename: str, versions: List[str]
+    ) -> None:
+        if len(versions) == 0:
+            return
+
+        def release(record: Dict[str, Any]) -> None:
+            record["hidden_versions"] = [
+                v for v in record["hidden_versions"] if v not in versions
+            ]
+            record["staged_at"] = {
+                v: t
+                for v, t in record.get("staged_at", {}).items()
+                if v not in versions
+            }
+
+        try:
+            await self.__update_version_record(
+                index_name=index_name, filename=filename, update=release
+            )
+            get_hidden_versions_cache().invalidate(index_name=index_name)
+        except Exception as e:
+            raise VersionUpdateException(msg=str(e))
+
+    async def delete_versions(self: Self, index_name: str, filename: str) -> None:
+        """See `VectorDBInterface.delete_versions`. Deletes the version record
+        point of the file.
+        """
+        try:
+            result: UpdateResult = await self._client.delete(
+                collection_name=index_name,
+                points_selector=[self.__version_record_id(filename=filename)],
+                wait=True,
+            )
+
+            if result.status is not UpdateStatus.COMPLETED:
+                raise Exception(
+                    f"Deleting the versions of '{filename}' from index '{index_name}' did not complete successfully."
+                )
+
+            get_hidden_versions_cache().invalidate(index_name=index_name)
+        except Exception as e:
+            raise VersionUpdateException(msg=str(e))
+
+    async def get_hidden_versions(
+        self: Self, index_name: str, filename: str
+    ) -> Dict[str, Optional[float]]:
+        """See `VectorDBInterface.get_hidden_versions`. The staging times are
+        kept in the version record, next to the hidden versions.
+        """
+        record: Dict[str, Any] = await self.__read_version_record(
+            index_name=index_name, filename=filename
+        )
+        staged_at: Dict[str, float] = record.get("staged_at", {})
+
+        return {v: staged_at.get(v) for v in record["hidden_versions"]}
+
+    async def __bump_revision(self: Self, index_name: str) -> None:
+        """Upserts the revision record with a new revision. Like the version
+        records it has neither vectors nor `filename`, so no search returns it.
+        """
+        result: UpdateResult = await self._client.upsert(
+            collection_name=index_name,
+            points=[
+                PointStruct(
+                    id=_REVISION_RECORD_ID,
+                    vector={},
+                    payload={"revision": uuid4().hex},
+                )
+            ],
+            wait=True,
+        )
+
+        if result.status is not UpdateStatus.COMPLETED:
+            raise Exception(
+                f"Updating the revision of index '{index_name}' did not complete successfully."
+            )
+
+    async def get_revision(self: Self, index_name: str) -> Optional[str]:
+        """See `VectorDBInterface.get_revision`. The revision lives in a record
+        point of the collection, rewritten by every change of the contents.
+        """
+        records: List[Record] = await self._client.retrieve(
+            collection_name=index_name,
+            ids=[_REVISION_RECORD_ID],
+            with_payload=True,
+            with_vectors=False,
+        )
+
+        return records[0].payload.get("revision") if records else None
+
+    async def __hide_versions(
+        self: Self, index_name: str, query_filter: Optional[Filter]
+    ) -> Optional[Filter]:
+        """Adds to the filter the exclusion of the staged and superseded versions,
+        served from the process-wide hidden versions cache.
+        """
+        hidden: List[str] = await get_hidden_versions_cache().get(
+            index_name=index_name,
+            load=lambda: self.__load_hidden_versions(index_name=index_name),
+        )
+
+        if not hidden:
+            return query_filter
+
+        hidden_condition: FieldCondition = FieldCondition(
+            key="version", match=MatchAny(any=hidden)
+        )
+
+        if query_filter is None:
+            return Filter(must_not=[hidden_condition])
+
+        return Filter(must=[query_filter], must_not=[hidden_condition])
+
+    async def __load_hidden_versions(self: Self, index_name: str) -> List[str]:
+        """Collects the hidden versions of the collection. Only the records of
+        the files being re-ingested or waiting for garbage collection have
+        hidden versions, so this reads a handful of points.
+        """
+        hidden: List[str] = []
+        offset: Optional[Any] = None
+
+        while True:
+            records, offset = await self._client.scroll(
+                collection_name=index_name,
+                scroll_filter=Filter(
+                    must_not=[
+                        IsEmptyCondition(is_empty=PayloadField(key="hidden_versions"))
+                    ]
+                ),
+                limit=_HIDDEN_VERSIONS_PAGE_SIZE,
+                offset=offset,
+                with_payload=["hidden_versions"],
+            )
+
+            for record in records:
+                hidden.extend(record.payload.get("hidden_versions", []))
+
+            if offset is None:
+                return hidden
+
     async def semantic_search(
         self: Self,
         index_name: str,
@@ -186,13 +734,22 @@ class QdrantVectorDB(VectorDBInterface):
         max_results: PositiveInt,
         score_threshold: Annotated[PositiveFloat, Field(ge=0.0, le=1.0)],
         filters: Optional[MetadataFilters] = None,
+        search_params: Optional[SearchParams] = None,
     ) -> List[SearchResult]:
+        """See `VectorDBInterface.semantic_search`. `search_params` (hnsw_ef,
+        quantization oversampling/rescore, ...) trades recall for latency; it
+        defaults to the `QDRANT_SEARCH_*` env.
+        """
         result: QueryResponse = await self._client.query_points(
             collection_name=index_name,
             query=embedding_query,
-            query_filter=self._build_filter_condition(filters),
+            query_filter=await self.__hide_versions(
+                index_name=index_name,
+                query_filter=self._build_filter_condition(filters),
+            ),
             limit=max_results,
             using="vector",
+            search_params=search_params or self.__default_search_params(),
         )
 
         return [
@@ -215,7 +772,9 @@ class QdrantVectorDB(VectorDBInterface):
     ) -> List[SearchResult]:
         records, _ = await self._client.scroll(
             collection_name=index_name,
-            scroll_filter=self._build_filter_condition(filters),
+            scroll_filter=await self.__chunks_filter(
+                index_name=index_name, filters=filters
+            ),
             limit=max_results,
             with_payload=True,
         )
@@ -231,6 +790,40 @@ class QdrantVectorDB(VectorDBInterface):
             for r in records
         ]
 
+    async def get_objects(
+        self: Self,
+        index_name: str,
+        filters: MetadataFilters,
+        max_results: PositiveInt,
+    ) -> List[ObjectData]:
+        records, _ = await self._client.scroll(
+            collection_name=index_name,
+            scroll_filter=await self.__chunks_filter(
+                index_name=index_name, filters=filters
+            ),
+            limit=max_results,
+            with_payload=True,
+            with_vectors=["vector"],
+        )
+
+        return [ObjectData(**r.payload, vector=r.vector["vector"]) for r in records]
+
+    async def __chunks_filter(
+        self: Self, index_name: str, filters: MetadataFilters
+    ) -> Filter:
+        """The filter of the scrolls over the visible chunks. The version
+        records have no filename, so they never match it.
+        """
+        query_filter: Optional[Filter] = await self.__hide_versions(
+            index_name=index_name,
+            query_filter=self._build_filter_condition(filters),
+        )
+
+        return Filter(
+            must=[query_filter] if query_filter is not None else None,
+            must_not=[IsEmptyCondition(is_empty=PayloadField(key="filename"))],
+        )
+
     def _build_filter_condition(
         self: Self, metadata_filters: Optional[MetadataFilters]
     ) -> Optional[Filter]:
@@ -317,12 +910,21 @@ class QdrantVectorDB(VectorDBInterface):
             )
             similarities = None
         else:
+            # Per-tool search params, passed by the retriever as vector_store_kwargs
+            search_params: Optional[SearchParams | Dict[str, Any]] = kwargs.get(
+                "search_params"
+            )
             results = await self.semantic_search(
                 index_name=self.index_name,
                 embedding_query=query.query_embedding,
                 max_results=query.similarity_top_k,
                 score_threshold=0.0,
                 filters=query.filters,
+                search_params=(
+                    SearchParams.model_validate(search_params)
+                    if isinstance(search_params, dict)
+                    else search_params
+                ),
             )
             similarities = [r.score for r in results]
 
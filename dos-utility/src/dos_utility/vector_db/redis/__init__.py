@@ -1,3 +1,3 @@
-from .implementation import get_redis_vector_db
+from .implementation import get_redis_vector_db, RedisIndexOptions
 
-__all__ = ["get_redis_vector_db"]
+__all__ = ["get_redis_vector_db", "RedisIndexOptions"]
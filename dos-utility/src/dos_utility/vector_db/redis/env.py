@@ -0,0 +1,61 @@
+from functools import lru_cache
+from pydantic_settings import BaseSettings
+from pydantic import Field
+from typing import Annotated, Literal
+
+
+class RedisVectorDBSettings(BaseSettings):
+    REDIS_VECTOR_DB_VALIDATE_ON_LOAD: Annotated[
+        bool,
+        Field(
+            default=True,
+            description="Validate the objects against the index schema before loading them",
+        ),
+    ]
+    REDIS_VECTOR_DB_SCHEMA_CACHE: Annotated[
+        bool,
+        Field(
+            default=True,
+            description="Keep the index schemas in memory instead of running FT.INFO on every call",
+        ),
+    ]
+
+    REDIS_VECTOR_DB_ALGORITHM: Annotated[
+        Literal["FLAT", "HNSW"],
+        Field(
+            default="FLAT",
+            description="Vector index algorithm of the new indexes",
+        ),
+    ]
+    REDIS_VECTOR_DB_DATATYPE: Annotated[
+        Literal["FLOAT32", "FLOAT16", "BFLOAT16"],
+        Field(
+            default="FLOAT32",
+            description="Precision of the vectors of the new indexes",
+        ),
+    ]
+    REDIS_VECTOR_DB_HNSW_M: Annotated[
+        int, Field(default=16, gt=0, description="HNSW max outgoing edges per node")
+    ]
+    REDIS_VECTOR_DB_HNSW_EF_CONSTRUCTION: Annotated[
+        int,
+        Field(default=200, gt=0, description="HNSW candidate list size while building"),
+    ]
+    REDIS_VECTOR_DB_HNSW_EF_RUNTIME: Annotated[
+        int,
+        Field(default=10, gt=0, description="HNSW candidate list size while searching"),
+    ]
+
+    REDIS_VECTOR_DB_DELETE_BATCH_SIZE: Annotated[
+        int,
+        Field(
+            default=1000,
+            gt=0,
+            description="Keys fetched and unlinked per round-trip by delete_by_filter",
+        ),
+    ]
+
+
+@lru_cache()
+def get_redis_vector_db_settings() -> RedisVectorDBSettings:
+    return RedisVectorDBSettings()
@@ -1,4 +1,10 @@
+import asyncio
+import json
 import logging
+import re
+import time
+
+from uuid import uuid4
 
 from redis.connection import ConnectionPool
 from redis.asyncio import Redis as RedisAsync
@@ -12,8 +18,8 @@ from redisvl.schema.fields import (
 )
 from redisvl.query import VectorQuery, FilterQuery
 from redisvl.query.filter import FilterExpression, Tag, Num, Text
-from typing import Self, List, Optional, Annotated, Any
-from pydantic import Field, PositiveFloat, PositiveInt, PrivateAttr
+from typing import Self, Dict, List, Literal, Optional, Annotated, Any, Set, Tuple
+from pydantic import BaseModel, Field, PositiveFloat, PositiveInt, PrivateAttr
 from llama_index.core.vector_stores.types import (
     VectorStoreQuery,
     VectorStoreQueryResult,
@@ -25,24 +31,100 @@ from llama_index.core.schema import TextNode
 
 from ...utils.redis.connection import get_redis_connection_pool
 from ..interface import VectorDBInterface, ObjectData, SearchResult
+from ..catalog import get_index_catalog
+from ..hidden_versions import get_hidden_versions_cache
+from .env import RedisVectorDBSettings, get_redis_vector_db_settings
 from ..exceptions import (
     IndexCreationException,
     IndexDeletionException,
     PutObjectsException,
     DeleteObjectsException,
+    VersionUpdateException,
 )
 
 
+class RedisIndexOptions(BaseModel):
+    """Vector index options of a Redis index. They are persisted next to the
+    index, in the `<index_name>/options` key, so the search path knows the
+    datatype of the vectors and the runtime ef to query it with.
+
+    The defaults are the options of the indexes created before they were
+    configurable; new indexes take theirs from the `REDIS_VECTOR_DB_*` env.
+    """
+
+    algorithm: Annotated[
+        Literal["FLAT", "HNSW"],
+        Field(
+            default="FLAT",
+            description="FLAT (exact, brute-force) or HNSW (approximate, sub-linear).",
+        ),
+    ]
+    datatype: Annotated[
+        Literal["FLOAT32", "FLOAT16", "BFLOAT16"],
+        Field(
+            default="FLOAT32",
+            description="Precision of the stored vectors. FLOAT16/BFLOAT16 halve the index memory.",
+        ),
+    ]
+    m: Annotated[
+        PositiveInt,
+        Field(default=16, description="HNSW: max outgoing edges per node."),
+    ]
+    ef_construction: Annotated[
+        PositiveInt,
+        Field(default=200, description="HNSW: candidate list size while building."),
+    ]
+    ef_runtime: Annotated[
+        PositiveInt,
+        Field(default=10, description="HNSW: candidate list size while searching."),
+    ]
+
+
+# Per-process cache of the index schemas and options, keyed by index name.
+# Loading a schema costs an FT.INFO round-trip plus parsing, while building an
+# AsyncSearchIndex from a known schema is free, so only the schemas are cached:
+# the index handles are bound to the client of each RedisVectorDB, which is
+# closed on exit.
+_index_schemas: Dict[str, Tuple[IndexSchema, RedisIndexOptions]] = {}
+
+# A rebuilt index lives under `<index_name>:v<n>`, with `<index_name>` as alias
+_REBUILT_INDEX_PATTERN: re.Pattern = re.compile(r"^(?P<name>.+):v(?P<version>\d+)$")
+
+
+# Makes ARGV[2] the active version of the file ARGV[1]: it leaves the hidden
+# versions and the previous active version joins them, as superseded (no
+# staging time), in a single atomic step
+_ACTIVATE_VERSION_SCRIPT: str = """
+local previous = redis.call('HGET', KEYS[1], ARGV[1])
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+redis.call('SREM', KEYS[2], ARGV[2])
+redis.call('HDEL', KEYS[3], ARGV[2])
+if previous and previous ~= ARGV[2] then
+    redis.call('SADD', KEYS[2], previous)
+    redis.call('HSET', KEYS[3], previous, cjson.encode({filename = ARGV[1]}))
+    return previous
+end
+return false
+"""
+
+
+def clear_index_schema_cache() -> None:
+    """Drops every cached index schema."""
+    _index_schemas.clear()
+
+
 class RedisVectorDB(VectorDBInterface):
     index_name: Optional[str] = None
 
     _redis_aclient: RedisAsync = PrivateAttr()
+    _settings: RedisVectorDBSettings = PrivateAttr()
 
     def model_post_init(
         self: Self, __context: Any
     ) -> None:  # see VectorDBInterface for why this is used instead of __init__
         connection_pool: ConnectionPool = get_redis_connection_pool()
         self._redis_aclient = RedisAsync(connection_pool=connection_pool)
+        self._settings = get_redis_vector_db_settings()
 
     @property
     def client(self: Self) -> RedisAsync:
@@ -54,15 +136,65 @@ class RedisVectorDB(VectorDBInterface):
     async def __aexit__(self: Self, exc_type, exc_val, exc_tb) -> None:
         await self._redis_aclient.aclose()
 
-    async def __get_index(self: Self, index_name: str) -> AsyncSearchIndex:
+    async def __load_index(
+        self: Self, index_name: str, validate_on_load: bool = False
+    ) -> Tuple[AsyncSearchIndex, RedisIndexOptions]:
+        """Returns a handle on the index and its options, loading them from Redis
+        only when they are not cached yet. `validate_on_load` only matters for
+        writes, so the search paths leave it off.
+        """
+        cached: Optional[Tuple[IndexSchema, RedisIndexOptions]] = _index_schemas.get(
+            index_name
+        )
+
+        if cached is not None:
+            schema, options = cached
+
+            return (
+                AsyncSearchIndex(
+                    schema=schema,
+                    redis_client=self._redis_aclient,
+                    validate_on_load=validate_on_load,
+                ),
+                options,
+            )
+
         index = await AsyncSearchIndex.from_existing(
             name=index_name,
             redis_client=self._redis_aclient,
-            validate_on_load=True,
+            validate_on_load=validate_on_load,
         )
         index.schema.index.prefix = f"{index_name}/vector"
+
+        raw_options: Optional[bytes] = await self._redis_aclient.get(
+            f"{index_name}/options"
+        )
+        options: RedisIndexOptions = (
+            RedisIndexOptions.model_validate_json(raw_options)
+            if raw_options is not None
+            else RedisIndexOptions()
+        )
+
+        if self._settings.REDIS_VECTOR_DB_SCHEMA_CACHE:
+            _index_schemas[index_name] = (index.schema, options)
+
+        return index, options
+
+    async def __get_index(
+        self: Self, index_name: str, validate_on_load: bool = False
+    ) -> AsyncSearchIndex:
+        index, _ = await self.__load_index(
+            index_name=index_name, validate_on_load=validate_on_load
+        )
+
         return index
 
+    def __forget_index(self: Self, index_name: str) -> None:
+        """Drops the cached schema, e.g. after the index was dropped or changed
+        by another process and a call against it failed.
+        """
+        _index_schemas.pop(index_name, None)
+
     async def is_healthy(self: Self) -> bool:
         try:
             response = await self._redis_aclient.ping()
@@ -71,30 +203,65 @@ class RedisVectorDB(VectorDBInterface):
             logging.error(f"Redis health check failed: {e}")
             return False
 
-    async def create_index(self: Self, index_name: str, vector_dim: int) -> None:
-        try:
-            index_info: IndexInfo = IndexInfo(
-                name=index_name,
+    def __default_index_options(self: Self) -> RedisIndexOptions:
+        return RedisIndexOptions(
+            algorithm=self._settings.REDIS_VECTOR_DB_ALGORITHM,
+            datatype=self._settings.REDIS_VECTOR_DB_DATATYPE,
+            m=self._settings.REDIS_VECTOR_DB_HNSW_M,
+            ef_construction=self._settings.REDIS_VECTOR_DB_HNSW_EF_CONSTRUCTION,
+            ef_runtime=self._settings.REDIS_VECTOR_DB_HNSW_EF_RUNTIME,
+        )
+
+    def __build_schema(
+        self: Self,
+        index_name: str,
+        physical_name: str,
+        vector_dim: int,
+        options: RedisIndexOptions,
+    ) -> IndexSchema:
+        vector_attrs: Dict[str, Any] = {
+            "dims": vector_dim,
+            "algorithm": VectorIndexAlgorithm(options.algorithm),
+            "datatype": VectorDataType(options.datatype),
+            "distance_metric": VectorDistanceMetric.COSINE,
+        }
+
+        if options.algorithm == "HNSW":
+            vector_attrs["m"] = options.m
+            vector_attrs["ef_construction"] = options.ef_construction
+            vector_attrs["ef_runtime"] = options.ef_runtime
+
+        return IndexSchema(
+            index=IndexInfo(
+                name=physical_name,
                 prefix=f"{index_name}/vector",
                 storage_type=StorageType.JSON,
-            )
-            index_schema: IndexSchema = IndexSchema(
-                index=index_info,
-                fields=[
-                    {"name": "filename", "type": "tag"},
-                    {"name": "chunk_id", "type": "numeric"},
-                    {"name": "content", "type": "text", "attrs": {"weight": 1.0}},
-                    {
-                        "name": "vector",
-                        "type": "vector",
-                        "attrs": {
-                            "dims": vector_dim,
-                            "algorithm": VectorIndexAlgorithm.FLAT,
-                            "datatype": VectorDataType.FLOAT32,
-                            "distance_metric": VectorDistanceMetric.COSINE,
-                        },
-                    },
-                ],
+            ),
+            fields=[
+                {"name": "filename", "type": "tag"},
+                {"name": "chunk_id", "type": "numeric"},
+                {"name": "version", "type": "tag"},
+                {"name": "content", "type": "text", "attrs": {"weight": 1.0}},
+                {"name": "vector", "type": "vector", "attrs": vector_attrs},
+            ],
+        )
+
+    async def create_index(
+        self: Self,
+        index_name: str,
+        vector_dim: int,
+        options: Optional[RedisIndexOptions] = None,
+    ) -> None:
+        """Creates the index. Without `options`, the vector index options come
+        from the `REDIS_VECTOR_DB_*` env.
+        """
+        try:
+            options = options or self.__default_index_options()
+            index_schema: IndexSchema = self.__build_schema(
+                index_name=index_name,
+                physical_name=index_name,
+                vector_dim=vector_dim,
+                options=options,
             )
             index: AsyncSearchIndex = AsyncSearchIndex(
                 schema=index_schema,
@@ -103,14 +270,28 @@ class RedisVectorDB(VectorDBInterface):
             )
 
             await index.create(overwrite=False)
+            await self._redis_aclient.set(
+                f"{index_name}/options", options.model_dump_json()
+            )
+            await self.__bump_revision(index_name=index_name)
+
+            if self._settings.REDIS_VECTOR_DB_SCHEMA_CACHE:
+                _index_schemas[index_name] = (index_schema, options)
 
-            logging.info(f"Index '{index_name}' created successfully.")
+            logging.info(
+                f"Index '{index_name}' created successfully ({options.algorithm}, {options.datatype})."
+            )
+            await get_index_catalog().invalidate()
         except Exception as e:
             raise IndexCreationException(msg=str(e))
 
     async def delete_index(self: Self, index_name: str) -> None:
         try:
+            # Load the schema from Redis: for a rebuilt index it names the index
+            # behind the alias, which is the one to drop
+            self.__forget_index(index_name=index_name)
             index: AsyncSearchIndex = await self.__get_index(index_name=index_name)
+            self.__forget_index(index_name=index_name)
 
             try:
                 deleted: bool = await index.delete(
@@ -120,7 +301,17 @@ class RedisVectorDB(VectorDBInterface):
                 if deleted is False:
                     raise Exception(f"Failed to delete index '{index_name}'")
 
+                await self._redis_aclient.delete(
+                    f"{index_name}/options",
+                    f"{index_name}/versions",
+                    f"{index_name}/hidden_versions",
+                    f"{index_name}/hidden_version_info",
+                    f"{index_name}/revision",
+                )
+                get_hidden_versions_cache().invalidate(index_name=index_name)
+
                 logging.info(f"Index '{index_name}' deleted successfully.")
+                await get_index_catalog().invalidate()
             except RedisSearchError as e:
                 if "Error while deleting index: Unknown Index name" == str(e):
                     logging.warning(
@@ -135,10 +326,91 @@ class RedisVectorDB(VectorDBInterface):
         except Exception as e:
             raise IndexDeletionException(msg=str(e))
 
+    async def rebuild_index(
+        self: Self,
+        index_name: str,
+        options: RedisIndexOptions,
+        poll_interval_seconds: float = 1.0,
+    ) -> None:
+        """Rebuilds an existing index with new vector index options, e.g. to move
+        a FLAT index to HNSW, without downtime.
+
+        A new index `<index_name>:v<n>` is created over the same documents and
+        backfilled by Redis while the current one keeps serving queries. Once
+        the backfill is complete, a single MULTI/EXEC drops the current index
+        (keeping the documents) and points the `<index_name>` alias to the new
+        one, so callers keep using `index_name` unchanged.
+
+        Args:
+            index_name (str): The name of the index to rebuild.
+            options (RedisIndexOptions): The new vector index options.
+            poll_interval_seconds (float): How often the backfill progress is checked.
+
+        Raises:
+            IndexCreationException: If the new index could not be built or swapped in.
+        """
+        try:
+            index: AsyncSearchIndex = await self.__get_index(index_name=index_name)
+            vector_dim: int = index.schema.fields["vector"].attrs.dims
+
+            info: Dict[str, Any] = await self._redis_aclient.ft(index_name).info()
+            current: str = info["index_name"]
+            match: Optional[re.Match] = _REBUILT_INDEX_PATTERN.match(current)
+            version: int = int(match.group("version")) + 1 if match else 2
+            rebuilt: str = f"{index_name}:v{version}"
+
+            new_index: AsyncSearchIndex = AsyncSearchIndex(
+                schema=self.__build_schema(
+                    index_name=index_name,
+                    physical_name=rebuilt,
+                    vector_dim=vector_dim,
+                    options=options,
+                ),
+                redis_client=self._redis_aclient,
+            )
+            await new_index.create(overwrite=False)
+
+            while True:
+                progress: Dict[str, Any] = await self._redis_aclient.ft(rebuilt).info()
+
+                if int(progress["indexing"]) == 0:
+                    break
+
+                logging.info(
+                    f"Rebuilding index '{index_name}': {float(progress['percent_indexed']) * 100:.1f}% indexed"
+                )
+                await asyncio.sleep(poll_interval_seconds)
+
+            async with self._redis_aclient.pipeline(transaction=True) as pipe:
+                if current == index_name:
+                    pipe.execute_command("FT.DROPINDEX", current)
+                    pipe.execute_command("FT.ALIASADD", index_name, rebuilt)
+                else:
+                    pipe.execute_command("FT.ALIASUPDATE", index_name, rebuilt)
+                    pipe.execute_command("FT.DROPINDEX", current)
+
+                pipe.set(f"{index_name}/options", options.model_dump_json())
+                await pipe.execute()
+
+            self.__forget_index(index_name=index_name)
+            logging.info(
+                f"Index '{index_name}' rebuilt successfully as '{rebuilt}' ({options.algorithm}, {options.datatype})."
+            )
+            await get_index_catalog().invalidate()
+        except Exception as e:
+            raise IndexCreationException(msg=str(e))
+
     async def get_indexes(self: Self) -> List[str]:
         indexes: List[bytes] = await self._redis_aclient.execute_command("FT._LIST")
+        names: Dict[str, None] = {}
+
+        for index in indexes:
+            name: str = index.decode("utf-8")
+            match: Optional[re.Match] = _REBUILT_INDEX_PATTERN.match(name)
+            # Rebuilt indexes are listed under the alias the callers use
+            names[match.group("name") if match else name] = None
 
-        return [index.decode("utf-8") for index in indexes]
+        return list(names)
 
     async def put_objects(
         self: Self,
@@ -147,21 +419,27 @@ class RedisVectorDB(VectorDBInterface):
         custom_keys: Optional[List[str]] = None,
     ) -> List[str]:
         try:
-            index: AsyncSearchIndex = await self.__get_index(index_name=index_name)
+            index: AsyncSearchIndex = await self.__get_index(
+                index_name=index_name,
+                validate_on_load=self._settings.REDIS_VECTOR_DB_VALIDATE_ON_LOAD,
+            )
 
             if custom_keys is not None:
                 keys: List[str] = await index.load(
-                    data=[obj.model_dump() for obj in data], keys=custom_keys
+                    data=[obj.model_dump(exclude_none=True) for obj in data],
+                    keys=custom_keys,
                 )
             else:
                 keys: List[str] = await index.load(
-                    data=[obj.model_dump() for obj in data]
+                    data=[obj.model_dump(exclude_none=True) for obj in data]
                 )
 
+            await self.__bump_revision(index_name=index_name)
             logging.info(f"Objects added to index '{index_name}' successfully.")
 
             return keys
         except Exception as e:
+            self.__forget_index(index_name=index_name)
             raise PutObjectsException(msg=str(e))
 
     async def delete_objects(self: Self, index_name: str, ids: List[str]) -> None:
@@ -172,11 +450,251 @@ class RedisVectorDB(VectorDBInterface):
         try:
             index: AsyncSearchIndex = await self.__get_index(index_name=index_name)
             _ = await index.drop_keys(keys=ids)
+            await self.__bump_revision(index_name=index_name)
 
             logging.info(f"Objects deleted from index '{index_name}' successfully.")
         except Exception as e:
+            self.__forget_index(index_name=index_name)
             raise DeleteObjectsException(msg=str(e))
 
+    async def delete_by_filter(
+        self: Self, index_name: str, filters: MetadataFilters
+    ) -> int:
+        """See `VectorDBInterface.delete_by_filter`. Pages through the matching
+        keys with `FT.SEARCH ... NOCONTENT`, `REDIS_VECTOR_DB_DELETE_BATCH_SIZE`
+        at a time, and pipelines the UNLINK of each page with the search of the
+        next one, so every batch costs a single round-trip. Unlinked documents
+        leave the index immediately, so every search reads the first page.
+        """
+        try:
+            filter_expression: FilterExpression = self.__build_filter_expression(
+                metadata_filters=filters
+            )
+            query: str = str(filter_expression)
+
+            if query == "*":
+                raise Exception("Refusing to delete by an empty filter")
+
+            batch_size: int = self._settings.REDIS_VECTOR_DB_DELETE_BATCH_SIZE
+            search_args: Tuple[Any, ...] = (
+                "FT.SEARCH",
+                index_name,
+                query,
+                "NOCONTENT",
+                "LIMIT",
+                0,
+                batch_size,
+                "DIALECT",
+                2,
+            )
+            deleted: int = 0
+            response: List[Any] = await self._redis_aclient.execute_command(
+                *search_args
+            )
+            keys: List[bytes] = response[1:]
+
+            while keys:
+                async with self._redis_aclient.pipeline(transaction=False) as pipe:
+                    pipe.unlink(*keys)
+                    pipe.execute_command(*search_args)
+                    unlinked, response = await pipe.execute()
+
+                deleted += unlinked
+
+                if unlinked == 0:
+                    # The index still lists keys that no longer exist: stop
+                    # instead of fetching the same page forever
+                    logging.warning(
+                        f"Index '{index_name}' lists {len(keys)} missing keys. Stopping the deletion."
+                    )
+                    break
+
+                keys = response[1:]
+
+            if deleted > 0:
+                await self.__bump_revision(index_name=index_name)
+
+            logging.info(
+                f"{deleted} objects deleted from index '{index_name}' successfully."
+            )
+
+            return deleted
+        except Exception as e:
+            raise DeleteObjectsException(msg=str(e))
+
+    async def stage_version(
+        self: Self, index_name: str, filename: str, version: str
+    ) -> None:
+        """See `VectorDBInterface.stage_version`. Adds the version to the
+        `<index_name>/hidden_versions` set and its file and staging time to the
+        `<index_name>/hidden_version_info` hash, in one transaction. Indexes
+        created before the chunks were versioned get the `version` field first,
+        with FT.ALTER. Returns once no process serves a cached copy of the hidden
+        versions without this one.
+        """
+        try:
+            index: AsyncSearchIndex = await self.__get_index(index_name=index_name)
+
+            if "version" not in index.schema.fields:
+                await self._redis_aclient.execute_command(
+                    "FT.ALTER",
+                    index_name,
+                    "SCHEMA",
+                    "ADD",
+                    "$.version",
+                    "AS",
+                    "version",
+                    "TAG",
+                )
+                self.__forget_index(index_name=index_name)
+                logging.info(f"Field 'version' added to index '{index_name}'.")
+
+            async with self._redis_aclient.pipeline(transaction=True) as pipe:
+                pipe.sadd(f"{index_name}/hidden_versions", version)
+                pipe.hset(
+                    f"{index_name}/hidden_version_info",
+                    version,
+                    json.dumps({"filename": filename, "staged_at": time.time()}),
+                )
+                await pipe.execute()
+
+            get_hidden_versions_cache().invalidate(index_name=index_name)
+            await get_hidden_versions_cache().settle()
+        except Exception as e:
+            raise VersionUpdateException(msg=str(e))
+
+    async def activate_version(
+        self: Self, index_name: str, filename: str, version: str
+    ) -> Optional[str]:
+        """See `VectorDBInterface.activate_version`. The active versions live in
+        the `<index_name>/versions` hash; a Lua script swaps the active version
+        and the hidden set together, so the flip is atomic. The revision is
+        bumped once no process serves the old hidden versions.
+        """
+        try:
+            previous: Optional[bytes] = await self._redis_aclient.eval(
+                _ACTIVATE_VERSION_SCRIPT,
+                3,
+                f"{index_name}/versions",
+                f"{index_name}/hidden_versions",
+                f"{index_name}/hidden_version_info",
+                filename,
+                version,
+            )
+            get_hidden_versions_cache().invalidate(index_name=index_name)
+            await get_hidden_versions_cache().settle()
+            await self.__bump_revision(index_name=index_name)
+
+            logging.info(
+                f"Version '{version}' of '{filename}' is now active in index '{index_name}'."
+            )
+
+            return previous.decode("utf-8") if previous else None
+        except Exception as e:
+            raise VersionUpdateException(msg=str(e))
+
+    async def release_versions(
+        self: Self, index_name: str, filename: str, versions: List[str]
+    ) -> None:
+        if len(versions) == 0:
+            return
+
+        try:
+            async with self._redis_aclient.pipeline(transaction=True) as pipe:
+                pipe.srem(f"{index_name}/hidden_versions", *versions)
+                pipe.hdel(f"{index_name}/hidden_version_info", *versions)
+                await pipe.execute()
+
+            get_hidden_versions_cache().invalidate(index_name=index_name)
+        except Exception as e:
+            raise VersionUpdateException(msg=str(e))
+
+    async def delete_versions(self: Self, index_name: str, filename: str) -> None:
+        """See `VectorDBInterface.delete_versions`. Removes the file from the
+        `<index_name>/versions` hash and its hidden versions from the hidden set
+        and `<index_name>/hidden_version_info`, in one transaction.
+        """
+        try:
+            hidden: Dict[str, Optional[float]] = await self.get_hidden_versions(
+                index_name=index_name, filename=filename
+            )
+
+            async with self._redis_aclient.pipeline(transaction=True) as pipe:
+                pipe.hdel(f"{index_name}/versions", filename)
+
+                if hidden:
+                    pipe.srem(f"{index_name}/hidden_versions", *hidden)
+                    pipe.hdel(f"{index_name}/hidden_version_info", *hidden)
+
+                await pipe.execute()
+
+            get_hidden_versions_cache().invalidate(index_name=index_name)
+        except Exception as e:
+            raise VersionUpdateException(msg=str(e))
+
+    async def get_hidden_versions(
+        self: Self, index_name: str, filename: str
+    ) -> Dict[str, Optional[float]]:
+        """See `VectorDBInterface.get_hidden_versions`. The file and staging time
+        of the hidden versions live in the `<index_name>/hidden_version_info`
+        hash, which only holds the ingestions in progress or waiting for garbage
+        collection.
+        """
+        info: Dict[bytes, bytes] = await self._redis_aclient.hgetall(
+            f"{index_name}/hidden_version_info"
+        )
+        hidden: Dict[str, Optional[float]] = {}
+
+        for version, value in info.items():
+            entry: Dict[str, Any] = json.loads(value)
+
+            if entry["filename"] == filename:
+                hidden[version.decode("utf-8")] = entry.get("staged_at")
+
+        return hidden
+
+    async def __bump_revision(self: Self, index_name: str) -> None:
+        await self._redis_aclient.set(f"{index_name}/revision", uuid4().hex)
+
+    async def get_revision(self: Self, index_name: str) -> Optional[str]:
+        """See `VectorDBInterface.get_revision`. The revision lives in the
+        `<index_name>/revision` key, rewritten by every change of the contents.
+        """
+        revision: Optional[bytes] = await self._redis_aclient.get(
+            f"{index_name}/revision"
+        )
+
+        return revision.decode("utf-8") if revision else None
+
+    async def __hide_versions(
+        self: Self, index_name: str, filter_expression: Optional[FilterExpression]
+    ) -> Optional[FilterExpression]:
+        """Adds to the filter the exclusion of the staged and superseded versions,
+        served from the process-wide hidden versions cache.
+        """
+        hidden: List[str] = await get_hidden_versions_cache().get(
+            index_name=index_name,
+            load=lambda: self.__load_hidden_versions(index_name=index_name),
+        )
+
+        if not hidden:
+            return filter_expression
+
+        visible: FilterExpression = Tag("version") != hidden
+
+        return visible if filter_expression is None else filter_expression & visible
+
+    async def __load_hidden_versions(self: Self, index_name: str) -> List[str]:
+        """Reads the `<index_name>/hidden_versions` set. It only holds the
+        versions of the ingestions in progress or waiting for garbage
+        collection, so it stays small.
+        """
+        hidden: Set[bytes] = await self._redis_aclient.smembers(
+            f"{index_name}/hidden_versions"
+        )
+
+        return sorted(v.decode("utf-8") for v in hidden)
+
     async def semantic_search(
         self: Self,
         index_name: str,
@@ -185,9 +703,14 @@ class RedisVectorDB(VectorDBInterface):
         score_threshold: Annotated[PositiveFloat, Field(ge=0.0, le=1.0)],
         filters: Optional[MetadataFilters] = None,
     ) -> List[SearchResult]:
-        index: AsyncSearchIndex = await self.__get_index(index_name=index_name)
+        index, options = await self.__load_index(index_name=index_name)
 
-        filter_expression = self.__build_filter_expression(filters) if filters else None
+        filter_expression = await self.__hide_versions(
+            index_name=index_name,
+            filter_expression=(
+                self.__build_filter_expression(filters) if filters else None
+            ),
+        )
         query: VectorQuery = VectorQuery(
             vector=embedding_query,
             vector_field_name="vector",
@@ -195,8 +718,10 @@ class RedisVectorDB(VectorDBInterface):
             return_fields=["id", "filename", "chunk_id", "content"],
             return_score=True,
             filter_expression=filter_expression,
+            dtype=options.datatype.lower(),
+            ef_runtime=options.ef_runtime if options.algorithm == "HNSW" else None,
         )
-        results = await index.query(query=query)
+        results = await self.__query(index_name=index_name, index=index, query=query)
 
         return [
             SearchResult(
@@ -221,15 +746,16 @@ class RedisVectorDB(VectorDBInterface):
     ) -> List[SearchResult]:
         index: AsyncSearchIndex = await self.__get_index(index_name=index_name)
 
-        filter_expression: FilterExpression = self.__build_filter_expression(
-            metadata_filters=filters
+        filter_expression: FilterExpression = await self.__hide_versions(
+            index_name=index_name,
+            filter_expression=self.__build_filter_expression(metadata_filters=filters),
         )
         query: FilterQuery = FilterQuery(
             filter_expression=filter_expression,
             return_fields=["id", "filename", "chunk_id", "content"],
             num_results=max_results,
         )
-        results = await index.query(query=query)
+        results = await self.__query(index_name=index_name, index=index, query=query)
 
         return [
             SearchResult(
@@ -242,6 +768,59 @@ class RedisVectorDB(VectorDBInterface):
             for r in results
         ]
 
+    async def get_objects(
+        self: Self,
+        index_name: str,
+        filters: MetadataFilters,
+        max_results: PositiveInt,
+    ) -> List[ObjectData]:
+        """See `VectorDBInterface.get_objects`. Looks the keys up with
+        `FT.SEARCH ... NOCONTENT` and reads the whole JSON documents with a
+        single `JSON.MGET`, since the search results don't carry the vectors.
+        """
+        filter_expression: FilterExpression = await self.__hide_versions(
+            index_name=index_name,
+            filter_expression=self.__build_filter_expression(metadata_filters=filters),
+        )
+        response: List[Any] = await self._redis_aclient.execute_command(
+            "FT.SEARCH",
+            index_name,
+            str(filter_expression),
+            "NOCONTENT",
+            "LIMIT",
+            0,
+            max_results,
+            "DIALECT",
+            2,
+        )
+        keys: List[bytes] = response[1:]
+
+        if not keys:
+            return []
+
+        documents: List[Optional[bytes]] = await self._redis_aclient.execute_command(
+            "JSON.MGET", *keys, "$"
+        )
+
+        # Each document is the JSON array of the matches of the "$" path
+        return [
+            ObjectData(**json.loads(document)[0])
+            for document in documents
+            if document is not None
+        ]
+
+    async def __query(
+        self: Self,
+        index_name: str,
+        index: AsyncSearchIndex,
+        query: VectorQuery | FilterQuery,
+    ) -> List[Dict[str, Any]]:
+        try:
+            return await index.query(query=query)
+        except Exception:
+            self.__forget_index(index_name=index_name)
+            raise
+
     def __build_filter_expression(
         self: Self, metadata_filters: Optional[MetadataFilters]
     ) -> FilterExpression:
@@ -87,6 +87,9 @@ def test_rag_tool_spec_optional_fields_default_to_none():
     assert spec.similarity_top_k is None
     assert spec.qa_prompt is None
     assert spec.refine_prompt is None
+    assert spec.search_params is None
+    assert spec.mode == "synthesize"
+    assert spec.parallel is False
 
 
 def test_rag_tool_spec_with_all_fields():
@@ -97,10 +100,21 @@ def test_rag_tool_spec_with_all_fields():
         similarity_top_k=10,
         qa_prompt="{context_str} {query_str}",
         refine_prompt="{existing_answer} {context_msg}",
+        search_params={"hnsw_ef": 128},
+        mode="retrieve",
+        parallel=True,
     )
     assert spec.similarity_top_k == 10
     assert spec.qa_prompt is not None
     assert spec.refine_prompt is not None
+    assert spec.search_params == {"hnsw_ef": 128}
+    assert spec.mode == "retrieve"
+    assert spec.parallel is True
+
+
+def test_rag_tool_spec_rejects_unknown_mode():
+    with pytest.raises(Exception):
+        RagToolSpec(index_id="idx", name="search_tool", description="d", mode="fast")
 
 
 # ---------------------------------------------------------------------------
@@ -2,10 +2,31 @@ import pytest
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
+from llama_index.core.agent.workflow import (
+    AgentOutput,
+    AgentStream,
+    ToolCall,
+    ToolCallResult,
+)
+from llama_index.core.base.base_retriever import BaseRetriever
+from llama_index.core.llms import ChatMessage
+from llama_index.core.query_engine import CustomQueryEngine
+from llama_index.core.schema import NodeWithScore, TextNode
+from llama_index.core.tools import ToolOutput
+
+import dos_utility.agent.llamaindex_google._tools as tools_mod
 import dos_utility.agent.llamaindex_google.implementation as impl_mod
 
 from dos_utility.agent.llamaindex_google.implementation import LlamaIndexGoogleAgent
-from dos_utility.agent.models import AgentResponse, ChatTurn
+from dos_utility.agent.models import (
+    AgentResponse,
+    AgentResponseEvent,
+    AgentSourceEvent,
+    AgentTokenEvent,
+    AgentToolCallEvent,
+    ChatTurn,
+    RagToolSpec,
+)
 from dos_utility.agent.exceptions import ChatGenerationException
 
 
@@ -235,6 +256,142 @@ async def test_chat_generate_raises_when_response_key_missing(
         await agent.chat_generate(query="q")
 
 
+# ---------------------------------------------------------------------------
+# chat_generate_stream
+# ---------------------------------------------------------------------------
+
+
+class _FakeHandler:
+    """Stands for the WorkflowHandler returned by `ReActAgent.run`."""
+
+    def __init__(self, events, result):
+        self._events = events
+        self._result = result
+        self._done = False
+        self.cancelled = False
+
+    async def stream_events(self):
+        for event in self._events:
+            yield event
+        self._done = True
+
+    def __await__(self):
+        async def _result():
+            return self._result
+
+        return _result().__await__()
+
+    def is_done(self):
+        return self._done
+
+    async def cancel_run(self):
+        self.cancelled = True
+
+
+def _stream(response: str) -> AgentStream:
+    return AgentStream(delta="", response=response, current_agent_name="agent")
+
+
+def _output(structured_response=None, tool_calls=None) -> AgentOutput:
+    output = AgentOutput(
+        response=ChatMessage(content=""),
+        structured_response=structured_response,
+        current_agent_name="agent",
+    )
+    # Like the agent, append the tool call results after validation
+    output.tool_calls.extend(tool_calls or [])
+    return output
+
+
+@pytest.mark.asyncio
+async def test_chat_generate_stream_yields_events_then_response(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    agent = _make_agent()
+    monkeypatch.setattr(
+        impl_mod, "Context", MagicMock(from_dict=MagicMock(return_value=MagicMock()))
+    )
+    tool_result = ToolCallResult(
+        tool_name="docs",
+        tool_kwargs={"input": "q"},
+        tool_id="1",
+        tool_output=ToolOutput(
+            content="",
+            tool_name="docs",
+            raw_input={},
+            raw_output=SimpleNamespace(
+                source_nodes=[_make_node("doc.txt", 1, "body", 0.9)]
+            ),
+        ),
+        return_direct=False,
+    )
+    agent._agent.run = MagicMock(
+        return_value=_FakeHandler(
+            events=[
+                _stream("Thought: I need a tool"),
+                _output(),
+                ToolCall(tool_name="docs", tool_kwargs={"input": "q"}, tool_id="1"),
+                tool_result,
+                _stream("Thought: I can answer"),
+                _stream("Thought: I can answer\nAnswer: The"),
+                _stream("Thought: I can answer\nAnswer: The answer"),
+            ],
+            result=_output(
+                structured_response={"response": "The answer"},
+                tool_calls=[tool_result],
+            ),
+        )
+    )
+
+    events = [e async for e in agent.chat_generate_stream(query="q")]
+
+    assert isinstance(events[0], AgentToolCallEvent)
+    assert events[0].tool_name == "docs"
+    assert isinstance(events[1], AgentSourceEvent)
+    assert events[1].chunk.filename == "doc.txt"
+    assert [e.delta for e in events if isinstance(e, AgentTokenEvent)] == [
+        "The",
+        " answer",
+    ]
+    assert isinstance(events[-1], AgentResponseEvent)
+    assert events[-1].response.response == "The answer"
+    assert len(events[-1].response.context) == 1
+
+
+@pytest.mark.asyncio
+async def test_chat_generate_stream_cancels_agent_when_closed_early(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    agent = _make_agent()
+    monkeypatch.setattr(
+        impl_mod, "Context", MagicMock(from_dict=MagicMock(return_value=MagicMock()))
+    )
+    handler = _FakeHandler(
+        events=[_stream("Answer: a"), _stream("Answer: ab")], result=_output()
+    )
+    agent._agent.run = MagicMock(return_value=handler)
+
+    stream = agent.chat_generate_stream(query="q")
+    assert (await anext(stream)).delta == "a"
+    await stream.aclose()
+
+    assert handler.cancelled is True
+
+
+@pytest.mark.asyncio
+async def test_chat_generate_stream_raises_chat_generation_exception(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    agent = _make_agent()
+    monkeypatch.setattr(
+        impl_mod, "Context", MagicMock(from_dict=MagicMock(return_value=MagicMock()))
+    )
+    agent._agent.run = MagicMock(side_effect=RuntimeError("llm down"))
+
+    with pytest.raises(ChatGenerationException):
+        [e async for e in agent.chat_generate_stream(query="q")]
+
+
 # ---------------------------------------------------------------------------
 # is_healthy
 # ---------------------------------------------------------------------------
@@ -254,6 +411,20 @@ async def test_is_healthy_returns_false_when_llm_raises():
     assert await agent.is_healthy() is False
 
 
+# ---------------------------------------------------------------------------
+# embed_query
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_embed_query_uses_the_tools_embed_model():
+    agent = _make_agent()
+    agent._embed_model.aget_query_embedding = AsyncMock(return_value=[0.1, 0.2])
+
+    assert await agent.embed_query(query="q") == [0.1, 0.2]
+    agent._embed_model.aget_query_embedding.assert_awaited_once_with("q")
+
+
 # ---------------------------------------------------------------------------
 # close
 # ---------------------------------------------------------------------------
@@ -263,3 +434,147 @@ async def test_is_healthy_returns_false_when_llm_raises():
 async def test_close_returns_none():
     agent = _make_agent()
     assert await agent.close() is None
+
+
+# ---------------------------------------------------------------------------
+# RAG tools
+# ---------------------------------------------------------------------------
+
+
+class _RetrieverStub(BaseRetriever):
+    def __init__(self, nodes):
+        super().__init__()
+        self.nodes = nodes
+        self.queries = []
+
+    def _retrieve(self, query_bundle):
+        self.queries.append(query_bundle.query_str)
+        return self.nodes
+
+    async def _aretrieve(self, query_bundle):
+        return self._retrieve(query_bundle)
+
+
+class _FailingQueryEngine(CustomQueryEngine):
+    def custom_query(self, query_str):
+        raise RuntimeError("unreachable")
+
+
+def _node(filename: str, chunk_id: int, content: str, score) -> NodeWithScore:
+    return NodeWithScore(
+        node=TextNode(
+            text=content, metadata={"filename": filename, "chunk_id": chunk_id}
+        ),
+        score=score,
+    )
+
+
+@pytest.mark.asyncio
+async def test_retrieval_query_engine_returns_ranked_sources_without_llm():
+    retriever = _RetrieverStub(
+        nodes=[_node("a.pdf", 1, "first", 0.9), _node("b.pdf", 2, "second", None)]
+    )
+
+    response = await tools_mod.RetrievalQueryEngine(retriever=retriever).aquery("q")
+
+    assert retriever.queries == ["q"]
+    assert str(response) == (
+        "[1] a.pdf (chunk 1, score 0.900)\nfirst\n\n[2] b.pdf (chunk 2, score n/a)\nsecond"
+    )
+    assert [n.node.text for n in response.source_nodes] == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_retrieval_query_engine_without_results():
+    engine = tools_mod.RetrievalQueryEngine(retriever=_RetrieverStub(nodes=[]))
+
+    response = await engine.aquery("q")
+
+    assert str(response) == "No relevant sources found."
+    assert response.source_nodes == []
+
+
+@pytest.mark.asyncio
+async def test_parallel_query_engine_merges_tools_and_isolates_failures():
+    engine = tools_mod.ParallelQueryEngine(
+        query_engines={
+            "Docs": tools_mod.RetrievalQueryEngine(
+                retriever=_RetrieverStub(nodes=[_node("a.pdf", 1, "first", 0.9)])
+            ),
+            "Broken": _FailingQueryEngine(),
+            "Faq": tools_mod.RetrievalQueryEngine(
+                retriever=_RetrieverStub(nodes=[_node("b.pdf", 2, "second", 0.8)])
+            ),
+        }
+    )
+
+    response = await engine.aquery("q")
+
+    sections = str(response).split("\n\n")
+    assert sections[0].startswith("Docs:\n[1] a.pdf")
+    assert sections[1] == "Broken:\nFailed to retrieve sources."
+    assert sections[2].startswith("Faq:\n[1] b.pdf")
+    assert [n.node.text for n in response.source_nodes] == ["first", "second"]
+
+
+def test_build_rag_tools_modes_and_parallel_tool(monkeypatch: pytest.MonkeyPatch):
+    index = MagicMock()
+    index.as_retriever.return_value = _RetrieverStub(nodes=[])
+    monkeypatch.setattr(tools_mod, "get_vector_db_instance", MagicMock())
+    monkeypatch.setattr(tools_mod, "_load_index", MagicMock(return_value=index))
+
+    tools = tools_mod.build_rag_tools(
+        rag_tools=[
+            RagToolSpec(
+                index_id=f"idx-{name}",
+                name=name,
+                description=f"{name} tool",
+                mode="retrieve",
+                parallel=name != "Solo",
+            )
+            for name in ["Docs", "Faq", "Solo"]
+        ],
+        llm=MagicMock(),
+        embed_model=MagicMock(),
+        default_similarity_top_k=5,
+    )
+
+    assert [tool.metadata.name for tool in tools] == [
+        "Docs",
+        "Faq",
+        "Solo",
+        tools_mod.PARALLEL_TOOL_NAME,
+    ]
+    assert all(
+        isinstance(tool.query_engine, tools_mod.RetrievalQueryEngine)
+        for tool in tools[:3]
+    )
+    assert list(tools[3].query_engine.query_engines) == ["Docs", "Faq"]
+    assert "- Docs: Docs tool" in tools[3].metadata.description
+    assert "Solo" not in tools[3].metadata.description
+
+
+def test_build_rag_tools_without_enough_parallel_tools(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    index = MagicMock()
+    index.as_retriever.return_value = _RetrieverStub(nodes=[])
+    monkeypatch.setattr(tools_mod, "get_vector_db_instance", MagicMock())
+    monkeypatch.setattr(tools_mod, "_load_index", MagicMock(return_value=index))
+
+    tools = tools_mod.build_rag_tools(
+        rag_tools=[
+            RagToolSpec(
+                index_id="idx",
+                name="Docs",
+                description="d",
+                mode="retrieve",
+                parallel=True,
+            )
+        ],
+        llm=MagicMock(),
+        embed_model=MagicMock(),
+        default_similarity_top_k=5,
+    )
+
+    assert [tool.metadata.name for tool in tools] == ["Docs"]
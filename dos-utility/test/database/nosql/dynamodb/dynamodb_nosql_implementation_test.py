@@ -1,35 +1,53 @@
 import pytest
+import pytest_asyncio
 
 from typing import List
 
 from dos_utility.utils.aws import get_aws_credentials_settings
 from dos_utility.database.nosql.models import KeyCondition, ConditionOperator
-from dos_utility.database.nosql.dynamodb import implementation
+from dos_utility.database.nosql.exceptions import BatchWriteException
+from dos_utility.database.nosql.dynamodb import implementation, connection
 from dos_utility.database.nosql.env import get_nosql_settings
 from dos_utility.database.nosql.dynamodb.implementation import (
     DynamoDBNoSQL,
     get_dynamodb_nosql,
 )
-from dos_utility.database.nosql.dynamodb.implementation import boto3
+from dos_utility.database.nosql.dynamodb.connection import (
+    boto3,
+    close_dynamodb_connection,
+    open_dynamodb_connection,
+)
 
 from test.utils.aws.mocks import get_aws_credentials_settings_mock
 from test.database.nosql.dynamodb.mocks import (
     get_dynamodb_settings_mock,
     get_dynamodb_settings_mock_no_prefix,
-    boto3_dynamodb_resource_mock,
-    boto3_dynamodb_resource_not_healthy_mock,
+    boto3_dynamodb_client_mock,
+    boto3_dynamodb_client_not_healthy_mock,
+    boto3_dynamodb_client_paginated_mock,
+    boto3_dynamodb_client_scan_error_mock,
+    boto3_dynamodb_client_unprocessed_mock,
+    boto3_dynamodb_client_always_unprocessed_mock,
 )
 
 
+@pytest_asyncio.fixture(autouse=True)
+async def reset_dynamodb_connection():
+    await close_dynamodb_connection()
+    yield
+    await close_dynamodb_connection()
+
+
 def test_dynamodb_nosql_initialization(monkeypatch: pytest.MonkeyPatch):
     get_aws_credentials_settings.cache_clear()
     get_nosql_settings.cache_clear()
 
     monkeypatch.setattr(
-        implementation,
+        connection,
         "get_aws_credentials_settings",
         get_aws_credentials_settings_mock,
     )
+    monkeypatch.setattr(connection, "get_dynamodb_settings", get_dynamodb_settings_mock)
     monkeypatch.setattr(
         implementation, "get_dynamodb_settings", get_dynamodb_settings_mock
     )
@@ -45,10 +63,11 @@ async def test_dynamodb_nosql_aenter_aexit(monkeypatch: pytest.MonkeyPatch):
     get_nosql_settings.cache_clear()
 
     monkeypatch.setattr(
-        implementation,
+        connection,
         "get_aws_credentials_settings",
         get_aws_credentials_settings_mock,
     )
+    monkeypatch.setattr(connection, "get_dynamodb_settings", get_dynamodb_settings_mock)
     monkeypatch.setattr(
         implementation, "get_dynamodb_settings", get_dynamodb_settings_mock
     )
@@ -65,14 +84,15 @@ async def test_dynamodb_nosql_is_healthy(monkeypatch: pytest.MonkeyPatch):
     get_nosql_settings.cache_clear()
 
     monkeypatch.setattr(
-        implementation,
+        connection,
         "get_aws_credentials_settings",
         get_aws_credentials_settings_mock,
     )
+    monkeypatch.setattr(connection, "get_dynamodb_settings", get_dynamodb_settings_mock)
     monkeypatch.setattr(
         implementation, "get_dynamodb_settings", get_dynamodb_settings_mock
     )
-    monkeypatch.setattr(boto3, "resource", boto3_dynamodb_resource_mock)
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_mock)
 
     async with DynamoDBNoSQL() as nosql:
         is_healthy: bool = await nosql.is_healthy()
@@ -86,14 +106,15 @@ async def test_dynamodb_nosql_is_not_healthy(monkeypatch: pytest.MonkeyPatch):
     get_nosql_settings.cache_clear()
 
     monkeypatch.setattr(
-        implementation,
+        connection,
         "get_aws_credentials_settings",
         get_aws_credentials_settings_mock,
     )
+    monkeypatch.setattr(connection, "get_dynamodb_settings", get_dynamodb_settings_mock)
     monkeypatch.setattr(
         implementation, "get_dynamodb_settings", get_dynamodb_settings_mock
     )
-    monkeypatch.setattr(boto3, "resource", boto3_dynamodb_resource_not_healthy_mock)
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_not_healthy_mock)
 
     async with DynamoDBNoSQL() as nosql:
         is_healthy: bool = await nosql.is_healthy()
@@ -107,14 +128,15 @@ async def test_dynamodb_nosql_put_item(monkeypatch: pytest.MonkeyPatch):
     get_nosql_settings.cache_clear()
 
     monkeypatch.setattr(
-        implementation,
+        connection,
         "get_aws_credentials_settings",
         get_aws_credentials_settings_mock,
     )
+    monkeypatch.setattr(connection, "get_dynamodb_settings", get_dynamodb_settings_mock)
     monkeypatch.setattr(
         implementation, "get_dynamodb_settings", get_dynamodb_settings_mock
     )
-    monkeypatch.setattr(boto3, "resource", boto3_dynamodb_resource_mock)
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_mock)
 
     async with DynamoDBNoSQL() as nosql:
         await nosql.put_item(
@@ -132,14 +154,17 @@ async def test_dynamodb_nosql_put_item_no_table_name_prefix(
     get_nosql_settings.cache_clear()
 
     monkeypatch.setattr(
-        implementation,
+        connection,
         "get_aws_credentials_settings",
         get_aws_credentials_settings_mock,
     )
+    monkeypatch.setattr(
+        connection, "get_dynamodb_settings", get_dynamodb_settings_mock_no_prefix
+    )
     monkeypatch.setattr(
         implementation, "get_dynamodb_settings", get_dynamodb_settings_mock_no_prefix
     )
-    monkeypatch.setattr(boto3, "resource", boto3_dynamodb_resource_mock)
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_mock)
 
     async with DynamoDBNoSQL() as nosql:
         await nosql.put_item(
@@ -155,14 +180,15 @@ async def test_dynamodb_nosql_get_item(monkeypatch: pytest.MonkeyPatch):
     get_nosql_settings.cache_clear()
 
     monkeypatch.setattr(
-        implementation,
+        connection,
         "get_aws_credentials_settings",
         get_aws_credentials_settings_mock,
     )
+    monkeypatch.setattr(connection, "get_dynamodb_settings", get_dynamodb_settings_mock)
     monkeypatch.setattr(
         implementation, "get_dynamodb_settings", get_dynamodb_settings_mock
     )
-    monkeypatch.setattr(boto3, "resource", boto3_dynamodb_resource_mock)
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_mock)
 
     async with DynamoDBNoSQL() as nosql:
         item: dict = await nosql.get_item(table_name="test_table", key={"id": "123"})
@@ -176,14 +202,15 @@ async def test_dynamodb_nosql_delete_item(monkeypatch: pytest.MonkeyPatch):
     get_nosql_settings.cache_clear()
 
     monkeypatch.setattr(
-        implementation,
+        connection,
         "get_aws_credentials_settings",
         get_aws_credentials_settings_mock,
     )
+    monkeypatch.setattr(connection, "get_dynamodb_settings", get_dynamodb_settings_mock)
     monkeypatch.setattr(
         implementation, "get_dynamodb_settings", get_dynamodb_settings_mock
     )
-    monkeypatch.setattr(boto3, "resource", boto3_dynamodb_resource_mock)
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_mock)
 
     async with DynamoDBNoSQL() as nosql:
         await nosql.delete_item(table_name="test_table", key={"id": "123"})
@@ -197,14 +224,15 @@ async def test_dynamodb_nosql_update_item(monkeypatch: pytest.MonkeyPatch):
     get_nosql_settings.cache_clear()
 
     monkeypatch.setattr(
-        implementation,
+        connection,
         "get_aws_credentials_settings",
         get_aws_credentials_settings_mock,
     )
+    monkeypatch.setattr(connection, "get_dynamodb_settings", get_dynamodb_settings_mock)
     monkeypatch.setattr(
         implementation, "get_dynamodb_settings", get_dynamodb_settings_mock
     )
-    monkeypatch.setattr(boto3, "resource", boto3_dynamodb_resource_mock)
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_mock)
 
     async with DynamoDBNoSQL() as nosql:
         updated_item: dict = await nosql.update_item(
@@ -277,14 +305,15 @@ async def test_dynamodb_nosql_query(
     get_nosql_settings.cache_clear()
 
     monkeypatch.setattr(
-        implementation,
+        connection,
         "get_aws_credentials_settings",
         get_aws_credentials_settings_mock,
     )
+    monkeypatch.setattr(connection, "get_dynamodb_settings", get_dynamodb_settings_mock)
     monkeypatch.setattr(
         implementation, "get_dynamodb_settings", get_dynamodb_settings_mock
     )
-    monkeypatch.setattr(boto3, "resource", boto3_dynamodb_resource_mock)
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_mock)
 
     async with DynamoDBNoSQL() as nosql:
         query_result = await nosql.query(
@@ -304,14 +333,15 @@ async def test_dynamodb_nosql_scan(monkeypatch: pytest.MonkeyPatch):
     get_nosql_settings.cache_clear()
 
     monkeypatch.setattr(
-        implementation,
+        connection,
         "get_aws_credentials_settings",
         get_aws_credentials_settings_mock,
     )
+    monkeypatch.setattr(connection, "get_dynamodb_settings", get_dynamodb_settings_mock)
     monkeypatch.setattr(
         implementation, "get_dynamodb_settings", get_dynamodb_settings_mock
     )
-    monkeypatch.setattr(boto3, "resource", boto3_dynamodb_resource_mock)
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_mock)
 
     async with DynamoDBNoSQL() as nosql:
         scan_result = await nosql.scan(
@@ -326,10 +356,11 @@ def test_get_dynamodb_nosql(monkeypatch: pytest.MonkeyPatch):
     get_nosql_settings.cache_clear()
 
     monkeypatch.setattr(
-        implementation,
+        connection,
         "get_aws_credentials_settings",
         get_aws_credentials_settings_mock,
     )
+    monkeypatch.setattr(connection, "get_dynamodb_settings", get_dynamodb_settings_mock)
     monkeypatch.setattr(
         implementation, "get_dynamodb_settings", get_dynamodb_settings_mock
     )
@@ -337,3 +368,274 @@ def test_get_dynamodb_nosql(monkeypatch: pytest.MonkeyPatch):
     nosql: DynamoDBNoSQL = get_dynamodb_nosql()
 
     assert isinstance(nosql, DynamoDBNoSQL)
+
+
+@pytest.mark.asyncio
+async def test_dynamodb_nosql_shares_connection(monkeypatch: pytest.MonkeyPatch):
+    get_aws_credentials_settings.cache_clear()
+    get_nosql_settings.cache_clear()
+
+    monkeypatch.setattr(
+        connection,
+        "get_aws_credentials_settings",
+        get_aws_credentials_settings_mock,
+    )
+    monkeypatch.setattr(connection, "get_dynamodb_settings", get_dynamodb_settings_mock)
+    monkeypatch.setattr(
+        implementation, "get_dynamodb_settings", get_dynamodb_settings_mock
+    )
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_mock)
+
+    opened = await open_dynamodb_connection()
+
+    async with DynamoDBNoSQL() as first:
+        await first.put_item(table_name="test_table", item={"id": "123"})
+
+    async with DynamoDBNoSQL() as second:
+        await second.get_item(table_name="test_table", key={"id": "123"})
+
+    assert first._connection is opened
+    assert second._connection is opened
+    assert [name for name, _ in opened.client.calls] == ["put_item", "get_item"]
+
+
+@pytest.mark.asyncio
+async def test_dynamodb_nosql_serializes_requests(monkeypatch: pytest.MonkeyPatch):
+    get_aws_credentials_settings.cache_clear()
+    get_nosql_settings.cache_clear()
+
+    monkeypatch.setattr(
+        connection,
+        "get_aws_credentials_settings",
+        get_aws_credentials_settings_mock,
+    )
+    monkeypatch.setattr(connection, "get_dynamodb_settings", get_dynamodb_settings_mock)
+    monkeypatch.setattr(
+        implementation, "get_dynamodb_settings", get_dynamodb_settings_mock
+    )
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_mock)
+
+    async with DynamoDBNoSQL() as nosql:
+        query_result = await nosql.query(
+            table_name="test_table",
+            key_conditions=[
+                KeyCondition(field="id", operator=ConditionOperator.EQ, value="123")
+            ],
+        )
+        scan_result = await nosql.scan(table_name="test_table", start_key={"id": "1"})
+
+    _, query_kwargs = nosql._connection.client.calls[0]
+    _, scan_kwargs = nosql._connection.client.calls[1]
+
+    assert query_kwargs["TableName"] == "test_test_table"
+    assert query_kwargs["KeyConditionExpression"] == "#n0 = :v0"
+    assert query_kwargs["ExpressionAttributeNames"] == {"#n0": "id"}
+    assert query_kwargs["ExpressionAttributeValues"] == {":v0": {"S": "123"}}
+    assert query_result.items == [{"id": "123", "name": "Test Item"}]
+    assert scan_kwargs["ExclusiveStartKey"] == {"id": {"S": "1"}}
+    assert scan_result.last_evaluated_key == {"id": "123"}
+
+
+def _patch_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    get_aws_credentials_settings.cache_clear()
+    get_nosql_settings.cache_clear()
+
+    monkeypatch.setattr(
+        connection,
+        "get_aws_credentials_settings",
+        get_aws_credentials_settings_mock,
+    )
+    monkeypatch.setattr(connection, "get_dynamodb_settings", get_dynamodb_settings_mock)
+    monkeypatch.setattr(
+        implementation, "get_dynamodb_settings", get_dynamodb_settings_mock
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "limit, expected_ids, expected_limits",
+    [
+        (None, ["0-1", "0-2", "0-3"], [None, None, None]),
+        (2, ["0-1", "0-2"], [2, 1]),
+    ],
+)
+async def test_dynamodb_nosql_query_follows_pages(
+    monkeypatch: pytest.MonkeyPatch,
+    limit: int,
+    expected_ids: List[str],
+    expected_limits: List[int],
+):
+    _patch_settings(monkeypatch)
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_paginated_mock)
+
+    async with DynamoDBNoSQL() as nosql:
+        query_result = await nosql.query(
+            table_name="test_table",
+            key_conditions=[
+                KeyCondition(field="id", operator=ConditionOperator.EQ, value="123")
+            ],
+            limit=limit,
+        )
+
+    calls = nosql._connection.client.calls
+
+    assert [item["id"] for item in query_result.items] == expected_ids
+    assert query_result.count == len(expected_ids)
+    assert [kwargs.get("Limit") for _, kwargs in calls] == expected_limits
+
+
+@pytest.mark.asyncio
+async def test_dynamodb_nosql_query_iter(monkeypatch: pytest.MonkeyPatch):
+    _patch_settings(monkeypatch)
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_paginated_mock)
+
+    async with DynamoDBNoSQL() as nosql:
+        ids: List[str] = [
+            item["id"]
+            async for item in nosql.query_iter(
+                table_name="test_table",
+                key_conditions=[
+                    KeyCondition(field="id", operator=ConditionOperator.EQ, value="1")
+                ],
+                page_size=1,
+                attributes=["id", "createdAt"],
+            )
+        ]
+
+    _, kwargs = nosql._connection.client.calls[0]
+
+    assert ids == ["0-1", "0-2", "0-3"]
+    assert kwargs["Limit"] == 1
+    assert kwargs["ProjectionExpression"] == "#p0, #p1"
+    assert kwargs["ExpressionAttributeNames"] == {
+        "#n0": "id",
+        "#p0": "id",
+        "#p1": "createdAt",
+    }
+
+
+@pytest.mark.asyncio
+async def test_dynamodb_nosql_query_iter_stops_early(monkeypatch: pytest.MonkeyPatch):
+    _patch_settings(monkeypatch)
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_paginated_mock)
+
+    async with DynamoDBNoSQL() as nosql:
+        async for item in nosql.query_iter(
+            table_name="test_table",
+            key_conditions=[
+                KeyCondition(field="id", operator=ConditionOperator.EQ, value="1")
+            ],
+        ):
+            break
+
+    assert item["id"] == "0-1"
+    assert len(nosql._connection.client.calls) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "segments, expected_ids",
+    [
+        (1, ["0-1", "0-2", "0-3"]),
+        (2, ["0-1", "0-2", "0-3", "1-1", "1-2", "1-3"]),
+    ],
+)
+async def test_dynamodb_nosql_scan_iter(
+    monkeypatch: pytest.MonkeyPatch, segments: int, expected_ids: List[str]
+):
+    _patch_settings(monkeypatch)
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_paginated_mock)
+
+    async with DynamoDBNoSQL() as nosql:
+        ids: List[str] = [
+            item["id"]
+            async for item in nosql.scan_iter(
+                table_name="test_table", attributes=["id"], segments=segments
+            )
+        ]
+
+    assert sorted(ids) == expected_ids
+
+
+@pytest.mark.asyncio
+async def test_dynamodb_nosql_scan_iter_segment_error(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _patch_settings(monkeypatch)
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_scan_error_mock)
+
+    with pytest.raises(Exception, match="Mocked exception"):
+        async with DynamoDBNoSQL() as nosql:
+            async for _ in nosql.scan_iter(table_name="test_table", segments=2):
+                pass
+
+
+@pytest.mark.asyncio
+async def test_dynamodb_nosql_batch_put_items(monkeypatch: pytest.MonkeyPatch):
+    _patch_settings(monkeypatch)
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_mock)
+
+    async with DynamoDBNoSQL() as nosql:
+        await nosql.batch_put_items(
+            table_name="test_table",
+            items=[{"id": str(i), "name": "Test Item"} for i in range(60)],
+        )
+
+    calls = nosql._connection.client.calls
+    batches = [kwargs["RequestItems"]["test_test_table"] for _, kwargs in calls]
+
+    # The batches are sent concurrently, so they can arrive in any order
+    assert sorted(len(batch) for batch in batches) == [10, 25, 25]
+
+    [first] = [
+        batch for batch in batches if batch[0]["PutRequest"]["Item"]["id"] == {"S": "0"}
+    ]
+
+    assert len(first) == 25
+    assert first[0] == {
+        "PutRequest": {"Item": {"id": {"S": "0"}, "name": {"S": "Test Item"}}}
+    }
+
+
+@pytest.mark.asyncio
+async def test_dynamodb_nosql_batch_delete_items_retries_unprocessed(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _patch_settings(monkeypatch)
+    monkeypatch.setattr(implementation, "DYNAMODB_BATCH_WRITE_BACKOFF_SECONDS", 0)
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_unprocessed_mock)
+
+    async with DynamoDBNoSQL() as nosql:
+        await nosql.batch_delete_items(
+            table_name="test_table", keys=[{"id": "1"}, {"id": "2"}]
+        )
+
+    calls = nosql._connection.client.calls
+    batches = [kwargs["RequestItems"]["test_test_table"] for _, kwargs in calls]
+
+    assert len(batches) == 2
+    assert batches[1] == [{"DeleteRequest": {"Key": {"id": {"S": "1"}}}}]
+
+
+@pytest.mark.asyncio
+async def test_dynamodb_nosql_batch_delete_items_unprocessed_exception(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    _patch_settings(monkeypatch)
+    monkeypatch.setattr(implementation, "DYNAMODB_BATCH_WRITE_BACKOFF_SECONDS", 0)
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_always_unprocessed_mock)
+
+    with pytest.raises(BatchWriteException):
+        async with DynamoDBNoSQL() as nosql:
+            await nosql.batch_delete_items(table_name="test_table", keys=[{"id": "1"}])
+
+
+@pytest.mark.asyncio
+async def test_dynamodb_nosql_batch_write_empty(monkeypatch: pytest.MonkeyPatch):
+    _patch_settings(monkeypatch)
+    monkeypatch.setattr(boto3, "client", boto3_dynamodb_client_mock)
+
+    async with DynamoDBNoSQL() as nosql:
+        await nosql.batch_delete_items(table_name="test_table", keys=[])
+
+    assert nosql._connection.client.calls == []
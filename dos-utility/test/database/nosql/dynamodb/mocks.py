@@ -1,4 +1,4 @@
-from typing import Any, Dict, Self, Optional
+from typing import Any, Dict, List, Optional, Self, Tuple
 
 from dos_utility.database.nosql.dynamodb.env import DynamoDBSettings
 
@@ -21,72 +21,143 @@ def get_dynamodb_settings_mock_no_prefix() -> DynamoDBSettings:
     )
 
 
-class _MockBoto3Tables:
-    def limit(self: Self, limit: int):
-        return ["table1"]
+class MockBoto3DynamoDBClient:
+    def __init__(self, *args, **kwargs):
+        self.calls: List[Tuple[str, Dict[str, Any]]] = []
+
+    def list_tables(self: Self, **kwargs) -> Dict[str, Any]:
+        self.calls.append(("list_tables", kwargs))
+        return {"TableNames": ["table1"]}
+
+    def put_item(self: Self, **kwargs) -> Dict[str, Any]:
+        self.calls.append(("put_item", kwargs))
+        return {}
+
+    def get_item(self: Self, **kwargs) -> Dict[str, Any]:
+        self.calls.append(("get_item", kwargs))
+        return {"Item": {"id": {"S": "123"}, "name": {"S": "Test Item"}}}
+
+    def delete_item(self: Self, **kwargs) -> Dict[str, Any]:
+        self.calls.append(("delete_item", kwargs))
+        return {}
+
+    def update_item(self: Self, **kwargs) -> Dict[str, Any]:
+        self.calls.append(("update_item", kwargs))
+        return {"Attributes": {"id": {"S": "123"}, "name": {"S": "Updated Test Item"}}}
+
+    def query(self: Self, **kwargs) -> Dict[str, Any]:
+        self.calls.append(("query", kwargs))
+        return {
+            "Items": [{"id": {"S": "123"}, "name": {"S": "Test Item"}}],
+            "Count": 1,
+        }
+
+    def scan(self: Self, **kwargs) -> Dict[str, Any]:
+        self.calls.append(("scan", kwargs))
+        return {
+            "Items": [{"id": {"S": "123"}, "name": {"S": "Test Item"}}],
+            "LastEvaluatedKey": {"id": {"S": "123"}},
+        }
+
+    def batch_write_item(self: Self, **kwargs) -> Dict[str, Any]:
+        self.calls.append(("batch_write_item", kwargs))
+        return {"UnprocessedItems": {}}
+
+    def close(self: Self) -> None:
+        pass
+
+
+class MockBoto3DynamoDBClientPaginated(MockBoto3DynamoDBClient):
+    """Serves three one-item pages, chained through LastEvaluatedKey."""
+
+    PAGES: List[str] = ["1", "2", "3"]
+
+    def __page(self: Self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        start_key: Optional[Dict[str, Any]] = kwargs.get("ExclusiveStartKey")
+        index: int = (
+            0 if start_key is None else self.PAGES.index(start_key["id"]["S"]) + 1
+        )
+        item_id: str = self.PAGES[index]
+        response: Dict[str, Any] = {
+            "Items": [{"id": {"S": f"{kwargs.get('Segment', 0)}-{item_id}"}}],
+            "Count": 1,
+        }
+
+        if index < len(self.PAGES) - 1:
+            response["LastEvaluatedKey"] = {"id": {"S": item_id}}
+
+        return response
+
+    def query(self: Self, **kwargs) -> Dict[str, Any]:
+        self.calls.append(("query", kwargs))
+        return self.__page(kwargs)
+
+    def scan(self: Self, **kwargs) -> Dict[str, Any]:
+        self.calls.append(("scan", kwargs))
+        return self.__page(kwargs)
+
+
+class MockBoto3DynamoDBClientScanError(MockBoto3DynamoDBClient):
+    def scan(self: Self, **kwargs) -> Dict[str, Any]:
+        if kwargs.get("Segment") == 1:
+            raise Exception("Mocked exception")
+
+        return {"Items": [{"id": {"S": "123"}}], "Count": 1}
+
 
+class MockBoto3DynamoDBClientUnprocessed(MockBoto3DynamoDBClient):
+    """Leaves the first request of each batch unprocessed `unprocessed_times` times."""
 
-class _MockBoto3TablesNotHealthy:
-    def limit(self: Self, limit: int):
+    def __init__(self, *args, unprocessed_times: int = 1, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.unprocessed_times: int = unprocessed_times
+
+    def batch_write_item(self: Self, **kwargs) -> Dict[str, Any]:
+        self.calls.append(("batch_write_item", kwargs))
+        table_name, requests = next(iter(kwargs["RequestItems"].items()))
+
+        if self.unprocessed_times == 0:
+            return {"UnprocessedItems": {}}
+
+        self.unprocessed_times -= 1
+
+        return {"UnprocessedItems": {table_name: requests[:1]}}
+
+
+class MockBoto3DynamoDBClientNotHealthy(MockBoto3DynamoDBClient):
+    def list_tables(self: Self, **kwargs) -> Dict[str, Any]:
         raise Exception("Mocked exception")
 
 
-class _MockBoto3Table:
-    def put_item(self: Self, Item: Dict[str, Any]) -> None:
-        pass
+def boto3_dynamodb_client_mock(*args, **kwargs) -> MockBoto3DynamoDBClient:
+    return MockBoto3DynamoDBClient()
 
-    def get_item(self: Self, Key: Dict[str, Any]) -> Dict[str, Any]:
-        return {"Item": {"id": "123", "name": "Test Item"}}
 
-    def delete_item(self: Self, Key: Dict[str, Any]) -> None:
-        pass
+def boto3_dynamodb_client_paginated_mock(
+    *args, **kwargs
+) -> MockBoto3DynamoDBClientPaginated:
+    return MockBoto3DynamoDBClientPaginated()
 
-    def update_item(
-        self: Self,
-        Key: Dict[str, Any],
-        UpdateExpression: str,
-        ExpressionAttributeNames: Dict[str, str],
-        ExpressionAttributeValues: Dict[str, Any],
-        ReturnValues: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        return {"Attributes": {"id": "123", "name": "Updated Test Item"}}
-
-    def query(
-        self: Self,
-        KeyConditionExpression: Any,
-        ScanIndexForward: bool = True,
-        Limit: Optional[int] = None,
-        IndexName: Optional[str] = None,
-        Select: Optional[str] = None,
-    ) -> Dict[str, Any]:
-        return {"Items": [{"id": "123", "name": "Test Item"}], "Count": 1}
-
-    def scan(
-        self: Self,
-        Limit: Optional[int] = None,
-        ExclusiveStartKey: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
-        return {"Items": [{"id": "123", "name": "Test Item"}], "LastEvaluatedKey": None}
-
-
-class MockBoto3DynamoDBResource:
-    def __init__(self, *args, **kwargs):
-        self.tables: _MockBoto3Tables = _MockBoto3Tables()
 
-    def Table(self: Self, table_name: str) -> _MockBoto3Table:
-        return _MockBoto3Table()
+def boto3_dynamodb_client_scan_error_mock(
+    *args, **kwargs
+) -> MockBoto3DynamoDBClientScanError:
+    return MockBoto3DynamoDBClientScanError()
 
 
-class MockBoto3DynamoDBResourceNotHealthy:
-    def __init__(self, *args, **kwargs):
-        self.tables: _MockBoto3TablesNotHealthy = _MockBoto3TablesNotHealthy()
+def boto3_dynamodb_client_unprocessed_mock(
+    *args, **kwargs
+) -> MockBoto3DynamoDBClientUnprocessed:
+    return MockBoto3DynamoDBClientUnprocessed()
 
 
-def boto3_dynamodb_resource_mock(*args, **kwargs) -> MockBoto3DynamoDBResource:
-    return MockBoto3DynamoDBResource()
+def boto3_dynamodb_client_always_unprocessed_mock(
+    *args, **kwargs
+) -> MockBoto3DynamoDBClientUnprocessed:
+    return MockBoto3DynamoDBClientUnprocessed(unprocessed_times=100)
 
 
-def boto3_dynamodb_resource_not_healthy_mock(
+def boto3_dynamodb_client_not_healthy_mock(
     *args, **kwargs
-) -> MockBoto3DynamoDBResourceNotHealthy:
-    return MockBoto3DynamoDBResourceNotHealthy()
+) -> MockBoto3DynamoDBClientNotHealthy:
+    return MockBoto3DynamoDBClientNotHealthy()
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Self
+from typing import Any, AsyncIterator, Dict, List, Optional, Self
 
 from dos_utility.database.nosql.env import NoSQLProvider
 from dos_utility.database.nosql.interface import NoSQLInterface
@@ -29,6 +29,14 @@ class MockNoSQLClient(NoSQLInterface):
         fields_to_update: Dict[str, Any],
     ) -> Optional[Dict[str, Any]]: ...
 
+    async def batch_put_items(
+        self: Self, table_name: str, items: List[Dict[str, Any]]
+    ) -> None: ...
+
+    async def batch_delete_items(
+        self: Self, table_name: str, keys: List[Dict[str, Any]]
+    ) -> None: ...
+
     async def query(
         self: Self,
         table_name: str,
@@ -46,6 +54,28 @@ class MockNoSQLClient(NoSQLInterface):
         start_key: Optional[Dict[str, Any]] = None,
     ) -> ScanResult: ...
 
+    async def query_iter(
+        self: Self,
+        table_name: str,
+        key_conditions: List[KeyCondition],
+        index_name: Optional[str] = None,
+        sort_ascending: bool = True,
+        page_size: Optional[int] = None,
+        attributes: Optional[List[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for item in []:
+            yield item
+
+    async def scan_iter(
+        self: Self,
+        table_name: str,
+        page_size: Optional[int] = None,
+        attributes: Optional[List[str]] = None,
+        segments: int = 1,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        for item in []:
+            yield item
+
 
 class MockDynamoDBClient(MockNoSQLClient):
     pass
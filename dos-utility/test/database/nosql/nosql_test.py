@@ -1,6 +1,7 @@
 import pytest
 
-from typing import AsyncGenerator, Callable
+from types import SimpleNamespace
+from typing import AsyncGenerator, Callable, List
 
 from dos_utility.database import nosql
 from dos_utility.database.nosql import (
@@ -8,6 +9,7 @@ from dos_utility.database.nosql import (
     get_nosql_client,
     get_nosql_settings,
     get_nosql_client_ctx,
+    nosql_lifespan,
 )
 
 from test.database.nosql.mocks import (
@@ -76,3 +78,40 @@ async def test_get_nosql_client_ctx(
     async with get_nosql_client_ctx() as client:
         print(type(client))
         assert isinstance(client, NoSQLInterface)
+
+
+@pytest.mark.asyncio
+async def test_nosql_lifespan_dynamodb(monkeypatch: pytest.MonkeyPatch):
+    get_nosql_settings.cache_clear()
+    events: List[str] = []
+
+    async def open_mock():
+        events.append("open")
+
+    async def close_mock():
+        events.append("close")
+
+    monkeypatch.setattr(nosql, "get_nosql_settings", get_nosql_settings_dynamodb_mock)
+    monkeypatch.setattr(nosql, "open_dynamodb_connection", open_mock)
+    monkeypatch.setattr(nosql, "close_dynamodb_connection", close_mock)
+
+    async with nosql_lifespan():
+        assert events == ["open"]
+
+    assert events == ["open", "close"]
+
+
+@pytest.mark.asyncio
+async def test_nosql_lifespan_without_pool(monkeypatch: pytest.MonkeyPatch):
+    get_nosql_settings.cache_clear()
+
+    async def open_mock():
+        raise AssertionError("No pool to open")
+
+    monkeypatch.setattr(
+        nosql, "get_nosql_settings", lambda: SimpleNamespace(NOSQL_PROVIDER="other")
+    )
+    monkeypatch.setattr(nosql, "open_dynamodb_connection", open_mock)
+
+    async with nosql_lifespan():
+        pass
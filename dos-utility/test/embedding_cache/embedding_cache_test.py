@@ -0,0 +1,209 @@
+import pytest
+
+from dos_utility.embedding_cache import cache, embedding
+from dos_utility.embedding_cache.cache import (
+    EmbeddingCache,
+    embedding_cache_key,
+    get_embedding_cache,
+)
+from dos_utility.embedding_cache.embedding import CachedEmbedding, cached_embed_model
+
+from test.embedding_cache.mocks import (
+    EmbedModelMock,
+    SharedRedisMock,
+    FailingRedisMock,
+    get_embedding_cache_settings_mock,
+    get_embedding_cache_settings_shared_mock,
+    get_embedding_cache_settings_disabled_mock,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_store():
+    SharedRedisMock.store.clear()
+    yield
+    SharedRedisMock.store.clear()
+
+
+def _cached_embedding(
+    monkeypatch: pytest.MonkeyPatch, embedding_cache: EmbeddingCache
+) -> CachedEmbedding:
+    monkeypatch.setattr(embedding, "get_embedding_cache", lambda: embedding_cache)
+    return CachedEmbedding(
+        embed_model=EmbedModelMock(), embed_dim=2, task_type="RETRIEVAL_DOCUMENT"
+    )
+
+
+def test_embedding_cache_key_depends_on_every_parameter():
+    key = embedding_cache_key("model", 768, "RETRIEVAL_DOCUMENT", "text", "hello")
+
+    assert key == embedding_cache_key(
+        "model", 768, "RETRIEVAL_DOCUMENT", "text", "hello"
+    )
+    assert key != embedding_cache_key(
+        "other", 768, "RETRIEVAL_DOCUMENT", "text", "hello"
+    )
+    assert key != embedding_cache_key(
+        "model", 1536, "RETRIEVAL_DOCUMENT", "text", "hello"
+    )
+    assert key != embedding_cache_key("model", 768, "RETRIEVAL_QUERY", "text", "hello")
+    assert key != embedding_cache_key(
+        "model", 768, "RETRIEVAL_DOCUMENT", "query", "hello"
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_embedding_embeds_only_the_misses(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        cache, "get_embedding_cache_settings", get_embedding_cache_settings_mock
+    )
+    embedding_cache = EmbeddingCache()
+    embed_model = _cached_embedding(monkeypatch, embedding_cache)
+
+    first = await embed_model.aget_text_embedding_batch(["a", "bb", "a"])
+    second = await embed_model.aget_text_embedding_batch(["bb", "ccc"])
+
+    assert first == [[1.0, 0.5], [2.0, 0.5], [1.0, 0.5]]
+    assert second == [[2.0, 0.5], [3.0, 0.5]]
+    # Duplicated texts are embedded once, cached ones never again
+    assert embed_model.embed_model.calls == [["a", "bb"], ["ccc"]]
+    assert embedding_cache.stats() == {
+        "hits": 1,
+        "shared_hits": 0,
+        "misses": 4,
+        "entries": 2,
+        "hit_rate": 1 / 5,
+    }
+
+
+def test_cached_embedding_sync_query(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        cache, "get_embedding_cache_settings", get_embedding_cache_settings_mock
+    )
+    embedding_cache = EmbeddingCache()
+    embed_model = _cached_embedding(monkeypatch, embedding_cache)
+
+    assert embed_model.get_query_embedding("what") == [4.0, 0.5]
+    assert embed_model.get_query_embedding("what") == [4.0, 0.5]
+    # A query and a text are different cache entries
+    assert embed_model.get_text_embedding("what") == [4.0, 0.5]
+
+    assert embed_model.embed_model.calls == [["what"], ["what"]]
+    assert embedding_cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        cache, "get_embedding_cache_settings", get_embedding_cache_settings_mock
+    )
+    embedding_cache = EmbeddingCache()
+
+    await embedding_cache.put_many({"a": [1.0], "b": [2.0]})
+    assert await embedding_cache.get_many(["a"]) == [[1.0]]
+    await embedding_cache.put_many({"c": [3.0]})
+
+    assert await embedding_cache.get_many(["a", "b", "c"]) == [[1.0], None, [3.0]]
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_expires(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        cache, "get_embedding_cache_settings", get_embedding_cache_settings_mock
+    )
+    embedding_cache = EmbeddingCache()
+    now = cache.time.monotonic()
+
+    await embedding_cache.put_many({"a": [1.0]})
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now + 86401)
+
+    assert await embedding_cache.get_many(["a"]) == [None]
+    assert embedding_cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_stores_float32(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        cache, "get_embedding_cache_settings", get_embedding_cache_settings_mock
+    )
+    embedding_cache = EmbeddingCache()
+
+    await embedding_cache.put_many({"a": [0.1, 0.25]})
+    vector = (await embedding_cache.get_many(["a"]))[0]
+
+    assert vector[1] == 0.25
+    assert vector[0] == pytest.approx(0.1, rel=1e-6)
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_shared_across_processes(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        cache, "get_embedding_cache_settings", get_embedding_cache_settings_shared_mock
+    )
+    monkeypatch.setattr(cache, "get_redis_connection_pool", lambda **kwargs: None)
+    monkeypatch.setattr(cache, "Redis", SharedRedisMock)
+
+    # Two caches stand for two processes sharing the same Redis
+    first = _cached_embedding(monkeypatch, EmbeddingCache())
+    await first.aget_text_embedding_batch(["a", "bb"])
+
+    second_cache = EmbeddingCache()
+    second = _cached_embedding(monkeypatch, second_cache)
+
+    assert await second.aget_text_embedding_batch(["a", "bb"]) == [
+        [1.0, 0.5],
+        [2.0, 0.5],
+    ]
+    assert second.embed_model.calls == []
+    assert second_cache.stats()["shared_hits"] == 2
+    assert all(key.startswith("embedding_cache:") for key in SharedRedisMock.store)
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_shared_redis_failure(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        cache, "get_embedding_cache_settings", get_embedding_cache_settings_shared_mock
+    )
+    monkeypatch.setattr(cache, "get_redis_connection_pool", lambda **kwargs: None)
+    monkeypatch.setattr(cache, "Redis", FailingRedisMock)
+    embed_model = _cached_embedding(monkeypatch, EmbeddingCache())
+
+    assert await embed_model.aget_text_embedding_batch(["a"]) == [[1.0, 0.5]]
+    assert await embed_model.aget_text_embedding_batch(["a"]) == [[1.0, 0.5]]
+
+    assert embed_model.embed_model.calls == [["a"]]
+
+
+def test_cached_embed_model_disabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        embedding,
+        "get_embedding_cache_settings",
+        get_embedding_cache_settings_disabled_mock,
+    )
+    embed_model = EmbedModelMock()
+
+    assert cached_embed_model(embed_model=embed_model) is embed_model
+
+
+def test_cached_embed_model_enabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        embedding, "get_embedding_cache_settings", get_embedding_cache_settings_mock
+    )
+
+    result = cached_embed_model(
+        embed_model=EmbedModelMock(), embed_dim=768, task_type="RETRIEVAL_QUERY"
+    )
+
+    assert isinstance(result, CachedEmbedding)
+    assert result.model_name == "embed-model"
+    assert result.embed_dim == 768
+
+
+def test_get_embedding_cache_is_process_wide():
+    assert get_embedding_cache() is get_embedding_cache()
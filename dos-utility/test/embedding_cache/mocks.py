@@ -0,0 +1,105 @@
+import asyncio
+
+from typing import Dict, List, Optional, Self
+
+from llama_index.core.base.embeddings.base import BaseEmbedding
+
+from dos_utility.embedding_cache.env import EmbeddingCacheSettings
+
+
+class EmbedModelMock(BaseEmbedding):
+    """Embeds every text as [len(text), 0.5], recording the texts it received."""
+
+    model_name: str = "embed-model"
+    calls: List[List[str]] = []
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "EmbedModelMock"
+
+    def __embed(self: Self, texts: List[str]) -> List[List[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(text)), 0.5] for text in texts]
+
+    def _get_query_embedding(self: Self, query: str) -> List[float]:
+        return self.__embed(texts=[query])[0]
+
+    async def _aget_query_embedding(self: Self, query: str) -> List[float]:
+        return self.__embed(texts=[query])[0]
+
+    def _get_text_embedding(self: Self, text: str) -> List[float]:
+        return self.__embed(texts=[text])[0]
+
+    def _get_text_embeddings(self: Self, texts: List[str]) -> List[List[float]]:
+        return self.__embed(texts=texts)
+
+    async def _aget_text_embeddings(self: Self, texts: List[str]) -> List[List[float]]:
+        return self.__embed(texts=texts)
+
+
+class SlowEmbedModelMock(EmbedModelMock):
+    """Yields to the event loop before answering, so concurrent queries overlap."""
+
+    async def _aget_query_embedding(self: Self, query: str) -> List[float]:
+        await asyncio.sleep(0.01)
+        return await super()._aget_query_embedding(query)
+
+
+class _PipelineMock:
+    def __init__(self: Self, store: Dict[str, bytes]):
+        self._store = store
+        self._pending: Dict[str, bytes] = {}
+
+    async def __aenter__(self: Self) -> Self:
+        return self
+
+    async def __aexit__(self: Self, exc_type, exc_value, traceback) -> None:
+        pass
+
+    def set(self: Self, name: str, value: bytes, px: int) -> None:
+        self._pending[name] = value
+
+    async def execute(self: Self) -> None:
+        self._store.update(self._pending)
+
+
+class SharedRedisMock:
+    """In-memory stand-in for the Redis client, shared by every instance."""
+
+    store: Dict[str, bytes] = {}
+
+    def __init__(self: Self, *args, **kwargs):
+        pass
+
+    async def mget(self: Self, keys: List[str]) -> List[Optional[bytes]]:
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self: Self, transaction: bool = True) -> _PipelineMock:
+        return _PipelineMock(store=self.store)
+
+
+class FailingRedisMock:
+    def __init__(self: Self, *args, **kwargs):
+        pass
+
+    async def mget(self: Self, keys: List[str]) -> List[Optional[bytes]]:
+        raise Exception("Mocked exception")
+
+    def pipeline(self: Self, transaction: bool = True) -> _PipelineMock:
+        raise Exception("Mocked exception")
+
+
+def get_embedding_cache_settings_mock() -> EmbeddingCacheSettings:
+    return EmbeddingCacheSettings(
+        EMBEDDING_CACHE_ENABLED=True, EMBEDDING_CACHE_MAX_ENTRIES=2
+    )
+
+
+def get_embedding_cache_settings_shared_mock() -> EmbeddingCacheSettings:
+    return EmbeddingCacheSettings(
+        EMBEDDING_CACHE_ENABLED=True, EMBEDDING_CACHE_SHARED=True
+    )
+
+
+def get_embedding_cache_settings_disabled_mock() -> EmbeddingCacheSettings:
+    return EmbeddingCacheSettings(EMBEDDING_CACHE_ENABLED=False)
@@ -0,0 +1,120 @@
+import asyncio
+import pytest
+
+from dos_utility.embedding_cache import query
+from dos_utility.embedding_cache.query import (
+    CachedQueryEmbedding,
+    cached_query_embed_model,
+)
+
+from test.embedding_cache.mocks import EmbedModelMock, SlowEmbedModelMock
+
+
+@pytest.mark.asyncio
+async def test_cached_query_embedding_served_from_memory():
+    embed_model = CachedQueryEmbedding(
+        embed_model=EmbedModelMock(), max_entries=10, ttl_seconds=60.0
+    )
+
+    assert await embed_model.aget_query_embedding("what") == [4.0, 0.5]
+    assert await embed_model.aget_query_embedding("what") == [4.0, 0.5]
+    assert embed_model.get_query_embedding("what") == [4.0, 0.5]
+
+    assert embed_model.embed_model.calls == [["what"]]
+    stats = embed_model.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 2 / 3
+    assert stats["saved_seconds"] >= 0.0
+
+
+@pytest.mark.asyncio
+async def test_cached_query_embedding_evicts_and_expires(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    embed_model = CachedQueryEmbedding(
+        embed_model=EmbedModelMock(), max_entries=1, ttl_seconds=60.0
+    )
+    now = query.time.monotonic()
+
+    await embed_model.aget_query_embedding("a")
+    await embed_model.aget_query_embedding("bb")
+    await embed_model.aget_query_embedding("a")
+
+    monkeypatch.setattr(query.time, "monotonic", lambda: now + 61)
+    await embed_model.aget_query_embedding("a")
+
+    assert embed_model.embed_model.calls == [["a"], ["bb"], ["a"], ["a"]]
+    assert embed_model.stats()["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_query_embedding_coalesces_concurrent_queries():
+    embed_model = CachedQueryEmbedding(
+        embed_model=SlowEmbedModelMock(), max_entries=10, ttl_seconds=60.0
+    )
+
+    results = await asyncio.gather(
+        *(embed_model.aget_query_embedding("what") for _ in range(3))
+    )
+
+    assert results == [[4.0, 0.5]] * 3
+    assert embed_model.embed_model.calls == [["what"]]
+    assert embed_model.stats()["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_query_embedding_waiters_survive_a_cancelled_query():
+    embed_model = CachedQueryEmbedding(
+        embed_model=SlowEmbedModelMock(), max_entries=10, ttl_seconds=60.0
+    )
+
+    first = asyncio.create_task(embed_model.aget_query_embedding("what"))
+    await asyncio.sleep(0)
+    waiters = [
+        asyncio.create_task(embed_model.aget_query_embedding("what")) for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    first.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    assert await asyncio.gather(*waiters) == [[4.0, 0.5]] * 2
+    # Only the first waiter embedded the query again
+    assert embed_model.embed_model.calls == [["what"]]
+    assert embed_model.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_query_embedding_does_not_cache_texts():
+    embed_model = CachedQueryEmbedding(
+        embed_model=EmbedModelMock(), max_entries=10, ttl_seconds=60.0
+    )
+
+    await embed_model.aget_text_embedding_batch(["a", "a"])
+    await embed_model.aget_text_embedding_batch(["a"])
+
+    assert embed_model.embed_model.calls == [["a", "a"], ["a"]]
+    assert embed_model.stats()["entries"] == 0
+
+
+@pytest.mark.parametrize("max_entries, ttl_seconds", [(0, 60.0), (10, 0.0)])
+def test_cached_query_embed_model_disabled(max_entries: int, ttl_seconds: float):
+    embed_model = EmbedModelMock()
+
+    assert (
+        cached_query_embed_model(
+            embed_model=embed_model, max_entries=max_entries, ttl_seconds=ttl_seconds
+        )
+        is embed_model
+    )
+
+
+def test_cached_query_embed_model_enabled():
+    result = cached_query_embed_model(
+        embed_model=EmbedModelMock(), max_entries=10, ttl_seconds=60.0
+    )
+
+    assert isinstance(result, CachedQueryEmbedding)
+    assert result.model_name == "embed-model"
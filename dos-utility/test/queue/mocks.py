@@ -1,5 +1,7 @@
+import asyncio
+
 from dataclasses import dataclass
-from typing import Self, Tuple, Optional
+from typing import Self, Tuple, Optional, List
 from dos_utility.queue import QueueInterface
 from dos_utility.queue.env import QueueProvider
 
@@ -17,12 +19,48 @@ class MockQueue(QueueInterface):
     async def enqueue(self: Self, msg: bytes) -> str:
         return "mock"
 
+    async def enqueue_many(self: Self, msgs: List[bytes]) -> List[str]:
+        return ["mock" for _ in msgs]
+
     async def dequeue(self: Self) -> Tuple[Optional[bytes], Optional[str]]:
         return None, None
 
+    async def dequeue_many(
+        self: Self, max_messages: int = 10, wait: float = 20.0
+    ) -> List[Tuple[bytes, str]]:
+        return []
+
     async def acknowledge(self: Self, ack_token: str) -> None:
         pass
 
+    async def acknowledge_many(self: Self, ack_tokens: List[str]) -> None:
+        pass
+
+
+class MockLongPollQueue(MockQueue):
+    """Waits the whole `wait` for messages, as on an empty queue."""
+
+    def __init__(self: Self):
+        self.cancelled: bool = False
+
+    async def dequeue_many(
+        self: Self, max_messages: int = 10, wait: float = 20.0
+    ) -> List[Tuple[bytes, str]]:
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+        return []
+
+
+class MockMessagesQueue(MockQueue):
+    async def dequeue_many(
+        self: Self, max_messages: int = 10, wait: float = 20.0
+    ) -> List[Tuple[bytes, str]]:
+        return [(b"body", f"ack-{i}") for i in range(max_messages)]
+
 
 class MockSQSQueue(MockQueue):
     pass
@@ -1,11 +1,32 @@
-from typing import Self, Any
+from typing import Self, Any, List, Optional
 from redis.asyncio import Redis
 from redis import ResponseError
 
 
+class RedisPipelineMock:
+    def __init__(self: Self) -> None:
+        self.commands: List[Any] = []
+
+    async def __aenter__(self: Self) -> Self:
+        return self
+
+    async def __aexit__(self: Self, *args) -> None:
+        pass
+
+    def xadd(self: Self, name: str, fields: Any) -> Self:
+        self.commands.append(fields)
+
+        return self
+
+    async def execute(self: Self) -> List[str]:
+        return [f"mocked-msg-id-{idx}" for idx in range(len(self.commands))]
+
+
 class RedisMock(Redis):
     def __init__(self: Self, *args, **kwargs) -> None:
-        pass
+        self.xreadgroup_calls: List[dict] = []
+        self.xautoclaim_calls: List[dict] = []
+        self.xack_calls: List[tuple] = []
 
     async def xgroup_create(
         self: Self, name: str, groupname: str, id: str, mkstream: bool
@@ -21,19 +42,52 @@ class RedisMock(Redis):
     async def xadd(self: Self, name: str, fields: Any) -> str:
         return "mocked-msg-id"
 
+    def pipeline(self: Self, transaction: bool = True) -> RedisPipelineMock:
+        return RedisPipelineMock()
+
     async def xreadgroup(
         self: Self,
         groupname: str,
         consumername: str,
         streams: Any,
         count: int,
-        block: int,
-        noack: bool,
+        block: Optional[int],
+        noack: bool = False,
     ) -> Any:
+        self.xreadgroup_calls.append(
+            {
+                "consumername": consumername,
+                "count": count,
+                "block": block,
+                "noack": noack,
+            }
+        )
+
         return []
 
+    async def xautoclaim(
+        self: Self,
+        name: str,
+        groupname: str,
+        consumername: str,
+        min_idle_time: int,
+        start_id: str,
+        count: int,
+    ) -> Any:
+        self.xautoclaim_calls.append(
+            {
+                "consumername": consumername,
+                "min_idle_time": min_idle_time,
+                "count": count,
+            }
+        )
+
+        return ["0-0", [], []]
+
     async def xack(self: Self, name: str, groupname: str, *ids: str) -> int:
-        return 0
+        self.xack_calls.append(ids)
+
+        return len(ids)
 
 
 class RedisGroupAlreadyExistsMock(RedisMock):
@@ -62,15 +116,42 @@ class RedisDequeueNewMessageMock(RedisMock):
         consumername: str,
         streams: Any,
         count: int,
-        block: int,
-        noack: bool,
+        block: Optional[int],
+        noack: bool = False,
+    ) -> Any:
+        return [
+            (
+                "mocked-stream",
+                [
+                    ("mocked-msg-id", {b"body": b"test-message"}),
+                    ("mocked-msg-id-2", {b"body": b"test-message-2"}),
+                ][:count],
+            )
+        ]
+
+
+class RedisClaimStaleMessageMock(RedisMock):
+    async def xautoclaim(
+        self: Self,
+        name: str,
+        groupname: str,
+        consumername: str,
+        min_idle_time: int,
+        start_id: str,
+        count: int,
     ) -> Any:
-        return [("mocked-stream", [("mocked-msg-id", {b"body": b"test-message"})])]
+        return [
+            "0-0",
+            [("stale-msg-id", {b"body": b"stale-message"}), ("trimmed-msg-id", None)],
+            [],
+        ]
 
 
 class RedisQueueSettingsMock(RedisMock):
     REDIS_STREAM: str = "mocked-stream"
     REDIS_GROUP: str = "mocked-group"
+    REDIS_CONSUMER_NAME: Optional[str] = None
+    REDIS_CLAIM_IDLE_SECONDS: float = 300.0
 
 
 def get_redis_queue_settings_mock() -> RedisQueueSettingsMock:
@@ -13,3 +13,4 @@ def test_get_redis_queue_settings(monkeypatch: pytest.MonkeyPatch) -> None:
 
     assert settings.REDIS_STREAM == "test-stream"
     assert settings.REDIS_GROUP == "test-group"
+    assert settings.REDIS_CLAIM_IDLE_SECONDS == 300.0
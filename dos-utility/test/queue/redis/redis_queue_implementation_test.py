@@ -12,6 +12,7 @@ from test.queue.redis.mocks import (
     RedisUnexpectedResponseErrorMock,
     RedisUnhealthyMock,
     RedisDequeueNewMessageMock,
+    RedisClaimStaleMessageMock,
     get_redis_queue_settings_mock,
 )
 from test.utils.redis.mocks import get_queue_pool_mock
@@ -196,3 +197,122 @@ def test_get_redis_queue(monkeypatch: pytest.MonkeyPatch):
     redis_queue: RedisQueue = get_redis_queue()
 
     assert isinstance(redis_queue, RedisQueue)
+
+
+@pytest.mark.asyncio
+async def test_redis_enqueue_many(monkeypatch: pytest.MonkeyPatch):
+    get_redis_queue_settings.cache_clear()
+
+    monkeypatch.setattr(implementation, "Redis", RedisMock)
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(
+        implementation, "get_redis_queue_settings", get_redis_queue_settings_mock
+    )
+
+    async with RedisQueue() as redis_queue:
+        msg_ids = await redis_queue.enqueue_many(msgs=[b"msg-1", b"msg-2"])
+        empty = await redis_queue.enqueue_many(msgs=[])
+
+        assert msg_ids == ["mocked-msg-id-0", "mocked-msg-id-1"]
+        assert empty == []
+
+
+@pytest.mark.asyncio
+async def test_redis_dequeue_many(monkeypatch: pytest.MonkeyPatch):
+    get_redis_queue_settings.cache_clear()
+
+    monkeypatch.setattr(implementation, "Redis", RedisDequeueNewMessageMock)
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(
+        implementation, "get_redis_queue_settings", get_redis_queue_settings_mock
+    )
+
+    async with RedisQueue() as redis_queue:
+        messages = await redis_queue.dequeue_many(max_messages=10, wait=5)
+
+        assert messages == [
+            (b"test-message", "mocked-msg-id"),
+            (b"test-message-2", "mocked-msg-id-2"),
+        ]
+
+
+@pytest.mark.asyncio
+async def test_redis_dequeue_many_uses_stable_consumer(monkeypatch: pytest.MonkeyPatch):
+    get_redis_queue_settings.cache_clear()
+
+    monkeypatch.setattr(implementation, "Redis", RedisMock)
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(
+        implementation, "get_redis_queue_settings", get_redis_queue_settings_mock
+    )
+
+    async with RedisQueue() as redis_queue:
+        await redis_queue.dequeue()
+        messages = await redis_queue.dequeue_many(max_messages=5, wait=0)
+        calls = redis_queue._redis_client.xreadgroup_calls
+
+        assert messages == []
+        assert calls[0]["consumername"] == calls[1]["consumername"]
+        assert calls[1]["count"] == 5
+        # block=0 would block forever in Redis, so no wait means no block
+        assert calls[1]["block"] is None
+        # Kept pending until acknowledged, so a crash doesn't lose them
+        assert calls[1]["noack"] is False
+        [claim_call] = redis_queue._redis_client.xautoclaim_calls
+        assert claim_call["consumername"] == calls[1]["consumername"]
+        assert claim_call["min_idle_time"] == 300_000
+        assert claim_call["count"] == 5
+
+    async with RedisQueue() as other_queue:
+        await other_queue.dequeue()
+
+        assert (
+            other_queue._redis_client.xreadgroup_calls[0]["consumername"]
+            == calls[0]["consumername"]
+        )
+
+
+@pytest.mark.asyncio
+async def test_redis_dequeue_many_claims_stale_messages(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    get_redis_queue_settings.cache_clear()
+
+    monkeypatch.setattr(implementation, "Redis", RedisClaimStaleMessageMock)
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(
+        implementation, "get_redis_queue_settings", get_redis_queue_settings_mock
+    )
+
+    async with RedisQueue() as redis_queue:
+        messages = await redis_queue.dequeue_many(max_messages=10, wait=5)
+
+        assert messages == [(b"stale-message", "stale-msg-id")]
+        assert redis_queue._redis_client.xreadgroup_calls == []
+
+
+@pytest.mark.asyncio
+async def test_redis_acknowledge_many(monkeypatch: pytest.MonkeyPatch):
+    get_redis_queue_settings.cache_clear()
+
+    monkeypatch.setattr(implementation, "Redis", RedisMock)
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(
+        implementation, "get_redis_queue_settings", get_redis_queue_settings_mock
+    )
+
+    async with RedisQueue() as redis_queue:
+        await redis_queue.acknowledge_many(ack_tokens=[])
+        await redis_queue.acknowledge_many(ack_tokens=["id-1", "id-2"])
+
+        assert redis_queue._redis_client.xack_calls == [("id-1", "id-2")]
@@ -0,0 +1,61 @@
+import asyncio
+import os
+import signal
+
+import pytest
+
+from dos_utility.queue import (
+    install_stop_handlers,
+    remove_stop_handlers,
+    dequeue_many_or_stop,
+)
+
+from test.queue.mocks import MockLongPollQueue, MockMessagesQueue
+
+
+@pytest.mark.asyncio
+async def test_stop_handlers_set_the_stop_event_on_sigterm():
+    stop = asyncio.Event()
+    install_stop_handlers(stop)
+
+    try:
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.wait_for(stop.wait(), timeout=1)
+    finally:
+        remove_stop_handlers()
+
+    assert stop.is_set()
+
+
+@pytest.mark.asyncio
+async def test_remove_stop_handlers_restores_the_default_handlers():
+    stop = asyncio.Event()
+    install_stop_handlers(stop)
+    remove_stop_handlers()
+
+    assert signal.getsignal(signal.SIGINT) is signal.default_int_handler
+
+
+@pytest.mark.asyncio
+async def test_dequeue_many_or_stop_returns_the_messages():
+    messages = await dequeue_many_or_stop(
+        queue_client=MockMessagesQueue(), stop=asyncio.Event(), max_messages=2
+    )
+
+    assert messages == [(b"body", "ack-0"), (b"body", "ack-1")]
+
+
+@pytest.mark.asyncio
+async def test_dequeue_many_or_stop_interrupts_the_long_poll():
+    queue_client = MockLongPollQueue()
+    stop = asyncio.Event()
+    asyncio.get_running_loop().call_later(0.01, stop.set)
+
+    messages = await asyncio.wait_for(
+        dequeue_many_or_stop(queue_client=queue_client, stop=stop, wait=20),
+        timeout=1,
+    )
+    await asyncio.sleep(0)
+
+    assert messages == []
+    assert queue_client.cancelled
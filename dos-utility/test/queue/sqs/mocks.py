@@ -1,9 +1,10 @@
-from typing import Self, Any, Dict
+from typing import Self, Any, Dict, List
 
 
 class Boto3ClientMock:
     def __init__(self: Self, *args, **kwargs) -> None:
-        pass
+        self.receive_calls: List[Dict[str, Any]] = []
+        self.batch_calls: List[List[Dict[str, str]]] = []
 
     def get_queue_url(self: Self, QueueName: str) -> Dict[str, str]:
         return {"QueueUrl": "http://mocked-queue-url"}
@@ -17,14 +18,53 @@ class Boto3ClientMock:
     ) -> Dict[str, str]:
         return {"MessageId": "mocked-message-id"}
 
+    def send_message_batch(
+        self: Self, QueueUrl: str, Entries: List[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        self.batch_calls.append(Entries)
+
+        # SQS doesn't guarantee the order of the successful entries
+        return {
+            "Successful": [
+                {"Id": x["Id"], "MessageId": f"id-{len(self.batch_calls)}-{x['Id']}"}
+                for x in reversed(Entries)
+            ]
+        }
+
     def receive_message(
         self: Self, QueueUrl: str, MaxNumberOfMessages: int, WaitTimeSeconds: int
     ) -> Dict[str, Any]:
+        self.receive_calls.append(
+            {
+                "MaxNumberOfMessages": MaxNumberOfMessages,
+                "WaitTimeSeconds": WaitTimeSeconds,
+            }
+        )
+
         return {"Messages": []}
 
     def delete_message(self: Self, QueueUrl: str, ReceiptHandle: str) -> None:
         return None
 
+    def delete_message_batch(
+        self: Self, QueueUrl: str, Entries: List[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        self.batch_calls.append(Entries)
+
+        return {"Successful": [{"Id": x["Id"]} for x in Entries]}
+
+
+class Boto3ClientBatchFailureMock(Boto3ClientMock):
+    def send_message_batch(
+        self: Self, QueueUrl: str, Entries: List[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        return {"Successful": [], "Failed": [{"Id": "0", "Code": "Throttled"}]}
+
+    def delete_message_batch(
+        self: Self, QueueUrl: str, Entries: List[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        return {"Successful": [], "Failed": [{"Id": "0", "Code": "Throttled"}]}
+
 
 class Boto3ClientUnhealthyMock(Boto3ClientMock):
     def get_queue_url(self: Self, QueueName: str) -> Dict[str, str]:
@@ -49,6 +89,10 @@ def boto3_client_mock(*args, **kwargs) -> Boto3ClientMock:
     return Boto3ClientMock()
 
 
+def boto3_client_batch_failure_mock(*args, **kwargs) -> Boto3ClientBatchFailureMock:
+    return Boto3ClientBatchFailureMock()
+
+
 def boto3_client_unhealthy_mock(*args, **kwargs) -> Boto3ClientUnhealthyMock:
     return Boto3ClientUnhealthyMock()
 
@@ -1,11 +1,13 @@
 import pytest
 
+from dos_utility.queue import BatchEnqueueException, BatchAcknowledgeException
 from dos_utility.queue.sqs import implementation, SQSQueue, get_sqs_queue
 from dos_utility.queue.sqs.env import get_sqs_queue_settings
 from dos_utility.utils.aws import get_aws_credentials_settings
 
 from test.queue.sqs.mocks import (
     boto3_client_mock,
+    boto3_client_batch_failure_mock,
     boto3_client_unhealthy_mock,
     boto3_client_new_message_dequeue_mock,
     get_sqs_queue_settings_mock,
@@ -196,3 +198,83 @@ def test_get_sqs_queue(monkeypatch: pytest.MonkeyPatch):
     sqs_queue: SQSQueue = get_sqs_queue()
 
     assert isinstance(sqs_queue, SQSQueue)
+
+
+def _patch_sqs(monkeypatch: pytest.MonkeyPatch, client_mock) -> None:
+    get_sqs_queue_settings.cache_clear()
+    get_aws_credentials_settings.cache_clear()
+
+    monkeypatch.setattr(implementation.boto3, "client", client_mock)
+    monkeypatch.setattr(
+        implementation, "get_sqs_queue_settings", get_sqs_queue_settings_mock
+    )
+    monkeypatch.setattr(
+        implementation,
+        "get_aws_credentials_settings",
+        get_aws_credentials_settings_mock,
+    )
+
+
+@pytest.mark.asyncio
+async def test_sqs_enqueue_many(monkeypatch: pytest.MonkeyPatch):
+    _patch_sqs(monkeypatch, boto3_client_mock)
+
+    async with SQSQueue() as sqs_queue:
+        msg_ids = await sqs_queue.enqueue_many(msgs=[b"msg"] * 12)
+
+        # Split in batches of 10 and returned in request order
+        assert [len(x) for x in sqs_queue._client.batch_calls] == [10, 2]
+        assert msg_ids[:2] == ["id-1-0", "id-1-1"]
+        assert msg_ids[10:] == ["id-2-0", "id-2-1"]
+
+
+@pytest.mark.asyncio
+async def test_sqs_enqueue_many_failure(monkeypatch: pytest.MonkeyPatch):
+    _patch_sqs(monkeypatch, boto3_client_batch_failure_mock)
+
+    async with SQSQueue() as sqs_queue:
+        with pytest.raises(BatchEnqueueException):
+            await sqs_queue.enqueue_many(msgs=[b"msg"])
+
+
+@pytest.mark.asyncio
+async def test_sqs_dequeue_many(monkeypatch: pytest.MonkeyPatch):
+    _patch_sqs(monkeypatch, boto3_client_new_message_dequeue_mock)
+
+    async with SQSQueue() as sqs_queue:
+        messages = await sqs_queue.dequeue_many(max_messages=50, wait=60)
+
+        assert messages == [(b"test-message", "mocked-receipt-handle")]
+
+
+@pytest.mark.asyncio
+async def test_sqs_dequeue_many_caps_to_sqs_limits(monkeypatch: pytest.MonkeyPatch):
+    _patch_sqs(monkeypatch, boto3_client_mock)
+
+    async with SQSQueue() as sqs_queue:
+        messages = await sqs_queue.dequeue_many(max_messages=50, wait=60)
+
+        assert messages == []
+        assert sqs_queue._client.receive_calls == [
+            {"MaxNumberOfMessages": 10, "WaitTimeSeconds": 20}
+        ]
+
+
+@pytest.mark.asyncio
+async def test_sqs_acknowledge_many(monkeypatch: pytest.MonkeyPatch):
+    _patch_sqs(monkeypatch, boto3_client_mock)
+
+    async with SQSQueue() as sqs_queue:
+        await sqs_queue.acknowledge_many(ack_tokens=[f"handle-{i}" for i in range(11)])
+
+        assert [len(x) for x in sqs_queue._client.batch_calls] == [10, 1]
+        assert sqs_queue._client.batch_calls[1][0]["ReceiptHandle"] == "handle-10"
+
+
+@pytest.mark.asyncio
+async def test_sqs_acknowledge_many_failure(monkeypatch: pytest.MonkeyPatch):
+    _patch_sqs(monkeypatch, boto3_client_batch_failure_mock)
+
+    async with SQSQueue() as sqs_queue:
+        with pytest.raises(BatchAcknowledgeException):
+            await sqs_queue.acknowledge_many(ack_tokens=["handle"])
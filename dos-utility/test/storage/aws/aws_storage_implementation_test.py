@@ -117,6 +117,27 @@ def test_aws_s3_get_object(monkeypatch: pytest.MonkeyPatch):
     assert data is not None
 
 
+def test_aws_s3_download_object(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    get_aws_storage_settings.cache_clear()
+    get_aws_credentials_settings.cache_clear()
+
+    monkeypatch.setattr(
+        implementation, "get_aws_storage_settings", get_aws_storage_settings_mock
+    )
+    monkeypatch.setattr(
+        implementation,
+        "get_aws_credentials_settings",
+        get_aws_credentials_settings_mock,
+    )
+    monkeypatch.setattr(implementation.boto3, "client", aws_client_mock)
+
+    aws_s3: AWSS3 = AWSS3()
+    path = tmp_path / "test-object"
+    aws_s3.download_object(bucket="test-bucket", name="test-object", path=str(path))
+
+    assert path.read_bytes() == b"mocked data"
+
+
 def test_aws_s3_put_object(monkeypatch: pytest.MonkeyPatch):
     get_aws_storage_settings.cache_clear()
     get_aws_credentials_settings.cache_clear()
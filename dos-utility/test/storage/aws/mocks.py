@@ -10,6 +10,10 @@ class AWSClientMock:
     def get_object(self: Self, Bucket: str, Key: str) -> Dict:
         return {"Body": BytesIO(b"mocked data")}
 
+    def download_file(self: Self, Bucket: str, Key: str, Filename: str) -> None:
+        with open(Filename, "wb") as file:
+            file.write(b"mocked data")
+
     def put_object(
         self: Self, Bucket: str, Key: str, Body: BytesIO, ContentType: str
     ) -> None:
@@ -68,6 +68,21 @@ def test_minio_get_object(monkeypatch: pytest.MonkeyPatch):
     assert data is not None
 
 
+def test_minio_download_object(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    get_minio_storage_settings.cache_clear()
+
+    monkeypatch.setattr(
+        implementation, "get_minio_storage_settings", get_minio_storage_settings_mock
+    )
+    monkeypatch.setattr(implementation, "Minio", MinioMock)
+
+    minio: MinIO = MinIO()
+    path = tmp_path / "test-object"
+    minio.download_object(bucket="test-bucket", name="test-object", path=str(path))
+
+    assert path.read_bytes() == b"mocked data"
+
+
 def test_minio_put_object(monkeypatch: pytest.MonkeyPatch):
     get_minio_storage_settings.cache_clear()
 
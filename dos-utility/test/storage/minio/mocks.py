@@ -28,6 +28,10 @@ class MinioMock:
     def get_object(self: Self, bucket_name: str, object_name: str) -> HTTPResponseMock:
         return HTTPResponseMock(b"mocked data")
 
+    def fget_object(self: Self, bucket_name: str, object_name: str, file_path: str):
+        with open(file_path, "wb") as file:
+            file.write(b"mocked data")
+
     def put_object(
         self: Self,
         bucket_name: str,
@@ -5,6 +5,7 @@ from dos_utility.storage import StorageInterface, get_storage
 from dos_utility.storage.env import get_storage_settings
 
 from test.storage.mocks import (
+    StorageMock,
     get_aws_s3_storage_mock,
     get_minio_storage_mock,
     get_storage_settings_aws_mock,
@@ -34,3 +35,14 @@ def test_get_storage_minio(monkeypatch: pytest.MonkeyPatch) -> None:
     storage_interface: StorageInterface = get_storage()
 
     assert isinstance(storage_interface, StorageInterface)
+
+
+def test_storage_download_object_falls_back_to_get_object(tmp_path) -> None:
+    class _StorageMock(StorageMock):
+        def get_object(self, bucket: str, name: str) -> bytes:
+            return b"mocked data"
+
+    path = tmp_path / "test-object"
+    _StorageMock().download_object(bucket="bucket", name="name", path=str(path))
+
+    assert path.read_bytes() == b"mocked data"
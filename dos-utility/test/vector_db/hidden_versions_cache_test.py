@@ -0,0 +1,98 @@
+import time
+import pytest
+
+from typing import List
+
+from dos_utility.vector_db import hidden_versions
+from dos_utility.vector_db.hidden_versions import HiddenVersionsCache
+
+from test.vector_db.mocks import (
+    get_hidden_versions_cache_settings_mock,
+    get_hidden_versions_cache_settings_short_mock,
+    get_hidden_versions_cache_settings_disabled_mock,
+)
+
+
+class _LoaderMock:
+    def __init__(self):
+        self.calls: int = 0
+        self.hidden: List[str] = ["v1"]
+
+    async def __call__(self) -> List[str]:
+        self.calls += 1
+        return list(self.hidden)
+
+
+@pytest.mark.asyncio
+async def test_hidden_versions_served_from_memory(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        hidden_versions,
+        "get_hidden_versions_cache_settings",
+        get_hidden_versions_cache_settings_mock,
+    )
+    load = _LoaderMock()
+    cache = HiddenVersionsCache()
+
+    for _ in range(3):
+        assert await cache.get(index_name="index1", load=load) == ["v1"]
+
+    assert load.calls == 1
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_hidden_versions_invalidate(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        hidden_versions,
+        "get_hidden_versions_cache_settings",
+        get_hidden_versions_cache_settings_mock,
+    )
+    load = _LoaderMock()
+    cache = HiddenVersionsCache()
+
+    await cache.get(index_name="index1", load=load)
+    load.hidden = ["v1", "v2"]
+    cache.invalidate(index_name="index1")
+
+    assert await cache.get(index_name="index1", load=load) == ["v1", "v2"]
+    assert load.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_hidden_versions_disabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        hidden_versions,
+        "get_hidden_versions_cache_settings",
+        get_hidden_versions_cache_settings_disabled_mock,
+    )
+    load = _LoaderMock()
+    cache = HiddenVersionsCache()
+
+    await cache.get(index_name="index1", load=load)
+    await cache.get(index_name="index1", load=load)
+    started: float = time.monotonic()
+    await cache.settle()
+
+    assert load.calls == 2
+    assert time.monotonic() - started < 0.05
+
+
+@pytest.mark.asyncio
+async def test_hidden_versions_settle_outlives_the_cached_copies(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        hidden_versions,
+        "get_hidden_versions_cache_settings",
+        get_hidden_versions_cache_settings_short_mock,
+    )
+    load = _LoaderMock()
+    cache = HiddenVersionsCache()
+
+    await cache.get(index_name="index1", load=load)
+    # Another process changed the versions, without invalidating this cache
+    load.hidden = ["v1", "v2"]
+    await cache.settle()
+
+    assert await cache.get(index_name="index1", load=load) == ["v1", "v2"]
+    assert load.calls == 2
@@ -0,0 +1,151 @@
+import pytest
+
+from dos_utility.vector_db import catalog
+from dos_utility.vector_db.catalog import IndexCatalog, get_index_catalog
+
+from test.vector_db.mocks import (
+    CountingVectorDBMock,
+    SharedRedisMock,
+    FailingRedisMock,
+    get_index_catalog_settings_mock,
+    get_index_catalog_settings_shared_mock,
+    get_index_catalog_settings_disabled_mock,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_store():
+    SharedRedisMock.store.clear()
+    yield
+    SharedRedisMock.store.clear()
+
+
+@pytest.mark.asyncio
+async def test_index_catalog_exists_served_from_memory(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        catalog, "get_index_catalog_settings", get_index_catalog_settings_mock
+    )
+    vdb = CountingVectorDBMock()
+    index_catalog = IndexCatalog()
+
+    assert await index_catalog.exists(vdb=vdb, index_name="index1") is True
+    assert await index_catalog.exists(vdb=vdb, index_name="index1") is True
+    assert await index_catalog.exists(vdb=vdb, index_name="index1") is True
+
+    assert vdb._get_indexes_calls == 1
+    assert index_catalog.stats() == {
+        "hits": 2,
+        "shared_hits": 0,
+        "misses": 1,
+        "hit_rate": 2 / 3,
+    }
+
+
+@pytest.mark.asyncio
+async def test_index_catalog_missing_index_is_looked_up_again(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        catalog, "get_index_catalog_settings", get_index_catalog_settings_mock
+    )
+    vdb = CountingVectorDBMock()
+    index_catalog = IndexCatalog()
+
+    assert await index_catalog.exists(vdb=vdb, index_name="index2") is False
+
+    # Created by another process: the cached list is stale but not trusted
+    vdb._indexes.append("index2")
+
+    assert await index_catalog.exists(vdb=vdb, index_name="index2") is True
+    assert vdb._get_indexes_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_index_catalog_expires(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        catalog, "get_index_catalog_settings", get_index_catalog_settings_mock
+    )
+    vdb = CountingVectorDBMock()
+    index_catalog = IndexCatalog()
+    now = catalog.time.monotonic()
+
+    await index_catalog.get_indexes(vdb=vdb)
+    monkeypatch.setattr(catalog.time, "monotonic", lambda: now + 31)
+    await index_catalog.get_indexes(vdb=vdb)
+
+    assert vdb._get_indexes_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_index_catalog_invalidate(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        catalog, "get_index_catalog_settings", get_index_catalog_settings_mock
+    )
+    vdb = CountingVectorDBMock()
+    index_catalog = IndexCatalog()
+
+    await index_catalog.get_indexes(vdb=vdb)
+    await index_catalog.invalidate()
+    await index_catalog.get_indexes(vdb=vdb)
+
+    assert vdb._get_indexes_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_index_catalog_disabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        catalog, "get_index_catalog_settings", get_index_catalog_settings_disabled_mock
+    )
+    vdb = CountingVectorDBMock()
+    index_catalog = IndexCatalog()
+
+    await index_catalog.get_indexes(vdb=vdb)
+    await index_catalog.get_indexes(vdb=vdb)
+
+    assert vdb._get_indexes_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_index_catalog_shared_across_processes(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        catalog, "get_index_catalog_settings", get_index_catalog_settings_shared_mock
+    )
+    monkeypatch.setattr(catalog, "get_redis_connection_pool", lambda **kwargs: None)
+    monkeypatch.setattr(catalog, "Redis", SharedRedisMock)
+    vdb = CountingVectorDBMock()
+
+    # Two catalogs stand for two processes sharing the same Redis key
+    first, second = IndexCatalog(), IndexCatalog()
+
+    assert await first.exists(vdb=vdb, index_name="index1") is True
+    assert await second.exists(vdb=vdb, index_name="index1") is True
+
+    assert vdb._get_indexes_calls == 1
+    assert second.stats()["shared_hits"] == 1
+
+    await first.invalidate()
+
+    assert SharedRedisMock.store == {}
+
+
+@pytest.mark.asyncio
+async def test_index_catalog_shared_redis_failure(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        catalog, "get_index_catalog_settings", get_index_catalog_settings_shared_mock
+    )
+    monkeypatch.setattr(catalog, "get_redis_connection_pool", lambda **kwargs: None)
+    monkeypatch.setattr(catalog, "Redis", FailingRedisMock)
+    vdb = CountingVectorDBMock()
+    index_catalog = IndexCatalog()
+
+    assert await index_catalog.exists(vdb=vdb, index_name="index1") is True
+
+    await index_catalog.invalidate()
+
+    assert vdb._get_indexes_calls == 1
+
+
+def test_get_index_catalog_is_process_wide():
+    assert get_index_catalog() is get_index_catalog()
@@ -1,7 +1,11 @@
 from dataclasses import dataclass
-from typing import Self, List, Optional, Any
+from typing import Self, Dict, List, Optional, Any
 from dos_utility.vector_db.interface import VectorDBInterface, ObjectData, SearchResult
-from dos_utility.vector_db.env import VectorDBProvider
+from dos_utility.vector_db.env import (
+    VectorDBProvider,
+    IndexCatalogSettings,
+    HiddenVersionsCacheSettings,
+)
 from llama_index.core.vector_stores.types import (
     VectorStoreQuery,
     VectorStoreQueryResult,
@@ -59,6 +63,37 @@ class VectorDBMock(VectorDBInterface):
     async def delete_objects(self: Self, index_name: str, ids: List[str]) -> None:
         pass
 
+    async def delete_by_filter(
+        self: Self, index_name: str, filters: MetadataFilters
+    ) -> int:
+        return 0
+
+    async def stage_version(
+        self: Self, index_name: str, filename: str, version: str
+    ) -> None:
+        pass
+
+    async def activate_version(
+        self: Self, index_name: str, filename: str, version: str
+    ) -> Optional[str]:
+        return None
+
+    async def release_versions(
+        self: Self, index_name: str, filename: str, versions: List[str]
+    ) -> None:
+        pass
+
+    async def delete_versions(self: Self, index_name: str, filename: str) -> None:
+        pass
+
+    async def get_hidden_versions(
+        self: Self, index_name: str, filename: str
+    ) -> Dict[str, Optional[float]]:
+        return {}
+
+    async def get_revision(self: Self, index_name: str) -> Optional[str]:
+        return None
+
     async def semantic_search(
         self: Self,
         index_name: str,
@@ -77,6 +112,14 @@ class VectorDBMock(VectorDBInterface):
     ) -> List[SearchResult]:
         return []
 
+    async def get_objects(
+        self: Self,
+        index_name: str,
+        filters: MetadataFilters,
+        max_results: int,
+    ) -> List[ObjectData]:
+        return []
+
     async def aquery(
         self: Self, query: VectorStoreQuery, **kwargs: Any
     ) -> VectorStoreQueryResult:
@@ -97,3 +140,73 @@ def get_qdrant_vector_db_mock(index_name=None) -> VectorDBInterface:
 
 def get_redis_vector_db_mock(index_name=None) -> VectorDBInterface:
     return RedisVectorDBMock()
+
+
+class CountingVectorDBMock(VectorDBMock):
+    """Serves a mutable list of indexes and counts how many times it is listed."""
+
+    def model_post_init(self: Self, __context: Any) -> None:
+        self._indexes: List[str] = ["index1"]
+        self._get_indexes_calls: int = 0
+
+    async def get_indexes(self: Self) -> List[str]:
+        self._get_indexes_calls += 1
+        return list(self._indexes)
+
+
+class SharedRedisMock:
+    """In-memory stand-in for the Redis client, shared by every instance."""
+
+    store: Dict[str, str] = {}
+
+    def __init__(self: Self, *args, **kwargs):
+        pass
+
+    async def get(self: Self, name: str) -> Optional[str]:
+        return self.store.get(name)
+
+    async def set(self: Self, name: str, value: str, px: int) -> None:
+        self.store[name] = value
+
+    async def delete(self: Self, name: str) -> None:
+        self.store.pop(name, None)
+
+
+class FailingRedisMock:
+    def __init__(self: Self, *args, **kwargs):
+        pass
+
+    async def get(self: Self, name: str) -> Optional[str]:
+        raise Exception("Mocked exception")
+
+    async def set(self: Self, name: str, value: str, px: int) -> None:
+        raise Exception("Mocked exception")
+
+    async def delete(self: Self, name: str) -> None:
+        raise Exception("Mocked exception")
+
+
+def get_index_catalog_settings_mock() -> IndexCatalogSettings:
+    return IndexCatalogSettings(VECTOR_DB_INDEX_CATALOG_TTL_SECONDS=30.0)
+
+
+def get_index_catalog_settings_shared_mock() -> IndexCatalogSettings:
+    return IndexCatalogSettings(
+        VECTOR_DB_INDEX_CATALOG_TTL_SECONDS=30.0, VECTOR_DB_INDEX_CATALOG_SHARED=True
+    )
+
+
+def get_index_catalog_settings_disabled_mock() -> IndexCatalogSettings:
+    return IndexCatalogSettings(VECTOR_DB_INDEX_CATALOG_TTL_SECONDS=0.0)
+
+
+def get_hidden_versions_cache_settings_mock() -> HiddenVersionsCacheSettings:
+    return HiddenVersionsCacheSettings(VECTOR_DB_HIDDEN_VERSIONS_TTL_SECONDS=30.0)
+
+
+def get_hidden_versions_cache_settings_short_mock() -> HiddenVersionsCacheSettings:
+    return HiddenVersionsCacheSettings(VECTOR_DB_HIDDEN_VERSIONS_TTL_SECONDS=0.05)
+
+
+def get_hidden_versions_cache_settings_disabled_mock() -> HiddenVersionsCacheSettings:
+    return HiddenVersionsCacheSettings(VECTOR_DB_HIDDEN_VERSIONS_TTL_SECONDS=0.0)
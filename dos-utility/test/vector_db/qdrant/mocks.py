@@ -1,3 +1,4 @@
+from copy import deepcopy
 from dataclasses import dataclass, field
 from typing import Self, Dict, Any, List, Optional
 from qdrant_client.conversions.common_types import Points
@@ -8,6 +9,9 @@ from qdrant_client.http.models import (
     CollectionsResponse,
     QueryResponse,
     ScoredPoint,
+    CountResult,
+    IsEmptyCondition,
+    Filter,
 )
 
 
@@ -20,11 +24,20 @@ class _HealthStatusMock:
 class ScrollRecordMock:
     id: str
     payload: dict = field(default_factory=dict)
+    vector: dict = field(default_factory=dict)
 
 
 class QdrantVectorDBSettingsMock:
     QDRANT_HOST: str = "http://localhost:6333"
     QDRANT_PORT: str = "test_collection"
+    QDRANT_QUANTIZATION: str = "none"
+    QDRANT_QUANTIZATION_ALWAYS_RAM: bool = True
+    QDRANT_ON_DISK_VECTORS: bool = False
+    QDRANT_ON_DISK_PAYLOAD: bool = False
+    QDRANT_HNSW_M: int = 16
+    QDRANT_HNSW_EF_CONSTRUCT: int = 100
+    QDRANT_SEARCH_HNSW_EF: Optional[int] = None
+    QDRANT_SEARCH_OVERSAMPLING: Optional[float] = None
 
 
 def get_qdrant_vector_db_settings_mock() -> QdrantVectorDBSettingsMock:
@@ -45,13 +58,19 @@ class AsyncQdrantClientMock:
         return False
 
     async def create_collection(
-        self: Self, collection_name: str, vectors_config: Dict[str, Any]
+        self: Self, collection_name: str, vectors_config: Dict[str, Any], **kwargs
     ) -> bool:
         return True
 
     async def delete_collection(self: Self, collection_name: str) -> bool:
         return True
 
+    async def create_payload_index(self: Self, collection_name: str, **kwargs) -> None:
+        pass
+
+    async def count(self: Self, collection_name: str, **kwargs) -> CountResult:
+        return CountResult(count=2)
+
     async def get_collections(self: Self) -> CollectionsResponse:
         return CollectionsResponse(
             collections=[
@@ -61,7 +80,11 @@ class AsyncQdrantClientMock:
         )
 
     async def upsert(
-        self: Self, collection_name: str, points: Points, wait: bool
+        self: Self,
+        collection_name: str,
+        points: Points,
+        wait: bool,
+        update_filter: Optional[Filter] = None,
     ) -> UpdateResult:
         return UpdateResult(status=UpdateStatus.COMPLETED)
 
@@ -77,6 +100,7 @@ class AsyncQdrantClientMock:
         limit: int,
         using: str,
         query_filter=None,
+        search_params=None,
     ) -> QueryResponse:
         return QueryResponse(
             points=[
@@ -113,8 +137,16 @@ class AsyncQdrantClientMock:
             ]
         )
 
+    async def retrieve(self: Self, collection_name: str, ids: List[str], **kwargs):
+        return []
+
     async def scroll(
-        self: Self, collection_name: str, scroll_filter, limit: int, with_payload: bool
+        self: Self,
+        collection_name: str,
+        scroll_filter,
+        limit: int,
+        with_payload: bool,
+        offset=None,
     ):
         records = [
             ScrollRecordMock(
@@ -144,7 +176,7 @@ class AsyncQdrantClientCollectionAlreadyExistsMock(AsyncQdrantClientMock):
 
 class AsyncQdrantClientCreateCollectionFailedMock(AsyncQdrantClientMock):
     async def create_collection(
-        self: Self, collection_name: str, vectors_config: Dict[str, Any]
+        self: Self, collection_name: str, vectors_config: Dict[str, Any], **kwargs
     ) -> bool:
         return False
 
@@ -156,7 +188,11 @@ class AsyncQdrantClientDeleteCollectionFailedMock(AsyncQdrantClientMock):
 
 class AsyncQdrantClientPutObjectsFailedMock(AsyncQdrantClientMock):
     async def upsert(
-        self: Self, collection_name: str, points: Points, wait: bool
+        self: Self,
+        collection_name: str,
+        points: Points,
+        wait: bool,
+        update_filter: Optional[Filter] = None,
     ) -> UpdateResult:
         return UpdateResult(status=UpdateStatus.ACKNOWLEDGED)
 
@@ -176,3 +212,156 @@ class AsyncQdrantClientHealthUnhealthyMock(AsyncQdrantClientMock):
 class AsyncQdrantClientHealthExceptionMock(AsyncQdrantClientMock):
     async def health(self: Self) -> _HealthStatusMock:
         raise Exception("Connection refused")
+
+
+class AsyncQdrantClientRecordingMock(AsyncQdrantClientMock):
+    calls: List[tuple] = []
+
+    async def create_collection(
+        self: Self, collection_name: str, vectors_config: Dict[str, Any], **kwargs
+    ) -> bool:
+        AsyncQdrantClientRecordingMock.calls.append(
+            ("create_collection", dict(vectors_config=vectors_config, **kwargs))
+        )
+        return True
+
+    async def query_points(self: Self, *args, **kwargs) -> QueryResponse:
+        AsyncQdrantClientRecordingMock.calls.append(("query_points", kwargs))
+        return await super().query_points(*args, **kwargs)
+
+    async def create_payload_index(self: Self, collection_name: str, **kwargs) -> None:
+        AsyncQdrantClientRecordingMock.calls.append(("create_payload_index", kwargs))
+
+    async def delete(self: Self, collection_name: str, **kwargs) -> UpdateResult:
+        AsyncQdrantClientRecordingMock.calls.append(("delete", kwargs))
+        return UpdateResult(status=UpdateStatus.COMPLETED)
+
+
+class AsyncQdrantClientRecordingExistingCollectionMock(AsyncQdrantClientRecordingMock):
+    async def collection_exists(self: Self, collection_name: str) -> bool:
+        return True
+
+
+class AsyncQdrantClientNothingToDeleteMock(AsyncQdrantClientRecordingMock):
+    async def count(self: Self, collection_name: str, **kwargs) -> CountResult:
+        return CountResult(count=0)
+
+
+class AsyncQdrantClientVersionsMock(AsyncQdrantClientRecordingMock):
+    """Keeps the upserted version records, so they can be read back."""
+
+    records: Dict[str, dict] = {}
+
+    async def retrieve(self: Self, collection_name: str, ids: List[str], **kwargs):
+        return [
+            ScrollRecordMock(
+                id=i, payload=deepcopy(AsyncQdrantClientVersionsMock.records[i])
+            )
+            for i in ids
+            if i in AsyncQdrantClientVersionsMock.records
+        ]
+
+    async def upsert(
+        self: Self,
+        collection_name: str,
+        points: Points,
+        wait: bool,
+        update_filter: Optional[Filter] = None,
+    ) -> UpdateResult:
+        for point in points:
+            existing: Optional[dict] = AsyncQdrantClientVersionsMock.records.get(
+                point.id
+            )
+
+            # Conditional update: existing points not matching the filter are kept
+            if existing is not None and update_filter is not None:
+                [condition] = update_filter.must
+
+                if isinstance(condition, IsEmptyCondition):
+                    matches: bool = not existing.get(condition.is_empty.key)
+                else:
+                    matches = existing.get(condition.key) == condition.match.value
+
+                if not matches:
+                    continue
+
+            AsyncQdrantClientVersionsMock.records[point.id] = deepcopy(point.payload)
+        return UpdateResult(status=UpdateStatus.COMPLETED)
+
+    async def delete(self: Self, collection_name: str, **kwargs) -> UpdateResult:
+        if isinstance(kwargs["points_selector"], list):
+            for i in kwargs["points_selector"]:
+                AsyncQdrantClientVersionsMock.records.pop(i, None)
+
+        return await super().delete(collection_name=collection_name, **kwargs)
+
+    async def scroll(self: Self, collection_name: str, scroll_filter, **kwargs):
+        AsyncQdrantClientRecordingMock.calls.append(
+            ("scroll", dict(scroll_filter=scroll_filter, **kwargs))
+        )
+        condition = (scroll_filter.must_not or [None])[0]
+
+        if (
+            isinstance(condition, IsEmptyCondition)
+            and condition.is_empty.key == "hidden_versions"
+        ):
+            return [
+                ScrollRecordMock(id=i, payload=payload)
+                for i, payload in AsyncQdrantClientVersionsMock.records.items()
+                if payload.get("hidden_versions")
+            ], None
+        return [], None
+
+
+class AsyncQdrantClientVersionsConflictMock(AsyncQdrantClientVersionsMock):
+    """Another process updates the version record right before the first write."""
+
+    conflicts: int = 1
+
+    async def upsert(self: Self, collection_name: str, points: Points, **kwargs):
+        for point in points:
+            existing: Optional[dict] = AsyncQdrantClientVersionsMock.records.get(
+                point.id
+            )
+
+            if existing is not None and AsyncQdrantClientVersionsConflictMock.conflicts:
+                AsyncQdrantClientVersionsConflictMock.conflicts -= 1
+                existing["hidden_versions"].append("concurrent")
+                existing["record_revision"] = "concurrent-revision"
+
+        return await super().upsert(
+            collection_name=collection_name, points=points, **kwargs
+        )
+
+
+class AsyncQdrantClientGetObjectsMock(AsyncQdrantClientRecordingMock):
+    async def scroll(self: Self, collection_name: str, scroll_filter, **kwargs):
+        AsyncQdrantClientRecordingMock.calls.append(
+            ("scroll", dict(scroll_filter=scroll_filter, **kwargs))
+        )
+        return [
+            ScrollRecordMock(
+                id="obj1",
+                payload={
+                    "filename": "doc.pdf",
+                    "chunk_id": 0,
+                    "content": "chunk 0",
+                    "version": "v1",
+                    "document_hash": "doc-hash",
+                    "content_hash": "hash0",
+                },
+                vector={"vector": [0.1, 0.2]},
+            )
+        ], None
+
+
+class QdrantVectorDBTunedSettingsMock(QdrantVectorDBSettingsMock):
+    QDRANT_QUANTIZATION: str = "scalar"
+    QDRANT_ON_DISK_VECTORS: bool = True
+    QDRANT_HNSW_M: int = 32
+    QDRANT_SEARCH_HNSW_EF: Optional[int] = 128
+    QDRANT_SEARCH_OVERSAMPLING: Optional[float] = 2.0
+
+
+def get_qdrant_vector_db_tuned_settings_mock() -> QdrantVectorDBTunedSettingsMock:
+    return QdrantVectorDBTunedSettingsMock()
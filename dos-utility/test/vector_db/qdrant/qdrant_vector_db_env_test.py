@@ -15,3 +15,20 @@ def test_get_qdrant_vector_db_settings(monkeypatch: pytest.MonkeyPatch):
     settings: QdrantVectorDBSettings = get_qdrant_vector_db_settings()
 
     assert isinstance(settings, QdrantVectorDBSettings)
+
+
+def test_get_qdrant_vector_db_settings_tuning(monkeypatch: pytest.MonkeyPatch):
+    get_qdrant_vector_db_settings.cache_clear()
+
+    monkeypatch.setenv("QDRANT_QUANTIZATION", "binary")
+    monkeypatch.setenv("QDRANT_ON_DISK_VECTORS", "true")
+    monkeypatch.setenv("QDRANT_SEARCH_OVERSAMPLING", "3.0")
+
+    settings: QdrantVectorDBSettings = get_qdrant_vector_db_settings()
+
+    assert settings.QDRANT_QUANTIZATION == "binary"
+    assert settings.QDRANT_ON_DISK_VECTORS is True
+    assert settings.QDRANT_SEARCH_OVERSAMPLING == 3.0
+    assert settings.QDRANT_SEARCH_HNSW_EF is None
+
+    get_qdrant_vector_db_settings.cache_clear()
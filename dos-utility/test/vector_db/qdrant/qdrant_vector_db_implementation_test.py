@@ -1,16 +1,30 @@
 import pytest
 
 from typing import List
+from uuid import NAMESPACE_URL, uuid5
 
-from dos_utility.vector_db import ObjectData
+from dos_utility.vector_db import ObjectData, hidden_versions
+from dos_utility.vector_db.hidden_versions import HiddenVersionsCache
 from dos_utility.vector_db.qdrant import implementation
-from dos_utility.vector_db.qdrant import QdrantVectorDB, get_qdrant_vector_db
+from dos_utility.vector_db.qdrant import (
+    QdrantVectorDB,
+    QdrantIndexOptions,
+    get_qdrant_vector_db,
+)
 from dos_utility.vector_db.qdrant.env import get_qdrant_vector_db_settings
 from dos_utility.vector_db.exceptions import (
     IndexCreationException,
     IndexDeletionException,
     PutObjectsException,
     DeleteObjectsException,
+    VersionUpdateException,
+)
+from qdrant_client.models import (
+    FilterSelector,
+    BinaryQuantization,
+    ScalarQuantization,
+    SearchParams,
+    QuantizationSearchParams,
 )
 from llama_index.core.vector_stores.types import (
     VectorStoreQuery,
@@ -21,6 +35,10 @@ from llama_index.core.vector_stores.types import (
     FilterCondition,
 )
 
+from test.vector_db.mocks import (
+    get_hidden_versions_cache_settings_mock,
+    get_hidden_versions_cache_settings_disabled_mock,
+)
 from test.vector_db.qdrant.mocks import (
     get_qdrant_vector_db_settings_mock,
     AsyncQdrantClientMock,
@@ -31,9 +49,54 @@ from test.vector_db.qdrant.mocks import (
     AsyncQdrantClientDeleteObjectsFailedMock,
     AsyncQdrantClientHealthUnhealthyMock,
     AsyncQdrantClientHealthExceptionMock,
+    AsyncQdrantClientRecordingMock,
+    AsyncQdrantClientRecordingExistingCollectionMock,
+    AsyncQdrantClientNothingToDeleteMock,
+    AsyncQdrantClientVersionsMock,
+    AsyncQdrantClientVersionsConflictMock,
+    AsyncQdrantClientGetObjectsMock,
+    get_qdrant_vector_db_tuned_settings_mock,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_payload_index_cache():
+    implementation.clear_payload_index_cache()
+    yield
+    implementation.clear_payload_index_cache()
+
+
+@pytest.fixture(autouse=True)
+def hidden_versions_cache(monkeypatch: pytest.MonkeyPatch) -> HiddenVersionsCache:
+    # Disabled, so staging and activating versions don't wait for it
+    monkeypatch.setattr(
+        hidden_versions,
+        "get_hidden_versions_cache_settings",
+        get_hidden_versions_cache_settings_disabled_mock,
+    )
+    cache = HiddenVersionsCache()
+    monkeypatch.setattr(implementation, "get_hidden_versions_cache", lambda: cache)
+
+    return cache
+
+
+@pytest.fixture
+def recording_client(monkeypatch: pytest.MonkeyPatch):
+    get_qdrant_vector_db_settings.cache_clear()
+
+    monkeypatch.setattr(
+        implementation,
+        "get_qdrant_vector_db_settings",
+        get_qdrant_vector_db_settings_mock,
+    )
+    monkeypatch.setattr(
+        implementation, "AsyncQdrantClient", AsyncQdrantClientRecordingMock
+    )
+    monkeypatch.setattr(AsyncQdrantClientRecordingMock, "calls", [])
+
+    return AsyncQdrantClientRecordingMock
+
+
 def test_instantiate_qdrant_vector_db(monkeypatch: pytest.MonkeyPatch):
     get_qdrant_vector_db_settings.cache_clear()
 
@@ -918,3 +981,535 @@ async def test_delete_objects_empty_ids(monkeypatch: pytest.MonkeyPatch):
         await db.delete_objects(index_name="test_index", ids=[])
 
     assert True
+
+
+@pytest.mark.asyncio
+async def test_create_index_default_options(recording_client):
+    async with QdrantVectorDB() as db:
+        await db.create_index(index_name="test_index", vector_dim=128)
+
+    [kwargs] = [k for name, k in recording_client.calls if name == "create_collection"]
+
+    assert kwargs["vectors_config"]["vector"].on_disk is False
+    assert kwargs["hnsw_config"].m == 16
+    assert kwargs["quantization_config"] is None
+    assert kwargs["on_disk_payload"] is False
+
+
+@pytest.mark.asyncio
+async def test_create_index_options_from_env(
+    recording_client, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(
+        implementation,
+        "get_qdrant_vector_db_settings",
+        get_qdrant_vector_db_tuned_settings_mock,
+    )
+
+    async with QdrantVectorDB() as db:
+        await db.create_index(index_name="test_index", vector_dim=128)
+
+    [kwargs] = [k for name, k in recording_client.calls if name == "create_collection"]
+
+    assert kwargs["vectors_config"]["vector"].on_disk is True
+    assert kwargs["hnsw_config"].m == 32
+    assert isinstance(kwargs["quantization_config"], ScalarQuantization)
+    assert kwargs["quantization_config"].scalar.always_ram is True
+
+
+@pytest.mark.asyncio
+async def test_create_index_with_options(recording_client):
+    options = QdrantIndexOptions(
+        quantization="binary",
+        on_disk_vectors=True,
+        on_disk_payload=True,
+        hnsw_m=8,
+        hnsw_ef_construct=64,
+    )
+
+    async with QdrantVectorDB() as db:
+        await db.create_index(index_name="test_index", vector_dim=128, options=options)
+
+    [kwargs] = [k for name, k in recording_client.calls if name == "create_collection"]
+
+    assert isinstance(kwargs["quantization_config"], BinaryQuantization)
+    assert kwargs["hnsw_config"].m == 8
+    assert kwargs["hnsw_config"].ef_construct == 64
+    assert kwargs["on_disk_payload"] is True
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_params(
+    recording_client, monkeypatch: pytest.MonkeyPatch
+):
+    search_params = SearchParams(
+        hnsw_ef=32, quantization=QuantizationSearchParams(oversampling=1.5)
+    )
+
+    async with QdrantVectorDB() as db:
+        await db.semantic_search(
+            index_name="test_index",
+            embedding_query=[0.1] * 128,
+            max_results=5,
+            score_threshold=0.0,
+        )
+        await db.semantic_search(
+            index_name="test_index",
+            embedding_query=[0.1] * 128,
+            max_results=5,
+            score_threshold=0.0,
+            search_params=search_params,
+        )
+
+    monkeypatch.setattr(
+        implementation,
+        "get_qdrant_vector_db_settings",
+        get_qdrant_vector_db_tuned_settings_mock,
+    )
+
+    async with QdrantVectorDB() as db:
+        await db.semantic_search(
+            index_name="test_index",
+            embedding_query=[0.1] * 128,
+            max_results=5,
+            score_threshold=0.0,
+        )
+
+    default, explicit, from_env = [kwargs for _, kwargs in recording_client.calls]
+
+    assert default["search_params"] is None
+    assert explicit["search_params"] == search_params
+    assert from_env["search_params"].hnsw_ef == 128
+    assert from_env["search_params"].quantization.oversampling == 2.0
+    assert from_env["search_params"].quantization.rescore is True
+
+
+@pytest.mark.asyncio
+async def test_aquery_search_params_from_kwargs(recording_client):
+    async with QdrantVectorDB(index_name="test_index") as db:
+        await db.aquery(
+            VectorStoreQuery(query_embedding=[0.1] * 128, similarity_top_k=5),
+            search_params={"hnsw_ef": 64},
+        )
+
+    [(_, kwargs)] = recording_client.calls
+
+    assert kwargs["search_params"] == SearchParams(hnsw_ef=64)
+
+
+@pytest.mark.asyncio
+async def test_create_index_creates_payload_indexes(recording_client):
+    async with QdrantVectorDB() as db:
+        await db.create_index(
+            index_name="test_index",
+            vector_dim=128,
+            options=QdrantIndexOptions(on_disk_payload=True),
+        )
+
+    payload_indexes = {
+        kwargs["field_name"]: kwargs["field_schema"]
+        for name, kwargs in recording_client.calls
+        if name == "create_payload_index"
+    }
+
+    assert payload_indexes["filename"].type == "keyword"
+    assert payload_indexes["filename"].on_disk is True
+    assert payload_indexes["chunk_id"].type == "integer"
+    assert payload_indexes["chunk_id"].lookup is True
+    assert payload_indexes["version"].type == "keyword"
+    assert payload_indexes["hidden_versions"].type == "keyword"
+
+
+@pytest.mark.asyncio
+async def test_create_index_existing_collection_ensures_payload_indexes(
+    recording_client, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(
+        implementation,
+        "AsyncQdrantClient",
+        AsyncQdrantClientRecordingExistingCollectionMock,
+    )
+
+    async with QdrantVectorDB() as db:
+        await db.create_index(index_name="test_index", vector_dim=128)
+
+    assert [name for name, _ in recording_client.calls] == ["create_payload_index"] * 4
+
+
+@pytest.mark.asyncio
+async def test_stage_version_ensures_payload_indexes_once(versions_client):
+    async with QdrantVectorDB() as db:
+        for version in ["v1", "v2"]:
+            await db.stage_version(
+                index_name="test_index", filename="doc.pdf", version=version
+            )
+
+    payload_indexes = [
+        kwargs["field_name"]
+        for name, kwargs in versions_client.calls
+        if name == "create_payload_index"
+    ]
+
+    assert payload_indexes == ["filename", "chunk_id", "version", "hidden_versions"]
+
+
+@pytest.mark.asyncio
+async def test_delete_by_filter(recording_client):
+    filters = MetadataFilters(
+        filters=[MetadataFilter(key="filename", value="idx/doc.pdf")]
+    )
+
+    async with QdrantVectorDB() as db:
+        deleted: int = await db.delete_by_filter(
+            index_name="test_index", filters=filters
+        )
+
+    [(name, kwargs)] = recording_client.calls
+
+    assert deleted == 2
+    assert name == "delete"
+    assert isinstance(kwargs["points_selector"], FilterSelector)
+    assert kwargs["points_selector"].filter.must[0].key == "filename"
+
+
+@pytest.mark.asyncio
+async def test_delete_by_filter_nothing_to_delete(
+    recording_client, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(
+        implementation, "AsyncQdrantClient", AsyncQdrantClientNothingToDeleteMock
+    )
+
+    async with QdrantVectorDB() as db:
+        deleted: int = await db.delete_by_filter(
+            index_name="test_index",
+            filters=MetadataFilters(
+                filters=[MetadataFilter(key="filename", value="idx/doc.pdf")]
+            ),
+        )
+
+    assert deleted == 0
+    assert recording_client.calls == []
+
+
+@pytest.mark.asyncio
+async def test_delete_by_filter_empty_filters(recording_client):
+    async with QdrantVectorDB() as db:
+        with pytest.raises(
+            expected_exception=DeleteObjectsException, match="empty filter"
+        ):
+            await db.delete_by_filter(
+                index_name="test_index", filters=MetadataFilters(filters=[])
+            )
+
+    assert recording_client.calls == []
+
+
+@pytest.mark.asyncio
+async def test_delete_by_filter_failed(monkeypatch: pytest.MonkeyPatch):
+    get_qdrant_vector_db_settings.cache_clear()
+
+    monkeypatch.setattr(
+        implementation,
+        "get_qdrant_vector_db_settings",
+        get_qdrant_vector_db_settings_mock,
+    )
+    monkeypatch.setattr(
+        implementation, "AsyncQdrantClient", AsyncQdrantClientDeleteObjectsFailedMock
+    )
+
+    async with QdrantVectorDB() as db:
+        with pytest.raises(
+            expected_exception=DeleteObjectsException, match="did not complete"
+        ):
+            await db.delete_by_filter(
+                index_name="test_index",
+                filters=MetadataFilters(
+                    filters=[MetadataFilter(key="filename", value="idx/doc.pdf")]
+                ),
+            )
+
+
+@pytest.fixture
+def versions_client(recording_client, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        implementation, "AsyncQdrantClient", AsyncQdrantClientVersionsMock
+    )
+    monkeypatch.setattr(AsyncQdrantClientVersionsMock, "records", {})
+
+    return AsyncQdrantClientVersionsMock
+
+
+@pytest.mark.asyncio
+async def test_activate_version_hides_previous_version(versions_client):
+    async with QdrantVectorDB() as db:
+        await db.stage_version(
+            index_name="test_index", filename="doc.pdf", version="v1"
+        )
+        first: str | None = await db.activate_version(
+            index_name="test_index", filename="doc.pdf", version="v1"
+        )
+        await db.stage_version(
+            index_name="test_index", filename="doc.pdf", version="v2"
+        )
+        previous: str | None = await db.activate_version(
+            index_name="test_index", filename="doc.pdf", version="v2"
+        )
+        await db.semantic_search(
+            index_name="test_index",
+            embedding_query=[0.1] * 128,
+            max_results=5,
+            score_threshold=0.0,
+        )
+
+    [record] = [r for r in versions_client.records.values() if "versions_of" in r]
+    query_filter = [
+        kwargs for name, kwargs in versions_client.calls if name == "query_points"
+    ][0]["query_filter"]
+
+    assert first is None
+    assert previous == "v1"
+    assert record["active_version"] == "v2"
+    assert record["hidden_versions"] == ["v1"]
+    assert query_filter.must_not[0].key == "version"
+    assert query_filter.must_not[0].match.any == ["v1"]
+
+
+@pytest.mark.asyncio
+async def test_hidden_versions_are_cached_until_they_change(
+    versions_client, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(
+        hidden_versions,
+        "get_hidden_versions_cache_settings",
+        get_hidden_versions_cache_settings_mock,
+    )
+    cache = HiddenVersionsCache()
+    monkeypatch.setattr(implementation, "get_hidden_versions_cache", lambda: cache)
+    versions_client.records[str(uuid5(NAMESPACE_URL, "versions/doc.pdf"))] = {
+        "versions_of": "doc.pdf",
+        "active_version": "v2",
+        "hidden_versions": ["v1"],
+    }
+
+    async with QdrantVectorDB() as db:
+        for _ in range(3):
+            await db.semantic_search(
+                index_name="test_index",
+                embedding_query=[0.1] * 128,
+                max_results=5,
+                score_threshold=0.0,
+            )
+        await db.release_versions(
+            index_name="test_index", filename="doc.pdf", versions=["v1"]
+        )
+        await db.semantic_search(
+            index_name="test_index",
+            embedding_query=[0.1] * 128,
+            max_results=5,
+            score_threshold=0.0,
+        )
+
+    scrolls = [name for name, _ in versions_client.calls if name == "scroll"]
+    query_filters = [
+        kwargs["query_filter"]
+        for name, kwargs in versions_client.calls
+        if name == "query_points"
+    ]
+
+    # Read once, then again after the release dropped the cached copy
+    assert len(scrolls) == 2
+    assert query_filters[0].must_not[0].match.any == ["v1"]
+    assert query_filters[-1] is None
+
+
+@pytest.mark.asyncio
+async def test_revision_changes_with_the_contents(versions_client):
+    async with QdrantVectorDB() as db:
+        assert await db.get_revision(index_name="test_index") is None
+
+        await db.put_objects(
+            index_name="test_index",
+            data=[
+                ObjectData(
+                    filename="doc.pdf", chunk_id=0, content="chunk", vector=[0.1]
+                )
+            ],
+        )
+        first: str | None = await db.get_revision(index_name="test_index")
+
+        await db.activate_version(
+            index_name="test_index", filename="doc.pdf", version="v1"
+        )
+        second: str | None = await db.get_revision(index_name="test_index")
+
+        await db.stage_version(
+            index_name="test_index", filename="doc.pdf", version="v2"
+        )
+
+        assert first is not None
+        assert second not in (None, first)
+        # Staging a version doesn't change what searches return
+        assert await db.get_revision(index_name="test_index") == second
+
+
+@pytest.mark.asyncio
+async def test_release_versions_shows_every_version(versions_client):
+    async with QdrantVectorDB() as db:
+        await db.stage_version(
+            index_name="test_index", filename="doc.pdf", version="v1"
+        )
+        await db.release_versions(
+            index_name="test_index", filename="doc.pdf", versions=["v1"]
+        )
+        await db.filter_search(
+            index_name="test_index",
+            filters=MetadataFilters(
+                filters=[MetadataFilter(key="filename", value="doc.pdf")]
+            ),
+            max_results=5,
+        )
+
+    [record] = versions_client.records.values()
+    scroll_filter = [
+        kwargs for name, kwargs in versions_client.calls if name == "scroll"
+    ][-1]["scroll_filter"]
+
+    assert record["hidden_versions"] == []
+    assert scroll_filter.must[0].must[0].key == "filename"
+    assert scroll_filter.must_not[0].is_empty.key == "filename"
+
+
+@pytest.mark.asyncio
+async def test_stage_version_retries_concurrent_updates(
+    versions_client, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(
+        implementation, "AsyncQdrantClient", AsyncQdrantClientVersionsConflictMock
+    )
+    monkeypatch.setattr(AsyncQdrantClientVersionsConflictMock, "conflicts", 1)
+
+    async with QdrantVectorDB() as db:
+        await db.stage_version(
+            index_name="test_index", filename="doc.pdf", version="v1"
+        )
+        await db.stage_version(
+            index_name="test_index", filename="doc.pdf", version="v2"
+        )
+
+    [record] = versions_client.records.values()
+
+    # The update racing with the other process was retried on top of its write
+    assert record["hidden_versions"] == ["v1", "concurrent", "v2"]
+    assert record["staged_at"].keys() == {"v1", "v2"}
+
+
+@pytest.mark.asyncio
+async def test_get_hidden_versions(versions_client):
+    async with QdrantVectorDB() as db:
+        for version in ["v1", "v2"]:
+            await db.stage_version(
+                index_name="test_index", filename="doc.pdf", version=version
+            )
+            await db.activate_version(
+                index_name="test_index", filename="doc.pdf", version=version
+            )
+
+        await db.stage_version(
+            index_name="test_index", filename="doc.pdf", version="v3"
+        )
+        hidden = await db.get_hidden_versions(
+            index_name="test_index", filename="doc.pdf"
+        )
+
+    assert hidden.keys() == {"v1", "v3"}
+    # v1 was superseded by v2, v3 is still being ingested
+    assert hidden["v1"] is None
+    assert isinstance(hidden["v3"], float)
+
+
+@pytest.mark.asyncio
+async def test_delete_versions_shows_no_version_of_the_file(versions_client):
+    async with QdrantVectorDB() as db:
+        for version in ["v1", "v2"]:
+            await db.stage_version(
+                index_name="test_index", filename="doc.pdf", version=version
+            )
+            await db.activate_version(
+                index_name="test_index", filename="doc.pdf", version=version
+            )
+
+        await db.delete_versions(index_name="test_index", filename="doc.pdf")
+        await db.filter_search(
+            index_name="test_index",
+            filters=MetadataFilters(
+                filters=[MetadataFilter(key="filename", value="doc.pdf")]
+            ),
+            max_results=5,
+        )
+        hidden = await db.get_hidden_versions(
+            index_name="test_index", filename="doc.pdf"
+        )
+
+    scroll_filter = [
+        kwargs for name, kwargs in versions_client.calls if name == "scroll"
+    ][-1]["scroll_filter"]
+
+    assert str(uuid5(NAMESPACE_URL, "versions/doc.pdf")) not in versions_client.records
+    assert hidden == {}
+    # The superseded v1 is no longer excluded from the searches
+    assert scroll_filter.must_not[0].is_empty.key == "filename"
+
+
+@pytest.mark.asyncio
+async def test_stage_version_failed(monkeypatch: pytest.MonkeyPatch):
+    get_qdrant_vector_db_settings.cache_clear()
+
+    monkeypatch.setattr(
+        implementation,
+        "get_qdrant_vector_db_settings",
+        get_qdrant_vector_db_settings_mock,
+    )
+    monkeypatch.setattr(
+        implementation, "AsyncQdrantClient", AsyncQdrantClientPutObjectsFailedMock
+    )
+
+    async with QdrantVectorDB() as db:
+        with pytest.raises(
+            expected_exception=VersionUpdateException, match="did not complete"
+        ):
+            await db.stage_version(
+                index_name="test_index", filename="doc.pdf", version="v1"
+            )
+
+
+@pytest.mark.asyncio
+async def test_get_objects(recording_client, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        implementation, "AsyncQdrantClient", AsyncQdrantClientGetObjectsMock
+    )
+
+    async with QdrantVectorDB() as db:
+        objects: List[ObjectData] = await db.get_objects(
+            index_name="test_index",
+            filters=MetadataFilters(
+                filters=[MetadataFilter(key="filename", value="doc.pdf")]
+            ),
+            max_results=10,
+        )
+
+    scroll_kwargs = [kwargs for name, kwargs in recording_client.calls][-1]
+
+    assert objects == [
+        ObjectData(
+            filename="doc.pdf",
+            chunk_id=0,
+            content="chunk 0",
+            vector=[0.1, 0.2],
+            version="v1",
+            document_hash="doc-hash",
+            content_hash="hash0",
+        )
+    ]
+    assert scroll_kwargs["with_vectors"] == ["vector"]
+    assert scroll_kwargs["scroll_filter"].must_not[0].is_empty.key == "filename"
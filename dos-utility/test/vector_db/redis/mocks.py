@@ -1,3 +1,5 @@
+import json
+
 from typing import Self, List
 from redisvl.exceptions import RedisSearchError
 
@@ -7,14 +9,100 @@ class _IndexInfoMock:
         self.prefix = ""
 
 
+class _VectorAttrsMock:
+    def __init__(self: Self):
+        self.dims = 128
+
+
+class _VectorFieldMock:
+    def __init__(self: Self):
+        self.attrs = _VectorAttrsMock()
+
+
 class _SchemaMock:
     def __init__(self: Self):
         self.index = _IndexInfoMock()
+        self.fields = {"vector": _VectorFieldMock()}
+
+
+class _SearchMock:
+    def __init__(self: Self, client: "RedisClientMock", name: str):
+        self._client = client
+        self._name = name
+
+    async def info(self: Self) -> dict:
+        # Rebuilt indexes report their backfill as still running on the first poll
+        polls: int = self._client.info_calls.get(self._name, 0)
+        self._client.info_calls[self._name] = polls + 1
+
+        return {
+            "index_name": self._client.aliases.get(self._name, self._name),
+            "indexing": "1" if ":v" in self._name and polls == 0 else "0",
+            "percent_indexed": "0.5" if ":v" in self._name and polls == 0 else "1",
+        }
+
+
+class _PipelineMock:
+    def __init__(self: Self, client: "RedisClientMock"):
+        self._client = client
+        self.commands: List[tuple] = []
+
+    async def __aenter__(self: Self) -> Self:
+        return self
+
+    async def __aexit__(self: Self, *args) -> None:
+        pass
+
+    def execute_command(self: Self, *args) -> None:
+        self.commands.append(args)
+
+    def set(self: Self, key: str, value: str) -> None:
+        self.commands.append(("SET", key, value))
+
+    def unlink(self: Self, *keys: bytes) -> None:
+        self.commands.append(("UNLINK", *keys))
+
+    def sadd(self: Self, key: str, *values: str) -> None:
+        self.commands.append(("SADD", key, *values))
+
+    def srem(self: Self, key: str, *values: str) -> None:
+        self.commands.append(("SREM", key, *values))
+
+    def hset(self: Self, key: str, field: str, value: str) -> None:
+        self.commands.append(("HSET", key, field, value))
+
+    def hdel(self: Self, key: str, *fields: str) -> None:
+        self.commands.append(("HDEL", key, *fields))
+
+    async def execute(self: Self) -> list:
+        self._client.transactions.append(self.commands)
+        results: list = []
+
+        for command in self.commands:
+            if command[0] in ("FT.ALIASADD", "FT.ALIASUPDATE"):
+                self._client.aliases[command[1]] = command[2]
+                results.append(True)
+            elif command[0] == "SET":
+                self._client.store[command[1]] = command[2].encode("utf-8")
+                results.append(True)
+            elif command[0] in ("SADD", "SREM", "HSET", "HDEL"):
+                method = getattr(self._client, command[0].lower())
+                results.append(await method(*command[1:]))
+            else:
+                results.append(await self._client.execute_command(*command))
+
+        return results
 
 
 class RedisClientMock:
     def __init__(self: Self, *args, **kwargs):
-        pass
+        self.store: dict = {}
+        self.aliases: dict = {}
+        self.info_calls: dict = {}
+        self.transactions: List[list] = []
+        self.sets: dict = {}
+        self.hashes: dict = {}
+        self.commands: List[tuple] = []
 
     async def aclose(self: Self):
         pass
@@ -23,9 +111,76 @@ class RedisClientMock:
         return True
 
     async def execute_command(self: Self, *args, **kwargs) -> List[bytes]:
+        self.commands.append(args)
+
         if args[0] == "FT._LIST":
             return [b"index1", b"index2"]
 
+    async def get(self: Self, key: str) -> bytes | None:
+        return self.store.get(key)
+
+    async def set(self: Self, key: str, value: str) -> bool:
+        self.store[key] = value.encode("utf-8")
+        return True
+
+    async def delete(self: Self, *keys: str) -> int:
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    async def sadd(self: Self, key: str, *values: str) -> int:
+        self.sets.setdefault(key, set()).update(v.encode("utf-8") for v in values)
+        return len(values)
+
+    async def srem(self: Self, key: str, *values: str) -> int:
+        self.sets.setdefault(key, set()).difference_update(
+            v.encode("utf-8") for v in values
+        )
+        return len(values)
+
+    async def smembers(self: Self, key: str) -> set:
+        return set(self.sets.get(key, set()))
+
+    async def hset(self: Self, key: str, field: str, value: str) -> int:
+        self.hashes.setdefault(key, {})[field.encode("utf-8")] = value.encode("utf-8")
+        return 1
+
+    async def hdel(self: Self, key: str, *fields: str) -> int:
+        hash_: dict = self.hashes.setdefault(key, {})
+        return sum(hash_.pop(f.encode("utf-8"), None) is not None for f in fields)
+
+    async def hgetall(self: Self, key: str) -> dict:
+        return dict(self.hashes.get(key, {}))
+
+    async def eval(self: Self, script: str, numkeys: int, *args: str) -> bytes | None:
+        # Emulates the version activation script
+        versions, hidden, info, filename, version = args
+        previous: bytes | None = self.hashes.setdefault(versions, {}).get(
+            filename.encode("utf-8")
+        )
+        self.hashes[versions][filename.encode("utf-8")] = version.encode("utf-8")
+        await self.srem(hidden, version)
+        await self.hdel(info, version)
+
+        if previous and previous != version.encode("utf-8"):
+            await self.sadd(hidden, previous.decode("utf-8"))
+            await self.hset(
+                info, previous.decode("utf-8"), json.dumps({"filename": filename})
+            )
+            return previous
+
+        return None
+
+    def ft(self: Self, index_name: str) -> _SearchMock:
+        return _SearchMock(client=self, name=index_name)
+
+    def pipeline(self: Self, transaction: bool = True) -> _PipelineMock:
+        return _PipelineMock(client=self)
+
+
+class RedisClientRebuiltIndexesMock(RedisClientMock):
+    async def execute_command(self: Self, *args, **kwargs) -> List[bytes]:
+        if args[0] == "FT._LIST":
+            return [b"index1", b"index2:v3", b"index2:v4", b"other:version"]
+
 
 class AsyncSearchIndexMock:
     def __init__(self: Self, *args, **kwargs):
@@ -106,3 +261,81 @@ class AsyncSearchIndexDeleteObjectsFailedMock(AsyncSearchIndexMock):
 class RedisClientPingExceptionMock(RedisClientMock):
     async def ping(self: Self) -> bool:
         raise Exception("Connection refused")
+
+
+class RedisClientVersionsFailedMock(RedisClientMock):
+    async def sadd(self: Self, key: str, *values: str) -> int:
+        raise Exception("Connection lost")
+
+
+class AsyncSearchIndexCountingMock(AsyncSearchIndexMock):
+    from_existing_calls: int = 0
+    init_kwargs: List[dict] = []
+    queries: List[object] = []
+
+    async def query(self: Self, *args, **kwargs) -> List[dict]:
+        AsyncSearchIndexCountingMock.queries.append(kwargs["query"])
+        return await super().query(*args, **kwargs)
+
+    def __init__(self: Self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        AsyncSearchIndexCountingMock.init_kwargs.append(kwargs)
+
+    @classmethod
+    async def from_existing(cls, *args, **kwargs) -> Self:
+        cls.from_existing_calls += 1
+        return cls(**kwargs)
+
+
+class AsyncSearchIndexQueryFailedMock(AsyncSearchIndexCountingMock):
+    async def query(self: Self, *args, **kwargs) -> List[dict]:
+        raise Exception("Unknown index name")
+
+
+class RedisClientDeleteByFilterMock(RedisClientMock):
+    def __init__(self: Self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.documents: List[bytes] = [f"doc/vector:{i}".encode() for i in range(5)]
+        self.searches: List[tuple] = []
+
+    async def execute_command(self: Self, *args, **kwargs):
+        if args[0] == "FT.SEARCH":
+            self.searches.append(args)
+            limit: int = args[args.index("LIMIT") + 2]
+            return [len(self.documents), *self.documents[:limit]]
+
+        if args[0] == "UNLINK":
+            unlinked = [key for key in args[1:] if key in self.documents]
+            self.documents = [key for key in self.documents if key not in unlinked]
+            return len(unlinked)
+
+        return await super().execute_command(*args, **kwargs)
+
+
+class RedisClientDeleteByFilterStaleIndexMock(RedisClientDeleteByFilterMock):
+    async def execute_command(self: Self, *args, **kwargs):
+        if args[0] == "UNLINK":
+            return 0
+
+        return await super().execute_command(*args, **kwargs)
+
+
+class RedisClientGetObjectsMock(RedisClientDeleteByFilterMock):
+    async def execute_command(self: Self, *args, **kwargs):
+        if args[0] == "JSON.MGET":
+            return [
+                json.dumps(
+                    [
+                        {
+                            "filename": "idx/doc.pdf",
+                            "chunk_id": i,
+                            "content": f"chunk {i}",
+                            "vector": [0.1, 0.2],
+                            "content_hash": f"hash{i}",
+                        }
+                    ]
+                ).encode()
+                for i, _ in enumerate(args[1:-1])
+            ]
+
+        return await super().execute_command(*args, **kwargs)
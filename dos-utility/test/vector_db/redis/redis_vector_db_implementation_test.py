@@ -1,14 +1,17 @@
 import pytest
 
 from typing import List
-from dos_utility.vector_db import ObjectData
+from dos_utility.vector_db import ObjectData, hidden_versions
+from dos_utility.vector_db.hidden_versions import HiddenVersionsCache
 from dos_utility.vector_db.redis import implementation, get_redis_vector_db
 from dos_utility.vector_db.exceptions import (
     IndexCreationException,
     IndexDeletionException,
     PutObjectsException,
     DeleteObjectsException,
+    VersionUpdateException,
 )
+from dos_utility.vector_db.redis import RedisIndexOptions
 from dos_utility.vector_db.redis.implementation import RedisVectorDB
 from llama_index.core.vector_stores.types import (
     VectorStoreQuery,
@@ -19,10 +22,16 @@ from llama_index.core.vector_stores.types import (
     FilterCondition,
 )
 
+from test.vector_db.mocks import get_hidden_versions_cache_settings_disabled_mock
 from test.utils.redis.mocks import get_queue_pool_mock
 from test.vector_db.redis.mocks import (
     RedisClientMock,
+    RedisClientRebuiltIndexesMock,
+    RedisClientDeleteByFilterMock,
+    RedisClientDeleteByFilterStaleIndexMock,
+    RedisClientGetObjectsMock,
     RedisClientPingExceptionMock,
+    RedisClientVersionsFailedMock,
     AsyncSearchIndexMock,
     AsyncSearchIndexCreationIndexFailedMock,
     AsyncSearchIndexDeletionIndexFailedMock,
@@ -30,9 +39,38 @@ from test.vector_db.redis.mocks import (
     AsyncSearchIndexDeleteObjectsFailedMock,
     AsyncSearchIndexRedisSearchErrorNonExistingIndexMock,
     AsyncSearchIndexDeletionIndexFailedRedisSearchErrorMock,
+    AsyncSearchIndexCountingMock,
+    AsyncSearchIndexQueryFailedMock,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_index_schema_cache(monkeypatch: pytest.MonkeyPatch):
+    implementation.clear_index_schema_cache()
+    implementation.get_redis_vector_db_settings.cache_clear()
+    monkeypatch.setattr(AsyncSearchIndexCountingMock, "from_existing_calls", 0)
+    monkeypatch.setattr(AsyncSearchIndexCountingMock, "init_kwargs", [])
+    monkeypatch.setattr(AsyncSearchIndexCountingMock, "queries", [])
+    monkeypatch.setattr(AsyncSearchIndexQueryFailedMock, "from_existing_calls", 0)
+    yield
+    implementation.clear_index_schema_cache()
+    implementation.get_redis_vector_db_settings.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def hidden_versions_cache(monkeypatch: pytest.MonkeyPatch) -> HiddenVersionsCache:
+    # Disabled, so staging and activating versions don't wait for it
+    monkeypatch.setattr(
+        hidden_versions,
+        "get_hidden_versions_cache_settings",
+        get_hidden_versions_cache_settings_disabled_mock,
+    )
+    cache = HiddenVersionsCache()
+    monkeypatch.setattr(implementation, "get_hidden_versions_cache", lambda: cache)
+
+    return cache
+
+
 def test_instantiate_redis_vector_db(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(
         implementation, "get_redis_connection_pool", get_queue_pool_mock
@@ -719,3 +757,605 @@ async def test_redis_vector_db_delete_objects_empty_ids(
         await db.delete_objects(index_name="test_index", ids=[])
 
     assert True
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_schema_loaded_once(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientMock)
+    monkeypatch.setattr(
+        implementation, "AsyncSearchIndex", AsyncSearchIndexCountingMock
+    )
+
+    async with RedisVectorDB() as db:
+        for _ in range(3):
+            await db.semantic_search(
+                index_name="test_index",
+                embedding_query=[0.1] * 128,
+                max_results=5,
+                score_threshold=0.0,
+            )
+
+    async with RedisVectorDB() as db:
+        await db.filter_search(
+            index_name="test_index",
+            filters=MetadataFilters(
+                filters=[MetadataFilter(key="filename", value="file1.txt")]
+            ),
+            max_results=5,
+        )
+
+    assert AsyncSearchIndexCountingMock.from_existing_calls == 1
+    # Searches never validate, only writes do
+    assert all(
+        kwargs["validate_on_load"] is False
+        for kwargs in AsyncSearchIndexCountingMock.init_kwargs
+    )
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_schema_cache_disabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("REDIS_VECTOR_DB_SCHEMA_CACHE", "false")
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientMock)
+    monkeypatch.setattr(
+        implementation, "AsyncSearchIndex", AsyncSearchIndexCountingMock
+    )
+
+    async with RedisVectorDB() as db:
+        for _ in range(2):
+            await db.delete_objects(index_name="test_index", ids=["key1"])
+
+    assert AsyncSearchIndexCountingMock.from_existing_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_put_objects_validate_on_load(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("REDIS_VECTOR_DB_VALIDATE_ON_LOAD", "false")
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientMock)
+    monkeypatch.setattr(
+        implementation, "AsyncSearchIndex", AsyncSearchIndexCountingMock
+    )
+
+    async with RedisVectorDB() as db:
+        await db.put_objects(
+            index_name="test_index",
+            data=[
+                ObjectData(
+                    filename="file1.txt",
+                    chunk_id=1,
+                    content="This is a test chunk.",
+                    vector=[0.1] * 128,
+                )
+            ],
+        )
+
+    assert AsyncSearchIndexCountingMock.init_kwargs[-1]["validate_on_load"] is False
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_create_and_delete_index_update_schema_cache(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientMock)
+    monkeypatch.setattr(
+        implementation, "AsyncSearchIndex", AsyncSearchIndexCountingMock
+    )
+
+    async with RedisVectorDB() as db:
+        await db.create_index(index_name="test_index", vector_dim=128)
+        await db.delete_objects(index_name="test_index", ids=["key1"])
+
+        assert AsyncSearchIndexCountingMock.from_existing_calls == 0
+
+        # delete_index always reloads the schema, to drop the index behind an alias
+        await db.delete_index(index_name="test_index")
+
+        assert AsyncSearchIndexCountingMock.from_existing_calls == 1
+
+        await db.delete_objects(index_name="test_index", ids=["key1"])
+
+    assert AsyncSearchIndexCountingMock.from_existing_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_query_failure_drops_cached_schema(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientMock)
+    monkeypatch.setattr(
+        implementation, "AsyncSearchIndex", AsyncSearchIndexQueryFailedMock
+    )
+
+    async with RedisVectorDB() as db:
+        for _ in range(2):
+            with pytest.raises(Exception, match="Unknown index name"):
+                await db.semantic_search(
+                    index_name="test_index",
+                    embedding_query=[0.1] * 128,
+                    max_results=5,
+                    score_threshold=0.0,
+                )
+
+    assert AsyncSearchIndexQueryFailedMock.from_existing_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_create_index_defaults_from_env(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("REDIS_VECTOR_DB_ALGORITHM", "HNSW")
+    monkeypatch.setenv("REDIS_VECTOR_DB_DATATYPE", "FLOAT16")
+    monkeypatch.setenv("REDIS_VECTOR_DB_HNSW_EF_RUNTIME", "64")
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientMock)
+    monkeypatch.setattr(
+        implementation, "AsyncSearchIndex", AsyncSearchIndexCountingMock
+    )
+
+    async with RedisVectorDB() as db:
+        await db.create_index(index_name="test_index", vector_dim=128)
+
+        stored = RedisIndexOptions.model_validate_json(
+            db.client.store["test_index/options"]
+        )
+
+    attrs = AsyncSearchIndexCountingMock.init_kwargs[0]["schema"].fields["vector"].attrs
+
+    assert attrs.algorithm == "HNSW"
+    assert attrs.datatype == "FLOAT16"
+    assert attrs.ef_runtime == 64
+    assert stored == RedisIndexOptions(
+        algorithm="HNSW", datatype="FLOAT16", ef_runtime=64
+    )
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_semantic_search_uses_persisted_options(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientMock)
+    monkeypatch.setattr(
+        implementation, "AsyncSearchIndex", AsyncSearchIndexCountingMock
+    )
+
+    async with RedisVectorDB() as db:
+        await db.client.set(
+            "test_index/options",
+            RedisIndexOptions(
+                algorithm="HNSW", datatype="BFLOAT16", ef_runtime=100
+            ).model_dump_json(),
+        )
+        await db.semantic_search(
+            index_name="test_index",
+            embedding_query=[0.1] * 128,
+            max_results=5,
+            score_threshold=0.0,
+        )
+        await db.semantic_search(
+            index_name="legacy_index",
+            embedding_query=[0.1] * 128,
+            max_results=5,
+            score_threshold=0.0,
+        )
+
+    hnsw_query, legacy_query = AsyncSearchIndexCountingMock.queries
+
+    assert hnsw_query._dtype == "bfloat16"
+    assert hnsw_query.ef_runtime == 100
+    # Indexes without persisted options are FLAT/FLOAT32
+    assert legacy_query._dtype == "float32"
+    assert legacy_query.ef_runtime is None
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_rebuild_index(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientMock)
+    monkeypatch.setattr(
+        implementation, "AsyncSearchIndex", AsyncSearchIndexCountingMock
+    )
+
+    options = RedisIndexOptions(algorithm="HNSW", datatype="FLOAT16")
+
+    async with RedisVectorDB() as db:
+        await db.rebuild_index(
+            index_name="test_index", options=options, poll_interval_seconds=0
+        )
+        await db.rebuild_index(
+            index_name="test_index", options=options, poll_interval_seconds=0
+        )
+
+        first, second = db.client.transactions
+
+        assert first[:2] == [
+            ("FT.DROPINDEX", "test_index"),
+            ("FT.ALIASADD", "test_index", "test_index:v2"),
+        ]
+        assert second[:2] == [
+            ("FT.ALIASUPDATE", "test_index", "test_index:v3"),
+            ("FT.DROPINDEX", "test_index:v2"),
+        ]
+        assert (
+            RedisIndexOptions.model_validate_json(db.client.store["test_index/options"])
+            == options
+        )
+
+    # The new index is built over the same documents, with the new options
+    schema = AsyncSearchIndexCountingMock.init_kwargs[-1]["schema"]
+    assert schema.index.name == "test_index:v3"
+    assert schema.index.prefix == "test_index/vector"
+    assert schema.fields["vector"].attrs.algorithm == "HNSW"
+    assert schema.fields["vector"].attrs.dims == 128
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_rebuild_index_failure(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientMock)
+    monkeypatch.setattr(
+        implementation, "AsyncSearchIndex", AsyncSearchIndexCreationIndexFailedMock
+    )
+
+    async with RedisVectorDB() as db:
+        with pytest.raises(expected_exception=IndexCreationException):
+            await db.rebuild_index(
+                index_name="test_index", options=RedisIndexOptions(algorithm="HNSW")
+            )
+
+        assert db.client.transactions == []
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_get_indexes_rebuilt(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientRebuiltIndexesMock)
+
+    async with RedisVectorDB() as db:
+        indexes: List[str] = await db.get_indexes()
+
+    assert indexes == ["index1", "index2", "other:version"]
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_delete_by_filter(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("REDIS_VECTOR_DB_DELETE_BATCH_SIZE", "2")
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientDeleteByFilterMock)
+
+    async with RedisVectorDB() as db:
+        deleted: int = await db.delete_by_filter(
+            index_name="test_index",
+            filters=MetadataFilters(
+                filters=[MetadataFilter(key="filename", value="idx/doc.pdf")]
+            ),
+        )
+
+        assert deleted == 5
+        assert db.client.documents == []
+        # 1 search, then one UNLINK + next search round-trip per batch of 2
+        assert len(db.client.searches) == 4
+        assert len(db.client.transactions) == 3
+        assert db.client.searches[0][2] == "@filename:{idx\\/doc\\.pdf}"
+        assert "NOCONTENT" in db.client.searches[0]
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_delete_by_filter_stale_index(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(
+        implementation, "RedisAsync", RedisClientDeleteByFilterStaleIndexMock
+    )
+
+    async with RedisVectorDB() as db:
+        deleted: int = await db.delete_by_filter(
+            index_name="test_index",
+            filters=MetadataFilters(
+                filters=[MetadataFilter(key="filename", value="idx/doc.pdf")]
+            ),
+        )
+
+        assert deleted == 0
+        assert len(db.client.transactions) == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_delete_by_filter_empty_filters(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientDeleteByFilterMock)
+
+    async with RedisVectorDB() as db:
+        with pytest.raises(
+            expected_exception=DeleteObjectsException, match="empty filter"
+        ):
+            await db.delete_by_filter(
+                index_name="test_index", filters=MetadataFilters(filters=[])
+            )
+
+        assert db.client.searches == []
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_activate_version_hides_previous_version(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientMock)
+    monkeypatch.setattr(
+        implementation, "AsyncSearchIndex", AsyncSearchIndexCountingMock
+    )
+
+    async with RedisVectorDB() as db:
+        await db.stage_version(
+            index_name="test_index", filename="doc.pdf", version="v1"
+        )
+        first = await db.activate_version(
+            index_name="test_index", filename="doc.pdf", version="v1"
+        )
+        await db.stage_version(
+            index_name="test_index", filename="doc.pdf", version="v2"
+        )
+        previous = await db.activate_version(
+            index_name="test_index", filename="doc.pdf", version="v2"
+        )
+        await db.semantic_search(
+            index_name="test_index",
+            embedding_query=[0.1] * 128,
+            max_results=5,
+            score_threshold=0.0,
+        )
+
+        assert first is None
+        assert previous == "v1"
+        assert db.client.sets["test_index/hidden_versions"] == {b"v1"}
+        assert db.client.hashes["test_index/versions"] == {b"doc.pdf": b"v2"}
+
+    [query] = AsyncSearchIndexCountingMock.queries
+
+    assert str(query.filter) == "(-@version:{v1})"
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_revision_changes_with_the_contents(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientMock)
+    monkeypatch.setattr(
+        implementation, "AsyncSearchIndex", AsyncSearchIndexCountingMock
+    )
+
+    async with RedisVectorDB() as db:
+        assert await db.get_revision(index_name="test_index") is None
+
+        await db.put_objects(
+            index_name="test_index",
+            data=[
+                ObjectData(
+                    filename="doc.pdf", chunk_id=0, content="chunk", vector=[0.1]
+                )
+            ],
+        )
+        first = await db.get_revision(index_name="test_index")
+
+        await db.activate_version(
+            index_name="test_index", filename="doc.pdf", version="v1"
+        )
+        second = await db.get_revision(index_name="test_index")
+
+        await db.stage_version(
+            index_name="test_index", filename="doc.pdf", version="v2"
+        )
+
+        assert first is not None
+        assert second not in (None, first)
+        # Staging a version doesn't change what searches return
+        assert await db.get_revision(index_name="test_index") == second
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_release_versions(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientMock)
+    monkeypatch.setattr(
+        implementation, "AsyncSearchIndex", AsyncSearchIndexCountingMock
+    )
+
+    async with RedisVectorDB() as db:
+        await db.stage_version(
+            index_name="test_index", filename="doc.pdf", version="v1"
+        )
+        await db.release_versions(
+            index_name="test_index", filename="doc.pdf", versions=["v1"]
+        )
+        await db.filter_search(
+            index_name="test_index",
+            filters=MetadataFilters(
+                filters=[MetadataFilter(key="filename", value="doc.pdf")]
+            ),
+            max_results=5,
+        )
+
+        assert db.client.sets["test_index/hidden_versions"] == set()
+        assert db.client.hashes["test_index/hidden_version_info"] == {}
+
+    [query] = AsyncSearchIndexCountingMock.queries
+
+    assert str(query.filter) == "@filename:{doc\\.pdf}"
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_get_hidden_versions(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientMock)
+    monkeypatch.setattr(
+        implementation, "AsyncSearchIndex", AsyncSearchIndexCountingMock
+    )
+
+    async with RedisVectorDB() as db:
+        for version in ["v1", "v2"]:
+            await db.stage_version(
+                index_name="test_index", filename="doc.pdf", version=version
+            )
+            await db.activate_version(
+                index_name="test_index", filename="doc.pdf", version=version
+            )
+
+        await db.stage_version(
+            index_name="test_index", filename="doc.pdf", version="v3"
+        )
+        await db.stage_version(
+            index_name="test_index", filename="other.pdf", version="w1"
+        )
+
+        hidden = await db.get_hidden_versions(
+            index_name="test_index", filename="doc.pdf"
+        )
+
+    assert hidden.keys() == {"v1", "v3"}
+    # v1 was superseded by v2, v3 is still being ingested
+    assert hidden["v1"] is None
+    assert isinstance(hidden["v3"], float)
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_delete_versions(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientMock)
+    monkeypatch.setattr(
+        implementation, "AsyncSearchIndex", AsyncSearchIndexCountingMock
+    )
+
+    async with RedisVectorDB() as db:
+        for version in ["v1", "v2"]:
+            await db.stage_version(
+                index_name="test_index", filename="doc.pdf", version=version
+            )
+            await db.activate_version(
+                index_name="test_index", filename="doc.pdf", version=version
+            )
+
+        await db.stage_version(
+            index_name="test_index", filename="other.pdf", version="w1"
+        )
+        await db.delete_versions(index_name="test_index", filename="doc.pdf")
+
+        assert db.client.hashes["test_index/versions"] == {}
+        assert db.client.sets["test_index/hidden_versions"] == {b"w1"}
+        assert db.client.hashes["test_index/hidden_version_info"].keys() == {b"w1"}
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_stage_version_adds_the_version_field(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientMock)
+    monkeypatch.setattr(implementation, "AsyncSearchIndex", AsyncSearchIndexMock)
+
+    async with RedisVectorDB() as db:
+        await db.stage_version(
+            index_name="test_index", filename="doc.pdf", version="v1"
+        )
+
+        [alter] = [c for c in db.client.commands if c[0] == "FT.ALTER"]
+
+    assert alter == (
+        "FT.ALTER",
+        "test_index",
+        "SCHEMA",
+        "ADD",
+        "$.version",
+        "AS",
+        "version",
+        "TAG",
+    )
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_stage_version_failed(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientVersionsFailedMock)
+    monkeypatch.setattr(implementation, "AsyncSearchIndex", AsyncSearchIndexMock)
+
+    async with RedisVectorDB() as db:
+        with pytest.raises(
+            expected_exception=VersionUpdateException, match="Connection lost"
+        ):
+            await db.stage_version(
+                index_name="test_index", filename="doc.pdf", version="v1"
+            )
+
+
+@pytest.mark.asyncio
+async def test_redis_vector_db_get_objects(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        implementation, "get_redis_connection_pool", get_queue_pool_mock
+    )
+    monkeypatch.setattr(implementation, "RedisAsync", RedisClientGetObjectsMock)
+
+    async with RedisVectorDB() as db:
+        objects: List[ObjectData] = await db.get_objects(
+            index_name="test_index",
+            filters=MetadataFilters(
+                filters=[MetadataFilter(key="filename", value="idx/doc.pdf")]
+            ),
+            max_results=3,
+        )
+
+        [search] = db.client.searches
+
+    assert [o.chunk_id for o in objects] == [0, 1, 2]
+    assert objects[0].vector == [0.1, 0.2]
+    assert objects[0].content_hash == "hash0"
+    assert search[2] == "@filename:{idx\\/doc\\.pdf}"
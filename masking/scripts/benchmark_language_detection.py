@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Benchmark the language detectors of the masking service.
+
+What it does
+------------
+Detects the language of a set of labelled texts with every detector of
+``src/modules/mask/language.py`` (``MASK_LANGUAGE_DETECTOR``) and prints, for
+each one, the mean and p95 latency per text, the accuracy against the labels
+(texts no detector is sure about count as the Italian fallback) and how many
+texts get a different language when detected again.
+
+Unseeded ``langdetect`` (the detector used before ``MASK_LANGUAGE_DETECTOR``
+existed) is measured too, to show its run-to-run variance.
+
+Quick start
+-----------
+Run from the ``masking`` directory so its ``.venv`` is active.
+
+    # Built-in samples (it, en, de, fr), 20 rounds:
+    uv run python -m scripts.benchmark_language_detection
+
+    # Own samples, one "<lang_code>\\t<text>" per line:
+    uv run python -m scripts.benchmark_language_detection --file samples.tsv
+
+Flags
+-----
+    --file PATH       Tab-separated samples: language code, then the text.
+    --rounds INT      Times every text is detected. Default: 20.
+"""
+
+import argparse
+import statistics
+import time
+
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from langdetect import DetectorFactory
+
+from src.modules.mask.language import (
+    DEFAULT_LANGUAGE,
+    LangdetectLanguageDetector,
+    LanguageDetectorInterface,
+    LanguageDetectorName,
+    build_language_detector,
+)
+
+
+LANGUAGES: List[str] = ["en", "it", "de", "fr"]
+
+SAMPLES: List[Tuple[str, str]] = [
+    ("it", "Ciao, vorrei sapere come posso pagare un avviso pagoPA con la carta."),
+    ("it", "Il servizio non è disponibile in questo momento, riprova più tardi."),
+    ("it", "Grazie mille!"),
+    ("it", "Mi chiamo Mario Rossi e abito in via Roma 12 a Milano."),
+    ("it", "Quali sono i documenti necessari per richiedere la carta d'identità?"),
+    ("en", "Hello, how can I pay a notice with my credit card?"),
+    ("en", "The service is not available right now, please try again later."),
+    ("en", "Thanks a lot!"),
+    ("en", "My name is John Smith and I live at 12 Baker Street in London."),
+    ("en", "Which documents do I need to apply for an identity card?"),
+    ("de", "Hallo, wie kann ich eine Rechnung mit meiner Kreditkarte bezahlen?"),
+    ("de", "Der Dienst ist im Moment nicht verfügbar, bitte versuche es später."),
+    ("fr", "Bonjour, comment puis-je payer un avis avec ma carte de crédit ?"),
+    ("fr", "Le service n'est pas disponible pour le moment, réessayez plus tard."),
+]
+
+
+def read_samples(path: Path) -> List[Tuple[str, str]]:
+    samples: List[Tuple[str, str]] = []
+
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line.strip():
+            lang, text = line.split("\t", maxsplit=1)
+            samples.append((lang, text))
+
+    return samples
+
+
+def unseeded_langdetect() -> LanguageDetectorInterface:
+    detector: LanguageDetectorInterface = LangdetectLanguageDetector(
+        languages=LANGUAGES
+    )
+    DetectorFactory.seed = None
+
+    return detector
+
+
+def benchmark(
+    detector: LanguageDetectorInterface,
+    samples: List[Tuple[str, str]],
+    rounds: int,
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    results: List[set] = [set() for _ in samples]
+
+    for _ in range(rounds):
+        for i, (_, text) in enumerate(samples):
+            started_at: float = time.perf_counter()
+            detected: Optional[str] = detector.detect(text=text)
+            latencies.append(time.perf_counter() - started_at)
+            results[i].add(detected or DEFAULT_LANGUAGE)
+
+    correct: int = sum(
+        1 for (lang, _), detected in zip(samples, results) if detected == {lang}
+    )
+
+    return {
+        "mean_us": statistics.fmean(latencies) * 1e6,
+        "p95_us": statistics.quantiles(latencies, n=20)[-1] * 1e6,
+        "accuracy": correct / len(samples),
+        "unstable": sum(1 for detected in results if len(detected) > 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--file", type=Path, default=None)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    samples: List[Tuple[str, str]] = (
+        read_samples(args.file) if args.file is not None else SAMPLES
+    )
+    # The unseeded one goes last: seeding is global to langdetect
+    detectors: Dict[str, Callable[[], LanguageDetectorInterface]] = {
+        **{
+            name.value: lambda name=name: build_language_detector(
+                name=name, languages=LANGUAGES
+            )
+            for name in LanguageDetectorName
+        },
+        "langdetect (unseeded)": unseeded_langdetect,
+    }
+
+    print(f"{len(samples)} texts, {args.rounds} rounds\n")
+    print(
+        f"{'detector':<24}{'mean µs':>10}{'p95 µs':>10}{'accuracy':>10}{'unstable':>10}"
+    )
+
+    for name, build in detectors.items():
+        stats: Dict[str, float] = benchmark(
+            detector=build(), samples=samples, rounds=args.rounds
+        )
+        print(
+            f"{name:<24}{stats['mean_us']:>10.1f}{stats['p95_us']:>10.1f}"
+            f"{stats['accuracy']:>10.0%}{stats['unstable']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,35 @@
+from contextlib import asynccontextmanager
+from typing import Optional
 from fastapi import FastAPI
 
 from .modules.mask import mask_router
+from .modules.mask.pool import MaskWorkerPool, get_mask_worker_pool
+from .modules.mask.warmup import MaskWarmUp, get_mask_warm_up
 from .modules.health import health_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Models load in the background: /health answers at once, /health/ready
+    # once they are warm
+    warm_up: MaskWarmUp = get_mask_warm_up()
+    warm_up.start()
+
+    try:
+        yield
+    finally:
+        await warm_up.stop()
+        worker_pool: Optional[MaskWorkerPool] = get_mask_worker_pool()
+
+        if worker_pool is not None:
+            worker_pool.shutdown()
+
+
 app: FastAPI = FastAPI(
     title="Masking Service",
     description="Service for masking PII in user/assistant queries",
     docs_url="/",
+    lifespan=lifespan,
 )
 
 app.include_router(router=health_router)
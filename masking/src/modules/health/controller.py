@@ -1,4 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+
+from ..mask.warmup import get_mask_warm_up, MaskWarmUp
 
 
 router: APIRouter = APIRouter(prefix="/health", tags=["Health checks"])
@@ -11,3 +14,26 @@ async def health_check():
         "status": "ok",
         "service": "Masking Service",
     }
+
+
+@router.get(path="/ready", summary="Check Masking service models are warm")
+async def readiness_check():
+    # 503 until the models are loaded and warm, so no traffic is routed before
+    warm_up: MaskWarmUp = get_mask_warm_up()
+
+    if warm_up.ready:
+        return {
+            "status": "ready",
+            "warm_up_seconds": warm_up.seconds,
+        }
+
+    if warm_up.error is not None:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "failed", "error": str(warm_up.error)},
+        )
+
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": "warming up"},
+    )
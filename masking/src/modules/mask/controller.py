@@ -1,10 +1,16 @@
-from typing import Annotated
+from typing import Annotated, List
 from fastapi import APIRouter, Depends
 
 from .service import get_mask_service, MaskService
-from .dto import MaskRequestBody
+from .dto import MaskBatchRequestBody, MaskRequestBody, MaskStatsDTO
+from .warmup import wait_for_warm_up
 
-router: APIRouter = APIRouter(prefix="/mask", tags=["Mask"])
+# Requests received while the models warm up wait for them
+router: APIRouter = APIRouter(
+    prefix="/mask",
+    tags=["Mask"],
+    dependencies=[Depends(dependency=wait_for_warm_up)],
+)
 
 
 @router.post(
@@ -12,8 +18,39 @@ router: APIRouter = APIRouter(prefix="/mask", tags=["Mask"])
     response_model=str,
     summary="Mask PII",
 )
-def mask(
+async def mask(
     mask_service: Annotated[MaskService, Depends(dependency=get_mask_service)],
     mask_body: MaskRequestBody,
 ) -> str:
-    return mask_service.mask(text=mask_body.text)
+    return await mask_service.mask(
+        text=mask_body.text,
+        session_id=mask_body.session_id,
+        language=mask_body.language,
+    )
+
+
+@router.post(
+    path="/batch",
+    response_model=List[str],
+    summary="Mask PII in several texts",
+)
+async def mask_batch(
+    mask_service: Annotated[MaskService, Depends(dependency=get_mask_service)],
+    mask_body: MaskBatchRequestBody,
+) -> List[str]:
+    return await mask_service.mask_batch(
+        texts=mask_body.texts,
+        session_id=mask_body.session_id,
+        language=mask_body.language,
+    )
+
+
+@router.get(
+    path="/metrics",
+    response_model=MaskStatsDTO,
+    summary="Memory, session mappings and pre-screen counters of the masking processes",
+)
+async def metrics(
+    mask_service: Annotated[MaskService, Depends(dependency=get_mask_service)],
+) -> MaskStatsDTO:
+    return MaskStatsDTO.model_validate(await mask_service.stats())
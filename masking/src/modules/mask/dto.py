@@ -1,6 +1,79 @@
-from typing import Annotated
+from typing import Annotated, Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
 class MaskRequestBody(BaseModel):
     text: Annotated[str, Field(description="Text to mask")]
+    session_id: Annotated[
+        Optional[str],
+        Field(
+            default=None,
+            description="Conversation the text belongs to, to keep its placeholders across requests",
+        ),
+    ]
+    language: Annotated[
+        Optional[str],
+        Field(
+            default=None,
+            description="Language code of the text, skipping language detection. Ignored when not among the configured languages",
+        ),
+    ]
+
+
+class MaskBatchRequestBody(BaseModel):
+    texts: Annotated[
+        List[str],
+        Field(
+            min_length=1,
+            max_length=256,
+            description="Texts to mask. Placeholders are consistent across the texts of a request",
+        ),
+    ]
+    session_id: Annotated[
+        Optional[str],
+        Field(
+            default=None,
+            description="Conversation the texts belong to, to keep their placeholders across requests",
+        ),
+    ]
+    language: Annotated[
+        Optional[str],
+        Field(
+            default=None,
+            description="Language code of the texts, skipping language detection. Ignored when not among the configured languages",
+        ),
+    ]
+
+
+class ProcessStatsDTO(BaseModel):
+    pid: int
+    max_rss_bytes: Annotated[int, Field(description="Peak resident memory")]
+    pss_bytes: Annotated[
+        Optional[int],
+        Field(
+            description="Proportional set size: memory shared with other processes counts as a share, None when unavailable"
+        ),
+    ]
+    session_mapping: Annotated[
+        Optional[Dict[str, int]],
+        Field(description="Session mapping store counters, None when disabled"),
+    ]
+    prescreen: Annotated[
+        Optional[Dict[str, int | float]],
+        Field(description="PII pre-screen counters, None when disabled"),
+    ]
+
+
+class MaskStatsDTO(BaseModel):
+    processes: Annotated[
+        List[ProcessStatsDTO],
+        Field(description="The API process, or every worker when MASK_WORKERS > 0"),
+    ]
+    session_mapping: Annotated[
+        Optional[Dict[str, int]],
+        Field(description="Session mapping counters of all processes"),
+    ]
+    prescreen: Annotated[
+        Optional[Dict[str, int | float]],
+        Field(description="PII pre-screen counters of all processes"),
+    ]
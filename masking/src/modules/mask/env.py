@@ -0,0 +1,77 @@
+from functools import lru_cache
+from typing import Annotated, Literal
+from pydantic import Field, NonNegativeInt, PositiveFloat, PositiveInt
+from pydantic_settings import BaseSettings
+
+from .language import LanguageDetectorName
+
+
+class MaskSettings(BaseSettings):
+    mask_workers: Annotated[
+        NonNegativeInt,
+        Field(
+            default=0,
+            description="Worker processes masking texts, each one with its own preloaded Presidio engines. 0 masks in the API process",
+        ),
+    ]
+    mask_workers_start_method: Annotated[
+        Literal["spawn", "fork"],
+        Field(
+            default="spawn",
+            description="spawn: every worker loads its own models. fork: the API process loads the models once and the workers share them copy-on-write, using less memory per worker",
+        ),
+    ]
+    mask_batch_size: Annotated[
+        PositiveInt,
+        Field(
+            default=32,
+            description="Texts of the same language run through spaCy together (nlp.pipe batch size)",
+        ),
+    ]
+    mask_session_mapping_max_sessions: Annotated[
+        NonNegativeInt,
+        Field(
+            default=0,
+            description="Conversations whose placeholders are kept, so that a value gets the same placeholder in all of its requests. 0 scopes placeholders to a single request",
+        ),
+    ]
+    mask_session_mapping_ttl_seconds: Annotated[
+        PositiveFloat,
+        Field(
+            default=3600.0,
+            description="How long the placeholders of a conversation are kept after its last request",
+        ),
+    ]
+    mask_prescreen_enabled: Annotated[
+        bool,
+        Field(
+            default=False,
+            description="Return texts without digits, @, date words or capitalised words (other than stop words and the allow list) without running NER. Lowercase names are then not masked, so it trades PII recall for throughput",
+        ),
+    ]
+    mask_prescreen_sentence_min_chars: Annotated[
+        PositiveInt,
+        Field(
+            default=1000,
+            description="Texts at least this long only run NER on the sentences the pre-screen finds candidates in",
+        ),
+    ]
+    mask_language_detector: Annotated[
+        LanguageDetectorName,
+        Field(
+            default=LanguageDetectorName.STOPWORDS,
+            description="Language detector of the texts: stopwords (fast, deterministic, counts the spaCy stop words of the configured languages) or langdetect",
+        ),
+    ]
+    mask_language_max_sessions: Annotated[
+        NonNegativeInt,
+        Field(
+            default=10000,
+            description="Conversations whose detected language is remembered, so that their next texts skip detection. 0 detects every text",
+        ),
+    ]
+
+
+@lru_cache
+def get_mask_settings() -> MaskSettings:
+    return MaskSettings()
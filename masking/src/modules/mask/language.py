@@ -0,0 +1,142 @@
+import re
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from enum import Enum
+from threading import Lock
+from typing import Dict, List, Optional, Self, Set
+from langdetect import DetectorFactory, detect_langs
+from langdetect.language import Language
+
+from .prescreen import stop_words
+
+
+# Language of the texts no detector is sure about
+DEFAULT_LANGUAGE: str = "it"
+
+WORD: re.Pattern = re.compile(r"[^\W\d_]+")
+
+
+class LanguageDetectorName(str, Enum):
+    STOPWORDS = "stopwords"
+    LANGDETECT = "langdetect"
+
+
+class LanguageDetectorInterface(ABC):
+    """Detects the language of a text among the configured `lang_code`s."""
+
+    def __init__(self: Self, languages: List[str]) -> None:
+        self.languages: List[str] = languages
+
+    @abstractmethod
+    def detect(self: Self, text: str) -> Optional[str]:
+        """Return the language of the text, None when unsure."""
+        ...
+
+
+class StopWordLanguageDetector(LanguageDetectorInterface):
+    """Deterministic detector counting the spaCy stop words of each language.
+
+    Only the first `max_words` words are looked at. The language with the most
+    stop words wins; a tie, or no stop word at all, is reported as unsure.
+    """
+
+    def __init__(self: Self, languages: List[str], max_words: int = 100) -> None:
+        super().__init__(languages=languages)
+        self.max_words: int = max_words
+        self.stop_words: Dict[str, Set[str]] = {
+            lang: stop_words(languages=[lang]) for lang in languages
+        }
+
+    def detect(self: Self, text: str) -> Optional[str]:
+        counts: Dict[str, int] = dict.fromkeys(self.languages, 0)
+
+        for i, match in enumerate(WORD.finditer(text)):
+            if i == self.max_words:
+                break
+
+            word: str = match.group().lower()
+
+            for lang, words in self.stop_words.items():
+                if word in words:
+                    counts[lang] += 1
+
+        ranked: List[str] = sorted(counts, key=counts.get, reverse=True)
+
+        if counts[ranked[0]] == 0 or (
+            len(ranked) > 1 and counts[ranked[0]] == counts[ranked[1]]
+        ):
+            return None
+
+        return ranked[0]
+
+
+class LangdetectLanguageDetector(LanguageDetectorInterface):
+    """`langdetect` restricted to the configured languages, Italian first when found."""
+
+    def __init__(self: Self, languages: List[str]) -> None:
+        super().__init__(languages=languages)
+        # langdetect samples at random, seeding it makes its results repeatable
+        DetectorFactory.seed = 0
+
+    def detect(self: Self, text: str) -> Optional[str]:
+        try:
+            detected_languages: List[Language] = detect_langs(text=text)
+        except Exception:
+            return None
+
+        supported: List[str] = [
+            str(detected_language)
+            for detected_language in detected_languages
+            if str(detected_language) in self.languages
+        ]
+
+        if len(supported) == 0:
+            return None
+        elif DEFAULT_LANGUAGE in supported:
+            return DEFAULT_LANGUAGE
+
+        return supported[0]
+
+
+def build_language_detector(
+    name: LanguageDetectorName, languages: List[str]
+) -> LanguageDetectorInterface:
+    if name is LanguageDetectorName.LANGDETECT:
+        return LangdetectLanguageDetector(languages=languages)
+
+    return StopWordLanguageDetector(languages=languages)
+
+
+class SessionLanguages:
+    """Bounded LRU of the language detected for the last conversations.
+
+    Once a text of a session has been detected with confidence, the following
+    texts of the session skip detection. Safe to share between the threads of
+    the API process.
+    """
+
+    def __init__(self: Self, max_sessions: int) -> None:
+        self.max_sessions: int = max_sessions
+        self.__languages: OrderedDict[str, str] = OrderedDict()
+        self.__lock: Lock = Lock()
+
+    def get(self: Self, session_id: str) -> Optional[str]:
+        with self.__lock:
+            lang: Optional[str] = self.__languages.get(session_id)
+
+            if lang is not None:
+                self.__languages.move_to_end(session_id)
+
+            return lang
+
+    def set(self: Self, session_id: str, lang: str) -> None:
+        with self.__lock:
+            self.__languages[session_id] = lang
+            self.__languages.move_to_end(session_id)
+
+            while len(self.__languages) > self.max_sessions:
+                self.__languages.popitem(last=False)
+
+    def __len__(self: Self) -> int:
+        return len(self.__languages)
@@ -0,0 +1,109 @@
+import sys
+import time
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Dict, Self, Tuple
+
+
+@dataclass
+class EntityMapping:
+    """Placeholders given to the values found by `EntityTypeCountAnonymizer`.
+
+    The requests of a session share its mapping, and may be masked by several
+    threads at once: `lock` is held while a text is anonymized with it, so two
+    values never get the same placeholder.
+    """
+
+    # entity type -> original value -> placeholder
+    entity_mapping: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    # placeholder -> original value
+    deanonymize_mapping: Dict[str, str] = field(default_factory=dict)
+    lock: Lock = field(default_factory=Lock, repr=False, compare=False)
+
+    def __len__(self: Self) -> int:
+        return len(self.deanonymize_mapping)
+
+    def approx_bytes(self: Self) -> int:
+        """Approximate memory held by the mapped strings."""
+        with self.lock:
+            return sum(
+                sys.getsizeof(placeholder) + sys.getsizeof(value)
+                for placeholder, value in self.deanonymize_mapping.items()
+            )
+
+
+class EntityMappingStore:
+    """Bounded store of the entity mappings of the last conversations.
+
+    Keeps the placeholders of a session consistent across its requests: the
+    same name is `<PERSON_1>` in every question and answer of a conversation.
+    At most `max_sessions` mappings are kept, least recently used first out,
+    and a mapping is dropped `ttl_seconds` after its last use. Safe to share
+    between the threads of the API process.
+    """
+
+    def __init__(self: Self, max_sessions: int, ttl_seconds: float) -> None:
+        self.max_sessions: int = max_sessions
+        self.ttl_seconds: float = ttl_seconds
+        self.__mappings: OrderedDict[str, Tuple[float, EntityMapping]] = OrderedDict()
+        self.__lock: Lock = Lock()
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__evictions: int = 0
+        self.__expirations: int = 0
+
+    def __sweep(self: Self, now: float) -> None:
+        # Mappings are ordered by last use, so the expired ones come first
+        while self.__mappings:
+            expires_at, _ = next(iter(self.__mappings.values()))
+
+            if now < expires_at:
+                break
+
+            self.__mappings.popitem(last=False)
+            self.__expirations += 1
+
+    def get(self: Self, session_id: str) -> EntityMapping:
+        """Return the mapping of the session, a new one if unknown or expired."""
+        now: float = time.monotonic()
+
+        with self.__lock:
+            self.__sweep(now=now)
+            entry = self.__mappings.pop(session_id, None)
+
+            if entry is not None:
+                self.__hits += 1
+                mapping: EntityMapping = entry[1]
+            else:
+                self.__misses += 1
+                mapping = EntityMapping()
+
+            self.__mappings[session_id] = (now + self.ttl_seconds, mapping)
+
+            while len(self.__mappings) > self.max_sessions:
+                self.__mappings.popitem(last=False)
+                self.__evictions += 1
+
+        return mapping
+
+    def stats(self: Self) -> Dict[str, int]:
+        """Return the store counters.
+
+        Returns:
+            Dict[str, int]: sessions and entities held, their approximate size in bytes, hits, misses, evictions (LRU) and expirations (TTL).
+        """
+        with self.__lock:
+            self.__sweep(now=time.monotonic())
+            mappings = [mapping for _, mapping in self.__mappings.values()]
+
+            return {
+                "sessions": len(mappings),
+                "entities": sum(len(mapping) for mapping in mappings),
+                "approx_bytes": sum(mapping.approx_bytes() for mapping in mappings),
+                "hits": self.__hits,
+                "misses": self.__misses,
+                "evictions": self.__evictions,
+                "expirations": self.__expirations,
+            }
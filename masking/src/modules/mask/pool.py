@@ -0,0 +1,215 @@
+import asyncio
+import gc
+import logging
+import os
+import resource
+import zlib
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from multiprocessing import get_context
+from typing import Any, Dict, List, Literal, Optional, Self
+
+from .env import MaskSettings, get_mask_settings
+from .presidio import PresidioPII, get_presidio
+
+
+WorkerStartMethod = Literal["spawn", "fork"]
+
+
+def _pss_bytes() -> Optional[int]:
+    # Proportional set size: pages shared with other processes count as a share
+    try:
+        with open("/proc/self/smaps_rollup", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+
+    return None
+
+
+def process_stats(presidio: PresidioPII) -> Dict[str, Any]:
+    """Return the memory and pre-screen counters of the current process."""
+    return {
+        "pid": os.getpid(),
+        # ru_maxrss is in KiB on Linux
+        "max_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        "pss_bytes": _pss_bytes(),
+        "session_mapping": presidio.mapping_stats(),
+        "prescreen": presidio.prescreen_stats(),
+    }
+
+
+def _init_worker() -> None:
+    # Load the spaCy models and Presidio engines once, before the first request.
+    # A forked worker finds them already loaded by the API process.
+    get_presidio()
+
+
+def _warm_up() -> Dict[str, float]:
+    return get_presidio().warm_up()
+
+
+def _mask_batch(
+    texts: List[str],
+    batch_size: int,
+    session_id: Optional[str],
+    language: Optional[str],
+) -> List[str]:
+    return get_presidio().mask_pii_batch(
+        texts=texts, batch_size=batch_size, session_id=session_id, language=language
+    )
+
+
+def _stats() -> Dict[str, Any]:
+    return process_stats(presidio=get_presidio())
+
+
+class MaskWorkerPool:
+    """Pool of worker processes, each one holding its own `PresidioPII`.
+
+    spaCy NER holds the GIL, so masking in threads of the API process runs one
+    text at a time. The pool masks the texts of concurrent requests in parallel,
+    while the API process stays free to serve requests. A request is masked by
+    a single worker, so that its texts share the same placeholders.
+
+    Every worker has its own session mapping store (and remembers the language
+    of its sessions), so the requests of a session always go to the same
+    worker, picked by a hash of the session id. Requests without a session go
+    to the worker with the fewest requests in flight.
+
+    Spawned workers load the models in their initializer, each one holding its
+    own copy. With `start_method="fork"` the models are loaded (and warmed up)
+    once by the API process before the workers are forked: the workers share
+    its memory pages copy-on-write, and only the pages they write to are
+    copied. `start` creates and warms up every worker at once, so that no
+    request waits for a cold worker.
+
+    A worker whose process dies (killed for its memory, crashed in a model) is
+    replaced by a new, warmed up one, and the request is retried once on it. The
+    sessions of the dead worker lose their placeholders.
+    """
+
+    def __init__(
+        self: Self,
+        workers: int,
+        batch_size: int,
+        start_method: WorkerStartMethod = "spawn",
+    ) -> None:
+        self.workers: int = workers
+        self.batch_size: int = batch_size
+        self.start_method: WorkerStartMethod = start_method
+        self.__executors: List[ProcessPoolExecutor] = []
+        self.__in_flight: List[int] = [0] * workers
+
+    def __new_executor(self: Self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=get_context(self.start_method),
+            initializer=_init_worker,
+        )
+
+    def __get_executors(self: Self) -> List[ProcessPoolExecutor]:
+        if len(self.__executors) == 0:
+            self.__executors = [self.__new_executor() for _ in range(self.workers)]
+
+        return self.__executors
+
+    async def __replace(self: Self, worker: int, broken: ProcessPoolExecutor) -> None:
+        """Replace the broken executor of the worker with a warmed up one. The
+        requests that failed on the same executor only replace it once.
+        """
+        if self.__executors[worker] is not broken:
+            return
+
+        logging.warning(f"Mask worker {worker} died, starting a new one")
+        broken.shutdown(wait=False, cancel_futures=True)
+        self.__executors[worker] = self.__new_executor()
+        await asyncio.get_running_loop().run_in_executor(
+            self.__executors[worker], _warm_up
+        )
+
+    def __pick_worker(self: Self, session_id: Optional[str]) -> int:
+        if session_id is not None:
+            return zlib.crc32(session_id.encode()) % self.workers
+
+        return min(range(self.workers), key=lambda i: self.__in_flight[i])
+
+    async def __run(self: Self, worker: int, fn, *args) -> Any:
+        executor: ProcessPoolExecutor = self.__get_executors()[worker]
+        self.__in_flight[worker] += 1
+
+        try:
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    executor, fn, *args
+                )
+            except BrokenProcessPool:
+                await self.__replace(worker=worker, broken=executor)
+
+                return await asyncio.get_running_loop().run_in_executor(
+                    self.__executors[worker], fn, *args
+                )
+        finally:
+            self.__in_flight[worker] -= 1
+
+    async def start(self: Self) -> List[Dict[str, float]]:
+        """Start every worker and wait until their models are loaded and warm.
+
+        Returns:
+            List[Dict[str, float]]: The warm-up seconds per language of every worker.
+        """
+        if self.start_method == "fork" and len(self.__executors) == 0:
+            await asyncio.to_thread(_warm_up)
+            # Objects loaded so far are never collected: the collector would
+            # otherwise write to (and copy) every shared page it visits
+            gc.collect()
+            gc.freeze()
+
+        return await asyncio.gather(
+            *(self.__run(worker, _warm_up) for worker in range(self.workers))
+        )
+
+    async def mask_batch(
+        self: Self,
+        texts: List[str],
+        session_id: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> List[str]:
+        return await self.__run(
+            self.__pick_worker(session_id=session_id),
+            _mask_batch,
+            texts,
+            self.batch_size,
+            session_id,
+            language,
+        )
+
+    async def stats(self: Self) -> List[Dict[str, Any]]:
+        """Return the memory counters of every worker."""
+        return await asyncio.gather(
+            *(self.__run(worker, _stats) for worker in range(self.workers))
+        )
+
+    def shutdown(self: Self) -> None:
+        for executor in self.__executors:
+            executor.shutdown(cancel_futures=True)
+
+        self.__executors = []
+
+
+@lru_cache()
+def get_mask_worker_pool() -> Optional[MaskWorkerPool]:
+    settings: MaskSettings = get_mask_settings()
+
+    if settings.mask_workers == 0:
+        return None
+
+    return MaskWorkerPool(
+        workers=settings.mask_workers,
+        batch_size=settings.mask_batch_size,
+        start_method=settings.mask_workers_start_method,
+    )
@@ -0,0 +1,372 @@
+import re
+
+from threading import Lock
+from typing import Dict, Iterator, List, Optional, Self, Set, Tuple
+from spacy.util import get_lang_class
+
+
+# Cheap evidence each entity needs to be found at all: a text matching none of
+# them is returned as is, without running language detection and NER
+DIGITS: str = r"\d"
+ENTITY_PATTERNS: Dict[str, str] = {
+    "CREDIT_CARD": DIGITS,
+    "CRYPTO": DIGITS,
+    "EMAIL_ADDRESS": r"@",
+    "IBAN_CODE": DIGITS,
+    "IP_ADDRESS": r"\d|:[0-9A-Fa-f]*:",
+    "PHONE_NUMBER": DIGITS,
+    "MEDICAL_LICENSE": DIGITS,
+    # Fiscal codes of homonyms may have letters in place of every digit
+    "IT_FISCAL_CODE": r"\d|\b[A-Za-z]{6}[0-9A-Za-z]{10}\b",
+    "IT_DRIVER_LICENSE": DIGITS,
+    "IT_VAT_CODE": DIGITS,
+    "IT_PASSPORT": DIGITS,
+    "IT_IDENTITY_CARD": DIGITS,
+    "IT_PHYSICAL_ADDRESS": DIGITS,
+}
+
+# Entities found by NER, which can only start with a capitalised word
+NAME_ENTITIES: Set[str] = {"PERSON", "LOCATION", "NRP"}
+# Found by NER too, also as digits or the date words of a language
+DATE_ENTITY: str = "DATE_TIME"
+
+# Dates and times spaCy tags without any digit (lowercase months in it/fr)
+DATE_WORDS: Dict[str, List[str]] = {
+    "en": [
+        "today",
+        "tonight",
+        "tomorrow",
+        "yesterday",
+        "morning",
+        "afternoon",
+        "evening",
+        "night",
+        "noon",
+        "midnight",
+        "weekend",
+        "day",
+        "days",
+        "week",
+        "weeks",
+        "month",
+        "months",
+        "year",
+        "years",
+        "hour",
+        "hours",
+        "minute",
+        "minutes",
+    ],
+    "it": [
+        "oggi",
+        "stasera",
+        "stanotte",
+        "domani",
+        "dopodomani",
+        "ieri",
+        "mattina",
+        "mattino",
+        "pomeriggio",
+        "sera",
+        "notte",
+        "mezzogiorno",
+        "mezzanotte",
+        "weekend",
+        "giorno",
+        "giorni",
+        "settimana",
+        "settimane",
+        "mese",
+        "mesi",
+        "anno",
+        "anni",
+        "ora",
+        "ore",
+        "minuto",
+        "minuti",
+        "gennaio",
+        "febbraio",
+        "marzo",
+        "aprile",
+        "maggio",
+        "giugno",
+        "luglio",
+        "agosto",
+        "settembre",
+        "ottobre",
+        "novembre",
+        "dicembre",
+        "lunedì",
+        "martedì",
+        "mercoledì",
+        "giovedì",
+        "venerdì",
+        "sabato",
+        "domenica",
+    ],
+    "fr": [
+        "aujourd'hui",
+        "demain",
+        "hier",
+        "matin",
+        "soir",
+        "nuit",
+        "midi",
+        "minuit",
+        "jour",
+        "jours",
+        "semaine",
+        "semaines",
+        "mois",
+        "année",
+        "années",
+        "heure",
+        "heures",
+        "minute",
+        "minutes",
+        "janvier",
+        "février",
+        "mars",
+        "avril",
+        "mai",
+        "juin",
+        "juillet",
+        "août",
+        "septembre",
+        "octobre",
+        "novembre",
+        "décembre",
+        "lundi",
+        "mardi",
+        "mercredi",
+        "jeudi",
+        "vendredi",
+        "samedi",
+        "dimanche",
+    ],
+    "de": [
+        "heute",
+        "morgen",
+        "gestern",
+        "übermorgen",
+        "vorgestern",
+        "morgens",
+        "abends",
+        "nachts",
+    ],
+}
+
+CAPITALISED_WORD: re.Pattern = re.compile(r"\w*[A-ZÀ-ÖØ-Þ]\w*")
+SENTENCE_BOUNDARY: re.Pattern = re.compile(r"(?<=[.!?])\s+|\n\s*")
+
+
+def stop_words(languages: List[str]) -> Set[str]:
+    """Return the spaCy stop words of the languages, without loading any model."""
+    words: Set[str] = set()
+
+    for lang in languages:
+        try:
+            words |= get_lang_class(lang).Defaults.stop_words
+        except Exception:
+            continue
+
+    return words
+
+
+class PiiPrescreen:
+    """Regex pre-screen telling which parts of a text may contain PII.
+
+    The patterns of the configured entities are compiled into a single regex
+    (digits, `@`, date words, ...), and names are looked for as capitalised
+    words. A capitalised stop word ("The", "Il") is not a candidate, and
+    neither are the words of the allow list. A sentence with a candidate runs
+    through NER as a whole, so a single candidate is enough to find a name
+    next to it.
+
+    Names written in lowercase are not candidates: a text whose only PII is a
+    lowercase name is not masked. Entities without a known pattern make every
+    text a candidate.
+    """
+
+    def __init__(
+        self: Self,
+        entities: List[str],
+        languages: List[str],
+        allow_list: List[str],
+        sentence_min_chars: int = 1000,
+    ) -> None:
+        self.sentence_min_chars: int = sentence_min_chars
+        # Without a pattern for every entity no text can be skipped
+        self.screens: bool = all(
+            entity in ENTITY_PATTERNS
+            or entity in NAME_ENTITIES
+            or entity == DATE_ENTITY
+            for entity in entities
+        )
+        self.names: bool = len(NAME_ENTITIES.intersection(entities)) > 0
+        self.stop_words: Set[str] = stop_words(languages=languages)
+
+        alternatives: Set[str] = {
+            ENTITY_PATTERNS[entity] for entity in entities if entity in ENTITY_PATTERNS
+        }
+
+        if DATE_ENTITY in entities:
+            words: List[str] = [
+                re.escape(word)
+                for lang in languages
+                for word in DATE_WORDS.get(lang, [])
+            ]
+            alternatives.add(DIGITS)
+            alternatives.add(r"\b(?:" + "|".join(sorted(set(words))) + r")\b")
+
+        self.__pattern: Optional[re.Pattern] = (
+            re.compile("|".join(sorted(alternatives)), re.IGNORECASE)
+            if len(alternatives) > 0
+            else None
+        )
+        self.__allow_pattern: Optional[re.Pattern] = (
+            re.compile(
+                r"\b(?:"
+                + "|".join(
+                    re.escape(word)
+                    for word in sorted(allow_list, key=len, reverse=True)
+                )
+                + r")\b"
+            )
+            if len(allow_list) > 0
+            else None
+        )
+
+    def __has_candidates(self: Self, text: str, start: int, end: int) -> bool:
+        if self.__pattern is not None and self.__pattern.search(text, start, end):
+            return True
+
+        if not self.names:
+            return False
+
+        return any(
+            match.group().lower() not in self.stop_words
+            for match in CAPITALISED_WORD.finditer(text, start, end)
+        )
+
+    def __sentences(self: Self, text: str) -> Iterator[Tuple[int, int]]:
+        start: int = 0
+
+        for boundary in SENTENCE_BOUNDARY.finditer(text):
+            yield start, boundary.start()
+            start = boundary.end()
+
+        yield start, len(text)
+
+    def spans(self: Self, text: str) -> List[Tuple[int, int]]:
+        """Return the (start, end) spans of the text to run NER on.
+
+        Args:
+            text (str): The text to screen.
+
+        Returns:
+            List[Tuple[int, int]]: No span when the text has no candidate, the whole text when it is shorter than `sentence_min_chars`, the candidate sentences (adjacent ones merged) otherwise.
+        """
+        if not self.screens:
+            return [(0, len(text))]
+
+        # Allow-listed words are blanked, keeping the offsets
+        screened: str = (
+            self.__allow_pattern.sub(lambda m: " " * len(m.group()), text)
+            if self.__allow_pattern is not None
+            else text
+        )
+
+        if not self.__has_candidates(text=screened, start=0, end=len(screened)):
+            return []
+
+        if len(text) < self.sentence_min_chars:
+            return [(0, len(text))]
+
+        spans: List[Tuple[int, int]] = []
+        merge: bool = False
+
+        for start, end in self.__sentences(text=screened):
+            candidate: bool = self.__has_candidates(text=screened, start=start, end=end)
+
+            # Adjacent candidate sentences are analyzed together
+            if candidate and merge:
+                spans[-1] = (spans[-1][0], end)
+            elif candidate:
+                spans.append((start, end))
+
+            merge = candidate
+
+        return spans
+
+
+class PrescreenStats:
+    """Counters of the texts skipped, or partly skipped, by the pre-screen."""
+
+    def __init__(self: Self) -> None:
+        self.__lock: Lock = Lock()
+        self.__texts: int = 0
+        self.__skipped: int = 0
+        self.__sentence_level: int = 0
+        self.__chars: int = 0
+        self.__analyzed_chars: int = 0
+        self.__analyze_seconds: float = 0.0
+
+    def record(
+        self: Self,
+        texts: List[str],
+        spans: List[List[Tuple[int, int]]],
+        seconds: float,
+    ) -> None:
+        """Count the texts of a request, the spans they were analyzed on and the time it took."""
+        with self.__lock:
+            for text, text_spans in zip(texts, spans):
+                analyzed_chars: int = sum(end - start for start, end in text_spans)
+
+                self.__texts += 1
+                self.__chars += len(text)
+                self.__analyzed_chars += analyzed_chars
+
+                if len(text_spans) == 0:
+                    self.__skipped += 1
+                elif analyzed_chars < len(text):
+                    self.__sentence_level += 1
+
+            self.__analyze_seconds += seconds
+
+    def stats(self: Self) -> Dict[str, float]:
+        """Return the pre-screen counters.
+
+        Returns:
+            Dict[str, float]: texts screened, skipped (no candidate) and analyzed by sentence, the skip ratio, the characters screened and analyzed, the time spent analyzing and the time saved, estimated from the average analysis time per character.
+        """
+        with self.__lock:
+            seconds_per_char: float = (
+                self.__analyze_seconds / self.__analyzed_chars
+                if self.__analyzed_chars
+                else 0.0
+            )
+
+            return {
+                "texts": self.__texts,
+                "skipped": self.__skipped,
+                "sentence_level": self.__sentence_level,
+                "skip_ratio": self.__skipped / self.__texts if self.__texts else 0.0,
+                "chars": self.__chars,
+                "analyzed_chars": self.__analyzed_chars,
+                "analyze_seconds": self.__analyze_seconds,
+                "saved_seconds": (self.__chars - self.__analyzed_chars)
+                * seconds_per_char,
+            }
+
+
+def merge_prescreen_stats(stats: List[Dict[str, float]]) -> Dict[str, float]:
+    """Sum the pre-screen counters of several processes."""
+    merged: Dict[str, float] = {
+        key: sum(process[key] for process in stats) for key in stats[0]
+    }
+    merged["skip_ratio"] = (
+        merged["skipped"] / merged["texts"] if merged["texts"] else 0.0
+    )
+
+    return merged
@@ -1,14 +1,14 @@
+import time
 import yaml
 
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Self, Optional
-from langdetect import detect_langs
-from langdetect.language import Language
+from typing import Any, Dict, List, Self, Optional, Tuple
 from pydantic import BaseModel, ConfigDict, ValidationError
 from presidio_anonymizer.operators import Operator, OperatorType
 from presidio_analyzer import (
     AnalyzerEngine,
+    BatchAnalyzerEngine,
     Pattern,
     PatternRecognizer,
     RecognizerResult,
@@ -17,6 +17,17 @@ from presidio_analyzer.nlp_engine import NlpEngineProvider, NlpEngine
 from presidio_anonymizer import AnonymizerEngine, EngineResult
 from presidio_anonymizer.entities import OperatorConfig
 
+from .env import MaskSettings, get_mask_settings
+from .language import (
+    DEFAULT_LANGUAGE,
+    LanguageDetectorInterface,
+    LangdetectLanguageDetector,
+    SessionLanguages,
+    build_language_detector,
+)
+from .mapping import EntityMapping, EntityMappingStore
+from .prescreen import PiiPrescreen, PrescreenStats
+
 
 class PresidioModelConfig(BaseModel):
     model_config: ConfigDict = ConfigDict(extra="forbid")
@@ -124,6 +135,12 @@ IT_ENTITIES: List[str] = [
     "IT_PHYSICAL_ADDRESS",
 ]
 
+# Synthetic text run through every model at startup, one entity of each kind
+WARM_UP_TEXT: str = (
+    "Mario Rossi lives in via Roma 12, Milano. "
+    "Write to mario.rossi@example.com or call +39 333 123 4567 on 1 January 2024."
+)
+
 
 class PresidioPII:
     def __init__(
@@ -131,8 +148,11 @@ class PresidioPII:
         config: PresidioConfig | Dict[str, Any],
         analyzer_threshold: float = 0.4,
         entities: Optional[List[str]] = None,
-        mapping: Optional[Dict[str, str]] = None,
-        entity_mapping: Optional[Dict[str, Dict]] = None,
+        mapping_store: Optional[EntityMappingStore] = None,
+        prescreen: bool = False,
+        prescreen_sentence_min_chars: int = 1000,
+        language_detector: Optional[LanguageDetectorInterface] = None,
+        session_languages: Optional[SessionLanguages] = None,
     ):
         self.config: Dict[str, Any] = (
             config.model_dump() if isinstance(config, PresidioConfig) else config
@@ -141,8 +161,13 @@ class PresidioPII:
             item["lang_code"] for item in self.config["models"]
         ]
         self.entities: List[str] = entities if entities is not None else GLOBAL_ENTITIES
-        self.entity_mapping = entity_mapping if entity_mapping is not None else {}
-        self.mapping = mapping if mapping is not None else {}
+        self.mapping_store: Optional[EntityMappingStore] = mapping_store
+        self.language_detector: LanguageDetectorInterface = (
+            language_detector
+            if language_detector is not None
+            else LangdetectLanguageDetector(languages=self.languages)
+        )
+        self.session_languages: Optional[SessionLanguages] = session_languages
         self.provider: NlpEngineProvider = NlpEngineProvider(
             nlp_configuration=self.config
         )
@@ -152,6 +177,21 @@ class PresidioPII:
             supported_languages=self.languages,
             default_score_threshold=analyzer_threshold,
         )
+        self.batch_analyzer: BatchAnalyzerEngine = BatchAnalyzerEngine(
+            analyzer_engine=self.analyzer
+        )
+        # The language is only known after the pre-screen, Italian entities included
+        self.prescreen: Optional[PiiPrescreen] = (
+            PiiPrescreen(
+                entities=self.entities + IT_ENTITIES,
+                languages=self.languages,
+                allow_list=self.config["allow_list"],
+                sentence_min_chars=prescreen_sentence_min_chars,
+            )
+            if prescreen
+            else None
+        )
+        self.prescreen_counters: PrescreenStats = PrescreenStats()
         self.__add_italian_physical_address_entity()
         self.engine = AnonymizerEngine()
         self.engine.add_anonymizer(EntityTypeCountAnonymizer)
@@ -170,54 +210,243 @@ class PresidioPII:
 
         self.analyzer.registry.add_recognizer(recognizer=address_recognizer)
 
-    def __detect_language(self: Self, text: str) -> str:
-        language_list: List[Language] = []
+    def __detect_language(
+        self: Self,
+        text: str,
+        session_id: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> str:
+        # A hint of the caller skips detection, unless it is not configured
+        if language is not None and language in self.languages:
+            return language
 
-        try:
-            detected_languages: List[Language] = detect_langs(text=text)
-        except Exception:
-            return "it"
+        if session_id is not None and self.session_languages is not None:
+            session_language: Optional[str] = self.session_languages.get(
+                session_id=session_id
+            )
 
-        for detected_language in detected_languages:
-            if str(detected_language) in self.languages:
-                language_list.append(detected_language)
+            if session_language is not None:
+                return session_language
 
-        if len(language_list) == 0:
-            return "it"
-        elif "it" in language_list:
-            return "it"
+        detected: Optional[str] = self.language_detector.detect(text=text)
 
-        return language_list[0]
+        if detected is None:
+            return DEFAULT_LANGUAGE
 
-    def __detect_pii(self: Self, text: str) -> List[RecognizerResult]:
-        lang: str = self.__detect_language(text=text)
-        results: List[RecognizerResult] = self.analyzer.analyze(
-            text=text,
-            language=lang,
-            entities=self.entities + IT_ENTITIES if lang == "it" else self.entities,
-            allow_list=self.config["allow_list"],
-        )
+        if session_id is not None and self.session_languages is not None:
+            self.session_languages.set(session_id=session_id, lang=detected)
+
+        return detected
+
+    def __entities(self: Self, lang: str) -> List[str]:
+        return self.entities + IT_ENTITIES if lang == "it" else self.entities
+
+    def __spans(self: Self, text: str) -> List[Tuple[int, int]]:
+        if self.prescreen is None:
+            return [(0, len(text))]
+
+        return self.prescreen.spans(text=text)
+
+    def __shift(
+        self: Self, results: List[RecognizerResult], offset: int
+    ) -> List[RecognizerResult]:
+        # Results of a span are relative to its start
+        for result in results:
+            result.start += offset
+            result.end += offset
 
         return results
 
-    def mask_pii(self: Self, text: str) -> str:
-        results: List[RecognizerResult] = self.__detect_pii(text=text)
-        new_text: EngineResult = self.engine.anonymize(
-            text=text,
-            analyzer_results=results,
-            operators={
-                "DEFAULT": OperatorConfig(
-                    operator_name="EntityTypeCountAnonymizer",
-                    params={
-                        "entity_mapping": self.entity_mapping,
-                        "deanonymize_mapping": self.mapping,
-                    },
-                ),
-            },
+    def __record(
+        self: Self,
+        texts: List[str],
+        spans: List[List[Tuple[int, int]]],
+        started_at: float,
+    ) -> None:
+        if self.prescreen is not None:
+            self.prescreen_counters.record(
+                texts=texts, spans=spans, seconds=time.perf_counter() - started_at
+            )
+
+    def __detect_pii(
+        self: Self,
+        text: str,
+        spans: Optional[List[Tuple[int, int]]] = None,
+        session_id: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> List[RecognizerResult]:
+        lang: str = self.__detect_language(
+            text=text, session_id=session_id, language=language
         )
+        results: List[RecognizerResult] = []
+
+        for start, end in spans if spans is not None else [(0, len(text))]:
+            span_results: List[RecognizerResult] = self.analyzer.analyze(
+                text=text[start:end],
+                language=lang,
+                entities=self.__entities(lang=lang),
+                allow_list=self.config["allow_list"],
+            )
+            results.extend(self.__shift(results=span_results, offset=start))
+
+        return results
+
+    def __mapping(self: Self, session_id: Optional[str]) -> EntityMapping:
+        # Without a session (or a store) placeholders live as long as the request
+        if session_id is None or self.mapping_store is None:
+            return EntityMapping()
+
+        return self.mapping_store.get(session_id=session_id)
+
+    def __anonymize(
+        self: Self,
+        text: str,
+        results: List[RecognizerResult],
+        mapping: EntityMapping,
+    ) -> str:
+        # The operator numbers the placeholders from the mapping it updates
+        with mapping.lock:
+            new_text: EngineResult = self.engine.anonymize(
+                text=text,
+                analyzer_results=results,
+                operators={
+                    "DEFAULT": OperatorConfig(
+                        operator_name="EntityTypeCountAnonymizer",
+                        params={
+                            "entity_mapping": mapping.entity_mapping,
+                            "deanonymize_mapping": mapping.deanonymize_mapping,
+                        },
+                    ),
+                },
+            )
 
         return new_text.text
 
+    def mask_pii(
+        self: Self,
+        text: str,
+        session_id: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> str:
+        spans: List[Tuple[int, int]] = self.__spans(text=text)
+        started_at: float = time.perf_counter()
+
+        # Nothing in the text can be PII: no language detection, no NER
+        if len(spans) == 0:
+            self.__record(texts=[text], spans=[spans], started_at=started_at)
+            return text
+
+        results: List[RecognizerResult] = self.__detect_pii(
+            text=text, spans=spans, session_id=session_id, language=language
+        )
+        self.__record(texts=[text], spans=[spans], started_at=started_at)
+
+        return self.__anonymize(
+            text=text, results=results, mapping=self.__mapping(session_id=session_id)
+        )
+
+    def mask_pii_batch(
+        self: Self,
+        texts: List[str],
+        batch_size: int = 32,
+        session_id: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> List[str]:
+        """Mask several texts, running the NER of each language as one spaCy `nlp.pipe` batch.
+
+        Texts are grouped by detected language, analyzed in batches of
+        `batch_size` and anonymized in their original order, so that the same
+        value gets the same placeholder in every text of the batch (and of the
+        session, when the session mapping store is enabled). With the
+        pre-screen enabled, texts without candidates are left out of the batch
+        and long texts only contribute their candidate sentences. A `language`
+        hint, or the language already detected for the session, skips
+        language detection.
+        """
+        spans: List[List[Tuple[int, int]]] = [self.__spans(text=text) for text in texts]
+        started_at: float = time.perf_counter()
+        texts_by_lang: Dict[str, List[int]] = {}
+
+        for i, text in enumerate(texts):
+            if len(spans[i]) == 0:
+                continue
+
+            lang: str = self.__detect_language(
+                text=text, session_id=session_id, language=language
+            )
+            texts_by_lang.setdefault(lang, []).append(i)
+
+        results: List[List[RecognizerResult]] = [[] for _ in texts]
+
+        for lang, indexes in texts_by_lang.items():
+            segments: List[Tuple[int, int, int]] = [
+                (i, start, end) for i in indexes for start, end in spans[i]
+            ]
+            lang_results: List[List[RecognizerResult]] = (
+                self.batch_analyzer.analyze_iterator(
+                    texts=[texts[i][start:end] for i, start, end in segments],
+                    language=lang,
+                    batch_size=batch_size,
+                    entities=self.__entities(lang=lang),
+                    allow_list=self.config["allow_list"],
+                )
+            )
+
+            for (i, start, _), segment_results in zip(segments, lang_results):
+                results[i].extend(self.__shift(results=segment_results, offset=start))
+
+        self.__record(texts=texts, spans=spans, started_at=started_at)
+        mapping: EntityMapping = self.__mapping(session_id=session_id)
+
+        return [
+            self.__anonymize(text=text, results=text_results, mapping=mapping)
+            if len(text_results) > 0
+            else text
+            for text, text_results in zip(texts, results)
+        ]
+
+    def warm_up(self: Self) -> Dict[str, float]:
+        """Run a synthetic text through the pipeline of every configured language.
+
+        The first analysis of a language pays for the lazy initialisation of
+        spaCy and Presidio (and langdetect loads its profiles on first use):
+        running it at startup keeps that cost out of the first request.
+
+        Returns:
+            Dict[str, float]: The seconds the analysis took, per language.
+        """
+        self.language_detector.detect(text=WARM_UP_TEXT)
+        seconds: Dict[str, float] = {}
+
+        for lang in self.languages:
+            started_at: float = time.perf_counter()
+            results: List[RecognizerResult] = self.analyzer.analyze(
+                text=WARM_UP_TEXT,
+                language=lang,
+                entities=self.__entities(lang=lang),
+                allow_list=self.config["allow_list"],
+            )
+            self.__anonymize(
+                text=WARM_UP_TEXT, results=results, mapping=EntityMapping()
+            )
+            seconds[lang] = time.perf_counter() - started_at
+
+        return seconds
+
+    def mapping_stats(self: Self) -> Optional[Dict[str, int]]:
+        """Return the counters of the session mapping store, None when disabled."""
+        if self.mapping_store is None:
+            return None
+
+        return self.mapping_store.stats()
+
+    def prescreen_stats(self: Self) -> Optional[Dict[str, float]]:
+        """Return the counters of the pre-screen, None when disabled."""
+        if self.prescreen is None:
+            return None
+
+        return self.prescreen_counters.stats()
+
 
 @lru_cache()
 def __read_presidio_config() -> Dict[str, Any]:
@@ -252,5 +481,27 @@ def __read_presidio_config() -> Dict[str, Any]:
 def get_presidio() -> PresidioPII:
     # Leggy YAML configurazione
     presidio_config: Dict[str, Any] = __read_presidio_config()
-
-    return PresidioPII(config=presidio_config)
+    settings: MaskSettings = get_mask_settings()
+    languages: List[str] = [item["lang_code"] for item in presidio_config["models"]]
+
+    return PresidioPII(
+        config=presidio_config,
+        mapping_store=(
+            EntityMappingStore(
+                max_sessions=settings.mask_session_mapping_max_sessions,
+                ttl_seconds=settings.mask_session_mapping_ttl_seconds,
+            )
+            if settings.mask_session_mapping_max_sessions > 0
+            else None
+        ),
+        prescreen=settings.mask_prescreen_enabled,
+        prescreen_sentence_min_chars=settings.mask_prescreen_sentence_min_chars,
+        language_detector=build_language_detector(
+            name=settings.mask_language_detector, languages=languages
+        ),
+        session_languages=(
+            SessionLanguages(max_sessions=settings.mask_language_max_sessions)
+            if settings.mask_language_max_sessions > 0
+            else None
+        ),
+    )
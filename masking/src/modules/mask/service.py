@@ -1,20 +1,118 @@
 from functools import lru_cache
-from typing import Self, Annotated
-from fastapi import Depends
+from typing import Any, Dict, List, Optional, Self
+from fastapi.concurrency import run_in_threadpool
 
+from .env import get_mask_settings
+from .pool import MaskWorkerPool, get_mask_worker_pool, process_stats
+from .prescreen import merge_prescreen_stats
 from .presidio import get_presidio, PresidioPII
 
 
 class MaskService:
-    def __init__(self: Self, presidio_client: PresidioPII):
-        self.presidio_client: PresidioPII = presidio_client
+    def __init__(
+        self: Self,
+        presidio_client: Optional[PresidioPII] = None,
+        worker_pool: Optional[MaskWorkerPool] = None,
+        batch_size: int = 32,
+    ):
+        self.presidio_client: Optional[PresidioPII] = presidio_client
+        self.worker_pool: Optional[MaskWorkerPool] = worker_pool
+        self.batch_size: int = batch_size
 
-    def mask(self: Self, text: str) -> str:
-        return self.presidio_client.mask_pii(text=text)
+    async def mask(
+        self: Self,
+        text: str,
+        session_id: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> str:
+        if self.worker_pool is not None:
+            [masked_text] = await self.worker_pool.mask_batch(
+                texts=[text], session_id=session_id, language=language
+            )
+            return masked_text
+
+        return await run_in_threadpool(
+            self.presidio_client.mask_pii,
+            text=text,
+            session_id=session_id,
+            language=language,
+        )
+
+    async def mask_batch(
+        self: Self,
+        texts: List[str],
+        session_id: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> List[str]:
+        if self.worker_pool is not None:
+            return await self.worker_pool.mask_batch(
+                texts=texts, session_id=session_id, language=language
+            )
+
+        return await run_in_threadpool(
+            self.presidio_client.mask_pii_batch,
+            texts=texts,
+            batch_size=self.batch_size,
+            session_id=session_id,
+            language=language,
+        )
+
+    async def warm_up(self: Self) -> Dict[str, float]:
+        """Load the models and run a synthetic text through every language.
+
+        Returns:
+            Dict[str, float]: The warm-up seconds per language, the slowest worker's with a pool.
+        """
+        if self.worker_pool is None:
+            return await run_in_threadpool(self.presidio_client.warm_up)
+
+        workers: List[Dict[str, float]] = await self.worker_pool.start()
+
+        return {lang: max(worker[lang] for worker in workers) for lang in workers[0]}
+
+    async def stats(self: Self) -> Dict[str, Any]:
+        processes: List[Dict[str, Any]] = (
+            await self.worker_pool.stats()
+            if self.worker_pool is not None
+            else [process_stats(presidio=self.presidio_client)]
+        )
+        session_mappings: List[Dict[str, int]] = [
+            process["session_mapping"]
+            for process in processes
+            if process["session_mapping"] is not None
+        ]
+        prescreens: List[Dict[str, float]] = [
+            process["prescreen"]
+            for process in processes
+            if process["prescreen"] is not None
+        ]
+
+        return {
+            "processes": processes,
+            # Totals of every process, None when the session store is disabled
+            "session_mapping": (
+                {
+                    key: sum(mapping[key] for mapping in session_mappings)
+                    for key in session_mappings[0]
+                }
+                if len(session_mappings) > 0
+                else None
+            ),
+            "prescreen": (
+                merge_prescreen_stats(stats=prescreens) if len(prescreens) > 0 else None
+            ),
+        }
 
 
 @lru_cache()
-def get_mask_service(
-    presidio: Annotated[PresidioPII, Depends(dependency=get_presidio)],
-) -> MaskService:
-    return MaskService(presidio_client=presidio)
+def get_mask_service() -> MaskService:
+    worker_pool: Optional[MaskWorkerPool] = get_mask_worker_pool()
+
+    # With a worker pool the models are only loaded by the workers
+    if worker_pool is not None:
+        return MaskService(worker_pool=worker_pool)
+
+    return MaskService(
+        presidio_client=get_presidio(),
+        batch_size=get_mask_settings().mask_batch_size,
+    )
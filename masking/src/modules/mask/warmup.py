@@ -0,0 +1,81 @@
+import asyncio
+
+from functools import lru_cache
+from typing import Dict, Optional, Self
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+
+from .service import get_mask_service, MaskService
+
+
+class MaskWarmUp:
+    """Background loading and warm-up of the masking models.
+
+    Started by the lifespan of the app, so that the service accepts
+    connections (and answers its liveness probe) while the models load. Mask
+    requests received in the meantime wait for the warm-up to end.
+    """
+
+    def __init__(self: Self) -> None:
+        self.seconds: Optional[Dict[str, float]] = None
+        self.__task: Optional[asyncio.Task] = None
+
+    async def __run(self: Self) -> None:
+        # Building the service loads the models when they are in-process
+        mask_service: MaskService = await run_in_threadpool(get_mask_service)
+        self.seconds = await mask_service.warm_up()
+
+    def start(self: Self) -> None:
+        """Start the warm-up in the background, once."""
+        if self.__task is None:
+            self.__task = asyncio.create_task(self.__run())
+
+    @property
+    def ready(self: Self) -> bool:
+        return self.seconds is not None
+
+    @property
+    def error(self: Self) -> Optional[BaseException]:
+        if self.__task is None or not self.__task.done() or self.__task.cancelled():
+            return None
+
+        return self.__task.exception()
+
+    async def wait(self: Self) -> None:
+        """Wait for the warm-up to end, right away when it never started.
+
+        Raises:
+            HTTPException: 503 when the warm-up failed.
+        """
+        if self.__task is None:
+            return
+
+        try:
+            # A cancelled request must not cancel the warm-up
+            await asyncio.shield(self.__task)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Masking service warm-up failed",
+            ) from e
+
+    async def stop(self: Self) -> None:
+        """Cancel the warm-up when it is still running."""
+        if self.__task is None or self.__task.done():
+            return
+
+        self.__task.cancel()
+
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+
+
+@lru_cache()
+def get_mask_warm_up() -> MaskWarmUp:
+    return MaskWarmUp()
+
+
+async def wait_for_warm_up() -> None:
+    await get_mask_warm_up().wait()
@@ -1,7 +1,24 @@
 import pytest
 
+from typing import Dict, Optional
 from httpx import AsyncClient, Response
 
+import src.modules.health.controller as health_controller_mod
+
+
+class MaskWarmUpMock:
+    def __init__(
+        self,
+        seconds: Optional[Dict[str, float]] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        self.seconds: Optional[Dict[str, float]] = seconds
+        self.error: Optional[BaseException] = error
+
+    @property
+    def ready(self) -> bool:
+        return self.seconds is not None
+
 
 @pytest.mark.asyncio
 async def test_health_check(client_test: AsyncClient) -> None:
@@ -10,3 +27,36 @@ async def test_health_check(client_test: AsyncClient) -> None:
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok", "service": "Masking Service"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "warm_up, status_code, expected",
+    [
+        (MaskWarmUpMock(), 503, {"status": "warming up"}),
+        (
+            MaskWarmUpMock(error=OSError("model not found")),
+            503,
+            {"status": "failed", "error": "model not found"},
+        ),
+        (
+            MaskWarmUpMock(seconds={"it": 0.5}),
+            200,
+            {"status": "ready", "warm_up_seconds": {"it": 0.5}},
+        ),
+    ],
+)
+async def test_readiness_check(
+    monkeypatch: pytest.MonkeyPatch,
+    client_test: AsyncClient,
+    warm_up: MaskWarmUpMock,
+    status_code: int,
+    expected: Dict,
+) -> None:
+    """GET /health/ready answers 200 only once the models are warm."""
+    monkeypatch.setattr(health_controller_mod, "get_mask_warm_up", lambda: warm_up)
+
+    response: Response = await client_test.get("/health/ready")
+
+    assert response.status_code == status_code
+    assert response.json() == expected
@@ -1,5 +1,7 @@
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Self, Any, Dict, List, Optional
+from typing import Self, Any, Callable, Dict, List, Optional
 
 
 class NlpEngineMock:
@@ -40,6 +42,7 @@ class AnalyzerEngineMock:
         self.registry: AnalyzerRegistryMock = AnalyzerRegistryMock()
         self.analyze_return_value: List[Any] = []
         self.last_analyze_kwargs: Optional[Dict[str, Any]] = None
+        self.analyzed_languages: List[str] = []
 
     def analyze(
         self: Self,
@@ -54,9 +57,36 @@ class AnalyzerEngineMock:
             "entities": entities,
             "allow_list": allow_list,
         }
+        self.analyzed_languages.append(language)
         return self.analyze_return_value
 
 
+class BatchAnalyzerEngineMock:
+    """Mock for presidio_analyzer.BatchAnalyzerEngine, analyzing with the wrapped engine."""
+
+    def __init__(self: Self, analyzer_engine: AnalyzerEngineMock) -> None:
+        self.analyzer_engine: AnalyzerEngineMock = analyzer_engine
+        self.calls: List[Dict[str, Any]] = []
+
+    def analyze_iterator(
+        self: Self,
+        texts: List[str],
+        language: str,
+        batch_size: int,
+        entities: List[str],
+        allow_list: List[str],
+    ) -> List[List[Any]]:
+        self.calls.append(
+            {"texts": texts, "language": language, "batch_size": batch_size}
+        )
+        return [
+            self.analyzer_engine.analyze(
+                text=text, language=language, entities=entities, allow_list=allow_list
+            )
+            for text in texts
+        ]
+
+
 class FakeLang:
     """Mimics langdetect.language.Language with str() returning just the lang code."""
 
@@ -79,11 +109,107 @@ class PresidioPIIMock:
     def __init__(self: Self) -> None:
         self.mask_pii_called_with: Optional[str] = None
         self.mask_pii_return_value: str = "masked"
+        self.mask_pii_batch_called_with: Optional[Dict[str, Any]] = None
 
-    def mask_pii(self: Self, text: str) -> str:
+    def mask_pii(
+        self: Self,
+        text: str,
+        session_id: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> str:
         self.mask_pii_called_with = text
         return self.mask_pii_return_value
 
+    def mask_pii_batch(
+        self: Self,
+        texts: List[str],
+        batch_size: int,
+        session_id: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> List[str]:
+        self.mask_pii_batch_called_with = {
+            "texts": texts,
+            "batch_size": batch_size,
+            "session_id": session_id,
+            "language": language,
+        }
+        return [self.mask_pii_return_value for _ in texts]
+
+    def warm_up(self: Self) -> Dict[str, float]:
+        return {"it": 0.5, "en": 0.25}
+
+    def mapping_stats(self: Self) -> Optional[Dict[str, int]]:
+        return None
+
+    def prescreen_stats(self: Self) -> Optional[Dict[str, float]]:
+        return None
+
+
+class MaskWorkerPoolMock:
+    """Mock for MaskWorkerPool used in MaskService tests."""
+
+    def __init__(self: Self) -> None:
+        self.mask_batch_calls: List[Dict[str, Any]] = []
+
+    async def mask_batch(
+        self: Self,
+        texts: List[str],
+        session_id: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> List[str]:
+        self.mask_batch_calls.append(
+            {"texts": texts, "session_id": session_id, "language": language}
+        )
+        return [f"pooled {text}" for text in texts]
+
+    async def start(self: Self) -> List[Dict[str, float]]:
+        return [{"it": 0.5, "en": 0.25}, {"it": 0.25, "en": 0.75}]
+
+    async def stats(self: Self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "pid": pid,
+                "max_rss_bytes": 1000,
+                "pss_bytes": 500,
+                "session_mapping": {"sessions": 2, "entities": 5},
+                "prescreen": {"texts": 4, "skipped": 1, "skip_ratio": 0.25},
+            }
+            for pid in [1, 2]
+        ]
+
+
+class ProcessPoolExecutorMock(Executor):
+    """Mock for the ProcessPoolExecutor of a worker. The first `broken`
+    executors created behave as if their process died.
+    """
+
+    broken: int = 1
+    created: List["ProcessPoolExecutorMock"] = []
+
+    def __init__(self: Self, **kwargs: Any) -> None:
+        self.is_broken: bool = len(ProcessPoolExecutorMock.created) < self.broken
+        self.calls: List[str] = []
+        self.shutdown_calls: int = 0
+        ProcessPoolExecutorMock.created.append(self)
+
+    def submit(self: Self, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        self.calls.append(fn.__name__)
+        future: Future = Future()
+
+        if self.is_broken:
+            future.set_exception(BrokenProcessPool("A child process died"))
+        elif fn.__name__ == "_warm_up":
+            future.set_result({"en": 0.25})
+        else:
+            future.set_result([f"pooled {text}" for text in args[0]])
+
+        return future
+
+    def shutdown(
+        self: Self, wait: bool = True, *, cancel_futures: bool = False
+    ) -> None:
+        self.shutdown_calls += 1
+
 
 class MaskServiceMock:
     """Mock for MaskService used in controller tests."""
@@ -91,9 +217,37 @@ class MaskServiceMock:
     def __init__(self: Self) -> None:
         self.mask_return_value: str = "masked output"
 
-    def mask(self: Self, text: str) -> str:
+    async def mask(
+        self: Self,
+        text: str,
+        session_id: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> str:
         return self.mask_return_value
 
+    async def mask_batch(
+        self: Self,
+        texts: List[str],
+        session_id: Optional[str] = None,
+        language: Optional[str] = None,
+    ) -> List[str]:
+        return [f"{self.mask_return_value} {i}" for i in range(len(texts))]
+
+    async def stats(self: Self) -> Dict[str, Any]:
+        return {
+            "processes": [
+                {
+                    "pid": 1,
+                    "max_rss_bytes": 1000,
+                    "pss_bytes": None,
+                    "session_mapping": None,
+                    "prescreen": None,
+                }
+            ],
+            "session_mapping": None,
+            "prescreen": None,
+        }
+
 
 class ConfigPathMock:
     """Mock for pathlib.Path used in __read_presidio_config tests.
@@ -143,6 +297,13 @@ def detect_langs_unsupported_mock(text: str) -> List[FakeLang]:
     return [FakeLang("zh")]
 
 
+def detect_langs_english_greeting_mock(text: str) -> List[FakeLang]:
+    """Mock detect_langs returning English for greetings, failing (Italian) otherwise."""
+    if text.startswith("Hello"):
+        return [FakeLang("en")]
+    raise Exception("langdetect failed")
+
+
 def make_presidio_config() -> Dict[str, Any]:
     """Return a minimal presidio config dict for testing."""
     return {
@@ -2,7 +2,7 @@ import pytest
 
 from pydantic import ValidationError
 
-from src.modules.mask.dto import MaskRequestBody
+from src.modules.mask.dto import MaskBatchRequestBody, MaskRequestBody
 
 
 class TestMaskRequestBody:
@@ -23,3 +23,20 @@ class TestMaskRequestBody:
         )
         assert body.text == "Hello"
         assert not hasattr(body, "extra_field")
+
+
+class TestMaskBatchRequestBody:
+    def test_valid(self) -> None:
+        """A list of texts is accepted."""
+        body: MaskBatchRequestBody = MaskBatchRequestBody(texts=["a", "b"])
+        assert body.texts == ["a", "b"]
+
+    def test_empty_list(self) -> None:
+        """An empty list of texts raises ValidationError."""
+        with pytest.raises(ValidationError):
+            MaskBatchRequestBody(texts=[])
+
+    def test_too_many_texts(self) -> None:
+        """More than 256 texts raise ValidationError."""
+        with pytest.raises(ValidationError):
+            MaskBatchRequestBody(texts=["a"] * 257)
@@ -0,0 +1,111 @@
+import pytest
+
+from typing import List, Optional, Set
+
+import src.modules.mask.language as language_mod
+from src.modules.mask.language import (
+    LangdetectLanguageDetector,
+    LanguageDetectorName,
+    SessionLanguages,
+    StopWordLanguageDetector,
+    build_language_detector,
+)
+
+from test.modules.mask.mocks import (
+    detect_langs_error_mock,
+    detect_langs_italian_mock,
+    detect_langs_english_only_mock,
+    detect_langs_unsupported_mock,
+)
+
+
+STOP_WORDS = {
+    "it": {"il", "la", "di", "che", "a"},
+    "en": {"the", "of", "that", "a"},
+}
+
+
+def stop_words_mock(languages: List[str]) -> Set[str]:
+    return STOP_WORDS[languages[0]]
+
+
+@pytest.fixture
+def detector(monkeypatch: pytest.MonkeyPatch) -> StopWordLanguageDetector:
+    monkeypatch.setattr(language_mod, "stop_words", stop_words_mock)
+    return StopWordLanguageDetector(languages=["it", "en"], max_words=8)
+
+
+class TestStopWordLanguageDetector:
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("Il nome di Mario che abita a Roma", "it"),
+            ("The name of the user that lives in Rome", "en"),
+            # Only stop words shared by both languages: unsure
+            ("a Roma", None),
+            ("Mario Rossi", None),
+            ("", None),
+        ],
+    )
+    def test_detect(
+        self, detector: StopWordLanguageDetector, text: str, expected: Optional[str]
+    ) -> None:
+        """The language with the most stop words wins, ties are unsure."""
+        assert detector.detect(text=text) == expected
+
+    def test_only_first_words(self, detector: StopWordLanguageDetector) -> None:
+        """Words after max_words are not looked at."""
+        text: str = "the " * 8 + "il di che la " * 10
+
+        assert detector.detect(text=text) == "en"
+
+
+class TestLangdetectLanguageDetector:
+    @pytest.mark.parametrize(
+        "detect_langs, expected",
+        [
+            (detect_langs_error_mock, None),
+            (detect_langs_unsupported_mock, None),
+            (detect_langs_italian_mock, "it"),
+            (detect_langs_english_only_mock, "en"),
+        ],
+    )
+    def test_detect(
+        self, monkeypatch: pytest.MonkeyPatch, detect_langs, expected: Optional[str]
+    ) -> None:
+        """Only configured languages are returned, Italian first when detected."""
+        monkeypatch.setattr(language_mod, "detect_langs", detect_langs)
+        detector: LangdetectLanguageDetector = LangdetectLanguageDetector(
+            languages=["it", "en"]
+        )
+
+        assert detector.detect(text="some text") == expected
+
+
+def test_build_language_detector(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The detector is picked by name."""
+    monkeypatch.setattr(language_mod, "stop_words", stop_words_mock)
+
+    assert isinstance(
+        build_language_detector(name=LanguageDetectorName.STOPWORDS, languages=["it"]),
+        StopWordLanguageDetector,
+    )
+    assert isinstance(
+        build_language_detector(name=LanguageDetectorName.LANGDETECT, languages=["it"]),
+        LangdetectLanguageDetector,
+    )
+
+
+class TestSessionLanguages:
+    def test_least_recently_used_evicted(self) -> None:
+        """Beyond max_sessions, the least recently used session is forgotten."""
+        languages: SessionLanguages = SessionLanguages(max_sessions=2)
+
+        languages.set(session_id="s1", lang="it")
+        languages.set(session_id="s2", lang="en")
+        assert languages.get(session_id="s1") == "it"
+        languages.set(session_id="s3", lang="en")
+
+        assert languages.get(session_id="s2") is None
+        assert languages.get(session_id="s1") == "it"
+        assert len(languages) == 2
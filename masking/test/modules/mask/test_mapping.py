@@ -0,0 +1,59 @@
+import pytest
+
+import src.modules.mask.mapping as mapping_mod
+from src.modules.mask.mapping import EntityMapping, EntityMappingStore
+
+
+class TestEntityMapping:
+    def test_len_and_size(self) -> None:
+        """A mapping counts its placeholders and the memory of their strings."""
+        mapping: EntityMapping = EntityMapping()
+        assert len(mapping) == 0
+        assert mapping.approx_bytes() == 0
+
+        mapping.deanonymize_mapping["<PERSON_1>"] = "John Doe"
+
+        assert len(mapping) == 1
+        assert mapping.approx_bytes() > 0
+
+
+class TestEntityMappingStore:
+    def test_same_session_same_mapping(self) -> None:
+        """The mapping of a session is kept between requests."""
+        store: EntityMappingStore = EntityMappingStore(max_sessions=2, ttl_seconds=60)
+
+        mapping: EntityMapping = store.get(session_id="s1")
+
+        assert store.get(session_id="s1") is mapping
+        assert store.get(session_id="s2") is not mapping
+        stats = store.stats()
+        assert stats["sessions"] == 2
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+
+    def test_least_recently_used_evicted(self) -> None:
+        """Beyond max_sessions, the least recently used session is dropped."""
+        store: EntityMappingStore = EntityMappingStore(max_sessions=2, ttl_seconds=60)
+        first: EntityMapping = store.get(session_id="s1")
+        store.get(session_id="s2")
+        store.get(session_id="s1")
+
+        store.get(session_id="s3")
+
+        assert store.get(session_id="s1") is first
+        assert store.stats()["evictions"] == 1
+
+    def test_expired(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A mapping unused for ttl_seconds is dropped."""
+        store: EntityMappingStore = EntityMappingStore(max_sessions=2, ttl_seconds=60)
+        first: EntityMapping = store.get(session_id="s1")
+        first.deanonymize_mapping["<PERSON_1>"] = "John Doe"
+
+        now: float = mapping_mod.time.monotonic()
+        monkeypatch.setattr(mapping_mod.time, "monotonic", lambda: now + 61)
+
+        stats = store.stats()
+        assert stats["sessions"] == 0
+        assert stats["entities"] == 0
+        assert stats["expirations"] == 1
+        assert store.get(session_id="s1") is not first
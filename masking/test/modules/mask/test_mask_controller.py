@@ -48,3 +48,56 @@ async def test_mask_endpoint_empty_text(
     response: Response = await client_test.post("/mask", json={"text": ""})
     assert response.status_code == 200
     assert response.json() == ""
+
+
+@pytest.mark.asyncio
+async def test_mask_batch_endpoint_success(
+    app_test: FastAPI, client_test: AsyncClient
+) -> None:
+    """POST /mask/batch returns the masked texts in order."""
+    mock_service: MaskServiceMock = MaskServiceMock()
+
+    app_test.dependency_overrides[get_mask_service] = lambda: mock_service
+
+    response: Response = await client_test.post(
+        "/mask/batch", json={"texts": ["question", "answer"]}
+    )
+    assert response.status_code == 200
+    assert response.json() == ["masked output 0", "masked output 1"]
+
+
+@pytest.mark.asyncio
+async def test_mask_batch_endpoint_empty_list(
+    app_test: FastAPI, client_test: AsyncClient
+) -> None:
+    """POST /mask/batch with no texts returns 422."""
+    mock_service: MaskServiceMock = MaskServiceMock()
+    app_test.dependency_overrides[get_mask_service] = lambda: mock_service
+
+    response: Response = await client_test.post("/mask/batch", json={"texts": []})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_mask_metrics_endpoint(
+    app_test: FastAPI, client_test: AsyncClient
+) -> None:
+    """GET /mask/metrics returns the counters of the masking processes."""
+    mock_service: MaskServiceMock = MaskServiceMock()
+    app_test.dependency_overrides[get_mask_service] = lambda: mock_service
+
+    response: Response = await client_test.get("/mask/metrics")
+    assert response.status_code == 200
+    assert response.json() == {
+        "processes": [
+            {
+                "pid": 1,
+                "max_rss_bytes": 1000,
+                "pss_bytes": None,
+                "session_mapping": None,
+                "prescreen": None,
+            }
+        ],
+        "session_mapping": None,
+        "prescreen": None,
+    }
@@ -1,38 +1,136 @@
+import pytest
+
+import src.modules.mask.service as service_mod
 from src.modules.mask.service import MaskService, get_mask_service
 
-from test.modules.mask.mocks import PresidioPIIMock
+from test.modules.mask.mocks import MaskWorkerPoolMock, PresidioPIIMock
 
 
 class TestMaskService:
-    def test_mask_delegates_to_presidio(self) -> None:
+    @pytest.mark.asyncio
+    async def test_mask_delegates_to_presidio(self) -> None:
         """MaskService.mask delegates to PresidioPII.mask_pii."""
         mock_presidio: PresidioPIIMock = PresidioPIIMock()
         mock_presidio.mask_pii_return_value = "masked text"
 
         service: MaskService = MaskService(presidio_client=mock_presidio)
-        result: str = service.mask(text="original text")
+        result: str = await service.mask(text="original text")
 
         assert mock_presidio.mask_pii_called_with == "original text"
         assert result == "masked text"
 
-    def test_mask_returns_string(self) -> None:
+    @pytest.mark.asyncio
+    async def test_mask_returns_string(self) -> None:
         """MaskService.mask returns a string."""
         mock_presidio: PresidioPIIMock = PresidioPIIMock()
 
         service: MaskService = MaskService(presidio_client=mock_presidio)
-        result: str = service.mask(text="some text")
+        result: str = await service.mask(text="some text")
 
         assert isinstance(result, str)
 
+    @pytest.mark.asyncio
+    async def test_mask_batch_delegates_to_presidio(self) -> None:
+        """MaskService.mask_batch runs PresidioPII.mask_pii_batch with the batch size."""
+        mock_presidio: PresidioPIIMock = PresidioPIIMock()
+
+        service: MaskService = MaskService(presidio_client=mock_presidio, batch_size=4)
+        result = await service.mask_batch(texts=["a", "b"], language="en")
+
+        assert mock_presidio.mask_pii_batch_called_with == {
+            "texts": ["a", "b"],
+            "batch_size": 4,
+            "session_id": None,
+            "language": "en",
+        }
+        assert result == ["masked", "masked"]
+
+    @pytest.mark.asyncio
+    async def test_mask_uses_worker_pool(self) -> None:
+        """With a worker pool, both routes are masked by the workers."""
+        pool: MaskWorkerPoolMock = MaskWorkerPoolMock()
+
+        service: MaskService = MaskService(worker_pool=pool)
+
+        assert await service.mask(text="a") == "pooled a"
+        assert await service.mask_batch(texts=["b", "c"], session_id="s") == [
+            "pooled b",
+            "pooled c",
+        ]
+        assert pool.mask_batch_calls == [
+            {"texts": ["a"], "session_id": None, "language": None},
+            {"texts": ["b", "c"], "session_id": "s", "language": None},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stats_in_process(self) -> None:
+        """Without workers, the stats describe the API process."""
+        service: MaskService = MaskService(presidio_client=PresidioPIIMock())
+
+        stats = await service.stats()
+
+        [process] = stats["processes"]
+        assert process["max_rss_bytes"] > 0
+        assert process["session_mapping"] is None
+        assert stats["session_mapping"] is None
+        assert stats["prescreen"] is None
+
+    @pytest.mark.asyncio
+    async def test_stats_sums_workers(self) -> None:
+        """With workers, session mapping and pre-screen counters are summed over the workers."""
+        service: MaskService = MaskService(worker_pool=MaskWorkerPoolMock())
+
+        stats = await service.stats()
+
+        assert [p["pid"] for p in stats["processes"]] == [1, 2]
+        assert stats["session_mapping"] == {"sessions": 4, "entities": 10}
+        assert stats["prescreen"] == {"texts": 8, "skipped": 2, "skip_ratio": 0.25}
+
+    @pytest.mark.asyncio
+    async def test_warm_up_in_process(self) -> None:
+        """Without workers, the API process models are warmed up."""
+        service: MaskService = MaskService(presidio_client=PresidioPIIMock())
+
+        assert await service.warm_up() == {"it": 0.5, "en": 0.25}
+
+    @pytest.mark.asyncio
+    async def test_warm_up_workers(self) -> None:
+        """With workers, the slowest warm-up of each language is reported."""
+        service: MaskService = MaskService(worker_pool=MaskWorkerPoolMock())
+
+        assert await service.warm_up() == {"it": 0.5, "en": 0.75}
+
 
 class TestGetMaskService:
-    def test_returns_mask_service(self) -> None:
-        """get_mask_service factory returns a MaskService instance."""
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> None:
+        get_mask_service.cache_clear()
+        yield
         get_mask_service.cache_clear()
 
+    def test_returns_mask_service(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """get_mask_service factory returns a MaskService backed by Presidio."""
         mock_presidio: PresidioPIIMock = PresidioPIIMock()
-        result: MaskService = get_mask_service(presidio=mock_presidio)
+        monkeypatch.setattr(service_mod, "get_mask_worker_pool", lambda: None)
+        monkeypatch.setattr(service_mod, "get_presidio", lambda: mock_presidio)
+
+        result: MaskService = get_mask_service()
 
         assert isinstance(result, MaskService)
+        assert result.presidio_client is mock_presidio
+        assert result.worker_pool is None
 
-        get_mask_service.cache_clear()
+    def test_returns_pooled_mask_service(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """With a worker pool, Presidio is not loaded in the API process."""
+        pool: MaskWorkerPoolMock = MaskWorkerPoolMock()
+        monkeypatch.setattr(service_mod, "get_mask_worker_pool", lambda: pool)
+
+        def get_presidio_unexpected():
+            raise AssertionError("Presidio loaded in the API process")
+
+        monkeypatch.setattr(service_mod, "get_presidio", get_presidio_unexpected)
+
+        result: MaskService = get_mask_service()
+
+        assert result.worker_pool is pool
+        assert result.presidio_client is None
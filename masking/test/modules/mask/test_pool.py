@@ -0,0 +1,76 @@
+import pytest
+
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+
+import src.modules.mask.pool as pool_mod
+from src.modules.mask.env import get_mask_settings
+from src.modules.mask.pool import MaskWorkerPool, get_mask_worker_pool
+from test.modules.mask.mocks import ProcessPoolExecutorMock
+
+
+class TestGetMaskWorkerPool:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> None:
+        get_mask_settings.cache_clear()
+        get_mask_worker_pool.cache_clear()
+        yield
+        get_mask_settings.cache_clear()
+        get_mask_worker_pool.cache_clear()
+
+    def test_disabled_by_default(self) -> None:
+        """No worker pool without MASK_WORKERS: texts are masked in the API process."""
+        assert get_mask_worker_pool() is None
+
+    def test_enabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """MASK_WORKERS and MASK_BATCH_SIZE configure the pool."""
+        monkeypatch.setenv("MASK_WORKERS", "3")
+        monkeypatch.setenv("MASK_BATCH_SIZE", "8")
+
+        pool: Optional[MaskWorkerPool] = get_mask_worker_pool()
+
+        assert isinstance(pool, MaskWorkerPool)
+        assert pool.workers == 3
+        assert pool.batch_size == 8
+        assert pool.start_method == "spawn"
+
+    def test_fork(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """MASK_WORKERS_START_METHOD=fork shares the API process models."""
+        monkeypatch.setenv("MASK_WORKERS", "2")
+        monkeypatch.setenv("MASK_WORKERS_START_METHOD", "fork")
+
+        pool: Optional[MaskWorkerPool] = get_mask_worker_pool()
+
+        assert pool.start_method == "fork"
+
+    def test_shutdown_without_start(self) -> None:
+        """Shutting down a pool that never spawned a worker is a no-op."""
+        MaskWorkerPool(workers=2, batch_size=8).shutdown()
+
+
+class TestMaskWorkerPoolRecovery:
+    @pytest.fixture(autouse=True)
+    def _executor(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(pool_mod, "ProcessPoolExecutor", ProcessPoolExecutorMock)
+        monkeypatch.setattr(ProcessPoolExecutorMock, "created", [])
+
+    @pytest.mark.asyncio
+    async def test_dead_worker_is_replaced(self) -> None:
+        """A request hitting a dead worker is retried on a new, warm one."""
+        pool = MaskWorkerPool(workers=1, batch_size=8)
+
+        masked: List[str] = await pool.mask_batch(texts=["Mario"])
+
+        broken, replacement = ProcessPoolExecutorMock.created
+        assert masked == ["pooled Mario"]
+        assert broken.shutdown_calls == 1
+        assert replacement.calls == ["_warm_up", "_mask_batch"]
+
+    @pytest.mark.asyncio
+    async def test_retried_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A worker dying again fails the request instead of looping."""
+        monkeypatch.setattr(ProcessPoolExecutorMock, "broken", 3)
+        pool = MaskWorkerPool(workers=1, batch_size=8)
+
+        with pytest.raises(BrokenProcessPool):
+            await pool.mask_batch(texts=["Mario"])
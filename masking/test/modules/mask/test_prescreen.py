@@ -0,0 +1,144 @@
+import pytest
+
+from typing import List, Set, Tuple
+
+import src.modules.mask.prescreen as prescreen_mod
+from src.modules.mask.prescreen import (
+    PiiPrescreen,
+    PrescreenStats,
+    merge_prescreen_stats,
+    stop_words,
+)
+from src.modules.mask.presidio import GLOBAL_ENTITIES, IT_ENTITIES
+
+
+def stop_words_mock(languages: List[str]) -> Set[str]:
+    return {"here", "is", "the", "il", "la", "i"}
+
+
+@pytest.fixture
+def prescreen(monkeypatch: pytest.MonkeyPatch) -> PiiPrescreen:
+    monkeypatch.setattr(prescreen_mod, "stop_words", stop_words_mock)
+    return PiiPrescreen(
+        entities=GLOBAL_ENTITIES + IT_ENTITIES,
+        languages=["it", "en"],
+        allow_list=["PagoPA", "Firma con IO"],
+        sentence_min_chars=60,
+    )
+
+
+class TestPiiPrescreen:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "here is the summary you asked for.",
+            "Here is the summary you asked for.",
+            "I can help with PagoPA and Firma con IO.",
+            "",
+        ],
+    )
+    def test_no_candidates(self, prescreen: PiiPrescreen, text: str) -> None:
+        """Texts without any candidate are skipped."""
+        assert prescreen.spans(text=text) == []
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "call me at three four five 1",
+            "write to someone@example",
+            "see you tomorrow",
+            "ci vediamo lunedì",
+            "ask Mario about it",
+            "Sure, here is the summary",
+        ],
+    )
+    def test_candidates(self, prescreen: PiiPrescreen, text: str) -> None:
+        """Short texts with a candidate are analyzed as a whole."""
+        assert prescreen.spans(text=text) == [(0, len(text))]
+
+    def test_long_text_candidate_sentences(self, prescreen: PiiPrescreen) -> None:
+        """Long texts only keep their candidate sentences, adjacent ones merged."""
+        sentences: List[str] = [
+            "here is the summary.",
+            "ask Mario Rossi.",
+            "he lives in Roma.",
+            "the end is near.",
+            "write to someone@example.",
+        ]
+        text: str = " ".join(sentences)
+
+        spans: List[Tuple[int, int]] = prescreen.spans(text=text)
+
+        assert [text[start:end] for start, end in spans] == [
+            "ask Mario Rossi. he lives in Roma.",
+            "write to someone@example.",
+        ]
+
+    def test_unknown_entity_disables_screening(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An entity without a known pattern makes every text a candidate."""
+        monkeypatch.setattr(prescreen_mod, "stop_words", stop_words_mock)
+        prescreen: PiiPrescreen = PiiPrescreen(
+            entities=["PERSON", "US_SSN"], languages=["en"], allow_list=[]
+        )
+
+        assert prescreen.spans(text="nothing here") == [(0, 12)]
+
+    def test_only_pattern_entities(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without name entities, capitalised words are not candidates."""
+        monkeypatch.setattr(prescreen_mod, "stop_words", stop_words_mock)
+        prescreen: PiiPrescreen = PiiPrescreen(
+            entities=["EMAIL_ADDRESS"], languages=["en"], allow_list=[]
+        )
+
+        assert prescreen.spans(text="Mario Rossi") == []
+        assert prescreen.spans(text="mario@rossi") == [(0, 11)]
+
+    def test_stop_words_of_unknown_language(self) -> None:
+        """Languages spaCy does not know have no stop words."""
+        assert stop_words(languages=["zz"]) == set()
+
+
+class TestPrescreenStats:
+    def test_record(self) -> None:
+        """Skipped and sentence-level texts are counted, and the time they saved estimated."""
+        counters: PrescreenStats = PrescreenStats()
+
+        counters.record(
+            texts=["a" * 10, "b" * 10, "c" * 20],
+            spans=[[], [(0, 10)], [(0, 10)]],
+            seconds=2.0,
+        )
+
+        stats = counters.stats()
+        assert stats["texts"] == 3
+        assert stats["skipped"] == 1
+        assert stats["sentence_level"] == 1
+        assert stats["skip_ratio"] == 1 / 3
+        assert stats["chars"] == 40
+        assert stats["analyzed_chars"] == 20
+        assert stats["saved_seconds"] == 2.0
+
+    def test_empty(self) -> None:
+        """No text screened yet, no ratio."""
+        stats = PrescreenStats().stats()
+
+        assert stats["skip_ratio"] == 0.0
+        assert stats["saved_seconds"] == 0.0
+
+    def test_merge(self) -> None:
+        """Counters of several processes are summed, the skip ratio recomputed."""
+        merged = merge_prescreen_stats(
+            stats=[
+                {"texts": 4, "skipped": 1, "skip_ratio": 0.25, "saved_seconds": 1.0},
+                {"texts": 4, "skipped": 3, "skip_ratio": 0.75, "saved_seconds": 2.0},
+            ]
+        )
+
+        assert merged == {
+            "texts": 8,
+            "skipped": 4,
+            "skip_ratio": 0.5,
+            "saved_seconds": 3.0,
+        }
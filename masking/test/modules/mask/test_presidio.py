@@ -4,6 +4,7 @@ import yaml
 from pathlib import Path
 from typing import Any, Dict, List
 
+import src.modules.mask.language as language_mod
 import src.modules.mask.presidio as presidio_mod
 from src.modules.mask.presidio import (
     PresidioModelConfig,
@@ -16,6 +17,10 @@ from src.modules.mask.presidio import (
     IT_ENTITIES,
     get_presidio,
 )
+from src.modules.mask.env import get_mask_settings
+from src.modules.mask.language import SessionLanguages, StopWordLanguageDetector
+from src.modules.mask.mapping import EntityMapping, EntityMappingStore
+from src.modules.mask.prescreen import PiiPrescreen
 from presidio_analyzer import RecognizerResult
 from presidio_anonymizer.operators import OperatorType
 from pydantic import ValidationError
@@ -23,6 +28,7 @@ from pydantic import ValidationError
 from test.modules.mask.mocks import (
     NlpEngineProviderMock,
     AnalyzerEngineMock,
+    BatchAnalyzerEngineMock,
     FakeLang,
     ConfigPathMock,
     make_presidio_config,
@@ -30,6 +36,7 @@ from test.modules.mask.mocks import (
     detect_langs_italian_mock,
     detect_langs_english_only_mock,
     detect_langs_unsupported_mock,
+    detect_langs_english_greeting_mock,
     VALID_PRESIDIO_YAML,
 )
 
@@ -47,11 +54,29 @@ def presidio_instance(monkeypatch: pytest.MonkeyPatch) -> PresidioPII:
     """Create a PresidioPII with mocked NLP engine and analyzer."""
     monkeypatch.setattr(presidio_mod, "NlpEngineProvider", NlpEngineProviderMock)
     monkeypatch.setattr(presidio_mod, "AnalyzerEngine", AnalyzerEngineMock)
+    monkeypatch.setattr(presidio_mod, "BatchAnalyzerEngine", BatchAnalyzerEngineMock)
     config: Dict[str, Any] = make_presidio_config()
     instance: PresidioPII = PresidioPII(config=config)
     return instance
 
 
+@pytest.fixture
+def prescreened_instance(monkeypatch: pytest.MonkeyPatch) -> PresidioPII:
+    """Create a PresidioPII with the pre-screen enabled."""
+    monkeypatch.setattr(presidio_mod, "NlpEngineProvider", NlpEngineProviderMock)
+    monkeypatch.setattr(presidio_mod, "AnalyzerEngine", AnalyzerEngineMock)
+    monkeypatch.setattr(presidio_mod, "BatchAnalyzerEngine", BatchAnalyzerEngineMock)
+    config: Dict[str, Any] = make_presidio_config()
+    instance: PresidioPII = PresidioPII(
+        config=config, prescreen=True, prescreen_sentence_min_chars=40
+    )
+    return instance
+
+
+def detect_langs_unexpected(text: str) -> List[FakeLang]:
+    raise AssertionError("Language detected for a text without candidates")
+
+
 # ---------------------------------------------------------------------------
 # Pydantic config models
 # ---------------------------------------------------------------------------
@@ -238,7 +263,7 @@ class TestPresidioPII:
         self, monkeypatch: pytest.MonkeyPatch, presidio_instance: PresidioPII
     ) -> None:
         """Text without PII is returned as-is."""
-        monkeypatch.setattr(presidio_mod, "detect_langs", detect_langs_error_mock)
+        monkeypatch.setattr(language_mod, "detect_langs", detect_langs_error_mock)
 
         result: str = presidio_instance.mask_pii(text="Hello world")
         assert result == "Hello world"
@@ -247,7 +272,7 @@ class TestPresidioPII:
         self, monkeypatch: pytest.MonkeyPatch, presidio_instance: PresidioPII
     ) -> None:
         """Text with PII is masked via EntityTypeCountAnonymizer."""
-        monkeypatch.setattr(presidio_mod, "detect_langs", detect_langs_error_mock)
+        monkeypatch.setattr(language_mod, "detect_langs", detect_langs_error_mock)
 
         recognizer_result: RecognizerResult = RecognizerResult(
             entity_type="PERSON",
@@ -266,7 +291,7 @@ class TestPresidioPII:
         self, monkeypatch: pytest.MonkeyPatch, presidio_instance: PresidioPII
     ) -> None:
         """Exception in langdetect returns 'it'."""
-        monkeypatch.setattr(presidio_mod, "detect_langs", detect_langs_error_mock)
+        monkeypatch.setattr(language_mod, "detect_langs", detect_langs_error_mock)
 
         result: str = presidio_instance._PresidioPII__detect_language("some text")
         assert result == "it"
@@ -275,7 +300,7 @@ class TestPresidioPII:
         self, monkeypatch: pytest.MonkeyPatch, presidio_instance: PresidioPII
     ) -> None:
         """When no detected language matches supported languages, fallback to 'it'."""
-        monkeypatch.setattr(presidio_mod, "detect_langs", detect_langs_unsupported_mock)
+        monkeypatch.setattr(language_mod, "detect_langs", detect_langs_unsupported_mock)
 
         result: str = presidio_instance._PresidioPII__detect_language("some text")
         assert result == "it"
@@ -284,7 +309,7 @@ class TestPresidioPII:
         self, monkeypatch: pytest.MonkeyPatch, presidio_instance: PresidioPII
     ) -> None:
         """When 'it' is among detected languages, it is chosen."""
-        monkeypatch.setattr(presidio_mod, "detect_langs", detect_langs_italian_mock)
+        monkeypatch.setattr(language_mod, "detect_langs", detect_langs_italian_mock)
 
         result: str = presidio_instance._PresidioPII__detect_language(
             "testo in italiano"
@@ -296,7 +321,7 @@ class TestPresidioPII:
     ) -> None:
         """Non-Italian supported language is returned when 'it' is not detected."""
         monkeypatch.setattr(
-            presidio_mod, "detect_langs", detect_langs_english_only_mock
+            language_mod, "detect_langs", detect_langs_english_only_mock
         )
 
         result = presidio_instance._PresidioPII__detect_language("english text")
@@ -306,7 +331,7 @@ class TestPresidioPII:
         self, monkeypatch: pytest.MonkeyPatch, presidio_instance: PresidioPII
     ) -> None:
         """When language is 'it', IT_ENTITIES are included in analysis."""
-        monkeypatch.setattr(presidio_mod, "detect_langs", detect_langs_error_mock)
+        monkeypatch.setattr(language_mod, "detect_langs", detect_langs_error_mock)
 
         presidio_instance._PresidioPII__detect_pii("testo italiano")
 
@@ -321,7 +346,7 @@ class TestPresidioPII:
     ) -> None:
         """Non-IT language uses only GLOBAL_ENTITIES."""
         monkeypatch.setattr(
-            presidio_mod, "detect_langs", detect_langs_english_only_mock
+            language_mod, "detect_langs", detect_langs_english_only_mock
         )
 
         presidio_instance._PresidioPII__detect_pii("english text")
@@ -331,6 +356,219 @@ class TestPresidioPII:
         entities: List[str] = analyzer.last_analyze_kwargs["entities"]
         assert entities == GLOBAL_ENTITIES
 
+    def test_mask_pii_batch_groups_texts_by_language(
+        self, monkeypatch: pytest.MonkeyPatch, presidio_instance: PresidioPII
+    ) -> None:
+        """Texts are analyzed in one batch per language and returned in order."""
+        monkeypatch.setattr(
+            language_mod, "detect_langs", detect_langs_english_greeting_mock
+        )
+
+        result: List[str] = presidio_instance.mask_pii_batch(
+            texts=["Hello one", "Ciao due", "Hello three"], batch_size=8
+        )
+
+        assert result == ["Hello one", "Ciao due", "Hello three"]
+        batch_analyzer: BatchAnalyzerEngineMock = presidio_instance.batch_analyzer
+        assert batch_analyzer.calls == [
+            {"texts": ["Hello one", "Hello three"], "language": "en", "batch_size": 8},
+            {"texts": ["Ciao due"], "language": "it", "batch_size": 8},
+        ]
+
+    def test_mask_pii_batch_shares_placeholders(
+        self, monkeypatch: pytest.MonkeyPatch, presidio_instance: PresidioPII
+    ) -> None:
+        """The same value gets the same placeholder in every text of the batch."""
+        monkeypatch.setattr(language_mod, "detect_langs", detect_langs_error_mock)
+
+        analyzer: AnalyzerEngineMock = presidio_instance.analyzer
+        analyzer.analyze_return_value = [
+            RecognizerResult(entity_type="PERSON", start=0, end=8, score=0.85)
+        ]
+
+        result: List[str] = presidio_instance.mask_pii_batch(
+            texts=["John Doe asked", "John Doe answered"]
+        )
+
+        assert result == ["<PERSON_1> asked", "<PERSON_1> answered"]
+
+    def test_mask_pii_placeholders_are_request_scoped(
+        self, monkeypatch: pytest.MonkeyPatch, presidio_instance: PresidioPII
+    ) -> None:
+        """Without a session store, every request numbers its placeholders from 1."""
+        monkeypatch.setattr(language_mod, "detect_langs", detect_langs_error_mock)
+
+        analyzer: AnalyzerEngineMock = presidio_instance.analyzer
+        analyzer.analyze_return_value = [
+            RecognizerResult(entity_type="PERSON", start=0, end=8, score=0.85)
+        ]
+
+        assert presidio_instance.mask_pii(text="John Doe asked") == "<PERSON_1> asked"
+        assert (
+            presidio_instance.mask_pii(text="Jane Roe asked", session_id="s1")
+            == "<PERSON_1> asked"
+        )
+        assert presidio_instance.mapping_stats() is None
+        assert presidio_instance.prescreen_stats() is None
+
+    def test_mask_pii_placeholders_kept_per_session(
+        self, monkeypatch: pytest.MonkeyPatch, presidio_instance: PresidioPII
+    ) -> None:
+        """With a session store, placeholders are numbered per conversation."""
+        monkeypatch.setattr(language_mod, "detect_langs", detect_langs_error_mock)
+        presidio_instance.mapping_store = EntityMappingStore(
+            max_sessions=10, ttl_seconds=60
+        )
+
+        analyzer: AnalyzerEngineMock = presidio_instance.analyzer
+        analyzer.analyze_return_value = [
+            RecognizerResult(entity_type="PERSON", start=0, end=8, score=0.85)
+        ]
+
+        presidio_instance.mask_pii(text="John Doe asked", session_id="s1")
+
+        assert (
+            presidio_instance.mask_pii(text="Jane Roe asked", session_id="s1")
+            == "<PERSON_2> asked"
+        )
+        assert presidio_instance.mask_pii_batch(
+            texts=["John Doe again"], session_id="s1"
+        ) == ["<PERSON_1> again"]
+        assert (
+            presidio_instance.mask_pii(text="Jane Roe asked", session_id="s2")
+            == "<PERSON_1> asked"
+        )
+        stats = presidio_instance.mapping_stats()
+        assert stats["sessions"] == 2
+        assert stats["entities"] == 3
+
+    def test_mask_pii_holds_the_session_mapping_lock(
+        self, monkeypatch: pytest.MonkeyPatch, presidio_instance: PresidioPII
+    ) -> None:
+        """A session mapping is only updated under its lock."""
+        monkeypatch.setattr(language_mod, "detect_langs", detect_langs_error_mock)
+        presidio_instance.mapping_store = EntityMappingStore(
+            max_sessions=10, ttl_seconds=60
+        )
+        mapping: EntityMapping = presidio_instance.mapping_store.get(session_id="s1")
+
+        analyzer: AnalyzerEngineMock = presidio_instance.analyzer
+        analyzer.analyze_return_value = [
+            RecognizerResult(entity_type="PERSON", start=0, end=8, score=0.85)
+        ]
+        anonymize = presidio_instance.engine.anonymize
+        locked: List[bool] = []
+
+        def anonymize_mock(**kwargs: Any) -> Any:
+            locked.append(mapping.lock.locked())
+            return anonymize(**kwargs)
+
+        monkeypatch.setattr(presidio_instance.engine, "anonymize", anonymize_mock)
+
+        presidio_instance.mask_pii(text="John Doe asked", session_id="s1")
+
+        assert locked == [True]
+        assert not mapping.lock.locked()
+
+    def test_mask_pii_prescreen_skips_ner(
+        self, monkeypatch: pytest.MonkeyPatch, prescreened_instance: PresidioPII
+    ) -> None:
+        """Texts without candidates skip language detection and NER."""
+        monkeypatch.setattr(language_mod, "detect_langs", detect_langs_unexpected)
+
+        result: str = prescreened_instance.mask_pii(text="grazie mille, a presto")
+
+        assert result == "grazie mille, a presto"
+        analyzer: AnalyzerEngineMock = prescreened_instance.analyzer
+        assert analyzer.last_analyze_kwargs is None
+        stats = prescreened_instance.prescreen_stats()
+        assert stats["texts"] == 1
+        assert stats["skipped"] == 1
+
+    def test_mask_pii_prescreen_sentence_level(
+        self, monkeypatch: pytest.MonkeyPatch, prescreened_instance: PresidioPII
+    ) -> None:
+        """Long texts only run NER on their candidate sentences."""
+        monkeypatch.setattr(language_mod, "detect_langs", detect_langs_error_mock)
+
+        analyzer: AnalyzerEngineMock = prescreened_instance.analyzer
+        analyzer.analyze_return_value = [
+            RecognizerResult(entity_type="PERSON", start=4, end=9, score=0.85)
+        ]
+        text: str = "grazie mille. " * 5 + "ask Mario."
+
+        result: str = prescreened_instance.mask_pii(text=text)
+
+        assert result == "grazie mille. " * 5 + "ask <PERSON_1>."
+        assert analyzer.last_analyze_kwargs["text"] == "ask Mario."
+        assert prescreened_instance.prescreen_stats()["sentence_level"] == 1
+
+    def test_mask_pii_batch_prescreen(
+        self, monkeypatch: pytest.MonkeyPatch, prescreened_instance: PresidioPII
+    ) -> None:
+        """Texts without candidates are left out of the NER batch."""
+        monkeypatch.setattr(
+            language_mod, "detect_langs", detect_langs_english_greeting_mock
+        )
+
+        result: List[str] = prescreened_instance.mask_pii_batch(
+            texts=["grazie mille", "Hello Mario"]
+        )
+
+        assert result == ["grazie mille", "Hello Mario"]
+        batch_analyzer: BatchAnalyzerEngineMock = prescreened_instance.batch_analyzer
+        assert batch_analyzer.calls == [
+            {"texts": ["Hello Mario"], "language": "en", "batch_size": 32}
+        ]
+        assert prescreened_instance.prescreen_stats()["skip_ratio"] == 0.5
+
+    def test_mask_pii_language_hint(
+        self, monkeypatch: pytest.MonkeyPatch, presidio_instance: PresidioPII
+    ) -> None:
+        """A configured language hint skips detection, an unknown one is ignored."""
+        monkeypatch.setattr(language_mod, "detect_langs", detect_langs_unexpected)
+
+        presidio_instance.mask_pii_batch(texts=["Hello Mario"], language="en")
+
+        batch_analyzer: BatchAnalyzerEngineMock = presidio_instance.batch_analyzer
+        assert batch_analyzer.calls[-1]["language"] == "en"
+
+        monkeypatch.setattr(language_mod, "detect_langs", detect_langs_error_mock)
+        presidio_instance.mask_pii(text="Hello Mario", language="zh")
+
+        analyzer: AnalyzerEngineMock = presidio_instance.analyzer
+        assert analyzer.last_analyze_kwargs["language"] == "it"
+
+    def test_mask_pii_language_kept_per_session(
+        self, monkeypatch: pytest.MonkeyPatch, presidio_instance: PresidioPII
+    ) -> None:
+        """The language detected for a session is reused by its next texts."""
+        presidio_instance.session_languages = SessionLanguages(max_sessions=10)
+        monkeypatch.setattr(
+            language_mod, "detect_langs", detect_langs_english_only_mock
+        )
+
+        presidio_instance.mask_pii(text="Hello Mario", session_id="s1")
+        monkeypatch.setattr(language_mod, "detect_langs", detect_langs_unexpected)
+        presidio_instance.mask_pii(text="Ciao Mario", session_id="s1")
+
+        analyzer: AnalyzerEngineMock = presidio_instance.analyzer
+        assert analyzer.last_analyze_kwargs["language"] == "en"
+
+    def test_warm_up(
+        self, monkeypatch: pytest.MonkeyPatch, prescreened_instance: PresidioPII
+    ) -> None:
+        """Warm-up analyzes the synthetic text once per language, uncounted."""
+        monkeypatch.setattr(language_mod, "detect_langs", detect_langs_italian_mock)
+
+        seconds: Dict[str, float] = prescreened_instance.warm_up()
+
+        analyzer: AnalyzerEngineMock = prescreened_instance.analyzer
+        assert analyzer.analyzed_languages == ["it", "en"]
+        assert analyzer.last_analyze_kwargs["text"] == presidio_mod.WARM_UP_TEXT
+        assert list(seconds) == ["it", "en"]
+        assert prescreened_instance.prescreen_stats()["texts"] == 0
+
 
 # ---------------------------------------------------------------------------
 # __read_presidio_config
@@ -433,3 +671,40 @@ class TestGetPresidio:
 
         result: PresidioPII = get_presidio()
         assert isinstance(result, PresidioPII)
+        assert result.mapping_store is None
+        assert result.prescreen is None
+        assert isinstance(result.language_detector, StopWordLanguageDetector)
+        assert isinstance(result.session_languages, SessionLanguages)
+
+    def test_prescreen_enabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """MASK_PRESCREEN_ENABLED enables the PII pre-screen."""
+        get_mask_settings.cache_clear()
+        monkeypatch.setenv("MASK_PRESCREEN_ENABLED", "true")
+        monkeypatch.setattr(
+            presidio_mod, "__read_presidio_config", make_presidio_config
+        )
+        monkeypatch.setattr(presidio_mod, "NlpEngineProvider", NlpEngineProviderMock)
+        monkeypatch.setattr(presidio_mod, "AnalyzerEngine", AnalyzerEngineMock)
+
+        result: PresidioPII = get_presidio()
+        get_mask_settings.cache_clear()
+
+        assert isinstance(result.prescreen, PiiPrescreen)
+
+    def test_session_mapping_store(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """MASK_SESSION_MAPPING_MAX_SESSIONS enables the bounded session store."""
+        get_mask_settings.cache_clear()
+        monkeypatch.setenv("MASK_SESSION_MAPPING_MAX_SESSIONS", "100")
+        monkeypatch.setenv("MASK_SESSION_MAPPING_TTL_SECONDS", "30")
+        monkeypatch.setattr(
+            presidio_mod, "__read_presidio_config", make_presidio_config
+        )
+        monkeypatch.setattr(presidio_mod, "NlpEngineProvider", NlpEngineProviderMock)
+        monkeypatch.setattr(presidio_mod, "AnalyzerEngine", AnalyzerEngineMock)
+
+        result: PresidioPII = get_presidio()
+        get_mask_settings.cache_clear()
+
+        assert isinstance(result.mapping_store, EntityMappingStore)
+        assert result.mapping_store.max_sessions == 100
+        assert result.mapping_store.ttl_seconds == 30.0
@@ -0,0 +1,61 @@
+import pytest
+
+from fastapi import HTTPException
+
+import src.modules.mask.warmup as warmup_mod
+from src.modules.mask.service import MaskService
+from src.modules.mask.warmup import MaskWarmUp
+
+from test.modules.mask.mocks import PresidioPIIMock
+
+
+class FailingPresidioPIIMock(PresidioPIIMock):
+    def warm_up(self) -> None:
+        raise OSError("model not found")
+
+
+class TestMaskWarmUp:
+    @pytest.mark.asyncio
+    async def test_not_started(self) -> None:
+        """Without a lifespan nothing is warmed up, and requests do not wait."""
+        warm_up: MaskWarmUp = MaskWarmUp()
+
+        await warm_up.wait()
+
+        assert not warm_up.ready
+        assert warm_up.error is None
+
+    @pytest.mark.asyncio
+    async def test_ready(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Once the models are warm, the seconds per language are kept."""
+        monkeypatch.setattr(
+            warmup_mod,
+            "get_mask_service",
+            lambda: MaskService(presidio_client=PresidioPIIMock()),
+        )
+        warm_up: MaskWarmUp = MaskWarmUp()
+
+        warm_up.start()
+        await warm_up.wait()
+
+        assert warm_up.ready
+        assert warm_up.seconds == {"it": 0.5, "en": 0.25}
+
+    @pytest.mark.asyncio
+    async def test_failed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A failed warm-up answers 503 and keeps its error."""
+        monkeypatch.setattr(
+            warmup_mod,
+            "get_mask_service",
+            lambda: MaskService(presidio_client=FailingPresidioPIIMock()),
+        )
+        warm_up: MaskWarmUp = MaskWarmUp()
+
+        warm_up.start()
+        with pytest.raises(HTTPException) as exc_info:
+            await warm_up.wait()
+
+        assert exc_info.value.status_code == 503
+        assert not warm_up.ready
+        assert isinstance(warm_up.error, OSError)
+        await warm_up.stop()